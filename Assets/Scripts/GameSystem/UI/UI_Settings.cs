@@ -17,6 +17,15 @@ public class UI_Settings : MonoBehaviour
     [SerializeField] private Toggle immediatelyToggle;
     [SerializeField] private TMP_InputField loopThresholdInputField;
 
+    [Header("Turbo Settings")]
+    [SerializeField] private Toggle turboToggle;
+    [SerializeField] private TMP_InputField turboTicksInputField;
+    [SerializeField] private TMP_InputField turboTimeBudgetInputField;
+
+    [Header("Propagation Settings")]
+    [SerializeField] private Toggle changeOnlyToggle;
+    [SerializeField] private Toggle headlessKernelToggle;
+
 
     [Header("Buttons")]
     [SerializeField] private Button applyButton;
@@ -84,6 +93,28 @@ public class UI_Settings : MonoBehaviour
             loopThresholdInputField.onEndEdit.AddListener(OnLoopThresholdChanged);
             loopThresholdInputField.characterLimit = 2;
         }
+        if (turboToggle != null)
+        {
+            turboToggle.onValueChanged.AddListener(OnTurboToggleChanged);
+        }
+        if (turboTicksInputField != null)
+        {
+            turboTicksInputField.onEndEdit.AddListener(OnTurboTicksChanged);
+            turboTicksInputField.characterLimit = 6;
+        }
+        if (turboTimeBudgetInputField != null)
+        {
+            turboTimeBudgetInputField.onEndEdit.AddListener(OnTurboTimeBudgetChanged);
+            turboTimeBudgetInputField.characterLimit = 4;
+        }
+        if (changeOnlyToggle != null)
+        {
+            changeOnlyToggle.onValueChanged.AddListener(OnChangeOnlyToggleChanged);
+        }
+        if (headlessKernelToggle != null)
+        {
+            headlessKernelToggle.onValueChanged.AddListener(OnHeadlessKernelToggleChanged);
+        }
 
         // 버튼 이벤트
         if (applyButton != null)
@@ -107,6 +138,7 @@ public class UI_Settings : MonoBehaviour
     private void RefreshUIFromTempSettings()
     {
         var (vfx, speed, immediately, loopThreshold, keyMap) = Setting.GetTempSettings();
+        var (turbo, turboTicks, turboTimeBudget) = Setting.GetTempTurboSettings();
 
         if (vfxSlider != null)
         {
@@ -125,17 +157,27 @@ public class UI_Settings : MonoBehaviour
         {
             loopThresholdInputField.SetTextWithoutNotify(loopThreshold.ToString());
         }
+        RefreshTurboUI(turbo, turboTicks, turboTimeBudget);
+        if (changeOnlyToggle != null)
+        {
+            changeOnlyToggle.SetIsOnWithoutNotify(Setting.GetTempIsChangeOnly());
+        }
+        if (headlessKernelToggle != null)
+        {
+            headlessKernelToggle.SetIsOnWithoutNotify(Setting.GetTempIsHeadlessKernel());
+        }
         // 텍스트 업데이트
         UpdateVFXVolumeText(vfx);
         UpdateSimulationSpeedText(speed);
-        UpdateSimulationSpeedInteractable(immediately);
-        UpdateLoopThresholdVisibility(immediately);
+        UpdateSimulationSpeedInteractable(immediately || turbo);
+        UpdateLoopThresholdVisibility(immediately && !turbo);
         // 키맵 UI 업데이트
         RefreshKeyMapUI(_settingKeyManager.KeyMaps);
     }
     private void RefreshUIFromCurrentSettings()
     {
         var (vfx, speed, immediately, loopThreshold, keyMap) = Setting.GetCurrentSettings();
+        var (turbo, turboTicks, turboTimeBudget) = Setting.GetCurrentTurboSettings();
 
         if (vfxSlider != null)
         {
@@ -153,12 +195,21 @@ public class UI_Settings : MonoBehaviour
         {
             loopThresholdInputField.SetTextWithoutNotify(loopThreshold.ToString());
         }
+        RefreshTurboUI(turbo, turboTicks, turboTimeBudget);
+        if (changeOnlyToggle != null)
+        {
+            changeOnlyToggle.SetIsOnWithoutNotify(Setting.IsChangeOnly);
+        }
+        if (headlessKernelToggle != null)
+        {
+            headlessKernelToggle.SetIsOnWithoutNotify(Setting.IsHeadlessKernel);
+        }
 
         // 텍스트 업데이트
         UpdateVFXVolumeText(vfx);
         UpdateSimulationSpeedText(speed);
-        UpdateSimulationSpeedInteractable(immediately);
-        UpdateLoopThresholdVisibility(immediately);
+        UpdateSimulationSpeedInteractable(immediately || turbo);
+        UpdateLoopThresholdVisibility(immediately && !turbo);
 
         _settingKeyManager.Apply(keyMap);
         // 키맵 UI 업데이트
@@ -180,8 +231,63 @@ public class UI_Settings : MonoBehaviour
     private void OnImmediatelyToggleChanged(bool isOn)
     {
         Setting.SetTempIsImmediately(isOn);
-        UpdateSimulationSpeedInteractable(isOn);
-        UpdateLoopThresholdVisibility(isOn);
+        var (turbo, _, _) = Setting.GetTempTurboSettings();
+        UpdateSimulationSpeedInteractable(isOn || turbo);
+        UpdateLoopThresholdVisibility(isOn && !turbo);
+    }
+    private void OnTurboToggleChanged(bool isOn)
+    {
+        Setting.SetTempIsTurbo(isOn);
+        var (_, _, immediately, _, _) = Setting.GetTempSettings();
+        UpdateSimulationSpeedInteractable(immediately || isOn);
+        UpdateLoopThresholdVisibility(immediately && !isOn);
+        UpdateTurboFieldsVisibility(isOn);
+    }
+    private void OnChangeOnlyToggleChanged(bool isOn)
+    {
+        Setting.SetTempIsChangeOnly(isOn);
+    }
+    private void OnHeadlessKernelToggleChanged(bool isOn)
+    {
+        Setting.SetTempIsHeadlessKernel(isOn);
+    }
+    private void OnTurboTicksChanged(string value)
+    {
+        if (int.TryParse(value, out int ticks))
+        {
+            // 1~100000 범위로 제한
+            int clampedTicks = Mathf.Clamp(ticks, 1, 100000);
+            Setting.SetTempTurboTicksPerFrame(clampedTicks);
+
+            if (ticks != clampedTicks)
+            {
+                turboTicksInputField.SetTextWithoutNotify(clampedTicks.ToString());
+            }
+        }
+        else
+        {
+            var (_, turboTicks, _) = Setting.GetTempTurboSettings();
+            turboTicksInputField.SetTextWithoutNotify(turboTicks.ToString());
+        }
+    }
+    private void OnTurboTimeBudgetChanged(string value)
+    {
+        if (float.TryParse(value, out float budget))
+        {
+            // 1~33ms 범위로 제한
+            float clampedBudget = Mathf.Clamp(budget, 1f, 33f);
+            Setting.SetTempTurboTimeBudget(clampedBudget);
+
+            if (!Mathf.Approximately(budget, clampedBudget))
+            {
+                turboTimeBudgetInputField.SetTextWithoutNotify(clampedBudget.ToString("0.#"));
+            }
+        }
+        else
+        {
+            var (_, _, turboTimeBudget) = Setting.GetTempTurboSettings();
+            turboTimeBudgetInputField.SetTextWithoutNotify(turboTimeBudget.ToString("0.#"));
+        }
     }
     private void OnLoopThresholdChanged(string value)
     {
@@ -295,6 +401,34 @@ public class UI_Settings : MonoBehaviour
             simulationSpeedText.color = new Color(currentColor.r, currentColor.g, currentColor.b, isImmediately ? 0.2f : 1f);
         }
     }
+    private void RefreshTurboUI(bool turbo, int ticksPerFrame, float timeBudget)
+    {
+        if (turboToggle != null)
+        {
+            turboToggle.SetIsOnWithoutNotify(turbo);
+        }
+        if (turboTicksInputField != null)
+        {
+            turboTicksInputField.SetTextWithoutNotify(ticksPerFrame.ToString());
+        }
+        if (turboTimeBudgetInputField != null)
+        {
+            turboTimeBudgetInputField.SetTextWithoutNotify(timeBudget.ToString("0.#"));
+        }
+        UpdateTurboFieldsVisibility(turbo);
+    }
+    private void UpdateTurboFieldsVisibility(bool isTurbo)
+    {
+        // Turbo 토글이 체크되면 Tick 수, 시간 예산 InputField를 표시
+        if (turboTicksInputField != null)
+        {
+            turboTicksInputField.gameObject.SetActive(isTurbo);
+        }
+        if (turboTimeBudgetInputField != null)
+        {
+            turboTimeBudgetInputField.gameObject.SetActive(isTurbo);
+        }
+    }
     private void UpdateLoopThresholdVisibility(bool isImmediately)
     {
         // Immediately 토글이 체크되면 LoopThreshold InputField를 보이게 하고, 아니면 숨김
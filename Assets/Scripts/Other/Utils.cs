@@ -967,9 +967,27 @@ namespace Utils
             }
         }
 
-        #region Privates
+        /// <summary>
+        /// 임시 파일에 모두 쓴 뒤 교체. 쓰는 도중 중단되어도 기존 파일은 그대로 남는다.
+        /// </summary>
+        public static async Task WriteAllBytesAtomicAsync(string path, byte[] bytes)
+        {
+            string directoryPath = Path.GetDirectoryName(path);
+            if (!string.IsNullOrEmpty(directoryPath) && !Directory.Exists(directoryPath))
+                Directory.CreateDirectory(directoryPath);
+
+            string tempPath = path + ".tmp";
+            await File.WriteAllBytesAsync(tempPath, bytes);
 
-        private static string DefaultSerializePath => Path.Combine(Application.persistentDataPath, "SerializeData");
+            if (File.Exists(path))
+                File.Replace(tempPath, path, null);
+            else
+                File.Move(tempPath, path);
+        }
+
+        public static string DefaultSerializePath => Path.Combine(Application.persistentDataPath, "SerializeData");
+
+        #region Privates
 
         private static string FileNameTrimming(string fileName, DataFormat format)
         {
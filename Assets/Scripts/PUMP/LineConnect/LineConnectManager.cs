@@ -10,17 +10,34 @@ public class LineConnectManager : MonoBehaviour
 
     #region Privates
     private Action _lineRefreshAction;
+
+    /// <summary>
+    /// 선분은 연결 양쪽 노드의 직렬화 정보에 포함
+    /// </summary>
+    private void ReportConnectionChanges(TPConnection connection)
+    {
+        IChangeObserver observer = m_Background;
+        if (connection == null)
+        {
+            observer.ReportChanges();
+            return;
+        }
+
+        observer.ReportChanges(connection.SourcePoint?.Node);
+        observer.ReportChanges(connection.TargetPoint?.Node);
+    }
     #endregion
     
     #region Interface
-    public LineConnector AddLineConnector()
+    /// <param name="connection">선이 표시하는 연결. 선 편집 시 변경된 노드를 알리는 데 사용</param>
+    public LineConnector AddLineConnector(TPConnection connection = null)
     {
         GameObject lineGo = new GameObject("LineConnector");
         lineGo.transform.SetParent(m_LineConnectorParent);
         LineConnector lc = lineGo.AddComponent<LineConnector>();
 
-        lc.OnDragEnd += ((IChangeObserver)m_Background).ReportChanges;
-        lc.OnEdgeRemoved += _ => ((IChangeObserver)m_Background).ReportChanges();
+        lc.OnDragEnd += () => ReportConnectionChanges(connection);
+        lc.OnEdgeRemoved += _ => ReportConnectionChanges(connection);
         lc.OnRemove += () => _lineRefreshAction -= lc.RefreshPoints;
         lc.OnEdgeAdded += edge =>
         {
@@ -92,7 +92,7 @@ public class ClassedImporter : MonoBehaviour
                     {
                         if (Input.GetKeyDown(KeyCode.Mouse0))
                         {
-                            ExportData(_currentDataTarget.Data);
+                            ExportData(_currentDataTarget.Data).Forget();
                             return;
                         }
 
@@ -155,11 +155,16 @@ public class ClassedImporter : MonoBehaviour
         catch { }
     }
 
-    private void ExportData(PUMPSaveDataStructure structure)
+    private async UniTaskVoid ExportData(PUMPSaveDataStructure structure)
     {
         if (structure == null)
             return;
 
+        // 목록 항목은 본문이 없을 수 있음
+        structure = await structure.LoadAsync();
+        if (structure == null)
+            return;
+
         string path = SaveFilePanel("Export new module", "", structure.Name, FILE_EXTENSION);
 
         if (string.IsNullOrEmpty(path))
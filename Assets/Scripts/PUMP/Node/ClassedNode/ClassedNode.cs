@@ -334,7 +334,7 @@ public class ClassedNode : DynamicIONode, IClassedNode, INodeAdditionalArgs<Clas
 }
 
 [Serializable]
-public struct ClassedNodeSerializeInfo
+public struct ClassedNodeSerializeInfo : IEquatable<ClassedNodeSerializeInfo>
 {
     public ClassedNodeSerializeInfo (PUMPSaveDataStructure structure, int inputCount, int outputCount, bool isChange)
     {
@@ -348,4 +348,35 @@ public struct ClassedNodeSerializeInfo
     [OdinSerialize] public bool _isChange;
     [OdinSerialize] public int _inputCount;
     [OdinSerialize] public int _outputCount;
+
+    /// <summary>
+    /// 값 비교. 모듈 구조는 같은 참조가 아니면 본문 형식(NodeInfoBinaryFormat) 바이트로 비교
+    /// </summary>
+    public bool Equals(ClassedNodeSerializeInfo other)
+    {
+        return _inputCount == other._inputCount &&
+               _outputCount == other._outputCount &&
+               _isChange == other._isChange &&
+               StructureEquals(_structure, other._structure);
+    }
+
+    public override bool Equals(object obj) => obj is ClassedNodeSerializeInfo other && Equals(other);
+
+    public override int GetHashCode() => HashCode.Combine(_inputCount, _outputCount, _isChange, _structure?.NodeInfos?.Count ?? -1);
+
+    private static bool StructureEquals(PUMPSaveDataStructure a, PUMPSaveDataStructure b)
+    {
+        if (ReferenceEquals(a, b))
+        {
+            return true;
+        }
+
+        if (a == null || b == null || a.NodeInfos?.Count != b.NodeInfos?.Count)
+        {
+            return false;
+        }
+
+        ReadOnlySpan<byte> bytes = NodeInfoBinaryFormat.Serialize(a);
+        return bytes.SequenceEqual(NodeInfoBinaryFormat.Serialize(b));
+    }
 }
\ No newline at end of file
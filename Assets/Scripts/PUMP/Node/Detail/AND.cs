@@ -1,6 +1,6 @@
 using System.Collections.Generic;
 using UnityEngine;
-public class AND : Node
+public class AND : Node, ICombinationalEvaluable, IBitParallelEvaluable
 {
     protected override string SpritePath => "PUMP/Sprite/ingame/LogicSymbols/AND";
 
@@ -52,4 +52,20 @@ public class AND : Node
 
         OutputToken[0].State = InputToken[0].State && InputToken[1].State;
     }
+
+    void IHeadlessEvaluable.Evaluate(HeadlessContext context)
+    {
+        if (!context.IsStateChange)
+            return;
+
+        if (context.HasOnlyNull)
+        {
+            context.PushFirst(TransitionType.Bool.Null());
+            return;
+        }
+
+        context.PushFirst(context.GetInput(0) && context.GetInput(1));
+    }
+
+    BitGateType IBitParallelEvaluable.BitGateType => BitGateType.And;
 }
\ No newline at end of file
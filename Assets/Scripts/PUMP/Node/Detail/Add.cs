@@ -2,7 +2,7 @@ using System.Collections.Generic;
 using System.Linq;
 using UnityEngine;
 
-public class Add : DynamicIONode, INodeAdditionalArgs<int>
+public class Add : DynamicIONode, INodeAdditionalArgs<int>, ICombinationalEvaluable
 {
     private List<ContextElement> _contexts;
     private TransitionType _inputType = TransitionType.Int;
@@ -97,6 +97,26 @@ public class Add : DynamicIONode, INodeAdditionalArgs<int>
         OutputToken.PushFirst(Operate());
     }
 
+    void IHeadlessEvaluable.Evaluate(HeadlessContext context)
+    {
+        if (!context.AllSameType)
+            return;
+
+        if (context.HasOnlyNull)
+        {
+            context.PushFirst(context.FirstType.Null());
+            return;
+        }
+
+        Transition sum = context.GetInputType(0).Default();
+        for (int i = 0; i < context.InputCount; i++)
+        {
+            sum += context.GetInput(i);
+        }
+
+        context.PushFirst(sum.Convert(context.FirstType));
+    }
+
     protected override void OnAfterInit()
     {
         SplitterSupport.Initialize(InputCount, value =>
@@ -2,7 +2,7 @@ using System.Collections.Generic;
 using System.Linq;
 using UnityEngine;
 
-public class BinaryEncoder : DynamicIONode, INodeAdditionalArgs<int>
+public class BinaryEncoder : DynamicIONode, INodeAdditionalArgs<int>, IBatchStateUpdate
 {
     private SplitterSupport _splitterSupport;
 
@@ -86,9 +86,14 @@ public class BinaryEncoder : DynamicIONode, INodeAdditionalArgs<int>
         });
     }
 
-    protected override void StateUpdate(TransitionEventArgs args)
+    protected override void StateUpdate(TransitionEventArgs args) => Encode();
+
+    // 같은 Tick에 입력이 여러 번 바뀌어도 마지막 값만 출력
+    void IBatchStateUpdate.BatchStateUpdate(BatchStateEventArgs args) => Encode();
+
+    private void Encode()
     {
-        if (args.IsNull)
+        if (InputToken[0].State.IsNull)
         {
             foreach (var sf in OutputToken)
             {
@@ -1,6 +1,5 @@
 using System;
 using System.Collections.Generic;
-using Cysharp.Threading.Tasks;
 using OdinSerializer;
 using UnityEngine;
 
@@ -10,11 +9,9 @@ public class Blink : Node, INodeAdditionalArgs<BlinkSerializeInfo>
 
     private int _perFrame = 1;
 
-    private int _frameCount = 0;
-
     private bool _isRunning = false;
 
-    private SafetyCancellationTokenSource _cts = new(false);
+    private ClockTimer _tick;
 
     private BlinkSupport _blinkSupport;
 
@@ -64,8 +61,11 @@ public class Blink : Node, INodeAdditionalArgs<BlinkSerializeInfo>
     {
         BlinkSupport.Initialize(_perFrame, MAX_PER_FRAME, value =>
         {
-            _frameCount = 0;
             _perFrame = value;
+            if (_isRunning)
+            {
+                ScheduleNextPulse();
+            }
             ReportChanges();
         });
     }
@@ -74,7 +74,7 @@ public class Blink : Node, INodeAdditionalArgs<BlinkSerializeInfo>
     {
         if (_isRunning)
         {
-            BlinkAsync().Forget();
+            StartBlink();
         }
     }
 
@@ -108,45 +108,44 @@ public class Blink : Node, INodeAdditionalArgs<BlinkSerializeInfo>
 
             if (args.State)
             {
-                BlinkAsync().Forget();
+                StartBlink();
             }
         }
     }
 
     protected override void OnBeforeRemove()
     {
-        _cts.CancelAndDispose();
+        Reset();
     }
 
-    private async UniTaskVoid BlinkAsync()
+    private void StartBlink()
     {
-        try
-        {
-            _isRunning = true;
-            _frameCount = _perFrame;
+        _isRunning = true;
+        ScheduleNextPulse();
+        OutputToken[0].State = Transition.Pulse();
+    }
 
-            while (!_cts.Token.IsCancellationRequested)
-            {
-                if (_frameCount++ >= _perFrame)
-                {
-                    OutputToken[0].State = Transition.Pulse();
-                    _frameCount = 0;
-                }
+    /// <summary>
+    /// 펄스 후 _perFrame 프레임을 쉬고 다음 펄스 (주기 _perFrame + 1 프레임)
+    /// </summary>
+    private void ScheduleNextPulse()
+    {
+        _tick?.Cancel();
+        _tick = SimulationClock.ScheduleFrames(_perFrame + 1, OnPulse);
+    }
 
-                await UniTask.NextFrame(PlayerLoopTiming.EarlyUpdate, _cts.Token, true);
-            }
-        }
-        catch (OperationCanceledException) { }
-        finally
-        {
-            _isRunning = false;
-        }
+    private void OnPulse()
+    {
+        // 펄스가 rst로 되돌아와 Reset 될 수 있으므로 먼저 예약
+        ScheduleNextPulse();
+        OutputToken[0].State = Transition.Pulse();
     }
 
     private void Reset()
     {
-        _cts = _cts.CancelAndDisposeAndGetNew();
-        _frameCount = 0;
+        _tick?.Cancel();
+        _tick = null;
+        _isRunning = false;
     }
 
     public BlinkSerializeInfo AdditionalArgs
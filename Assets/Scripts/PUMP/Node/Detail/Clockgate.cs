@@ -1,7 +1,5 @@
 using System;
 using System.Collections.Generic;
-using System.Threading;
-using Cysharp.Threading.Tasks;
 using OdinSerializer;
 using UnityEngine;
 
@@ -21,8 +19,7 @@ public class ClockGate : Node, INodeAdditionalArgs<ClockGate.SerializeInfo>
 
     // ---- Runtime ----
     private List<ContextElement> _contexts;
-    private SafetyCancellationTokenSource _gateCts = new(false); // 타입 바뀜/제거 시 전체 취소
-    private SafetyCancellationTokenSource _pendingCts = new(false); // 최신 예약 1개만 유지(최신값 우선)
+    private ClockTimer _pending; // 최신 예약 1개만 유지(최신값 우선)
 
     // (선택) Edit 패널용 훅 ? 없으면 무시
     private ClockGateSupport _support;
@@ -63,8 +60,7 @@ public class ClockGate : Node, INodeAdditionalArgs<ClockGate.SerializeInfo>
 
     protected override void OnBeforeRemove()
     {
-        _pendingCts.CancelAndDispose();
-        _gateCts.CancelAndDispose();
+        _pending?.Cancel();
     }
 
     protected override void StateUpdate(TransitionEventArgs args)
@@ -74,24 +70,19 @@ public class ClockGate : Node, INodeAdditionalArgs<ClockGate.SerializeInfo>
         if (InputToken.FirstType != OutputToken.FirstType) return; // 안전장치 (Delay와 동일 패턴) :contentReference[oaicite:5]{index=5}
 
         // 기존 예약 취소(최신값만 유지)
-        _pendingCts = _pendingCts.CancelAndDisposeAndGetNew();
+        _pending?.Cancel();
 
         var current = InputToken.FirstState;
-        PushOnNextTickAsync(current, _pendingCts.Token).Forget();
-    }
-
-    private async UniTaskVoid PushOnNextTickAsync(Transition state, CancellationToken token)
-    {
-        try
+        int wait = ChannelClock.FramesUntilNextTick(_channel, Mathf.Max(1, _periodFrames), _emitImmediatelyIfAligned);
+        if (wait <= 0)
         {
-            int wait = ChannelClock.FramesUntilNextTick(_channel, Mathf.Max(1, _periodFrames), _emitImmediatelyIfAligned);
-            await UniTask.DelayFrame(wait, cancellationToken: token, cancelImmediately: true);
-            OutputToken.PushFirst(state);
-        }
-        catch (OperationCanceledException)
-        {
-            // 최신 예약으로 덮어썼을 때 정상 취소
+            _pending = null;
+            OutputToken.PushFirst(current);
+            return;
         }
+
+        // SimulationClock 프레임 격자에 맞춰 방출
+        _pending = SimulationClock.ScheduleFrames(wait, () => OutputToken.PushFirst(current));
     }
 
     // ---- Context Menu ----
@@ -161,8 +152,7 @@ public class ClockGate : Node, INodeAdditionalArgs<ClockGate.SerializeInfo>
 
     private void SetDataType(TransitionType type)
     {
-        _gateCts.CancelAndDispose();
-        _pendingCts.CancelAndDispose();
+        _pending?.Cancel();
 
         _inOutType = type;
         OutputToken.SetTypeAll(type);
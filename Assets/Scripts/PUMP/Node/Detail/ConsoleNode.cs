@@ -2,7 +2,7 @@ using System.Collections.Generic;
 using UnityEngine;
 
 [ResourceGetter("PUMP/Sprite/PaletteImage/palette_elem", "#383838", "#00FF00")]
-public class ConsoleNode : Node
+public class ConsoleNode : Node, IRepeatedStateListenable
 {
     private List<ContextElement> _contexts;
 
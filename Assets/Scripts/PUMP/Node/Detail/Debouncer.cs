@@ -1,7 +1,5 @@
 using System;
 using System.Collections.Generic;
-using Cysharp.Threading.Tasks;
-using System.Threading;
 using OdinSerializer;
 using UnityEngine;
 
@@ -54,7 +52,7 @@ public class Debouncer : Node, INodeAdditionalArgs<DebouncerSerializeInfo>
     private DebounceMode _debounceMode = DebounceMode.FixedTime;
     private TransitionType _currentType = TransitionType.Bool;
     private bool _debounceNull = false;
-    private CancellationTokenSource _cts;
+    private ClockTimer _pending;
     private Transition _pendingValue;
     private bool _isDebouncing = false;
 
@@ -163,41 +161,26 @@ public class Debouncer : Node, INodeAdditionalArgs<DebouncerSerializeInfo>
     {
         CancelDebounce();
         _isDebouncing = true;
-        _cts = new CancellationTokenSource();
-        DebounceRoutine(_cts.Token).Forget();
+        _pending = _debounceMode switch
+        {
+            DebounceMode.FixedTime => SimulationClock.ScheduleAfter(_debounceTime * 0.001f, OnDebounced),
+            DebounceMode.Frame => SimulationClock.ScheduleFrames(_frameCount, OnDebounced),
+            _ => throw new ArgumentOutOfRangeException()
+        };
     }
 
     private void CancelDebounce()
     {
         _isDebouncing = false;
-        _cts?.Cancel();
-        _cts?.Dispose();
-        _cts = null;
+        _pending?.Cancel();
+        _pending = null;
     }
 
-    private async UniTaskVoid DebounceRoutine(CancellationToken token)
+    private void OnDebounced()
     {
-        try
-        {
-            UniTask uniTask = _debounceMode switch
-            {
-                DebounceMode.FixedTime => UniTask.WaitForSeconds(_debounceTime * 0.001f, cancellationToken: token, cancelImmediately: true),
-                DebounceMode.Frame => UniTask.DelayFrame(_frameCount, cancellationToken: token, cancelImmediately: true),
-                _ => throw new ArgumentOutOfRangeException()
-            };
-
-            await uniTask;
-
-            if (!token.IsCancellationRequested)
-            {
-                _isDebouncing = false;
-                OutputToken.PushFirst(_pendingValue);
-            }
-        }
-        catch (OperationCanceledException)
-        {
-            _isDebouncing = false;
-        }
+        _pending = null;
+        _isDebouncing = false;
+        OutputToken.PushFirst(_pendingValue);
     }
 
     private void SetTypeAll(TransitionType type)
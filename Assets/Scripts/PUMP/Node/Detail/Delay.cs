@@ -1,7 +1,5 @@
 using System;
 using System.Collections.Generic;
-using System.Threading;
-using Cysharp.Threading.Tasks;
 using OdinSerializer;
 using UnityEngine;
 using static Delay;
@@ -19,7 +17,8 @@ public class Delay : Node, INodeAdditionalArgs<DelaySerializeInfo>
 
     private int _delay = 500;
     private DelaySupport _delaySupport;
-    private SafetyCancellationTokenSource _cts = new(false);
+    private ClockTimer _pending;
+    private Transition _pendingState;
     private List<ContextElement> _contexts;
 
     private DelaySupport DelaySupport
@@ -104,7 +103,7 @@ public class Delay : Node, INodeAdditionalArgs<DelaySerializeInfo>
                 _frameCount = Mathf.Max(1, (int)value);
             }
 
-            _cts.CancelAndDispose();
+            FlushPending();
             ReportChanges();
         };
     }
@@ -121,37 +120,44 @@ public class Delay : Node, INodeAdditionalArgs<DelaySerializeInfo>
             return;
         }
 
-        _cts = _cts.CancelAndDisposeAndGetNew();
-        PushAsync(args.State, _cts.Token).Forget();
+        // 대기중인 값은 즉시 내보내고 새 값 예약
+        FlushPending();
+
+        _pendingState = args.State;
+        _pending = _delayType switch
+        {
+            DelayType.FixedTime => SimulationClock.ScheduleAfter(_delay * 0.001f, PushPending),
+            DelayType.Frame => SimulationClock.ScheduleFrames(_frameCount, PushPending),
+            _ => throw new ArgumentOutOfRangeException()
+        };
     }
 
     protected override void OnBeforeRemove()
     {
-        _cts.CancelAndDispose();
+        _pending?.Cancel();
+        _pending = null;
     }
 
-    private async UniTaskVoid PushAsync(Transition state, CancellationToken token)
+    private void PushPending()
     {
-        try
-        {
-            UniTask uniTask = _delayType switch
-            {
-                DelayType.FixedTime => UniTask.WaitForSeconds(_delay * 0.001f, cancellationToken: token, cancelImmediately: true),
-                DelayType.Frame => UniTask.DelayFrame(_frameCount, cancellationToken: token, cancelImmediately: true),
-                _ => throw new ArgumentOutOfRangeException()
-            };
-            await uniTask;
-            OutputToken[0].State = state;
-        }
-        catch (OperationCanceledException)
+        _pending = null;
+        OutputToken[0].State = _pendingState;
+    }
+
+    private void FlushPending()
+    {
+        if (_pending is not { IsPending: true })
         {
-            OutputToken[0].State = state;
+            return;
         }
+
+        _pending.Cancel();
+        PushPending();
     }
     
     private void SetType(TransitionType type)
     {
-        _cts.CancelAndDispose();
+        FlushPending();
         OutputToken.SetTypeAll(type);
         InputToken.SetTypeAll(type);
         ReportChanges();
@@ -163,7 +169,7 @@ public class Delay : Node, INodeAdditionalArgs<DelaySerializeInfo>
             return;
 
         // 기존 대기 작업 취소
-        _cts.CancelAndDispose();
+        FlushPending();
         
         _delayType = newDelayType;
         
@@ -1,18 +1,15 @@
-using System;
 using System.Collections.Generic;
-using System.Threading;
-using Cysharp.Threading.Tasks;
 using UnityEngine;
 
-public class FrequencyMeter : Node
+public class FrequencyMeter : Node, IRepeatedStateListenable
 {
     private List<ContextElement> _contexts;
-    private readonly Queue<float> _signalWindow = new();
-    private UniTask _currentTask = UniTask.CompletedTask;
-    private readonly SafetyCancellationTokenSource _cts = new(false);
+    private readonly Queue<long> _signalWindow = new(); // 신호 수신 시각 (SimulationClock ms)
+    private ClockTimer _expiry;
 
     private const float WINDOW_SIZE = 1.0f;
     private const float TARGET_PERIOD = 1.0f;
+    private const long WINDOW_MILLISECONDS = (long)(WINDOW_SIZE * 1000);
 
     protected override List<ContextElement> ContextElements
     {
@@ -68,44 +65,49 @@ public class FrequencyMeter : Node
 
     protected override void StateUpdate(TransitionEventArgs args)
     {
-        _signalWindow.Enqueue(Time.time);
+        _signalWindow.Enqueue(SimulationClock.Now);
+        PushFrequency();
 
-        if (_currentTask.Status == UniTaskStatus.Pending)
+        if (_expiry is not { IsPending: true })
         {
-            return;
+            ScheduleExpiry();
         }
-
-        _currentTask = AnalyzeFrequency();
     }
 
     protected override void OnBeforeRemove()
     {
-        _cts.CancelAndDispose();
+        _expiry?.Cancel();
+        _expiry = null;
     }
 
-    private async UniTask AnalyzeFrequency()
+    /// <summary>
+    /// 가장 오래된 신호가 윈도우를 벗어나는 시각에만 재계산 (매 프레임 폴링하지 않음)
+    /// </summary>
+    private void ScheduleExpiry()
     {
-        try
-        {
-            CancellationToken token = _cts.Token;
+        _expiry = SimulationClock.ScheduleAt(_signalWindow.Peek() + WINDOW_MILLISECONDS + 1, OnSignalExpired);
+    }
 
-            while (!token.IsCancellationRequested)
-            {
-                if (_signalWindow.Count <= 0)
-                    return;
+    private void OnSignalExpired()
+    {
+        long currentTime = SimulationClock.Now;
 
-                float currentTime = Time.time;
+        while (_signalWindow.Count > 0 && currentTime - _signalWindow.Peek() > WINDOW_MILLISECONDS)
+        {
+            _signalWindow.Dequeue();
+        }
 
-                while (!token.IsCancellationRequested && _signalWindow.Count > 0 && currentTime - _signalWindow.Peek() > WINDOW_SIZE)
-                {
-                    _signalWindow.Dequeue();
-                }
+        PushFrequency();
 
-                float frequency = _signalWindow.Count / WINDOW_SIZE * TARGET_PERIOD;
-                OutputToken.PushFirst(frequency);
-                await UniTask.Yield(PlayerLoopTiming.Update, token, true);
-            }
+        if (_signalWindow.Count > 0)
+        {
+            ScheduleExpiry();
         }
-        catch (OperationCanceledException) { }
+    }
+
+    private void PushFrequency()
+    {
+        float frequency = _signalWindow.Count / WINDOW_SIZE * TARGET_PERIOD;
+        OutputToken.PushFirst(frequency);
     }
 }
\ No newline at end of file
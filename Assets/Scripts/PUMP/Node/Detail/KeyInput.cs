@@ -1,4 +1,3 @@
-using Cysharp.Threading.Tasks;
 using System;
 using System.Collections.Generic;
 using System.Linq;
@@ -9,6 +8,7 @@ public class KeyInput : Node, INodeAdditionalArgs<KeyCode>
     private static bool _blockInput = false;
     private static object _inputBlocker = new();
     private static HashSet<KeyInput> _instances = new();
+    private static readonly List<KeyInput> _pollBuffer = new();
 
     private static bool BlockInput
     {
@@ -52,8 +52,6 @@ public class KeyInput : Node, INodeAdditionalArgs<KeyCode>
 
     private KeyCode _currentKeyCode = KeyCode.None;
 
-    private SafetyCancellationTokenSource _cts = new(false);
-
     public override string NodePrefabPath => "PUMP/Prefab/Node/KEY_INPUT";
 
     protected override string NodeDisplayName => "Key Input";
@@ -85,54 +83,66 @@ public class KeyInput : Node, INodeAdditionalArgs<KeyCode>
 
     protected override void OnAfterInit()
     {
-        _instances.Add(this);
+        // 모든 KeyInput은 SimulationClock 프레임 콜백 하나로 폴링
+        if (_instances.Add(this) && _instances.Count == 1)
+        {
+            SimulationClock.OnFrame += PollAll;
+        }
+
         InputSupport.Initialize(_currentKeyCode);
         InputSupport.OnValueChange += keyCode =>
         {
             _currentKeyCode = keyCode;
             ReportChanges();
         };
-        DetectingKeyInput().Forget();
     }
 
     protected override void OnBeforeRemove()
     {
-        _cts.CancelAndDispose();
         _instances.Remove(this);
 
         if (_instances.Count <= 0)
         {
+            SimulationClock.OnFrame -= PollAll;
             InputManager.RemoveBlocker(_inputBlocker);
         }
     }
 
     protected override void StateUpdate(TransitionEventArgs args) { }
 
-    private async UniTaskVoid DetectingKeyInput()
+    private static void PollAll()
     {
-        try
+        // 출력 전파 중 노드가 추가/제거될 수 있으므로 복사본 순회
+        _pollBuffer.Clear();
+        _pollBuffer.AddRange(_instances);
+
+        foreach (KeyInput instance in _pollBuffer)
         {
-            while (!_cts.IsCancellationRequested)
+            if (_instances.Contains(instance))
             {
-                await UniTask.Yield(_cts.Token);
-
-                if (Input.GetKey(_currentKeyCode))
-                {
-                    if (!OutputToken.FirstState)
-                    {
-                        OutputToken.PushFirst(true);
-                    }
-
-                    continue;
-                }
-
-                if (OutputToken.FirstState)
-                {
-                    OutputToken.PushFirst(false);
-                }
+                instance.DetectKeyInput();
             }
         }
-        catch (OperationCanceledException) { }
+
+        _pollBuffer.Clear();
+    }
+
+    private void DetectKeyInput()
+    {
+        if (Input.GetKey(_currentKeyCode))
+        {
+            if (!OutputToken.FirstState)
+            {
+                OutputToken.PushFirst(true);
+            }
+
+            return;
+        }
+
+        if (OutputToken.FirstState)
+        {
+            OutputToken.PushFirst(false);
+        }
     }
 
     private static string GetInputBlockText()
@@ -4,7 +4,7 @@ using System.Collections.Generic;
 using System.Linq;
 using UnityEngine;
 
-public class MinMax : DynamicIONode, INodeAdditionalArgs<MinMax.MinMaxSerializeInfo>
+public class MinMax : DynamicIONode, INodeAdditionalArgs<MinMax.MinMaxSerializeInfo>, IBatchStateUpdate
 {
     private List<ContextElement> _contexts;
 
@@ -28,6 +28,8 @@ public class MinMax : DynamicIONode, INodeAdditionalArgs<MinMax.MinMaxSerializeI
 
     protected override void StateUpdate(TransitionEventArgs args) => OutputToken.PushFirst(GetResult());
 
+    void IBatchStateUpdate.BatchStateUpdate(BatchStateEventArgs args) => OutputToken.PushFirst(GetResult());
+
     protected override string DefineInputName(int tpIndex) => $"in {tpIndex}";
 
     protected override string DefineOutputName(int tpIndex) => "out";
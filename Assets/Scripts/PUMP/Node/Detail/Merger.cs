@@ -1,7 +1,7 @@
 using System.Collections.Generic;
 using UnityEngine;
 
-public class Merger : DynamicIONode, INodeAdditionalArgs<int>
+public class Merger : DynamicIONode, INodeAdditionalArgs<int>, IBatchStateUpdate
 {
     private List<ContextElement> _contexts;
     private SplitterSupport _splitterSupport;
@@ -107,6 +107,17 @@ public class Merger : DynamicIONode, INodeAdditionalArgs<int>
         OutputToken.PushFirst(args.State);
     }
 
+    // 같은 Tick에 여러 입력이 바뀌면 마지막으로 갱신된 입력을 출력
+    void IBatchStateUpdate.BatchStateUpdate(BatchStateEventArgs args)
+    {
+        if (!InputToken.AllSameType || args.LastIndex < 0)
+        {
+            return;
+        }
+
+        OutputToken.PushFirst(InputToken[args.LastIndex].State);
+    }
+
     public int AdditionalArgs
     {
         get => InputCount;
@@ -1,7 +1,7 @@
 using System.Collections.Generic;
 using UnityEngine;
 
-public class Multiplexer : Node
+public class Multiplexer : Node, ICombinationalEvaluable, IBitParallelEvaluable
 {
     protected override string NodeDisplayName => "Mux";
 
@@ -58,4 +58,21 @@ public class Multiplexer : Node
                 break;
         }
     }
+
+    void IHeadlessEvaluable.Evaluate(HeadlessContext context)
+    {
+        if (!context.IsStateChange)
+            return;
+
+        if (context.HasOnlyNull)
+        {
+            context.PushFirst(TransitionType.Bool.Null());
+            return;
+        }
+
+        int s = ((context.GetInput(4) ? 1 : 0) << 1 | (context.GetInput(5) ? 1 : 0));
+        context.PushFirst(context.GetInput(s));
+    }
+
+    BitGateType IBitParallelEvaluable.BitGateType => BitGateType.Multiplexer;
 }
\ No newline at end of file
@@ -2,7 +2,7 @@ using System.Collections.Generic;
 using System.Linq;
 using UnityEngine;
 
-public class Multiply : DynamicIONode
+public class Multiply : DynamicIONode, ICombinationalEvaluable
 {
     private List<ContextElement> _contexts;
     private TransitionType _inputType = TransitionType.Int;
@@ -97,6 +97,40 @@ public class Multiply : DynamicIONode
         OutputToken.PushFirst(Operate());
     }
 
+    void IHeadlessEvaluable.Evaluate(HeadlessContext context)
+    {
+        if (!context.AllSameType)
+            return;
+
+        if (context.HasOnlyNull)
+        {
+            context.PushFirst(context.FirstType.Null());
+            return;
+        }
+
+        Transition one = context.GetInputType(0) switch
+        {
+            TransitionType.Int => Transition.One,
+            TransitionType.Float => Transition.FloatOne,
+            _ => context.FirstType.Null()
+        };
+
+        if (one.IsNull)
+        {
+            context.PushFirst(one);
+            return;
+        }
+
+        Transition mul = one;
+        for (int i = 0; i < context.InputCount; i++)
+        {
+            Transition current = context.GetInput(i);
+            mul *= current.IsNull ? one : current;
+        }
+
+        context.PushFirst(mul.Convert(context.FirstType));
+    }
+
     protected override void OnAfterInit()
     {
         SplitterSupport.Initialize(InputCount, value =>
@@ -1,7 +1,7 @@
 using System.Collections.Generic;
 using UnityEngine;
 
-public class NOT : Node
+public class NOT : Node, ICombinationalEvaluable, IBitParallelEvaluable
 {
     protected override string SpritePath => "PUMP/Sprite/ingame/LogicSymbols/NOT";
 
@@ -53,4 +53,20 @@ public class NOT : Node
 
         OutputToken[0].State = !InputToken[0].State;
     }
+
+    void IHeadlessEvaluable.Evaluate(HeadlessContext context)
+    {
+        if (!context.IsStateChange)
+            return;
+
+        if (context.HasOnlyNull)
+        {
+            context.PushFirst(TransitionType.Bool.Null());
+            return;
+        }
+
+        context.PushFirst(!context.GetInput(0));
+    }
+
+    BitGateType IBitParallelEvaluable.BitGateType => BitGateType.Not;
 }
\ No newline at end of file
@@ -4,12 +4,12 @@ using UnityEngine;
 public static class ChannelClock
 {
     public const int MaxChannels = 8;
-    private static readonly int[] _phaseFrames = new int[MaxChannels];
+    private static readonly long[] _phaseFrames = new long[MaxChannels];
 
     public static void AlignNow(int channel)
     {
         if (channel < 0 || channel >= MaxChannels) throw new ArgumentOutOfRangeException(nameof(channel));
-        _phaseFrames[channel] = Time.frameCount;
+        _phaseFrames[channel] = SimulationClock.Frame;
     }
 
     public static int FramesUntilNextTick(int channel, int periodFrames, bool emitImmediatelyIfAligned = true)
@@ -17,8 +17,8 @@ public static class ChannelClock
         if (channel < 0 || channel >= MaxChannels) throw new ArgumentOutOfRangeException(nameof(channel));
         if (periodFrames <= 0) periodFrames = 1;
 
-        int now = Time.frameCount;
-        int elapsed = (now - _phaseFrames[channel]) % periodFrames;
+        long now = SimulationClock.Frame;
+        int elapsed = (int)((now - _phaseFrames[channel]) % periodFrames);
         if (elapsed < 0) elapsed += periodFrames;
 
         int wait = (periodFrames - elapsed) % periodFrames;
@@ -2,7 +2,7 @@ using System.Collections.Generic;
 using System.Linq;
 using UnityEngine;
 
-public class OR : Node
+public class OR : Node, ICombinationalEvaluable, IBitParallelEvaluable
 {
     protected override string SpritePath => "PUMP/Sprite/ingame/LogicSymbols/OR";
 
@@ -54,4 +54,20 @@ public class OR : Node
 
         OutputToken[0].State = InputToken[0].State || InputToken[1].State;
     }
+
+    void IHeadlessEvaluable.Evaluate(HeadlessContext context)
+    {
+        if (!context.IsStateChange)
+            return;
+
+        if (context.HasOnlyNull)
+        {
+            context.PushFirst(TransitionType.Bool.Null());
+            return;
+        }
+
+        context.PushFirst(context.GetInput(0) || context.GetInput(1));
+    }
+
+    BitGateType IBitParallelEvaluable.BitGateType => BitGateType.Or;
 }
\ No newline at end of file
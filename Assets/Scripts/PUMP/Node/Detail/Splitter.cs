@@ -2,7 +2,7 @@ using System.Collections.Generic;
 using System.Linq;
 using UnityEngine;
 
-public class Splitter : DynamicIONode, INodeAdditionalArgs<int>
+public class Splitter : DynamicIONode, INodeAdditionalArgs<int>, ICombinationalEvaluable
 {
     private List<ContextElement> _contexts;
     private TransitionType _currentType = TransitionType.Bool;
@@ -81,6 +81,11 @@ public class Splitter : DynamicIONode, INodeAdditionalArgs<int>
         }
     }
 
+    void IHeadlessEvaluable.Evaluate(HeadlessContext context)
+    {
+        context.PushAll(context.State);
+    }
+
     protected override void OnAfterInit()
     {
         SplitterSupport.Initialize(OutputCount, value =>
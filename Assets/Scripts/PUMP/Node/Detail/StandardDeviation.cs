@@ -2,7 +2,7 @@ using System.Collections.Generic;
 using System.Linq;
 using UnityEngine;
 
-public class StandardDeviation : DynamicIONode, INodeAdditionalArgs<int>
+public class StandardDeviation : DynamicIONode, INodeAdditionalArgs<int>, IBatchStateUpdate
 {
     private SplitterSupport _splitterSupport;
     private TransitionType _inputType = TransitionType.Float;
@@ -83,7 +83,12 @@ public class StandardDeviation : DynamicIONode, INodeAdditionalArgs<int>
         });
     }
 
-    protected override void StateUpdate(TransitionEventArgs args)
+    protected override void StateUpdate(TransitionEventArgs args) => PushResult();
+
+    // 입력 여러 개가 같은 Tick에 바뀌어도 1회만 계산
+    void IBatchStateUpdate.BatchStateUpdate(BatchStateEventArgs args) => PushResult();
+
+    private void PushResult()
     {
         if (!InputToken.AllSameType)
             return;
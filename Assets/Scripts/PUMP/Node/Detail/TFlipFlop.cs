@@ -1,7 +1,7 @@
 using System.Collections.Generic;
 using UnityEngine;
 
-public class TFlipFlop : Node
+public class TFlipFlop : Node, IHeadlessEvaluable, IBitParallelEvaluable
 {
     protected override string NodeDisplayName => "TFF";
 
@@ -48,4 +48,25 @@ public class TFlipFlop : Node
                 break;
         }
     }
+
+    void IHeadlessEvaluable.Evaluate(HeadlessContext context)
+    {
+        switch (context.Index)
+        {
+            case 0 when context.IsNull:
+                context.PushAllAsNull();
+                return;
+            case 0 when context.BeforeState.IsNull:
+                context.PushFirst(true);
+                return;
+            case 0:
+                context.PushFirst(!context.FirstState);
+                return;
+            case 1 when !context.IsNull:
+                context.PushFirst(false);
+                break;
+        }
+    }
+
+    BitGateType IBitParallelEvaluable.BitGateType => BitGateType.TFlipFlop;
 }
\ No newline at end of file
@@ -1,7 +1,5 @@
 using System;
-using Cysharp.Threading.Tasks;
 using System.Collections.Generic;
-using System.Threading;
 using UnityEngine;
 using OdinSerializer;
 using Utils;
@@ -56,8 +54,7 @@ public class Timer : Node, INodeAdditionalArgs<TimerSerializeInfo>
 
         if (IsDeserialized && _arg._isStarted)
         {
-            _cts?.Cancel();
-            _timerTask = TimerStart(GetCancellationToken(), _currentTime);
+            TimerStart(_currentTime);
         }
     }
 
@@ -81,20 +78,16 @@ public class Timer : Node, INodeAdditionalArgs<TimerSerializeInfo>
 
     protected override void OnBeforeRemove()
     {
-        _isRemoved = true;
-        _cts?.Cancel();
-        _cts?.Dispose();
+        StopTimer();
     }
 
     #region Privates
     private TimerSupport _timerSupport;
     private float _maxTime = 5;
     private float _currentTime = 0;
-    private UniTask _timerTask = UniTask.CompletedTask;
-    private SafetyCancellationTokenSource _cts;
-    private bool _isRemoved;
+    private ClockTimer _expiry;
     private TimerSerializeInfo _arg;
-    private bool IsStarted => _timerTask.Status == UniTaskStatus.Pending;
+    private bool IsStarted => _expiry is { IsPending: true };
     private TimerSupport TimerSupport
     {
         get
@@ -112,47 +105,66 @@ public class Timer : Node, INodeAdditionalArgs<TimerSerializeInfo>
     private void OnTextChange(float value)
     {
         _maxTime = value;
-        if (_timerTask.Status != UniTaskStatus.Pending)
+        if (!IsStarted)
         {
             _currentTime = value;
         }
+        else if (GetRemainingTime() > _maxTime)
+        {
+            // 진행 중 최대 시간이 줄어들면 남은 시간을 잘라 재예약
+            TimerStart(_maxTime);
+        }
         ReportChanges();
     }
 
-    private async UniTask TimerStart(CancellationToken token, float startTime)
+    /// <summary>
+    /// 만료 시각을 SimulationClock에 등록. 진행도 표시만 프레임마다 갱신
+    /// </summary>
+    private void TimerStart(float startTime)
     {
+        StopTimer();
+
         _currentTime = Mathf.Clamp(startTime, 0f, _maxTime);
-        float progress = GetProgressValue();
-        TimerSupport.SliderUpdate(progress);
+        TimerSupport.SliderUpdate(GetProgressValue());
+
+        _expiry = SimulationClock.ScheduleAfter(_currentTime, OnTimerExpired);
+        SimulationClock.OnFrame += UpdateProgress;
+    }
+
+    private void StopTimer()
+    {
+        _expiry?.Cancel();
+        _expiry = null;
+        SimulationClock.OnFrame -= UpdateProgress;
+    }
 
-        try
+    private void UpdateProgress()
+    {
+        if (!IsStarted)
         {
-            while (_currentTime > 0f && !token.IsCancellationRequested)
-            {
-                await UniTask.Yield(token);
+            return;
+        }
 
-                if (_maxTime <= float.Epsilon)
-                {
-                    break;
-                }
+        _currentTime = GetRemainingTime();
+        TimerSupport.SliderUpdate(GetProgressValue());
+    }
 
-                _currentTime = Mathf.Clamp(_currentTime, 0f, _maxTime);
-                _currentTime -= Time.deltaTime;
-                progress = GetProgressValue();
-                TimerSupport.SliderUpdate(progress);
-            }
+    private void OnTimerExpired()
+    {
+        SimulationClock.OnFrame -= UpdateProgress;
+        _currentTime = 0f;
+        TimerSupport.SliderUpdate(0f);
+        OutputToken[0].State = Transition.Pulse();
+    }
 
-            _currentTime = 0f;
-            TimerSupport.SliderUpdate(0f);
-            OutputToken[0].State = Transition.Pulse();
-        }
-        catch (OperationCanceledException)
+    private float GetRemainingTime()
+    {
+        if (!IsStarted)
         {
-            if (_isRemoved || !Support.IsAlive())
-                return;
-
-            TimerSupport?.SliderUpdate(1f);
+            return _currentTime;
         }
+
+        return Mathf.Clamp((_expiry.Due - SimulationClock.Now) * 0.001f, 0f, _maxTime);
     }
 
     private float GetProgressValue()
@@ -168,23 +180,14 @@ public class Timer : Node, INodeAdditionalArgs<TimerSerializeInfo>
     private void RestartTimer()
     {
         ResetTimer();
-        _timerTask = TimerStart(GetCancellationToken(), _maxTime);
+        TimerStart(_maxTime);
     }
 
     private void ResetTimer()
     {
-        _cts?.Cancel();
+        StopTimer();
         TimerSupport.SliderUpdate(1f);
     }
-
-    private CancellationToken GetCancellationToken()
-    {
-        _cts?.Cancel();
-        _cts?.Dispose();
-
-        _cts = new SafetyCancellationTokenSource(false);
-        return _cts.Token;
-    }
     #endregion
 
     #region AdditionalArgs
@@ -194,7 +197,7 @@ public class Timer : Node, INodeAdditionalArgs<TimerSerializeInfo>
         {
             return new()
             {
-                _currentTime = _currentTime,
+                _currentTime = GetRemainingTime(),
                 _maxTime = _maxTime,
                 _isStarted = IsStarted
             };
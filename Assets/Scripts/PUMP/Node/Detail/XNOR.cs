@@ -1,7 +1,7 @@
 using System.Collections.Generic;
 using UnityEngine;
 
-public class XNOR : Node
+public class XNOR : Node, ICombinationalEvaluable, IBitParallelEvaluable
 {
     protected override string SpritePath => "PUMP/Sprite/ingame/LogicSymbols/XNOR";
 
@@ -53,4 +53,20 @@ public class XNOR : Node
 
         OutputToken[0].State = InputToken[0].State == InputToken[1].State;
     }
+
+    void IHeadlessEvaluable.Evaluate(HeadlessContext context)
+    {
+        if (!context.IsStateChange)
+            return;
+
+        if (context.HasOnlyNull)
+        {
+            context.PushFirst(TransitionType.Bool.Null());
+            return;
+        }
+
+        context.PushFirst(context.GetInput(0) == context.GetInput(1));
+    }
+
+    BitGateType IBitParallelEvaluable.BitGateType => BitGateType.Xnor;
 }
\ No newline at end of file
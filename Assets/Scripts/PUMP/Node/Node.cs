@@ -10,7 +10,7 @@ using UnityEngine.EventSystems;
 using Utils;
 
 [ResourceGetter("PUMP/Sprite/PaletteImage/palette_elem", "#225881", "#001A2F")]
-public abstract class Node : INodeLifecycleCallable, INodeSupportSettable, IDeserializingListenable
+public abstract class Node : INodeLifecycleCallable, INodeSupportSettable, IDeserializingListenable, IKernelBindable
 {
     #region Privates
     private bool _initialized = false;
@@ -21,6 +21,12 @@ public abstract class Node : INodeLifecycleCallable, INodeSupportSettable, IDese
     private bool _inEnumActive = true;
     private bool _outEnumActive = true;
 
+    private SimulationKernel _kernel;
+    private int _kernelIndex = -1;
+    private BatchStateEventArgs _batchArgs;         // IBatchStateUpdate: 이번 Tick에 누적중인 입력 변경
+    private BatchStateEventArgs _dispatchingBatchArgs;
+    private bool _isBatchQueued = false;
+
     private void CheckSupportEnumeratorNull()
     {
         if (Support == null)
@@ -84,6 +90,11 @@ public abstract class Node : INodeLifecycleCallable, INodeSupportSettable, IDese
 
     public bool IsDestroyed { get; private set; }
 
+    /// <summary>
+    /// SimulationKernel이 이 노드를 평가중인지 (StateUpdate 대신 IHeadlessEvaluable.Evaluate 호출)
+    /// </summary>
+    public bool IsKernelBound => _kernel != null;
+
     public bool IgnoreSelectedDelete { get; set; } = false;
 
     public bool IgnoreSelectedDisconnect { get; set; } = false;
@@ -150,11 +161,11 @@ public abstract class Node : INodeLifecycleCallable, INodeSupportSettable, IDese
 
         foreach (ITransitionPoint tp in inputTPs)
         {
-            tp.Connection?.Disconnect();
+            tp.DisconnectAll();
         }
         foreach (ITransitionPoint tp in outputTPs)
         {
-            tp.Connection?.Disconnect();
+            tp.DisconnectAll();
         }
 
         OnDisconnect?.Invoke(this);
@@ -166,7 +177,7 @@ public abstract class Node : INodeLifecycleCallable, INodeSupportSettable, IDese
     /// </summary>
     public void ReportChanges()
     {
-        ((IChangeObserver)Background)?.ReportChanges();
+        ((IChangeObserver)Background)?.ReportChanges(this);
     }
     #endregion
 
@@ -496,6 +507,21 @@ public abstract class Node : INodeLifecycleCallable, INodeSupportSettable, IDese
         _isSupportSet = true;
     }
 
+    void IKernelBindable.BindKernel(SimulationKernel kernel, int kernelIndex)
+    {
+        _kernel = kernel;
+        _kernelIndex = kernelIndex;
+    }
+
+    void IKernelBindable.UnbindKernel(SimulationKernel kernel)
+    {
+        if (_kernel != kernel)
+            return;
+
+        _kernel = null;
+        _kernelIndex = -1;
+    }
+
     private void SetOutputToken()
     {
         if (Support.OutputEnumerator == null)
@@ -613,6 +639,28 @@ public abstract class Node : INodeLifecycleCallable, INodeSupportSettable, IDese
         if (IsDestroyed)
             return;
 
+        // 커널에 바인딩 된 경우 커널에서 평가
+        if (_kernel != null)
+        {
+            _kernel.WriteInput(_kernelIndex, args.Index, args.State);
+            return;
+        }
+
+        // 입력 변경을 누적하고 Tick이 끝날 때 1회 호출
+        if (this is IBatchStateUpdate)
+        {
+            _batchArgs ??= new BatchStateEventArgs();
+            _batchArgs.Record(args.Index, args.BeforeState, args.State);
+
+            if (!_isBatchQueued)
+            {
+                _isBatchQueued = true;
+                StateUpdateBatcher.Enqueue(this);
+            }
+            return;
+        }
+
+        StateUpdateBatcher.BeginWave();
         try
         {
             StateUpdate(args);
@@ -622,6 +670,40 @@ public abstract class Node : INodeLifecycleCallable, INodeSupportSettable, IDese
             Debug.LogError("<color=red><b>[LIFE CYCLE: StateUpdate]</b></color>");
             Debug.LogException(e);
         }
+        finally
+        {
+            StateUpdateBatcher.EndWave();
+        }
+    }
+
+    void INodeLifecycleCallable.CallBatchStateUpdate()
+    {
+        _isBatchQueued = false;
+
+        // 호출 중 발생한 입력 변경(피드백)은 다음 배치로 누적되도록 교체
+        BatchStateEventArgs args = _batchArgs;
+        _batchArgs = _dispatchingBatchArgs;
+        _dispatchingBatchArgs = args;
+
+        if (args == null || args.Count == 0)
+            return;
+
+        try
+        {
+            if (!IsDestroyed && this is IBatchStateUpdate batchStateUpdate)
+            {
+                batchStateUpdate.BatchStateUpdate(args);
+            }
+        }
+        catch (Exception e)
+        {
+            Debug.LogError("<color=red><b>[LIFE CYCLE: BatchStateUpdate]</b></color>");
+            Debug.LogException(e);
+        }
+        finally
+        {
+            args.Clear();
+        }
     }
 
     void INodeLifecycleCallable.CallOnAfterInstantiate()
@@ -860,7 +942,8 @@ public class TPConnectionInfo
     public List<Vector2>[] InVertices { get; private set; }
 
     /// <summary>
-    /// 이 노드의 Out에 연결된 In들
+    /// 이 노드의 Out에 연결된 In들. Fan-out된 Out은 첫 번째 Connection(ITransitionPoint.Connection)만 기록
+    /// 나머지 분기는 각 In 쪽(InConnectionTargets, InVertices)에서 복원
     /// </summary>
     public ITransitionPoint[] OutConnectionTargets { get; private set; }
     public List<Vector2>[] OutVertices { get; private set; }
@@ -868,7 +951,7 @@ public class TPConnectionInfo
     public TPConnectionInfo(ITransitionPoint[] inConnections, ITransitionPoint[] outConnections)
     {
         SetConnectionTarget(inConnections, outConnections);
-        SetVertices();
+        SetVertices(inConnections, outConnections);
     }
 
     public TPConnectionInfo(ITransitionPoint[] inConnectionTargets, ITransitionPoint[] outConnectionTargets,
@@ -893,18 +976,20 @@ public class TPConnectionInfo
     }
     
     /// <summary>
-    /// 선분 정보
+    /// 선분 정보. 이 노드 TP 자신의 Connection에서 읽음
+    /// (상대 TPOut의 Connection은 Fan-out 시 첫 번째 분기이므로 In 쪽은 상대를 거치면 안 됨)
     /// </summary>
-    private void SetVertices()
+    private void SetVertices(ITransitionPoint[] inConnections, ITransitionPoint[] outConnections)
     {
-        InVertices = new List<Vector2>[InConnectionTargets.Length];
-        OutVertices = new List<Vector2>[OutConnectionTargets.Length];
+        InVertices = new List<Vector2>[inConnections.Length];
+        OutVertices = new List<Vector2>[outConnections.Length];
 
-        for (int i = 0; i < InConnectionTargets.Length; i++)
-            InVertices[i] = InConnectionTargets[i]?.Connection?.LineConnector.GetVertices();
+        for (int i = 0; i < inConnections.Length; i++)
+            InVertices[i] = inConnections[i]?.Connection?.LineConnector.GetVertices();
 
-        for (int i = 0;i < OutConnectionTargets.Length; i++)
-            OutVertices[i] = OutConnectionTargets[i]?.Connection?.LineConnector.GetVertices();
+        // Out: 첫 번째 분기 (OutConnectionTargets[i]와 같은 Connection)
+        for (int i = 0; i < outConnections.Length; i++)
+            OutVertices[i] = outConnections[i]?.Connection?.LineConnector.GetVertices();
     }
     #endregion
 
@@ -955,6 +1040,7 @@ public class TPConnectionInfo
 public interface INodeLifecycleCallable
 {
     void CallStateUpdate(TransitionEventArgs args);
+    void CallBatchStateUpdate();
     void CallOnAfterInstantiate();
     void CallOnAfterSetAdditionalArgs();
     void CallOnBeforeInit();
@@ -973,4 +1059,10 @@ public interface INodeLifecycleCallable
 public interface INodeSupportSettable
 {
     void SetSupport(NodeSupport support);
-}
\ No newline at end of file
+}
+
+/// <summary>
+/// 같은 값이 반복해서 들어와도 매번 StateUpdate가 필요한 노드 (이벤트 수 측정, 로그 등)
+/// ChangeOnly 전파 모드에서도 이 노드로 가는 Connection은 값을 비교하지 않고 전달한다.
+/// </summary>
+public interface IRepeatedStateListenable { }
\ No newline at end of file
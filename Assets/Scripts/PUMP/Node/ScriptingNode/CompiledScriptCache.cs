@@ -0,0 +1,167 @@
+using System;
+using System.Collections.Generic;
+using Microsoft.Scripting.Hosting;
+
+/// <summary>
+/// 스크립트 해시 → CompiledCode 캐시 (프로세스 전역, 스레드 안전).
+/// 같은 스크립트의 ScriptingNode는 한 번만 컴파일하고, CompiledCode 하나를 각자의 ScriptScope에 실행한다.
+/// 추정 메모리가 MemoryBudget을 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+/// </summary>
+public static class CompiledScriptCache
+{
+    #region Privates
+    private const ulong FNV_OFFSET = 14695981039346656037UL;
+    private const ulong FNV_PRIME = 1099511628211UL;
+    private const long ENTRY_BASE_SIZE = 4 * 1024;
+    private const long SIZE_PER_CHAR = 64; // 컴파일 결과(식 트리, 델리게이트) 추정치
+
+    private class Entry
+    {
+        public string Script;
+        public CompiledCode Code;
+        public long Size;
+        public LinkedListNode<ulong> LruNode;
+    }
+
+    private static readonly object _lock = new();
+    private static readonly Dictionary<ulong, Entry> _entries = new();
+    private static readonly LinkedList<ulong> _lru = new(); // First = 최근 사용
+    private static long _memoryUsage;
+
+    private static ulong ComputeHash(string script)
+    {
+        ulong hash = FNV_OFFSET;
+        foreach (char c in script)
+        {
+            hash = (hash ^ c) * FNV_PRIME;
+        }
+
+        return hash;
+    }
+
+    private static bool TryGetLocked(ulong hash, string script, out CompiledCode code)
+    {
+        // 해시 충돌 시 원문이 다르면 캐시 미스
+        if (_entries.TryGetValue(hash, out Entry entry) && entry.Script == script)
+        {
+            _lru.Remove(entry.LruNode);
+            _lru.AddFirst(entry.LruNode);
+            code = entry.Code;
+            return true;
+        }
+
+        code = null;
+        return false;
+    }
+
+    private static void RemoveLocked(Entry entry)
+    {
+        _lru.Remove(entry.LruNode);
+        _entries.Remove(entry.LruNode.Value);
+        _memoryUsage -= entry.Size;
+    }
+
+    private static void TrimLocked()
+    {
+        // 최근 항목 하나는 한도를 넘어도 유지
+        while (_memoryUsage > MemoryBudget && _lru.Count > 1)
+        {
+            RemoveLocked(_entries[_lru.Last.Value]);
+        }
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 캐시 추정 메모리 한도 (byte)
+    /// </summary>
+    public static long MemoryBudget { get; set; } = 64L * 1024 * 1024;
+
+    /// <summary>
+    /// 캐시 추정 메모리 (byte)
+    /// </summary>
+    public static long MemoryUsage
+    {
+        get
+        {
+            lock (_lock)
+            {
+                return _memoryUsage;
+            }
+        }
+    }
+
+    public static int Count
+    {
+        get
+        {
+            lock (_lock)
+            {
+                return _entries.Count;
+            }
+        }
+    }
+
+    /// <summary>
+    /// 캐시된 컴파일 결과. 없으면 compile로 컴파일 후 캐시 (컴파일 예외는 호출자에게 전달, 캐시하지 않음)
+    /// 워커 스레드에서 호출 가능. 컴파일은 lock 밖에서 실행
+    /// </summary>
+    public static CompiledCode GetOrAdd(string script, Func<string, CompiledCode> compile)
+    {
+        if (script == null)
+        {
+            throw new ArgumentNullException(nameof(script));
+        }
+
+        ulong hash = ComputeHash(script);
+        lock (_lock)
+        {
+            if (TryGetLocked(hash, script, out CompiledCode cached))
+            {
+                return cached;
+            }
+        }
+
+        CompiledCode code = compile(script);
+
+        lock (_lock)
+        {
+            // 다른 스레드가 먼저 컴파일한 경우 그 결과 사용
+            if (TryGetLocked(hash, script, out CompiledCode cached))
+            {
+                return cached;
+            }
+
+            if (_entries.TryGetValue(hash, out Entry collided))
+            {
+                RemoveLocked(collided);
+            }
+
+            Entry entry = new()
+            {
+                Script = script,
+                Code = code,
+                Size = ENTRY_BASE_SIZE + script.Length * SIZE_PER_CHAR,
+                LruNode = new LinkedListNode<ulong>(hash),
+            };
+
+            _entries[hash] = entry;
+            _lru.AddFirst(entry.LruNode);
+            _memoryUsage += entry.Size;
+            TrimLocked();
+        }
+
+        return code;
+    }
+
+    public static void Clear()
+    {
+        lock (_lock)
+        {
+            _entries.Clear();
+            _lru.Clear();
+            _memoryUsage = 0;
+        }
+    }
+    #endregion
+}
@@ -1,7 +1,7 @@
 using Cysharp.Threading.Tasks;
 using IronPython.Hosting;
+using IronPython.Runtime;
 using IronPython.Runtime.Types;
-using Microsoft.CSharp.RuntimeBinder;
 using Microsoft.Scripting;
 using Microsoft.Scripting.Hosting;
 using System;
@@ -10,6 +10,7 @@ using System.IO;
 using System.Linq;
 using System.Numerics;
 using System.Reflection;
+using System.Runtime.ExceptionServices;
 using UnityEngine;
 using Debug = UnityEngine.Debug;
 
@@ -23,8 +24,33 @@ printer = Printer()";
     private static CompiledCode _callbackCompiled;
     private static readonly object _initLock = new object();
     private static ScriptEngine _engine;
+    private static string _stdLibPath;
+    private static ScriptScope _templateScope;
+    private static string[] _preImportedModules = Array.Empty<string>();
+    private static UniTask? _warmUpTask;
+    private static readonly string[] _defaultPreImportModules = { "json", "re", "collections", "math" };
     private static readonly Type[] _availableType = new[] { typeof(bool), typeof(int), typeof(float), typeof(BigInteger), typeof(double), typeof(string) };
 
+    // 입력 값 박싱 캐시 (Python에 넘길 때 자주 쓰는 값은 할당 없이)
+    private const int BOXED_INT_MIN = -128;
+    private const int BOXED_INT_MAX = 1023;
+    private static readonly object _boxedTrue = true;
+    private static readonly object _boxedFalse = false;
+    private static readonly object _boxedFloatZero = 0f;
+    private static readonly object _boxedFloatOne = 1f;
+    private static readonly object[] _boxedInts = CreateBoxedInts();
+
+    private static object[] CreateBoxedInts()
+    {
+        object[] boxed = new object[BOXED_INT_MAX - BOXED_INT_MIN + 1];
+        for (int i = 0; i < boxed.Length; i++)
+        {
+            boxed[i] = BOXED_INT_MIN + i;
+        }
+
+        return boxed;
+    }
+
     private static string CallbacksScript
     {
         get
@@ -52,7 +78,7 @@ printer = Printer()";
                     return _callbackCompiled;
                 }
 
-                ScriptSource callbackScriptSource = _engine.CreateScriptSourceFromString(CallbacksScript);
+                ScriptSource callbackScriptSource = Engine.CreateScriptSourceFromString(CallbacksScript);
                 _callbackCompiled = callbackScriptSource.Compile();
             }
 
@@ -60,6 +86,11 @@ printer = Printer()";
         }
     }
 
+    /// <summary>
+    /// Application.streamingAssetsPath는 메인 스레드에서 먼저 읽어 둠 (WarmUpAsync())
+    /// </summary>
+    private static string StdLibPath => _stdLibPath ??= Path.Combine(Application.streamingAssetsPath, "IronPython.StdLib.3.4.2", "content", "lib");
+
     private static ScriptEngine Engine
     {
         get
@@ -72,7 +103,7 @@ printer = Printer()";
                 }
 
                 _engine = Python.CreateEngine();
-                string stdLibPath = Path.Combine(Application.streamingAssetsPath, "IronPython.StdLib.3.4.2", "content", "lib");
+                string stdLibPath = StdLibPath;
                 if (Directory.Exists(stdLibPath))
                 {
                     ICollection<string> paths = _engine.GetSearchPaths();
@@ -84,20 +115,111 @@ printer = Printer()";
             return _engine;
         }
     }
+
+    /// <summary>
+    /// 새 Scope. WarmUpAsync()로 미리 import한 모듈은 템플릿 Scope에서 복사 (import 생략)
+    /// </summary>
+    private static ScriptScope CreateScope()
+    {
+        ScriptScope scope = Engine.CreateScope();
+
+        ScriptScope template;
+        string[] modules;
+        lock (_initLock)
+        {
+            template = _templateScope;
+            modules = _preImportedModules;
+        }
+
+        if (template == null)
+        {
+            return scope;
+        }
+
+        foreach (string module in modules)
+        {
+            scope.SetVariable(module, template.GetVariable(module));
+        }
+
+        return scope;
+    }
+
+    /// <summary>
+    /// Unity API(Resources.Load, Application.streamingAssetsPath)로 읽는 값. 메인 스레드에서 호출
+    /// </summary>
+    private static void LoadUnityResources()
+    {
+        _ = StdLibPath;
+        _ = CallbacksScript;
+    }
+
+    private static async UniTask WarmUpInternalAsync(IReadOnlyList<string> modules)
+    {
+        try
+        {
+            // Unity API는 메인 스레드에서 ---------
+            LoadUnityResources();
+
+            await UniTask.RunOnThreadPool(() =>
+            {
+                ScriptEngine engine = Engine;
+
+                // script_bridge 컴파일 및 실행 경로 준비 ---------
+                CallbackCompiled.Execute(engine.CreateScope());
+
+                ScriptScope template = engine.CreateScope();
+                List<string> imported = new();
+                foreach (string module in modules)
+                {
+                    try
+                    {
+                        engine.Execute($"import {module}", template);
+                        imported.Add(module);
+                    }
+                    catch (Exception e)
+                    {
+                        Debug.LogWarning($"{nameof(ScriptCommunicator)}: Pre-import failed ({module}): {e.Message}");
+                    }
+                }
+
+                lock (_initLock)
+                {
+                    _preImportedModules = imported.ToArray();
+                    _templateScope = template;
+                }
+            });
+        }
+        catch (Exception e)
+        {
+            Debug.LogException(e);
+        }
+    }
+
+    /// <summary>
+    /// 같은 스크립트는 CompiledScriptCache의 컴파일 결과를 공유
+    /// </summary>
+    private static CompiledCode GetCompiledCode(string script)
+    {
+        return CompiledScriptCache.GetOrAdd(script, source => Engine.CreateScriptSourceFromString(source).Compile());
+    }
     #endregion
 
     #region Privates
     private Action<string> _logger;
     private Action<Exception> _exLogger;
-    private Action<List<dynamic>> _initAction;
+    private Action<PythonList> _initAction;
     private Action _terminateAction;
-    private Action<List<dynamic>, int, dynamic, dynamic, bool> _stateUpdateAction;
+    private Action<PythonList, int, object, object, bool> _stateUpdateAction;
     private Func<dynamic> _pulseInstanceGetter;
+    private object _pulseInstance;
+    private PythonList _inputs; // init(), state_update()에 넘기는 입력 리스트. 변경된 Index만 교체
     private SafetyCancellationTokenSource _asyncModeCts;
     private readonly string _pulseInstanceId = Guid.NewGuid().ToString();
     private bool _isAsync = false;
     private bool _isSetAsync = false;
     private bool _disposed = false;
+    private string _preparedScript;
+    private ExceptionDispatchInfo _prepareError;
 
     private ScriptScope Scope { get; set; }
 
@@ -134,13 +256,25 @@ printer = Printer()";
     #endregion
 
     #region Interface
+    /// <summary>
+    /// 엔진 생성, script_bridge 컴파일, 자주 쓰는 모듈 미리 import (워커 스레드). 첫 스크립트의 콜드 스타트 지연 제거
+    /// 메인 스레드에서 호출. 여러 번 호출해도 한 번만 실행
+    /// </summary>
+    /// <param name="modules">미리 import할 모듈. null이면 json, re, collections, math</param>
+    public static UniTask WarmUpAsync(IReadOnlyList<string> modules = null)
+    {
+        _warmUpTask ??= WarmUpInternalAsync(modules ?? _defaultPreImportModules).Preserve();
+        return _warmUpTask.Value;
+    }
+
     public static async UniTask<ScriptCommunicator> CreateAsync(Action<string> logger, Action<Exception> exLogger)
     {
         try
         {
             ScriptCommunicator communicator = new ScriptCommunicator();
 
-            await UniTask.RunOnThreadPool(() => { communicator.Scope = Engine.CreateScope(); });
+            LoadUnityResources();
+            await UniTask.RunOnThreadPool(() => { communicator.Scope = CreateScope(); });
 
             CallbackCompiled.Execute(communicator.Scope);
             communicator.Scope.SetVariable("reference_ex_logger", new Action<string>(communicator.LoggingMissingReference));
@@ -160,7 +294,7 @@ printer = Printer()";
         try
         {
             ScriptCommunicator communicator = new ScriptCommunicator();
-            communicator.Scope = Engine.CreateScope();
+            communicator.Scope = CreateScope();
             CallbackCompiled.Execute(communicator.Scope);
             communicator.Scope.SetVariable("reference_ex_logger", new Action<string>(communicator.LoggingMissingReference));
             communicator._logger = logger;
@@ -174,6 +308,59 @@ printer = Printer()";
         }
     }
 
+    /// <summary>
+    /// 엔진 생성, script_bridge 읽기와 컴파일. Unity API를 쓰므로 메인 스레드에서 호출
+    /// 워커 스레드에서 Prepare()를 호출하기 전에 필요 (이미 준비되어 있으면 바로 반환)
+    /// </summary>
+    public static void EnsureBridge()
+    {
+        LoadUnityResources();
+        _ = CallbackCompiled;
+    }
+
+    /// <summary>
+    /// Scope 생성, 스크립트 컴파일과 실행까지 미리 진행 (EnsureBridge() 이후 워커 스레드에서 호출 가능)
+    /// 메인 스레드에서 SetLoggers() 후 같은 스크립트로 SetScript()를 호출하면 멤버 바인딩만 실행. 실행 오류도 그때 보고
+    /// </summary>
+    /// <returns>Scope 생성 실패 시 null</returns>
+    public static ScriptCommunicator Prepare(string script)
+    {
+        ScriptCommunicator communicator = new ScriptCommunicator();
+
+        try
+        {
+            communicator.Scope = CreateScope();
+            CallbackCompiled.Execute(communicator.Scope);
+            communicator.Scope.SetVariable("reference_ex_logger", new Action<string>(communicator.LoggingMissingReference));
+        }
+        catch (Exception e)
+        {
+            Debug.LogException(e);
+            return null;
+        }
+
+        try
+        {
+            GetCompiledCode(script).Execute(communicator.Scope);
+        }
+        catch (Exception e)
+        {
+            communicator._prepareError = ExceptionDispatchInfo.Capture(e);
+        }
+
+        communicator._preparedScript = script;
+        return communicator;
+    }
+
+    /// <summary>
+    /// Prepare()로 만든 경우 SetScript() 전에 호출
+    /// </summary>
+    public void SetLoggers(Action<string> logger, Action<Exception> exLogger)
+    {
+        _logger = logger;
+        _exLogger = exLogger;
+    }
+
     public ScriptFieldInfo ScriptFieldInfo { get; private set; }
     public event Action<IList<Transition?>> OnOutputApply;
     public event Action<int, Transition?> OnOutputApplyAt;
@@ -191,8 +378,7 @@ printer = Printer()";
         {
             await UniTask.RunOnThreadPool(() =>
             {
-                ScriptSource scriptSource = _engine.CreateScriptSourceFromString(script);
-                CompiledCode compiledCode = scriptSource.Compile();
+                CompiledCode compiledCode = GetCompiledCode(script);
                 compiledCode.Execute(Scope);
             });
 
@@ -224,6 +410,7 @@ printer = Printer()";
 
             Engine.Execute(CALLBACKS_INJECT_CODE, Scope);
             _pulseInstanceGetter = Scope.GetVariable("get_pulse_instance");
+            _pulseInstance = _pulseInstanceGetter();
             _pulseInstanceGetter()._set_instance_id(_pulseInstanceId);
             EssentialMembers["output_applier"] = Scope.GetVariable("output_applier");
             EssentialMembers["printer"] = Scope.GetVariable("printer");
@@ -270,9 +457,11 @@ printer = Printer()";
     {
         try
         {
-            ScriptSource scriptSource = _engine.CreateScriptSourceFromString(script);
-            CompiledCode compiledCode = scriptSource.Compile();
-            compiledCode.Execute(Scope);
+            if (!TakePreparedScript(script))
+            {
+                CompiledCode compiledCode = GetCompiledCode(script);
+                compiledCode.Execute(Scope);
+            }
 
             Dictionary<string, dynamic> tempMembers = new Dictionary<string, dynamic>();
 
@@ -302,6 +491,7 @@ printer = Printer()";
 
             Engine.Execute(CALLBACKS_INJECT_CODE, Scope);
             _pulseInstanceGetter = Scope.GetVariable("get_pulse_instance");
+            _pulseInstance = _pulseInstanceGetter();
             _pulseInstanceGetter()._set_instance_id(_pulseInstanceId);
             EssentialMembers["output_applier"] = Scope.GetVariable("output_applier");
             EssentialMembers["printer"] = Scope.GetVariable("printer");
@@ -340,22 +530,12 @@ printer = Printer()";
     }
 
     /// <summary>
-    /// Python 스크립트 init 호출
+    /// Python 스크립트 init 호출. 입력 리스트를 inputToken 전체로 다시 채움
     /// </summary>
-    public void InvokeInit(List<Transition> inputTokenState)
+    public void InvokeInit(TPEnumeratorToken inputToken)
     {
-        List<dynamic> dynamicStateList = inputTokenState.Select(state =>
-        {
-            dynamic dynamicState = state.GetValueAsDynamic();
-
-            if (dynamicState is Pulse)
-            {
-                return _pulseInstanceGetter();
-            }
-
-            return dynamicState;
-        }).ToList();
-
+        SyncInputs(inputToken);
+        PythonList inputs = IsAsync ? CopyInputs() : _inputs;
 
         if (IsAsync)
         {
@@ -363,7 +543,7 @@ printer = Printer()";
             {
                 try
                 {
-                    _initAction?.Invoke(dynamicStateList);
+                    _initAction?.Invoke(inputs);
                 }
                 catch (Exception e)
                 {
@@ -381,7 +561,7 @@ printer = Printer()";
 
         try
         {
-            _initAction?.Invoke(dynamicStateList);
+            _initAction?.Invoke(inputs);
         }
         catch (Exception e)
         {
@@ -405,10 +585,9 @@ printer = Printer()";
 
     /// <summary>
     /// Python 스크립트 state_update 호출
+    /// 입력 리스트는 args.Index만 교체. 개수가 다르면(init 이전 등) inputToken 전체로 다시 채움
     /// </summary>
-    /// <param name="args"></param>
-    /// <param name="inputTokenState"></param>
-    public void InvokeStateUpdate(TransitionEventArgs args, List<Transition> inputTokenState)
+    public void InvokeStateUpdate(TransitionEventArgs args, TPEnumeratorToken inputToken)
     {
         if (args == null)
         {
@@ -419,23 +598,20 @@ printer = Printer()";
 
         // Create Arguments
         int index = args.Index;
-        dynamic state = args.State.GetValueAsDynamic();
-        state = state is Pulse ? _pulseInstanceGetter() : state;
-        dynamic beforeState = args.BeforeState.GetValueAsDynamic();
-        beforeState = beforeState is Pulse ? _pulseInstanceGetter : beforeState;
+        object state = ToPython(args.State);
+        object beforeState = ToPython(args.BeforeState);
         bool isStateChange = args.IsStateChange;
 
-        List<dynamic> dynamicStateList = inputTokenState.Select(state =>
+        if (_inputs != null && _inputs.Count == inputToken.Count && index >= 0 && index < _inputs.Count)
         {
-            dynamic dynamicState = state.GetValueAsDynamic();
-
-            if (dynamicState is Pulse)
-            {
-                return _pulseInstanceGetter();
-            }
+            _inputs[index] = state;
+        }
+        else
+        {
+            SyncInputs(inputToken);
+        }
 
-            return dynamicState;
-        }).ToList();
+        PythonList inputs = IsAsync ? CopyInputs() : _inputs;
 
         if (IsAsync)
         {
@@ -443,7 +619,7 @@ printer = Printer()";
                 {
                     try
                     {
-                        _stateUpdateAction?.Invoke(dynamicStateList, index, state, beforeState, isStateChange);
+                        _stateUpdateAction?.Invoke(inputs, index, state, beforeState, isStateChange);
                     }
                     catch (Exception e)
                     {
@@ -461,7 +637,7 @@ printer = Printer()";
 
         try
         {
-            _stateUpdateAction?.Invoke(dynamicStateList, index, state, beforeState, isStateChange);
+            _stateUpdateAction?.Invoke(inputs, index, state, beforeState, isStateChange);
         }
         catch (Exception e)
         {
@@ -489,6 +665,7 @@ printer = Printer()";
             _initAction = null;
             _stateUpdateAction = null;
             _terminateAction = null;
+            _inputs = null;
             _logger = null;
             _exLogger = null;
             OnOutputApply = null;
@@ -506,6 +683,75 @@ printer = Printer()";
     #endregion
 
     #region Privates
+    /// <summary>
+    /// Transition => Python 값. 자주 쓰는 값은 캐시된 박싱 객체, Pulse는 스크립트의 Pulse 인스턴스
+    /// </summary>
+    private object ToPython(Transition state)
+    {
+        if (state.Type == TransitionType.None)
+        {
+            throw new TransitionNoneTypeException();
+        }
+
+        if (state.IsNull)
+        {
+            return null;
+        }
+
+        switch (state.Type)
+        {
+            case TransitionType.Bool:
+                return state.Value.BoolValue ? _boxedTrue : _boxedFalse;
+
+            case TransitionType.Int:
+                int intValue = state.Value.IntValue;
+                return intValue >= BOXED_INT_MIN && intValue <= BOXED_INT_MAX ? _boxedInts[intValue - BOXED_INT_MIN] : intValue;
+
+            case TransitionType.Float:
+                float floatValue = state.Value.FloatValue;
+                if (floatValue == 1f)
+                {
+                    return _boxedFloatOne;
+                }
+
+                return floatValue == 0f && !float.IsNegative(floatValue) ? _boxedFloatZero : floatValue;
+
+            case TransitionType.String:
+                return state.Value.StringValue;
+
+            case TransitionType.Pulse:
+                return _pulseInstance;
+
+            default:
+                return null;
+        }
+    }
+
+    private void SyncInputs(TPEnumeratorToken inputToken)
+    {
+        _inputs ??= new PythonList();
+        _inputs.Clear();
+
+        for (int i = 0; i < inputToken.Count; i++)
+        {
+            _inputs.append(ToPython(inputToken[i].State));
+        }
+    }
+
+    /// <summary>
+    /// 비동기 모드: 워커 스레드 실행 중 메인 스레드에서 _inputs를 바꾸므로 호출마다 복사본 전달
+    /// </summary>
+    private PythonList CopyInputs()
+    {
+        PythonList copy = new();
+        for (int i = 0; i < _inputs.Count; i++)
+        {
+            copy.append(_inputs[i]);
+        }
+
+        return copy;
+    }
+
     private bool RegistrationMembers()
     {
         try
@@ -513,9 +759,9 @@ printer = Printer()";
             OutputApplier = EssentialMembers["output_applier"];
             OutputApplier.set_callback
             (
-                new Action<IList<dynamic>>(InvokeApplyOutput), 
-                new Action<int, dynamic>(InvokeApplyOutputAt), 
-                new Action<string, dynamic>(InvokeApplyOutputTo)
+                new Action<IList<object>>(InvokeApplyOutput), 
+                new Action<int, object>(InvokeApplyOutputAt), 
+                new Action<string, object>(InvokeApplyOutputTo)
             );
 
             Printer = EssentialMembers["printer"];
@@ -637,30 +883,63 @@ printer = Printer()";
         action?.Invoke();
     }
 
-    private void InvokeApplyOutput(IList<dynamic> values)
+    /// <summary>
+    /// 스크립트 출력 값 => Transition. 자주 쓰는 타입은 dynamic 바인딩 없이 변환
+    /// Pulse는 이 Scope의 Pulse 인스턴스와 참조 비교
+    /// </summary>
+    private Transition? ToTransition(object value)
+    {
+        if (value == null)
+        {
+            return null;
+        }
+
+        if (ReferenceEquals(value, _pulseInstance))
+        {
+            return Transition.Pulse();
+        }
+
+        switch (value)
+        {
+            case bool b:
+                return new Transition(b);
+
+            case int i:
+                return new Transition(i);
+
+            case BigInteger bi:
+                int clamped = bi < int.MinValue ? int.MinValue : bi > int.MaxValue ? int.MaxValue : (int)bi;
+                return new Transition(clamped);
+
+            case double d:
+                return new Transition((float)d);
+
+            case float f:
+                return new Transition(f);
+
+            case string s:
+                return new Transition(s);
+
+            case Pulse:
+                return Transition.Pulse();
+
+            default:
+                // 그 외 타입(.NET 숫자 등)은 기존 dynamic 생성자 규칙으로
+                return new Transition((dynamic)value);
+        }
+    }
+
+    private void InvokeApplyOutput(IList<object> values)
     {
         void applyAction()
         {
             try
             {
-                List<Transition?> transitions = values.Select<dynamic, Transition?>(value =>
-                    {
-                        if (value == null) return null;
-
-                        try
-                        {
-                            if (value._get_instance_id() == _pulseInstanceId)
-                            {
-                                return Transition.Pulse();
-                            }
-                        }
-                        catch (RuntimeBinderException)
-                        {
-                        }
-
-                        return new Transition(value);
-                    })
-                    .ToList();
+                List<Transition?> transitions = new(values.Count);
+                for (int i = 0; i < values.Count; i++)
+                {
+                    transitions.Add(ToTransition(values[i]));
+                }
 
                 OnOutputApply?.Invoke(transitions);
             }
@@ -684,31 +963,13 @@ printer = Printer()";
         InvokeActionOnMainThread(applyAction, IsAsync);
     }
 
-    private void InvokeApplyOutputAt(int index, dynamic value)
+    private void InvokeApplyOutputAt(int index, object value)
     {
         void applyAction()
         {
             try
             {
-                if (value == null)
-                {
-                    OnOutputApplyAt?.Invoke(index, null);
-                    return;
-                }
-
-                try
-                {
-                    if (value._get_instance_id() == _pulseInstanceId)
-                    {
-                        OnOutputApplyAt?.Invoke(index, Transition.Pulse());
-                        return;
-                    }
-                }
-                catch (RuntimeBinderException)
-                {
-                }
-
-                OnOutputApplyAt?.Invoke(index, new Transition(value));
+                OnOutputApplyAt?.Invoke(index, ToTransition(value));
             }
             catch (TransitionException tEx)
             {
@@ -730,31 +991,13 @@ printer = Printer()";
         InvokeActionOnMainThread(applyAction, IsAsync);
     }
 
-    private void InvokeApplyOutputTo(string name, dynamic value)
+    private void InvokeApplyOutputTo(string name, object value)
     {
         void applyAction()
         {
             try
             {
-                if (value == null)
-                {
-                    OnOutputApplyTo?.Invoke(name, null);
-                    return;
-                }
-
-                try
-                {
-                    if (value._get_instance_id() == _pulseInstanceId)
-                    {
-                        OnOutputApplyTo?.Invoke(name, Transition.Pulse());
-                        return;
-                    }
-                }
-                catch (RuntimeBinderException)
-                {
-                }
-
-                OnOutputApplyTo?.Invoke(name, new Transition(value));
+                OnOutputApplyTo?.Invoke(name, ToTransition(value));
             }
             catch (TransitionException tEx)
             {
@@ -799,6 +1042,23 @@ printer = Printer()";
         InvokeActionOnMainThread(printAction, IsAsync);
     }
 
+    /// <summary>
+    /// Prepare()에서 이미 실행한 스크립트면 true. 실행 중 발생한 예외는 여기서 다시 던짐
+    /// </summary>
+    private bool TakePreparedScript(string script)
+    {
+        if (_preparedScript == null || _preparedScript != script)
+        {
+            return false;
+        }
+
+        ExceptionDispatchInfo error = _prepareError;
+        _preparedScript = null;
+        _prepareError = null;
+        error?.Throw();
+        return true;
+    }
+
     private void LoggingMissingReference(string assembly)
     {
         throw new MissingReferenceException($"Except: add_reference({assembly})");
@@ -0,0 +1,17 @@
+using System.Collections.Generic;
+using Cysharp.Threading.Tasks;
+using UnityEngine;
+
+/// <summary>
+/// 시작 시 IronPython 엔진을 워커 스레드에서 미리 준비 (선택 사항, 첫 씬에 배치)
+/// 첫 ScriptingNode 배치 / 스크립트가 있는 보드 불러오기의 콜드 스타트 지연 제거
+/// </summary>
+public class ScriptEngineWarmUp : MonoBehaviour
+{
+    [SerializeField] private List<string> m_PreImportModules = new() { "json", "re", "collections", "math" };
+
+    private void Start()
+    {
+        ScriptCommunicator.WarmUpAsync(m_PreImportModules).Forget();
+    }
+}
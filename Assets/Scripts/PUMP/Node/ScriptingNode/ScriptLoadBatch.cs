@@ -0,0 +1,187 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+/// <summary>
+/// 보드 불러오기 한 번에 포함된 ScriptingNode 스크립트를 워커 스레드에서 동시에 준비 (Scope 생성, 컴파일, 실행)
+/// 메인 스레드의 ScriptingNode.OnAfterInit()은 준비된 ScriptCommunicator를 받아 멤버, TP 바인딩만 실행
+/// init() 호출은 기존처럼 OnBeforeReplayPending()에서 노드 순서대로
+/// </summary>
+public class ScriptLoadBatch : IDisposable
+{
+    #region Privates
+    // Begin()으로 활성화된 배치. 메인 스레드 전용, 나중에 시작한 배치부터 검색
+    private static readonly List<ScriptLoadBatch> _active = new();
+
+    private readonly Dictionary<string, Queue<ScriptCommunicator>> _prepared = new();
+    private bool _disposed;
+
+    private ScriptLoadBatch() { }
+
+    private static List<string> CollectScripts(List<SerializeNodeInfo> infos)
+    {
+        List<string> scripts = new();
+        if (infos == null)
+        {
+            return scripts;
+        }
+
+        // 중첩 ClassedNode의 내부 Background는 불러오기가 끝난 뒤 따로 SetInfos() (그때 별도 배치)
+        foreach (SerializeNodeInfo info in infos)
+        {
+            if (info.NodeAdditionalArgs is ScriptingNode.ScriptingNodeSerializeInfo scriptInfo && !string.IsNullOrEmpty(scriptInfo._script))
+            {
+                scripts.Add(scriptInfo._script);
+            }
+        }
+
+        return scripts;
+    }
+
+    private bool TryTakeLocal(string script, out ScriptCommunicator communicator)
+    {
+        if (_prepared.TryGetValue(script, out Queue<ScriptCommunicator> queue) && queue.Count > 0)
+        {
+            communicator = queue.Dequeue();
+            return true;
+        }
+
+        communicator = null;
+        return false;
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 동시에 준비할 최대 스크립트 수
+    /// </summary>
+    public static int MaxDegreeOfParallelism { get; set; } = Math.Max(1, Environment.ProcessorCount - 1);
+
+    /// <summary>
+    /// 준비된 ScriptCommunicator 수 (아직 가져가지 않은 것)
+    /// </summary>
+    public int Count { get; private set; }
+
+    /// <summary>
+    /// infos에 ScriptingNode가 있으면 ScriptCommunicator.EnsureBridge(). Prepare() 전에 메인 스레드에서 호출
+    /// </summary>
+    public static void EnsureBridge(List<SerializeNodeInfo> infos)
+    {
+        if (CollectScripts(infos).Count > 0)
+        {
+            ScriptCommunicator.EnsureBridge();
+        }
+    }
+
+    /// <summary>
+    /// infos의 ScriptingNode마다 ScriptCommunicator 하나씩 준비. 모두 끝날 때까지 대기
+    /// EnsureBridge() 이후 워커 스레드에서 호출 가능. 취소되면 이미 준비한 것을 정리하고 OperationCanceledException
+    /// </summary>
+    public static ScriptLoadBatch Prepare(List<SerializeNodeInfo> infos, CancellationToken token = default)
+    {
+        ScriptLoadBatch batch = new();
+
+        List<string> scripts = CollectScripts(infos);
+        if (scripts.Count == 0)
+        {
+            return batch;
+        }
+
+        ScriptCommunicator[] communicators = new ScriptCommunicator[scripts.Count];
+        ParallelOptions options = new() { MaxDegreeOfParallelism = Math.Max(1, MaxDegreeOfParallelism), CancellationToken = token };
+        try
+        {
+            Parallel.For(0, scripts.Count, options, i => communicators[i] = ScriptCommunicator.Prepare(scripts[i]));
+        }
+        catch (OperationCanceledException)
+        {
+            foreach (ScriptCommunicator communicator in communicators)
+            {
+                communicator?.Dispose();
+            }
+
+            throw;
+        }
+
+        for (int i = 0; i < scripts.Count; i++)
+        {
+            if (communicators[i] == null)
+            {
+                continue;
+            }
+
+            if (!batch._prepared.TryGetValue(scripts[i], out Queue<ScriptCommunicator> queue))
+            {
+                queue = new Queue<ScriptCommunicator>();
+                batch._prepared.Add(scripts[i], queue);
+            }
+
+            queue.Enqueue(communicators[i]);
+            batch.Count++;
+        }
+
+        return batch;
+    }
+
+    /// <summary>
+    /// 활성화. Dispose()까지 TryTake()에서 이 배치의 결과를 사용. 메인 스레드에서 호출
+    /// </summary>
+    public ScriptLoadBatch Begin()
+    {
+        if (!_disposed && !_active.Contains(this))
+        {
+            _active.Add(this);
+        }
+
+        return this;
+    }
+
+    /// <summary>
+    /// 활성 배치에서 script로 준비된 ScriptCommunicator를 꺼냄. 메인 스레드에서 호출
+    /// 꺼낸 ScriptCommunicator는 SetLoggers() 후 같은 script로 SetScript() 호출
+    /// </summary>
+    public static bool TryTake(string script, out ScriptCommunicator communicator)
+    {
+        if (!string.IsNullOrEmpty(script))
+        {
+            for (int i = _active.Count - 1; i >= 0; i--)
+            {
+                if (_active[i].TryTakeLocal(script, out communicator))
+                {
+                    _active[i].Count--;
+                    return true;
+                }
+            }
+        }
+
+        communicator = null;
+        return false;
+    }
+
+    /// <summary>
+    /// 비활성화, 사용되지 않은 ScriptCommunicator 정리
+    /// </summary>
+    public void Dispose()
+    {
+        if (_disposed)
+        {
+            return;
+        }
+
+        _disposed = true;
+        _active.Remove(this);
+
+        foreach (Queue<ScriptCommunicator> queue in _prepared.Values)
+        {
+            foreach (ScriptCommunicator communicator in queue)
+            {
+                communicator.Dispose();
+            }
+        }
+
+        _prepared.Clear();
+        Count = 0;
+    }
+    #endregion
+}
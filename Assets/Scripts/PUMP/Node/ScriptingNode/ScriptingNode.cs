@@ -179,7 +179,9 @@ public class ScriptingNode : DynamicIONode, INodeAdditionalArgs<ScriptingNodeSer
             return;
         }
 
-        InternalAddScript(FileName, Script);
+        // 불러오기 배치(ScriptLoadBatch)에서 미리 실행한 결과가 있으면 바인딩만
+        ScriptLoadBatch.TryTake(Script, out ScriptCommunicator prepared);
+        InternalAddScript(FileName, Script, prepared);
     }
 
     protected override void OnBeforeReplayPending(bool[] pendings)
@@ -212,7 +214,7 @@ public class ScriptingNode : DynamicIONode, INodeAdditionalArgs<ScriptingNodeSer
 
     protected override void StateUpdate(TransitionEventArgs args)
     {
-        Communicator?.InvokeStateUpdate(args, InputToken.Select(sf => sf.State).ToList());
+        Communicator?.InvokeStateUpdate(args, InputToken);
     }
 
     protected override void OnBeforeRemove()
@@ -273,7 +275,11 @@ public class ScriptingNode : DynamicIONode, INodeAdditionalArgs<ScriptingNodeSer
         }
     }
 
-    private void InternalAddScript(string fileName, string script)
+    /// <summary>
+    /// 스크립트 설정 후 TP 바인딩
+    /// </summary>
+    /// <param name="prepared">ScriptCommunicator.Prepare(script) 결과. null이면 여기서 생성, 컴파일, 실행</param>
+    private void InternalAddScript(string fileName, string script, ScriptCommunicator prepared = null)
     {
         try
         {
@@ -283,10 +289,19 @@ public class ScriptingNode : DynamicIONode, INodeAdditionalArgs<ScriptingNodeSer
 
             if (string.IsNullOrEmpty(Script))
             {
+                prepared?.Dispose();
                 return;
             }
 
-            Communicator = ScriptCommunicator.Create(ScriptingSupport.Log, ScriptingSupport.LogException);
+            if (prepared != null)
+            {
+                prepared.SetLoggers(ScriptingSupport.Log, ScriptingSupport.LogException);
+                Communicator = prepared;
+            }
+            else
+            {
+                Communicator = ScriptCommunicator.Create(ScriptingSupport.Log, ScriptingSupport.LogException);
+            }
 
             if (Communicator.SetScript(Script))
             {
@@ -349,7 +364,7 @@ public class ScriptingNode : DynamicIONode, INodeAdditionalArgs<ScriptingNodeSer
 
         try
         {
-            Communicator.InvokeInit(InputToken.Select(tp => tp.State).ToList());
+            Communicator.InvokeInit(InputToken);
         }
         catch (Exception e)
         {
@@ -509,7 +524,7 @@ public class ScriptingNode : DynamicIONode, INodeAdditionalArgs<ScriptingNodeSer
     }
 
     [Serializable]
-    public struct ScriptingNodeSerializeInfo
+    public struct ScriptingNodeSerializeInfo : IEquatable<ScriptingNodeSerializeInfo>
     {
         [OdinSerialize] public int _inputCount;
         [OdinSerialize] public int _outputCount;
@@ -520,6 +535,18 @@ public class ScriptingNode : DynamicIONode, INodeAdditionalArgs<ScriptingNodeSer
         {
             return $"input: {_inputCount}\noutput: {_outputCount}\nfileName: {_fileName}\nscript: {_script}";
         }
+
+        public bool Equals(ScriptingNodeSerializeInfo other)
+        {
+            return _inputCount == other._inputCount &&
+                   _outputCount == other._outputCount &&
+                   string.Equals(_fileName, other._fileName, StringComparison.Ordinal) &&
+                   string.Equals(_script, other._script, StringComparison.Ordinal);
+        }
+
+        public override bool Equals(object obj) => obj is ScriptingNodeSerializeInfo other && Equals(other);
+
+        public override int GetHashCode() => HashCode.Combine(_inputCount, _outputCount, _fileName, _script);
     }
     #endregion
 }
\ No newline at end of file
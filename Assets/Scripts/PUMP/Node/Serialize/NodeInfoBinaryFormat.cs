@@ -0,0 +1,864 @@
+using System;
+using System.Buffers.Binary;
+using System.Collections.Generic;
+using System.Text;
+using OdinSerializer;
+using UnityEngine;
+
+/// <summary>
+/// 세이브 본문(PUMPSaveDataStructure) 전용 바이너리 형식 (v2)
+/// - 노드 타입 문자열 테이블 + 노드별 테이블 인덱스
+/// - 열 단위 배열: 위치, 배열 길이, TP 타입, TP 상태, StatePending 비트, 연결
+/// - 정수는 varint, Vertices는 이전 값과의 비트 XOR를 varint로 기록 (무손실)
+/// - ClassedNode, ScriptingNode의 NodeAdditionalArgs는 직접 기록 (중첩 모듈 구조도 같은 열 단위 형식으로 재귀 기록)
+/// - 그 밖의 형식이 정해지지 않은 NodeAdditionalArgs, Tag만 길이 + Odin 바이트
+/// 첫 4바이트가 MAGIC이 아니면 기존 Odin 형식으로 읽는다
+/// </summary>
+public static class NodeInfoBinaryFormat
+{
+    #region Privates
+    private const uint MAGIC = 0x32474E50; // "PNG2"
+    private const byte VERSION = 2;
+    private const int MAX_NESTED_DEPTH = 32;
+
+    // NodeAdditionalArgs 종류
+    private const byte ARGS_NULL = 0;
+    private const byte ARGS_OBJECT = 1;
+    private const byte ARGS_CLASSED = 2;
+    private const byte ARGS_SCRIPTING = 3;
+
+    private static readonly Dictionary<string, Type> _typeCache = new();
+
+    private sealed class ByteWriter
+    {
+        private byte[] _buffer;
+        private int _length;
+
+        public ByteWriter(int capacity)
+        {
+            _buffer = new byte[Math.Max(capacity, 16)];
+        }
+
+        private Span<byte> Reserve(int count)
+        {
+            if (_length + count > _buffer.Length)
+            {
+                Array.Resize(ref _buffer, Math.Max(_buffer.Length * 2, _length + count));
+            }
+
+            Span<byte> span = _buffer.AsSpan(_length, count);
+            _length += count;
+            return span;
+        }
+
+        public void WriteByte(byte value)
+        {
+            Reserve(1)[0] = value;
+        }
+
+        public void WriteUInt32(uint value)
+        {
+            BinaryPrimitives.WriteUInt32LittleEndian(Reserve(4), value);
+        }
+
+        public void WriteInt64(long value)
+        {
+            BinaryPrimitives.WriteInt64LittleEndian(Reserve(8), value);
+        }
+
+        public void WriteFloat(float value)
+        {
+            BinaryPrimitives.WriteInt32LittleEndian(Reserve(4), BitConverter.SingleToInt32Bits(value));
+        }
+
+        public void WriteVarUInt(uint value)
+        {
+            while (value >= 0x80)
+            {
+                WriteByte((byte)(value | 0x80));
+                value >>= 7;
+            }
+
+            WriteByte((byte)value);
+        }
+
+        public void WriteVarInt(int value)
+        {
+            WriteVarUInt((uint)((value << 1) ^ (value >> 31)));
+        }
+
+        /// <summary>
+        /// 길이 + 1 (null = 0)
+        /// </summary>
+        public void WriteLength(int? length)
+        {
+            WriteVarUInt(length.HasValue ? (uint)length.Value + 1 : 0);
+        }
+
+        public void WriteBytes(ReadOnlySpan<byte> bytes)
+        {
+            bytes.CopyTo(Reserve(bytes.Length));
+        }
+
+        public void WriteString(string value)
+        {
+            if (value == null)
+            {
+                WriteLength(null);
+                return;
+            }
+
+            int byteCount = Encoding.UTF8.GetByteCount(value);
+            WriteLength(byteCount);
+            Encoding.UTF8.GetBytes(value, Reserve(byteCount));
+        }
+
+        public byte[] ToArray()
+        {
+            return _buffer.AsSpan(0, _length).ToArray();
+        }
+    }
+
+    private ref struct ByteReader
+    {
+        private readonly ReadOnlySpan<byte> _span;
+        private int _position;
+
+        public ByteReader(ReadOnlySpan<byte> span)
+        {
+            _span = span;
+            _position = 0;
+        }
+
+        private ReadOnlySpan<byte> Take(int count)
+        {
+            if (count < 0 || _position + count > _span.Length)
+            {
+                throw new FormatException($"{nameof(NodeInfoBinaryFormat)}: Unexpected end of data");
+            }
+
+            ReadOnlySpan<byte> span = _span.Slice(_position, count);
+            _position += count;
+            return span;
+        }
+
+        public byte ReadByte()
+        {
+            return Take(1)[0];
+        }
+
+        public uint ReadUInt32()
+        {
+            return BinaryPrimitives.ReadUInt32LittleEndian(Take(4));
+        }
+
+        public long ReadInt64()
+        {
+            return BinaryPrimitives.ReadInt64LittleEndian(Take(8));
+        }
+
+        public float ReadFloat()
+        {
+            return BitConverter.Int32BitsToSingle(BinaryPrimitives.ReadInt32LittleEndian(Take(4)));
+        }
+
+        public uint ReadVarUInt()
+        {
+            uint result = 0;
+            for (int shift = 0; shift < 35; shift += 7)
+            {
+                byte b = ReadByte();
+                result |= (uint)(b & 0x7F) << shift;
+                if ((b & 0x80) == 0)
+                {
+                    return result;
+                }
+            }
+
+            throw new FormatException($"{nameof(NodeInfoBinaryFormat)}: Malformed varint");
+        }
+
+        public int ReadVarInt()
+        {
+            uint value = ReadVarUInt();
+            return (int)(value >> 1) ^ -(int)(value & 1);
+        }
+
+        /// <summary>
+        /// null = -1
+        /// </summary>
+        public int ReadLength()
+        {
+            return (int)ReadVarUInt() - 1;
+        }
+
+        public ReadOnlySpan<byte> ReadBytes(int count)
+        {
+            return Take(count);
+        }
+
+        public string ReadString()
+        {
+            int length = ReadLength();
+            return length < 0 ? null : Encoding.UTF8.GetString(Take(length));
+        }
+    }
+
+    private static string GetTypeName(Type type)
+    {
+        return $"{type.FullName}, {type.Assembly.GetName().Name}";
+    }
+
+    private static Type ResolveType(string typeName)
+    {
+        if (typeName == null)
+        {
+            return null;
+        }
+
+        lock (_typeCache)
+        {
+            if (!_typeCache.TryGetValue(typeName, out Type type))
+            {
+                type = Type.GetType(typeName);
+                if (type == null)
+                {
+                    Debug.LogWarning($"{nameof(NodeInfoBinaryFormat)}: Can't resolve node type '{typeName}'");
+                }
+
+                _typeCache.Add(typeName, type);
+            }
+
+            return type;
+        }
+    }
+
+    private static void WriteObject(ByteWriter writer, object value)
+    {
+        if (value == null)
+        {
+            writer.WriteLength(null);
+            return;
+        }
+
+        byte[] bytes = SerializationUtility.SerializeValue(value, DataFormat.Binary);
+        writer.WriteLength(bytes.Length);
+        writer.WriteBytes(bytes);
+    }
+
+    private static object ReadObject(ref ByteReader reader)
+    {
+        int length = reader.ReadLength();
+        if (length < 0)
+        {
+            return null;
+        }
+
+        byte[] bytes = reader.ReadBytes(length).ToArray();
+        return SerializationUtility.DeserializeValue<object>(bytes, DataFormat.Binary);
+    }
+
+    private static void WriteArgs(ByteWriter writer, object args, int depth)
+    {
+        switch (args)
+        {
+            case null:
+                writer.WriteByte(ARGS_NULL);
+                return;
+
+            // 중첩 모듈: 내부 구조도 열 단위 형식으로
+            case ClassedNodeSerializeInfo classed when depth < MAX_NESTED_DEPTH:
+                writer.WriteByte(ARGS_CLASSED);
+                writer.WriteVarInt(classed._inputCount);
+                writer.WriteVarInt(classed._outputCount);
+                writer.WriteByte(classed._isChange ? (byte)1 : (byte)0);
+                WriteStructure(writer, classed._structure, depth + 1);
+                return;
+
+            case ScriptingNode.ScriptingNodeSerializeInfo scripting:
+                writer.WriteByte(ARGS_SCRIPTING);
+                writer.WriteVarInt(scripting._inputCount);
+                writer.WriteVarInt(scripting._outputCount);
+                writer.WriteString(scripting._fileName);
+                writer.WriteString(scripting._script);
+                return;
+
+            default:
+                writer.WriteByte(ARGS_OBJECT);
+                WriteObject(writer, args);
+                return;
+        }
+    }
+
+    private static object ReadArgs(ref ByteReader reader, int depth)
+    {
+        byte kind = reader.ReadByte();
+        switch (kind)
+        {
+            case ARGS_NULL:
+                return null;
+
+            case ARGS_OBJECT:
+                return ReadObject(ref reader);
+
+            case ARGS_CLASSED:
+            {
+                int inputCount = reader.ReadVarInt();
+                int outputCount = reader.ReadVarInt();
+                bool isChange = reader.ReadByte() != 0;
+                return new ClassedNodeSerializeInfo(ReadStructure(ref reader, depth + 1), inputCount, outputCount, isChange);
+            }
+
+            case ARGS_SCRIPTING:
+                return new ScriptingNode.ScriptingNodeSerializeInfo
+                {
+                    _inputCount = reader.ReadVarInt(),
+                    _outputCount = reader.ReadVarInt(),
+                    _fileName = reader.ReadString(),
+                    _script = reader.ReadString(),
+                };
+
+            default:
+                throw new FormatException($"{nameof(NodeInfoBinaryFormat)}: Unknown args kind {kind}");
+        }
+    }
+
+    /// <summary>
+    /// 중첩 모듈 구조 (null이면 0 한 바이트)
+    /// </summary>
+    private static void WriteStructure(ByteWriter writer, PUMPSaveDataStructure structure, int depth)
+    {
+        if (structure == null)
+        {
+            writer.WriteByte(0);
+            return;
+        }
+
+        writer.WriteByte(1);
+        writer.WriteString(structure.Name);
+        writer.WriteInt64(structure.LastUpdate.ToBinary());
+        WriteObject(writer, structure.Tag);
+        WriteNodeInfos(writer, structure.NodeInfos, depth);
+    }
+
+    private static PUMPSaveDataStructure ReadStructure(ref ByteReader reader, int depth)
+    {
+        if (reader.ReadByte() == 0)
+        {
+            return null;
+        }
+
+        PUMPSaveDataStructure structure = new()
+        {
+            Name = reader.ReadString(),
+            LastUpdate = DateTime.FromBinary(reader.ReadInt64()),
+            Tag = ReadObject(ref reader),
+        };
+
+        structure.NodeInfos = ReadNodeInfos(ref reader, depth);
+        return structure;
+    }
+
+    // 상위 1비트: IsNull, 하위: TransitionType. None(default)은 0
+    private static void WriteTransition(ByteWriter writer, Transition state)
+    {
+        writer.WriteByte((byte)((byte)state.Type | (state.IsNull ? 0x80 : 0)));
+        if (state.IsNull)
+        {
+            return;
+        }
+
+        switch (state.Type)
+        {
+            case TransitionType.Bool:
+                writer.WriteByte(state.Value.BoolValue ? (byte)1 : (byte)0);
+                return;
+
+            case TransitionType.Int:
+                writer.WriteVarInt(state.Value.IntValue);
+                return;
+
+            case TransitionType.Float:
+                writer.WriteFloat(state.Value.FloatValue);
+                return;
+
+            case TransitionType.String:
+                writer.WriteString(state.Value.StringValue);
+                return;
+        }
+    }
+
+    private static Transition ReadTransition(ref ByteReader reader)
+    {
+        byte header = reader.ReadByte();
+        TransitionType type = (TransitionType)(header & 0x7F);
+        if (type == TransitionType.None)
+        {
+            return default;
+        }
+
+        if ((header & 0x80) != 0)
+        {
+            return Transition.Null(type);
+        }
+
+        return type switch
+        {
+            TransitionType.Bool => new Transition(reader.ReadByte() != 0),
+            TransitionType.Int => new Transition(reader.ReadVarInt()),
+            TransitionType.Float => new Transition(reader.ReadFloat()),
+            TransitionType.String => new Transition(reader.ReadString() ?? string.Empty),
+            TransitionType.Pulse => Transition.Pulse(),
+            _ => throw new FormatException($"{nameof(NodeInfoBinaryFormat)}: Unknown transition type {type}")
+        };
+    }
+
+    private static void WriteConnection(ByteWriter writer, TPConnectionIndexInfo connection)
+    {
+        if (connection == null)
+        {
+            writer.WriteVarUInt(0);
+            return;
+        }
+
+        writer.WriteVarUInt((uint)((connection.NodeIndex << 1) ^ (connection.NodeIndex >> 31)) + 1);
+        writer.WriteVarInt(connection.TpIndex);
+
+        List<Vector2> vertices = connection.Vertices;
+        writer.WriteLength(vertices?.Count);
+        if (vertices == null)
+        {
+            return;
+        }
+
+        // 인접한 점은 상위 비트(부호, 지수)가 같아 XOR 결과가 작다
+        int previousX = 0;
+        int previousY = 0;
+        foreach (Vector2 vertex in vertices)
+        {
+            int x = BitConverter.SingleToInt32Bits(vertex.x);
+            int y = BitConverter.SingleToInt32Bits(vertex.y);
+            writer.WriteVarUInt((uint)(x ^ previousX));
+            writer.WriteVarUInt((uint)(y ^ previousY));
+            previousX = x;
+            previousY = y;
+        }
+    }
+
+    private static TPConnectionIndexInfo ReadConnection(ref ByteReader reader)
+    {
+        uint nodeIndex = reader.ReadVarUInt();
+        if (nodeIndex == 0)
+        {
+            return null;
+        }
+
+        nodeIndex--;
+        TPConnectionIndexInfo connection = new()
+        {
+            NodeIndex = (int)(nodeIndex >> 1) ^ -(int)(nodeIndex & 1),
+            TpIndex = reader.ReadVarInt(),
+        };
+
+        int count = reader.ReadLength();
+        if (count < 0)
+        {
+            return connection;
+        }
+
+        List<Vector2> vertices = new(count);
+        int previousX = 0;
+        int previousY = 0;
+        for (int i = 0; i < count; i++)
+        {
+            previousX ^= (int)reader.ReadVarUInt();
+            previousY ^= (int)reader.ReadVarUInt();
+            vertices.Add(new Vector2(BitConverter.Int32BitsToSingle(previousX), BitConverter.Int32BitsToSingle(previousY)));
+        }
+
+        connection.Vertices = vertices;
+        return connection;
+    }
+
+    private static void WriteLengths<T>(ByteWriter writer, List<SerializeNodeInfo> infos, Func<SerializeNodeInfo, T[]> selector)
+    {
+        foreach (SerializeNodeInfo info in infos)
+        {
+            writer.WriteLength(selector(info)?.Length);
+        }
+    }
+
+    private static T[][] ReadArrays<T>(ref ByteReader reader, int nodeCount)
+    {
+        T[][] arrays = new T[nodeCount][];
+        for (int i = 0; i < nodeCount; i++)
+        {
+            int length = reader.ReadLength();
+            arrays[i] = length < 0 ? null : new T[length];
+        }
+
+        return arrays;
+    }
+
+    private static void WriteNodeInfos(ByteWriter writer, List<SerializeNodeInfo> infos, int depth)
+    {
+        writer.WriteLength(infos?.Count);
+        if (infos == null)
+        {
+            return;
+        }
+
+        // 타입 테이블
+        Dictionary<Type, int> typeIndices = new();
+        List<Type> types = new();
+        foreach (SerializeNodeInfo info in infos)
+        {
+            if (info.NodeType != null && !typeIndices.ContainsKey(info.NodeType))
+            {
+                typeIndices.Add(info.NodeType, types.Count);
+                types.Add(info.NodeType);
+            }
+        }
+
+        writer.WriteVarUInt((uint)types.Count);
+        foreach (Type type in types)
+        {
+            writer.WriteString(GetTypeName(type));
+        }
+
+        foreach (SerializeNodeInfo info in infos)
+        {
+            writer.WriteLength(info.NodeType == null ? null : typeIndices[info.NodeType]);
+        }
+
+        // 위치
+        foreach (SerializeNodeInfo info in infos)
+        {
+            writer.WriteFloat(info.NodePosition.x);
+        }
+
+        foreach (SerializeNodeInfo info in infos)
+        {
+            writer.WriteFloat(info.NodePosition.y);
+        }
+
+        // 배열 길이
+        WriteLengths(writer, infos, info => info.InTpType);
+        WriteLengths(writer, infos, info => info.OutTpType);
+        WriteLengths(writer, infos, info => info.InTpState);
+        WriteLengths(writer, infos, info => info.OutTpState);
+        WriteLengths(writer, infos, info => info.StatePending);
+        WriteLengths(writer, infos, info => info.InConnectionTargets);
+        WriteLengths(writer, infos, info => info.OutConnectionTargets);
+
+        // TP 타입
+        foreach (SerializeNodeInfo info in infos)
+        {
+            if (info.InTpType != null)
+            {
+                foreach (TransitionType type in info.InTpType)
+                {
+                    writer.WriteByte((byte)type);
+                }
+            }
+
+            if (info.OutTpType != null)
+            {
+                foreach (TransitionType type in info.OutTpType)
+                {
+                    writer.WriteByte((byte)type);
+                }
+            }
+        }
+
+        // TP 상태
+        foreach (SerializeNodeInfo info in infos)
+        {
+            if (info.InTpState != null)
+            {
+                foreach (Transition state in info.InTpState)
+                {
+                    WriteTransition(writer, state);
+                }
+            }
+
+            if (info.OutTpState != null)
+            {
+                foreach (Transition state in info.OutTpState)
+                {
+                    WriteTransition(writer, state);
+                }
+            }
+        }
+
+        // StatePending 비트
+        int bits = 0;
+        int bitCount = 0;
+        foreach (SerializeNodeInfo info in infos)
+        {
+            if (info.StatePending == null)
+            {
+                continue;
+            }
+
+            foreach (bool pending in info.StatePending)
+            {
+                bits |= (pending ? 1 : 0) << bitCount;
+                if (++bitCount == 8)
+                {
+                    writer.WriteByte((byte)bits);
+                    bits = 0;
+                    bitCount = 0;
+                }
+            }
+        }
+
+        if (bitCount > 0)
+        {
+            writer.WriteByte((byte)bits);
+        }
+
+        // 연결
+        foreach (SerializeNodeInfo info in infos)
+        {
+            if (info.InConnectionTargets != null)
+            {
+                foreach (TPConnectionIndexInfo connection in info.InConnectionTargets)
+                {
+                    WriteConnection(writer, connection);
+                }
+            }
+
+            if (info.OutConnectionTargets != null)
+            {
+                foreach (TPConnectionIndexInfo connection in info.OutConnectionTargets)
+                {
+                    WriteConnection(writer, connection);
+                }
+            }
+        }
+
+        // NodeAdditionalArgs
+        foreach (SerializeNodeInfo info in infos)
+        {
+            WriteArgs(writer, info.NodeAdditionalArgs, depth);
+        }
+    }
+
+    private static List<SerializeNodeInfo> ReadNodeInfos(ref ByteReader reader, int depth)
+    {
+        int nodeCount = reader.ReadLength();
+        if (nodeCount < 0)
+        {
+            return null;
+        }
+
+        Type[] types = new Type[reader.ReadVarUInt()];
+        for (int i = 0; i < types.Length; i++)
+        {
+            types[i] = ResolveType(reader.ReadString());
+        }
+
+        Type[] nodeTypes = new Type[nodeCount];
+        for (int i = 0; i < nodeCount; i++)
+        {
+            int typeIndex = reader.ReadLength();
+            nodeTypes[i] = typeIndex < 0 ? null : types[typeIndex];
+        }
+
+        float[] positionX = new float[nodeCount];
+        for (int i = 0; i < nodeCount; i++)
+        {
+            positionX[i] = reader.ReadFloat();
+        }
+
+        Vector2[] positions = new Vector2[nodeCount];
+        for (int i = 0; i < nodeCount; i++)
+        {
+            positions[i] = new Vector2(positionX[i], reader.ReadFloat());
+        }
+
+        TransitionType[][] inTypes = ReadArrays<TransitionType>(ref reader, nodeCount);
+        TransitionType[][] outTypes = ReadArrays<TransitionType>(ref reader, nodeCount);
+        Transition[][] inStates = ReadArrays<Transition>(ref reader, nodeCount);
+        Transition[][] outStates = ReadArrays<Transition>(ref reader, nodeCount);
+        bool[][] statePendings = ReadArrays<bool>(ref reader, nodeCount);
+        TPConnectionIndexInfo[][] inConnections = ReadArrays<TPConnectionIndexInfo>(ref reader, nodeCount);
+        TPConnectionIndexInfo[][] outConnections = ReadArrays<TPConnectionIndexInfo>(ref reader, nodeCount);
+
+        for (int i = 0; i < nodeCount; i++)
+        {
+            if (inTypes[i] != null)
+            {
+                for (int j = 0; j < inTypes[i].Length; j++)
+                {
+                    inTypes[i][j] = (TransitionType)reader.ReadByte();
+                }
+            }
+
+            if (outTypes[i] != null)
+            {
+                for (int j = 0; j < outTypes[i].Length; j++)
+                {
+                    outTypes[i][j] = (TransitionType)reader.ReadByte();
+                }
+            }
+        }
+
+        for (int i = 0; i < nodeCount; i++)
+        {
+            if (inStates[i] != null)
+            {
+                for (int j = 0; j < inStates[i].Length; j++)
+                {
+                    inStates[i][j] = ReadTransition(ref reader);
+                }
+            }
+
+            if (outStates[i] != null)
+            {
+                for (int j = 0; j < outStates[i].Length; j++)
+                {
+                    outStates[i][j] = ReadTransition(ref reader);
+                }
+            }
+        }
+
+        int bits = 0;
+        int bitCount = 8;
+        for (int i = 0; i < nodeCount; i++)
+        {
+            if (statePendings[i] == null)
+            {
+                continue;
+            }
+
+            for (int j = 0; j < statePendings[i].Length; j++)
+            {
+                if (bitCount == 8)
+                {
+                    bits = reader.ReadByte();
+                    bitCount = 0;
+                }
+
+                statePendings[i][j] = ((bits >> bitCount++) & 1) != 0;
+            }
+        }
+
+        for (int i = 0; i < nodeCount; i++)
+        {
+            if (inConnections[i] != null)
+            {
+                for (int j = 0; j < inConnections[i].Length; j++)
+                {
+                    inConnections[i][j] = ReadConnection(ref reader);
+                }
+            }
+
+            if (outConnections[i] != null)
+            {
+                for (int j = 0; j < outConnections[i].Length; j++)
+                {
+                    outConnections[i][j] = ReadConnection(ref reader);
+                }
+            }
+        }
+
+        List<SerializeNodeInfo> infos = new(nodeCount);
+        for (int i = 0; i < nodeCount; i++)
+        {
+            infos.Add(new SerializeNodeInfo
+            {
+                NodeType = nodeTypes[i],
+                NodePosition = positions[i],
+                NodeAdditionalArgs = ReadArgs(ref reader, depth),
+                InTpType = inTypes[i],
+                OutTpType = outTypes[i],
+                InTpState = inStates[i],
+                OutTpState = outStates[i],
+                StatePending = statePendings[i],
+                InConnectionTargets = inConnections[i],
+                OutConnectionTargets = outConnections[i],
+            });
+        }
+
+        return infos;
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// v2 형식인지 (아니면 기존 Odin 형식)
+    /// </summary>
+    public static bool IsBinaryFormat(ReadOnlySpan<byte> bytes)
+    {
+        return bytes.Length >= 5 && BinaryPrimitives.ReadUInt32LittleEndian(bytes) == MAGIC;
+    }
+
+    public static byte[] Serialize(PUMPSaveDataStructure structure)
+    {
+        if (structure == null)
+        {
+            throw new ArgumentNullException(nameof(structure));
+        }
+
+        ByteWriter writer = new(64 + (structure.NodeInfos?.Count ?? 0) * 64);
+        writer.WriteUInt32(MAGIC);
+        writer.WriteByte(VERSION);
+        writer.WriteString(structure.Name);
+        writer.WriteInt64(structure.LastUpdate.ToBinary());
+        WriteObject(writer, structure.Tag);
+        WriteNodeInfos(writer, structure.NodeInfos, 0);
+        return writer.ToArray();
+    }
+
+    /// <summary>
+    /// v2 형식 또는 기존 Odin 형식 본문을 읽음
+    /// </summary>
+    public static PUMPSaveDataStructure Deserialize(byte[] bytes)
+    {
+        if (bytes == null)
+        {
+            return null;
+        }
+
+        if (!IsBinaryFormat(bytes))
+        {
+            return SerializationUtility.DeserializeValue<PUMPSaveDataStructure>(bytes, DataFormat.Binary);
+        }
+
+        ByteReader reader = new(bytes);
+        reader.ReadUInt32();
+        byte version = reader.ReadByte();
+        if (version != VERSION)
+        {
+            throw new FormatException($"{nameof(NodeInfoBinaryFormat)}: Unsupported version {version}");
+        }
+
+        PUMPSaveDataStructure structure = new()
+        {
+            Name = reader.ReadString(),
+            LastUpdate = DateTime.FromBinary(reader.ReadInt64()),
+            Tag = ReadObject(ref reader),
+        };
+
+        structure.NodeInfos = ReadNodeInfos(ref reader, 0);
+        return structure;
+    }
+
+    /// <summary>
+    /// 같은 본문을 기존 Odin 형식과 v2 형식으로 기록했을 때의 크기 (byte). 형식 비교용
+    /// </summary>
+    public static (int odinSize, int binarySize) MeasureSize(PUMPSaveDataStructure structure)
+    {
+        if (structure == null)
+        {
+            throw new ArgumentNullException(nameof(structure));
+        }
+
+        int odinSize = SerializationUtility.SerializeValue(structure, DataFormat.Binary).Length;
+        int binarySize = Serialize(structure).Length;
+        return (odinSize, binarySize);
+    }
+    #endregion
+}
@@ -1,6 +1,9 @@
 using OdinSerializer;
 using System.Collections.Generic;
+using System.Linq;
+using System.Threading.Tasks;
 using System;
+using UnityEngine;
 
 public class PUMPSaveDataStructure
 {
@@ -26,6 +29,77 @@ public class PUMPSaveDataStructure
     [field: NonSerialized] private event Action<PUMPSaveDataStructure> DeleteRequest;
     [field: NonSerialized] private event Action<PUMPSaveDataStructure> UpdateNotification;
 
+    #region Header
+    // 목록용(본문 없이) 생성된 경우 사용. NodeInfos가 있으면 NodeInfos 기준
+    [NonSerialized] private Func<Task<List<SerializeNodeInfo>>> _bodyLoader;
+    [NonSerialized] private int _headerNodeCount;
+    [NonSerialized] private List<Vector2> _headerPreview;
+
+    private static readonly HashSet<Type> PreviewExclusionTypes = new() { typeof(ExternalInput), typeof(ExternalOutput) };
+
+    /// <summary>
+    /// 미리보기에 표시할 노드 위치 (Gateway 제외)
+    /// </summary>
+    public static List<Vector2> GetPreviewPositions(List<SerializeNodeInfo> nodeInfos)
+    {
+        if (nodeInfos == null)
+            return new List<Vector2>();
+
+        return nodeInfos
+            .Where(info => !PreviewExclusionTypes.Contains(info.NodeType))
+            .Select(info => info.NodePosition)
+            .ToList();
+    }
+
+    /// <summary>
+    /// NodeInfos가 메모리에 있는지. false면 LoadAsync()로 불러와야 함
+    /// </summary>
+    public bool IsBodyLoaded => NodeInfos != null;
+
+    public int NodeCount => NodeInfos?.Count ?? _headerNodeCount;
+
+    public List<Vector2> PreviewPositions => NodeInfos != null ? GetPreviewPositions(NodeInfos) : _headerPreview ?? new List<Vector2>();
+
+    /// <summary>
+    /// 본문 없이 목록 정보만 가진 구조로 설정. NodeInfos는 LoadAsync()에서 bodyLoader로 읽는다
+    /// </summary>
+    public void SetHeader(int nodeCount, List<Vector2> preview, Func<Task<List<SerializeNodeInfo>>> bodyLoader)
+    {
+        _headerNodeCount = nodeCount;
+        _headerPreview = preview;
+        _bodyLoader = bodyLoader;
+    }
+
+    /// <summary>
+    /// 본문을 다시 읽을 수 있으면 NodeInfos를 내려놓음 (목록 정보는 유지)
+    /// </summary>
+    public void ReleaseBody()
+    {
+        if (_bodyLoader == null || NodeInfos == null)
+            return;
+
+        _headerNodeCount = NodeInfos.Count;
+        _headerPreview = GetPreviewPositions(NodeInfos);
+        NodeInfos = null;
+    }
+
+    /// <summary>
+    /// NodeInfos를 포함한 구조. 본문이 메모리에 없으면 읽어서 별도 구조로 반환 (이 구조는 목록 정보만 유지)
+    /// </summary>
+    /// <returns>본문을 읽지 못하면 null</returns>
+    public async Task<PUMPSaveDataStructure> LoadAsync()
+    {
+        if (NodeInfos != null || _bodyLoader == null)
+            return this;
+
+        List<SerializeNodeInfo> nodeInfos = await _bodyLoader();
+        if (nodeInfos == null)
+            return null;
+
+        return new PUMPSaveDataStructure(nodeInfos, Name, Tag) { LastUpdate = LastUpdate };
+    }
+    #endregion
+
     public void SubscribeDeleteRequest(Action<PUMPSaveDataStructure> action)
     {
         if (DeleteRequest != null)
@@ -1,24 +1,36 @@
 using System;
 using System.Collections.Generic;
+using System.IO;
 using System.Linq;
+using System.Security.Cryptography;
 using System.Threading;
 using System.Threading.Tasks;
 using Cysharp.Threading.Tasks;
+using OdinSerializer;
 using UnityEngine;
 using static Utils.Serializer;
 
 /// <summary>
 /// 로컬 AppData에 저장
-/// 기본 저장 파일명은 node_data.bin
+/// 파일명(기본 node_data.bin) 하나가 디렉토리 하나의 저장소: manifest.bin(인덱스) + 세이브마다 본문 파일
+/// - 추가/수정/삭제 시 해당 세이브 본문과 manifest만 다시 씀 (임시 파일 → 교체)
+/// - 기존 단일 파일(List&lt;PUMPSaveDataStructure&gt;)은 처음 불러올 때 변환 후 .legacy로 보관
+/// - 본문은 NodeInfoBinaryFormat(v2)으로 기록. Odin 형식 본문도 읽을 수 있고, 다음 기록 때 v2로 바뀜
+/// - GetDatas()는 manifest 정보만 가진 구조를 반환. 본문(NodeInfos)은 PUMPSaveDataStructure.LoadAsync()에서 읽음
 /// </summary>
 public class PUMPAppdataSerializeManager : ISerializeManagable<PUMPSaveDataStructure>
 {
     #region Privates
+    private const string LEGACY_BACKUP_EXTENSION = ".legacy";
+
     private static PUMPAppdataSerializeManager _instance;
     private readonly Dictionary<string, List<PUMPSaveDataStructure>> _saveDatas = new();
+    private readonly Dictionary<string, SaveManifest> _manifests = new();
+    private readonly Dictionary<PUMPSaveDataStructure, SaveManifestEntry> _entries = new();
     private readonly PairEvent _onDataUpdated = new();
     private IPairEventInvokable _invokable;
     private static readonly SemaphoreSlim _semaphore = new(1, 1);
+    private static readonly SemaphoreSlim _writeSemaphore = new(1, 1);
 
     #region Singleton
     private PUMPAppdataSerializeManager() { }
@@ -26,6 +38,22 @@ public class PUMPAppdataSerializeManager : ISerializeManagable<PUMPSaveDataStruc
     public static PUMPAppdataSerializeManager Instance => _instance;
     #endregion
 
+    private static string GetStoreDirectory(string fileName)
+    {
+        return Path.Combine(DefaultSerializePath, Path.GetFileNameWithoutExtension(fileName));
+    }
+
+    private static string GetLegacyPath(string fileName)
+    {
+        return Path.Combine(DefaultSerializePath, string.IsNullOrEmpty(Path.GetExtension(fileName)) ? fileName + ".bin" : fileName);
+    }
+
+    private static string ComputeHash(byte[] bytes)
+    {
+        using SHA256 sha = SHA256.Create();
+        return BitConverter.ToString(sha.ComputeHash(bytes)).Replace("-", string.Empty);
+    }
+
     private async UniTask GetDataInDictionaryFromFile(string fileName)
     {
         await _semaphore.WaitAsync();
@@ -34,19 +62,45 @@ public class PUMPAppdataSerializeManager : ISerializeManagable<PUMPSaveDataStruc
         {
             if (_saveDatas.ContainsKey(fileName) && _saveDatas[fileName] != null)
                 return;
-        
-            List<PUMPSaveDataStructure> datas = await LoadDataAsync<List<PUMPSaveDataStructure>>(fileName);
-            datas ??= new();
-        
+
+            string directory = GetStoreDirectory(fileName);
+            List<PUMPSaveDataStructure> datas = new();
+            SaveManifest manifest = File.Exists(Path.Combine(directory, SaveManifest.FILE_NAME))
+                ? await LoadDataAsync<SaveManifest>(SaveManifest.FILE_NAME, directory)
+                : null;
+
+            if (manifest != null)
+            {
+                bool manifestChanged = false;
+                foreach (SaveManifestEntry entry in manifest.Entries.ToList())
+                {
+                    if (!File.Exists(Path.Combine(directory, entry.BodyFileName)))
+                    {
+                        Debug.LogWarning($"{GetType().Name}: Missing save body '{entry.Name}' ({entry.BodyFileName})");
+                        manifest.Entries.Remove(entry);
+                        manifestChanged = true;
+                        continue;
+                    }
+
+                    datas.Add(CreateHeader(directory, entry));
+                }
+
+                if (manifestChanged)
+                {
+                    await WriteManifestLockedAsync(directory, manifest);
+                }
+            }
+            else
+            {
+                manifest = await MigrateLegacyAsync(fileName, datas);
+            }
+
             foreach (PUMPSaveDataStructure data in datas)
             {
-                data.SubscribeDeleteRequest(saveStructure => DeleteData(fileName, saveStructure));
-                data.SubscribeUpdateNotification(saveStructure => saveStructure.LastUpdate = DateTime.Now);
-                data.SubscribeDeleteRequest(_ => InvokeDataUpdated(fileName));
-                data.SubscribeUpdateNotification(_ => InvokeDataUpdated(fileName));
+                Subscribe(fileName, data);
             }
 
-            _onDataUpdated.AddEvent(fileName, () => WriteData(fileName), GetType().Name);
+            _manifests.Add(fileName, manifest);
             _saveDatas.Add(fileName, datas);
         }
         finally
@@ -55,14 +109,255 @@ public class PUMPAppdataSerializeManager : ISerializeManagable<PUMPSaveDataStruc
         }
     }
 
-    private void WriteData(string fileName)
+    /// <summary>
+    /// 단일 파일 형식 → 세이브별 파일 + manifest
+    /// </summary>
+    private async UniTask<SaveManifest> MigrateLegacyAsync(string fileName, List<PUMPSaveDataStructure> datas)
+    {
+        SaveManifest manifest = new();
+        string legacyPath = GetLegacyPath(fileName);
+        if (!File.Exists(legacyPath))
+        {
+            return manifest;
+        }
+
+        List<PUMPSaveDataStructure> legacyDatas = await LoadDataAsync<List<PUMPSaveDataStructure>>(fileName);
+        if (legacyDatas == null)
+        {
+            Debug.LogError($"{GetType().Name}: Failed to read legacy save file '{legacyPath}'. Migration skipped");
+            return manifest;
+        }
+
+        string directory = GetStoreDirectory(fileName);
+        await _writeSemaphore.WaitAsync();
+        try
+        {
+            foreach (PUMPSaveDataStructure data in legacyDatas.Where(data => data != null))
+            {
+                SaveManifestEntry entry = SaveManifestEntry.Create();
+                ApplyHeader(entry, data);
+                await WriteBodyAsync(directory, entry, data);
+
+                manifest.Entries.Add(entry);
+                datas.Add(CreateHeader(directory, entry));
+            }
+
+            await WriteManifestAsync(directory, manifest);
+            File.Move(legacyPath, legacyPath + LEGACY_BACKUP_EXTENSION);
+            Debug.Log($"{GetType().Name}: Migrated {datas.Count} saves from '{legacyPath}' to '{directory}'");
+        }
+        catch (Exception e)
+        {
+            Debug.LogError($"{GetType().Name}: Legacy save migration failed / {e.Message}");
+        }
+        finally
+        {
+            _writeSemaphore.Release();
+        }
+
+        return manifest;
+    }
+
+    /// <summary>
+    /// manifest 항목으로 목록용 구조 생성 (본문은 LoadAsync() 시점에 읽음)
+    /// </summary>
+    private PUMPSaveDataStructure CreateHeader(string directory, SaveManifestEntry entry)
+    {
+        PUMPSaveDataStructure data = new()
+        {
+            Name = entry.Name,
+            Tag = entry.Tag,
+            LastUpdate = entry.LastUpdate,
+        };
+
+        data.SetHeader(entry.NodeCount, entry.Preview, () => LoadBodyAsync(directory, entry));
+        _entries[data] = entry;
+        return data;
+    }
+
+    private static async Task<List<SerializeNodeInfo>> LoadBodyAsync(string directory, SaveManifestEntry entry)
     {
-        _ = SaveDataAsync(fileName, _saveDatas[fileName]);
+        // 기록 중인 본문을 읽지 않도록 대기
+        await _writeSemaphore.WaitAsync();
+
+        try
+        {
+            PUMPSaveDataStructure body = await ReadBodyAsync(directory, entry);
+            return body?.NodeInfos;
+        }
+        finally
+        {
+            _writeSemaphore.Release();
+        }
+    }
+
+    /// <summary>
+    /// 본문 파일 읽기. v2 형식과 기존 Odin 형식 모두 읽음
+    /// </summary>
+    private static async Task<PUMPSaveDataStructure> ReadBodyAsync(string directory, SaveManifestEntry entry)
+    {
+        string path = Path.Combine(directory, entry.BodyFileName);
+
+        try
+        {
+            if (!File.Exists(path))
+            {
+                Debug.LogWarning($"File not found at {path}");
+                return null;
+            }
+
+            byte[] bytes = await File.ReadAllBytesAsync(path);
+            return await Task.Run(() => NodeInfoBinaryFormat.Deserialize(bytes));
+        }
+        catch (Exception e)
+        {
+            Debug.LogError($"Can't read from path: {path} / {e.Message}");
+            return null;
+        }
+    }
+
+    private static void ApplyHeader(SaveManifestEntry entry, PUMPSaveDataStructure data)
+    {
+        entry.Name = data.Name;
+        entry.Tag = data.Tag;
+        entry.LastUpdate = data.LastUpdate;
+    }
+
+    private void Subscribe(string fileName, PUMPSaveDataStructure data)
+    {
+        data.SubscribeDeleteRequest(saveStructure => DeleteData(fileName, saveStructure));
+        data.SubscribeUpdateNotification(saveStructure => saveStructure.LastUpdate = DateTime.Now);
+        data.SubscribeUpdateNotification(saveStructure => WriteData(fileName, saveStructure));
+        data.SubscribeDeleteRequest(_ => InvokeDataUpdated(fileName));
+        data.SubscribeUpdateNotification(_ => InvokeDataUpdated(fileName));
+    }
+
+    /// <summary>
+    /// 본문이 바뀌었을 때만 기록. manifest 항목(NodeCount, Preview, Size, Hash) 갱신
+    /// </summary>
+    private static async Task<bool> WriteBodyAsync(string directory, SaveManifestEntry entry, PUMPSaveDataStructure body)
+    {
+        entry.NodeCount = body.NodeInfos?.Count ?? 0;
+        entry.Preview = PUMPSaveDataStructure.GetPreviewPositions(body.NodeInfos);
+
+        byte[] bytes = await Task.Run(() => NodeInfoBinaryFormat.Serialize(body));
+        string hash = ComputeHash(bytes);
+
+        if (entry.Hash == hash && File.Exists(Path.Combine(directory, entry.BodyFileName)))
+        {
+            return false;
+        }
+
+        await WriteAllBytesAtomicAsync(Path.Combine(directory, entry.BodyFileName), bytes);
+        entry.Size = bytes.Length;
+        entry.Hash = hash;
+        return true;
+    }
+
+    private static async Task WriteManifestAsync(string directory, SaveManifest manifest)
+    {
+        byte[] bytes = SerializationUtility.SerializeValue(manifest, DataFormat.Binary);
+        await WriteAllBytesAtomicAsync(Path.Combine(directory, SaveManifest.FILE_NAME), bytes);
+    }
+
+    private static async Task WriteManifestLockedAsync(string directory, SaveManifest manifest)
+    {
+        await _writeSemaphore.WaitAsync();
+
+        try
+        {
+            await WriteManifestAsync(directory, manifest);
+        }
+        catch (Exception e)
+        {
+            Debug.LogError($"Can't write save manifest '{directory}' / {e.Message}");
+        }
+        finally
+        {
+            _writeSemaphore.Release();
+        }
+    }
+
+    private void WriteData(string fileName, PUMPSaveDataStructure data)
+    {
+        if (!_entries.TryGetValue(data, out SaveManifestEntry entry))
+        {
+            return;
+        }
+
+        ApplyHeader(entry, data);
+
+        // 본문이 메모리에 있을 때만 본문 기록 (이름 변경 등은 manifest만). 기록 후 목록 항목은 본문을 내려놓음
+        PUMPSaveDataStructure body = data.IsBodyLoaded ? new PUMPSaveDataStructure(data.NodeInfos, data.Name, data.Tag) { LastUpdate = data.LastUpdate } : null;
+        data.ReleaseBody();
+
+        WriteDataAsync(fileName, entry, body).Forget();
+    }
+
+    private async UniTaskVoid WriteDataAsync(string fileName, SaveManifestEntry entry, PUMPSaveDataStructure body)
+    {
+        await _writeSemaphore.WaitAsync();
+
+        try
+        {
+            if (!_manifests.TryGetValue(fileName, out SaveManifest manifest) || !manifest.Entries.Contains(entry))
+            {
+                return;
+            }
+
+            string directory = GetStoreDirectory(fileName);
+            if (body != null)
+            {
+                await WriteBodyAsync(directory, entry, body);
+            }
+
+            await WriteManifestAsync(directory, manifest);
+        }
+        catch (Exception e)
+        {
+            Debug.LogError($"Can't write save '{entry.Name}' / {e.Message}");
+        }
+        finally
+        {
+            _writeSemaphore.Release();
+        }
     }
 
     private void DeleteData(string fileName, PUMPSaveDataStructure data)
     {
         _saveDatas[fileName].Remove(data);
+
+        if (_entries.Remove(data, out SaveManifestEntry entry))
+        {
+            DeleteDataAsync(fileName, entry).Forget();
+        }
+    }
+
+    private async UniTaskVoid DeleteDataAsync(string fileName, SaveManifestEntry entry)
+    {
+        await _writeSemaphore.WaitAsync();
+
+        try
+        {
+            string directory = GetStoreDirectory(fileName);
+            SaveManifest manifest = _manifests[fileName];
+            manifest.Entries.Remove(entry);
+            await WriteManifestAsync(directory, manifest);
+
+            string bodyPath = Path.Combine(directory, entry.BodyFileName);
+            if (File.Exists(bodyPath))
+            {
+                File.Delete(bodyPath);
+            }
+        }
+        catch (Exception e)
+        {
+            Debug.LogError($"Can't delete save '{entry.Name}' / {e.Message}");
+        }
+        finally
+        {
+            _writeSemaphore.Release();
+        }
     }
 
     private void InvokeDataUpdated(string fileName)
@@ -78,14 +373,15 @@ public class PUMPAppdataSerializeManager : ISerializeManagable<PUMPSaveDataStruc
     public async Task AddData(string fileName, PUMPSaveDataStructure serializeObject)
     {
         await GetDataInDictionaryFromFile(fileName);
-        serializeObject.SubscribeDeleteRequest(saveStructure => DeleteData(fileName, saveStructure));
-        serializeObject.SubscribeUpdateNotification(saveStructure => saveStructure.LastUpdate = DateTime.Now);
-        serializeObject.SubscribeDeleteRequest(_ => InvokeDataUpdated(fileName));
-        serializeObject.SubscribeUpdateNotification(_ => InvokeDataUpdated(fileName));
+        Subscribe(fileName, serializeObject);
         serializeObject.LastUpdate = DateTime.Now;
 
+        SaveManifestEntry entry = SaveManifestEntry.Create();
+        _entries[serializeObject] = entry;
+        _manifests[fileName].Entries.Add(entry);
         _saveDatas[fileName].Add(serializeObject);
 
+        WriteData(fileName, serializeObject);
         InvokeDataUpdated(fileName);
     }
 
@@ -102,7 +398,7 @@ public class PUMPAppdataSerializeManager : ISerializeManagable<PUMPSaveDataStruc
             return AddData(fileName, structure);
         }
 
-        Debug.LogError("Cast fail serializeObject to PUMPSaveDataStructure"); 
+        Debug.LogError("Cast fail serializeObject to PUMPSaveDataStructure");
         return Task.CompletedTask;
     }
 
@@ -113,4 +409,4 @@ public class PUMPAppdataSerializeManager : ISerializeManagable<PUMPSaveDataStruc
         return objects;
     }
     #endregion
-}
\ No newline at end of file
+}
@@ -0,0 +1,51 @@
+using System;
+using System.Collections.Generic;
+using OdinSerializer;
+using UnityEngine;
+
+/// <summary>
+/// 세이브 저장소(디렉토리) 인덱스. 세이브 본문은 항목마다 별도 파일({Id}.bin)
+/// 항목 순서 = 세이브 추가 순서
+/// 목록 표시에 필요한 정보(이름, Tag, 날짜, 노드 수, 미리보기)는 manifest만 읽어도 알 수 있다
+/// </summary>
+[Serializable]
+public class SaveManifest
+{
+    public const string FILE_NAME = "manifest.bin";
+    public const int CURRENT_VERSION = 1;
+
+    [OdinSerialize] public int Version { get; set; } = CURRENT_VERSION;
+    [OdinSerialize] public List<SaveManifestEntry> Entries { get; set; } = new();
+}
+
+[Serializable]
+public class SaveManifestEntry
+{
+    [OdinSerialize] public string Id { get; set; }
+    [OdinSerialize] public string Name { get; set; }
+    [OdinSerialize] public object Tag { get; set; }
+    [OdinSerialize] public DateTime LastUpdate { get; set; }
+    [OdinSerialize] public int NodeCount { get; set; }
+
+    /// <summary>
+    /// 미리보기 노드 위치
+    /// </summary>
+    [OdinSerialize] public List<Vector2> Preview { get; set; } = new();
+
+    /// <summary>
+    /// 본문 파일 크기 (byte)
+    /// </summary>
+    [OdinSerialize] public long Size { get; set; }
+
+    /// <summary>
+    /// 본문 내용 해시. 같으면 다시 쓰지 않음
+    /// </summary>
+    [OdinSerialize] public string Hash { get; set; }
+
+    public string BodyFileName => Id + ".bin";
+
+    public static SaveManifestEntry Create()
+    {
+        return new SaveManifestEntry { Id = Guid.NewGuid().ToString("N") };
+    }
+}
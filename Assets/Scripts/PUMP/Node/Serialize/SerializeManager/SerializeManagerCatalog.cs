@@ -32,6 +32,8 @@ using UnityEngine;
 ///     PUMPBackground newBackground = BackgroundGetter?.Invoke();
 ///     if (matchedStructure != null)
 ///     {
+///         // 목록 항목은 본문(NodeInfos) 없이 올 수 있음
+///         matchedStructure = await matchedStructure.LoadAsync();
 ///         newBackground.SetInfos(matchedStructure.NodeInfos, true);
 ///         classedNode.Name = matchedStructure.Name;
 ///     }
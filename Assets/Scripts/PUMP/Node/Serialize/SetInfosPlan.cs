@@ -0,0 +1,102 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using UnityEngine;
+
+/// <summary>
+/// PUMPBackground.SetInfosAsync() 준비 단계. Unity 객체를 쓰지 않으므로 워커 스레드에서 실행
+/// - Splitter 변환, 노드 타입 검증
+/// - 연결 선분의 로컬 좌표 (정규화 값 * Rect 크기). 메인 스레드는 월드 좌표 변환만
+/// - ScriptingNode 스크립트 컴파일, 실행 (ScriptLoadBatch). 노드 초기화 때는 바인딩만
+/// </summary>
+public class SetInfosPlan
+{
+    #region Privates
+    private SetInfosPlan() { }
+
+    private static List<Vector2>[] GetLocalVertices(TPConnectionIndexInfo[] targets, Vector2 rectSize)
+    {
+        if (targets == null)
+        {
+            return Array.Empty<List<Vector2>>();
+        }
+
+        List<Vector2>[] result = new List<Vector2>[targets.Length];
+        for (int i = 0; i < targets.Length; i++)
+        {
+            List<Vector2> vertices = targets[i]?.Vertices;
+            if (vertices == null)
+            {
+                continue;
+            }
+
+            List<Vector2> local = new(vertices.Count);
+            foreach (Vector2 normalized in vertices)
+            {
+                local.Add(rectSize * normalized);
+            }
+
+            result[i] = local;
+        }
+
+        return result;
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// Splitter 변환을 마친 infos
+    /// </summary>
+    public List<SerializeNodeInfo> Infos { get; private set; }
+
+    /// <summary>
+    /// [노드][In 연결] 선분 로컬 좌표
+    /// </summary>
+    public List<Vector2>[][] InLocalVertices { get; private set; }
+
+    /// <summary>
+    /// [노드][Out 연결] 선분 로컬 좌표
+    /// </summary>
+    public List<Vector2>[][] OutLocalVertices { get; private set; }
+
+    /// <summary>
+    /// 생성할 수 없는 노드 Index (타입 없음, Node 아님)
+    /// </summary>
+    public List<int> InvalidNodes { get; } = new();
+
+    public bool IsValid => InvalidNodes.Count == 0;
+
+    /// <summary>
+    /// 준비된 스크립트. 노드 생성 전에 Begin(), 불러오기가 끝나면 Dispose()
+    /// </summary>
+    public ScriptLoadBatch Scripts { get; private set; }
+
+    /// <summary>
+    /// 워커 스레드에서 호출 가능. 취소되면 준비한 스크립트를 정리하고 OperationCanceledException
+    /// </summary>
+    public static SetInfosPlan Prepare(List<SerializeNodeInfo> infos, Vector2 rectSize, CancellationToken token = default)
+    {
+        SetInfosPlan plan = new() { Infos = SplitterMigration.FoldSplitters(infos) ?? new List<SerializeNodeInfo>() };
+
+        int count = plan.Infos.Count;
+        plan.InLocalVertices = new List<Vector2>[count][];
+        plan.OutLocalVertices = new List<Vector2>[count][];
+
+        for (int i = 0; i < count; i++)
+        {
+            SerializeNodeInfo info = plan.Infos[i];
+            if (info.NodeType == null || !typeof(Node).IsAssignableFrom(info.NodeType) || info.NodeType.IsAbstract)
+            {
+                plan.InvalidNodes.Add(i);
+            }
+
+            plan.InLocalVertices[i] = GetLocalVertices(info.InConnectionTargets, rectSize);
+            plan.OutLocalVertices[i] = GetLocalVertices(info.OutConnectionTargets, rectSize);
+        }
+
+        token.ThrowIfCancellationRequested();
+        plan.Scripts = ScriptLoadBatch.Prepare(plan.Infos, token);
+        return plan;
+    }
+    #endregion
+}
@@ -0,0 +1,189 @@
+using System.Collections.Generic;
+using UnityEngine;
+
+/// <summary>
+/// TPOut Fan-out 도입 이전 저장 데이터 변환.
+/// 입력이 연결된 Splitter를 제거하고, Splitter 출력에 연결되어 있던 TPIn을 Splitter의 입력 소스 TPOut에 직접 연결한다.
+/// - Splitter 체인은 최초 소스까지 따라가며, 선분은 경유하던 선분을 이어 붙여 기존 경로를 유지
+/// - 입력이 없거나 Splitter끼리 순환하는 Splitter는 그대로 둠
+/// - 원본 infos(Undo 기록, ModuleStructure 등)는 수정하지 않음
+/// </summary>
+public static class SplitterMigration
+{
+    #region Privates
+    private static bool IsValidTarget(TPConnectionIndexInfo info, int nodeCount)
+    {
+        return info != null && info.NodeIndex >= 0 && info.NodeIndex < nodeCount && info.TpIndex >= 0;
+    }
+
+    /// <summary>
+    /// Splitter 입력의 소스 (연결되지 않았으면 null)
+    /// </summary>
+    private static TPConnectionIndexInfo GetSplitterSource(List<SerializeNodeInfo> infos, int index)
+    {
+        SerializeNodeInfo info = infos[index];
+        if (info.NodeType != typeof(Splitter) || info.InConnectionTargets is not { Length: 1 })
+        {
+            return null;
+        }
+
+        TPConnectionIndexInfo source = info.InConnectionTargets[0];
+        return IsValidTarget(source, infos.Count) && source.NodeIndex != index ? source : null;
+    }
+
+    private static bool[] FindFoldable(List<SerializeNodeInfo> infos)
+    {
+        int count = infos.Count;
+        bool[] isCandidate = new bool[count];
+        for (int i = 0; i < count; i++)
+        {
+            isCandidate[i] = GetSplitterSource(infos, i) != null;
+        }
+
+        // Splitter끼리만 이어진 순환은 소스가 없으므로 제외
+        bool[] foldable = (bool[])isCandidate.Clone();
+        HashSet<int> visited = new();
+        for (int i = 0; i < count; i++)
+        {
+            if (!isCandidate[i])
+            {
+                continue;
+            }
+
+            visited.Clear();
+            int current = i;
+            while (isCandidate[current] && visited.Add(current))
+            {
+                current = GetSplitterSource(infos, current).NodeIndex;
+            }
+
+            if (current == i)
+            {
+                foldable[i] = false;
+            }
+        }
+
+        return foldable;
+    }
+
+    /// <summary>
+    /// 제거되는 Splitter의 출력을 소스 TPOut으로 치환. 선분은 소스 → ... → Splitter → 원래 대상 순서로 연결
+    /// </summary>
+    private static TPConnectionIndexInfo Resolve(List<SerializeNodeInfo> infos, bool[] foldable, TPConnectionIndexInfo target)
+    {
+        List<Vector2> vertices = new();
+        if (target.Vertices != null)
+        {
+            vertices.AddRange(target.Vertices);
+        }
+
+        int nodeIndex = target.NodeIndex;
+        int tpIndex = target.TpIndex;
+
+        while (foldable[nodeIndex])
+        {
+            TPConnectionIndexInfo source = GetSplitterSource(infos, nodeIndex);
+            if (source.Vertices != null)
+            {
+                vertices.InsertRange(0, source.Vertices);
+            }
+
+            nodeIndex = source.NodeIndex;
+            tpIndex = source.TpIndex;
+        }
+
+        return new TPConnectionIndexInfo { NodeIndex = nodeIndex, TpIndex = tpIndex, Vertices = vertices };
+    }
+
+    private static TPConnectionIndexInfo Remap(TPConnectionIndexInfo target, int[] newIndices)
+    {
+        return new TPConnectionIndexInfo
+        {
+            NodeIndex = newIndices[target.NodeIndex],
+            TpIndex = target.TpIndex,
+            Vertices = target.Vertices == null ? null : new List<Vector2>(target.Vertices),
+        };
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 제거 가능한 Splitter가 없으면 infos를 그대로 반환
+    /// </summary>
+    public static List<SerializeNodeInfo> FoldSplitters(List<SerializeNodeInfo> infos)
+    {
+        if (infos == null || !infos.Exists(info => info.NodeType == typeof(Splitter)))
+        {
+            return infos;
+        }
+
+        bool[] foldable = FindFoldable(infos);
+        if (System.Array.IndexOf(foldable, true) < 0)
+        {
+            return infos;
+        }
+
+        int count = infos.Count;
+        int[] newIndices = new int[count];
+        int nextIndex = 0;
+        for (int i = 0; i < count; i++)
+        {
+            newIndices[i] = foldable[i] ? -1 : nextIndex++;
+        }
+
+        List<SerializeNodeInfo> result = new(nextIndex);
+        for (int i = 0; i < count; i++)
+        {
+            if (foldable[i])
+            {
+                continue;
+            }
+
+            SerializeNodeInfo info = infos[i];
+
+            // In: Splitter 출력에서 오던 연결은 소스 TPOut으로 (target은 TPOut)
+            if (info.InConnectionTargets != null)
+            {
+                TPConnectionIndexInfo[] inTargets = new TPConnectionIndexInfo[info.InConnectionTargets.Length];
+                for (int j = 0; j < inTargets.Length; j++)
+                {
+                    TPConnectionIndexInfo target = info.InConnectionTargets[j];
+                    if (!IsValidTarget(target, count))
+                    {
+                        continue;
+                    }
+
+                    inTargets[j] = foldable[target.NodeIndex]
+                        ? Remap(Resolve(infos, foldable, target), newIndices)
+                        : Remap(target, newIndices);
+                }
+
+                info.InConnectionTargets = inTargets;
+            }
+
+            // Out: Splitter 입력으로 가던 연결은 제거. 대상 TPIn 쪽 연결 정보로 복원됨 (target은 TPIn)
+            if (info.OutConnectionTargets != null)
+            {
+                TPConnectionIndexInfo[] outTargets = new TPConnectionIndexInfo[info.OutConnectionTargets.Length];
+                for (int j = 0; j < outTargets.Length; j++)
+                {
+                    TPConnectionIndexInfo target = info.OutConnectionTargets[j];
+                    if (!IsValidTarget(target, count) || foldable[target.NodeIndex])
+                    {
+                        continue;
+                    }
+
+                    outTargets[j] = Remap(target, newIndices);
+                }
+
+                info.OutConnectionTargets = outTargets;
+            }
+
+            result.Add(info);
+        }
+
+        Debug.Log($"SplitterMigration: {count - nextIndex} Splitter → Fan-out connection");
+        return result;
+    }
+    #endregion
+}
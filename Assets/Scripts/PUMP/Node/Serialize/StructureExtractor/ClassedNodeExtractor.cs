@@ -4,6 +4,7 @@ using System.Collections.Generic;
 using System.Linq;
 using Unity.VisualScripting;
 using UnityEngine;
+using Utils;
 
 public class ClassedNodeExtractor : SaveLoadStructureExtractor, IClassedNodeDataManager
 {
@@ -89,6 +90,22 @@ public class ClassedNodeExtractor : SaveLoadStructureExtractor, IClassedNodeData
 
     public void SetCurrent(IClassedNode classedNode)
     {
+        // 처음 편집할 때 내부 Background 생성
+        if (!ClassedDict.ContainsKey(classedNode) && HeadlessDict.Remove(classedNode, out HeadlessModule headless))
+        {
+            headless.Dispose();
+            PUMPBackground materialized = Materialize(classedNode);
+
+            // BackgroundGetter가 다음 프레임에 Base를 다시 열기 때문에 그 이후에 다시 연다
+            Other.InvokeActionDelay(() =>
+            {
+                if (GetCurrent().PairBackground == materialized)
+                {
+                    materialized.Open();
+                }
+            }).Forget();
+        }
+
         if (ClassedDict.TryGetValue(classedNode, out PUMPBackground pairBackground))
         {
             CurrentPair.Set(classedNode, pairBackground, BaseBackground);
@@ -158,12 +175,18 @@ public class ClassedNodeExtractor : SaveLoadStructureExtractor, IClassedNodeData
 
     public void DestroyClassed(IClassedNode classedNode)
     {
+        if (HeadlessDict.Remove(classedNode, out HeadlessModule headless))
+        {
+            headless.Dispose();
+        }
+
         if (ClassedDict.TryGetValue(classedNode, out PUMPBackground background))
         {
             var current = CurrentPair.GetCurrent();
             if (current.ClassedNode == classedNode || current.PairBackground == background)
                 DiscardCurrent();
 
+            ModuleInliner.Unregister(classedNode);
             background.Destroy();
             // Destroy이벤트로 호출되기 때문에 classedNode는 파괴하지 않음.
 
@@ -189,6 +212,7 @@ public class ClassedNodeExtractor : SaveLoadStructureExtractor, IClassedNodeData
 
     #region Privates
     private Dictionary<IClassedNode, PUMPBackground> ClassedDict { get; set; } = new();
+    private Dictionary<IClassedNode, HeadlessModule> HeadlessDict { get; set; } = new();
     private CurrentClassedPairManager CurrentPair { get; set; } = new();
 
     private Action<TransitionEventArgs> _classedOnInputUpdateCache;
@@ -207,6 +231,37 @@ public class ClassedNodeExtractor : SaveLoadStructureExtractor, IClassedNodeData
 
         prog.SetProgress(60);
 
+        // 편집 전까지는 공유 템플릿으로 평가. 템플릿으로 평가할 수 없는 구조만 바로 Background 생성
+        if (!TryLinkHeadless(classedNode))
+        {
+            prog.SetProgress(80);
+            Materialize(classedNode);
+        }
+
+        prog.SetComplete();
+    }
+
+    /// <summary>
+    /// 내부 Background 없이 ModuleTemplate 인스턴스로 연결
+    /// </summary>
+    private bool TryLinkHeadless(IClassedNode classedNode)
+    {
+        PUMPSaveDataStructure matchedStructure = classedNode.ModuleStructure;
+        if (matchedStructure?.NodeInfos == null || !ModuleTemplateRegistry.TryGet(matchedStructure.NodeInfos, out ModuleTemplate template))
+        {
+            return false;
+        }
+
+        classedNode.Name = matchedStructure.Name;
+        HeadlessDict.Add(classedNode, new HeadlessModule(classedNode, template));
+        return true;
+    }
+
+    /// <summary>
+    /// 내부 Background 생성 후 연결
+    /// </summary>
+    private PUMPBackground Materialize(IClassedNode classedNode)
+    {
         PUMPSaveDataStructure matchedStructure = classedNode.ModuleStructure;
         PUMPBackground newBackground = BackgroundGetter?.Invoke();
         if (matchedStructure != null)
@@ -215,16 +270,15 @@ public class ClassedNodeExtractor : SaveLoadStructureExtractor, IClassedNodeData
             classedNode.Name = matchedStructure.Name;
         }
 
-        prog.SetProgress(80);
-
         LinkClassedToExternal(classedNode, newBackground.ExternalInput, newBackground.ExternalOutput);
 
         newBackground.ExternalInput.OnCountUpdate += _ => OnExternalCountUpdateHandler(classedNode, newBackground);
         newBackground.ExternalOutput.OnCountUpdate += _ => OnExternalCountUpdateHandler(classedNode, newBackground);
 
         ClassedDict.Add(classedNode, newBackground);
+        ModuleInliner.Register(classedNode, newBackground);
 
-        prog.SetComplete();
+        return newBackground;
     }
 
     /// <summary>
@@ -384,6 +438,123 @@ public class ClassedNodeExtractor : SaveLoadStructureExtractor, IClassedNodeData
     #endregion
 
     #region Private Class
+    /// <summary>
+    /// 내부 Background 없이 공유 ModuleTemplate의 인스턴스로 ClassedNode를 평가 (편집 전까지)
+    /// </summary>
+    private class HeadlessModule : IDisposable
+    {
+        private const int MAX_TICKS_PER_RUN = 256;
+
+        private readonly IClassedNode _classed;
+        private readonly ModuleInstance _instance;
+        private ClockTimer _continueTimer;
+        private bool _running;
+        private bool _disposed;
+
+        public HeadlessModule(IClassedNode classed, ModuleTemplate template)
+        {
+            _classed = classed;
+            _instance = template.CreateInstance();
+
+            if (classed.InputCount != template.InputCount || classed.OutputCount != template.OutputCount)
+            {
+                classed.InputCount = template.InputCount;
+                classed.OutputCount = template.OutputCount;
+            }
+
+            List<Action<TransitionType>> inputTypeApplier = classed.GetInputTypeApplier();
+            for (int i = 0; i < inputTypeApplier.Count && i < template.InputCount; i++)
+            {
+                inputTypeApplier[i]?.Invoke(template.GetInputType(i));
+            }
+
+            List<Action<TransitionType>> outputTypeApplier = classed.GetOutputTypeApplier();
+            for (int i = 0; i < outputTypeApplier.Count && i < template.OutputCount; i++)
+            {
+                outputTypeApplier[i]?.Invoke(template.GetOutputType(i));
+            }
+
+            classed.OutputStateValidate(_instance.GetOutputs());
+
+            classed.OnInputUpdate += OnInputUpdate;
+            _instance.OnOutput += OnOutput;
+
+            // 이미 연결되어 있는 입력 반영
+            ITransitionPoint[] inTps = classed.GetNode().GetTPs().inTps;
+            for (int i = 0; i < inTps.Length && i < template.InputCount; i++)
+            {
+                if (!inTps[i].State.IsNull && inTps[i].Type == template.GetInputType(i))
+                {
+                    _instance.WriteInput(i, inTps[i].State);
+                }
+            }
+
+            Run();
+        }
+
+        public void Dispose()
+        {
+            if (_disposed)
+            {
+                return;
+            }
+
+            _disposed = true;
+            _classed.OnInputUpdate -= OnInputUpdate;
+            _instance.OnOutput -= OnOutput;
+            _continueTimer?.Cancel();
+            _continueTimer = null;
+        }
+
+        private void OnInputUpdate(TransitionEventArgs args)
+        {
+            if (args.Index < 0 || args.Index >= _instance.InputCount)
+            {
+                Debug.LogError($"ClassedNodeExtractor.HeadlessModule: args.Index out of range: {args.Index}");
+                return;
+            }
+
+            _instance.WriteInput(args.Index, args.State);
+            Run();
+        }
+
+        private void OnOutput(int index, Transition state)
+        {
+            TransitionEventArgs args = TransitionEventArgs.Get(index, state, state, false);
+            _classed.OutputApply(args);
+            TransitionEventArgs.Release(args);
+        }
+
+        /// <summary>
+        /// 출력 전파 중 다시 들어온 입력은 대기열에 쌓이고 바깥 Run()에서 처리
+        /// </summary>
+        private void Run()
+        {
+            if (_disposed || _running)
+            {
+                return;
+            }
+
+            _running = true;
+            try
+            {
+                // 진동 회로: 상한을 넘으면 다음 프레임에 이어서
+                if (_instance.Run(MAX_TICKS_PER_RUN) && _continueTimer == null)
+                {
+                    _continueTimer = SimulationClock.ScheduleFrames(0, () =>
+                    {
+                        _continueTimer = null;
+                        Run();
+                    });
+                }
+            }
+            finally
+            {
+                _running = false;
+            }
+        }
+    }
+
     private class CurrentClassedPairManager
     {
         private IClassedNode _currentClassed;
@@ -1,4 +1,5 @@
 using System.Collections.Generic;
+using Cysharp.Threading.Tasks;
 using UnityEngine;
 
 public class DefaultExtractor : SaveLoadStructureExtractor
@@ -7,7 +8,8 @@ public class DefaultExtractor : SaveLoadStructureExtractor
 
     public override void ApplyData(PUMPSaveDataStructure structure)
     {
-        background.SetInfos(structure.NodeInfos, true);
+        // 큰 보드도 멈추지 않도록 여러 프레임에 나눠 불러옴
+        background.SetInfosAsync(structure.NodeInfos, true).Forget();
     }
 
     public override List<SerializeNodeInfo> GetNodeInfos()
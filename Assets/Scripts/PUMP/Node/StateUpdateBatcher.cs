@@ -0,0 +1,194 @@
+using System;
+using System.Collections.Generic;
+using UnityEngine;
+
+/// <summary>
+/// 입력 변경마다 StateUpdate를 호출하지 않고, 한 전파 단위(Tick)가 끝난 뒤 1회 호출받는 노드.
+/// 구현 시 StateUpdate는 호출되지 않는다.
+/// </summary>
+public interface IBatchStateUpdate
+{
+    /// <summary>
+    /// 이번 Tick 동안 변경된 입력 전체를 한 번에 전달
+    /// </summary>
+    void BatchStateUpdate(BatchStateEventArgs args);
+}
+
+/// <summary>
+/// 한 Tick 동안 변경된 입력 목록 (입력 Index 별 첫 이전 값, 마지막 값)
+/// 노드가 재사용하므로 BatchStateUpdate() 밖으로 참조를 넘기지 말 것.
+/// </summary>
+public class BatchStateEventArgs : EventArgs
+{
+    #region Privates
+    private readonly List<int> _indices = new();
+    private readonly List<Transition> _beforeStates = new();
+    private readonly List<Transition> _states = new();
+
+    internal void Record(int index, Transition beforeState, Transition state)
+    {
+        LastIndex = index;
+
+        int position = _indices.IndexOf(index);
+        if (position >= 0)
+        {
+            _states[position] = state;
+            return;
+        }
+
+        _indices.Add(index);
+        _beforeStates.Add(beforeState);
+        _states.Add(state);
+    }
+
+    internal void Clear()
+    {
+        _indices.Clear();
+        _beforeStates.Clear();
+        _states.Clear();
+        LastIndex = -1;
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 변경된 입력 개수
+    /// </summary>
+    public int Count => _indices.Count;
+
+    /// <summary>
+    /// 변경된 입력 Index 목록 (처음 변경된 순서)
+    /// </summary>
+    public IReadOnlyList<int> Indices => _indices;
+
+    /// <summary>
+    /// 가장 마지막으로 갱신된 입력 Index
+    /// </summary>
+    public int LastIndex { get; private set; } = -1;
+
+    /// <summary>
+    /// i번째 변경된 입력의 Tick 시작 전 State
+    /// </summary>
+    public Transition GetBeforeState(int i) => _beforeStates[i];
+
+    /// <summary>
+    /// i번째 변경된 입력의 현재 State
+    /// </summary>
+    public Transition GetState(int i) => _states[i];
+
+    /// <summary>
+    /// i번째 변경된 입력이 Tick 전후로 실제로 바뀌었는지
+    /// </summary>
+    public bool IsStateChange(int i) => !_beforeStates[i].Equals(_states[i]);
+
+    /// <summary>
+    /// 값이 실제로 바뀐 입력이 하나라도 있는지
+    /// </summary>
+    public bool AnyStateChange
+    {
+        get
+        {
+            for (int i = 0; i < _indices.Count; i++)
+            {
+                if (IsStateChange(i))
+                {
+                    return true;
+                }
+            }
+
+            return false;
+        }
+    }
+
+    public bool Contains(int index) => _indices.Contains(index);
+    #endregion
+}
+
+/// <summary>
+/// IBatchStateUpdate 노드의 호출 시점 관리.
+/// 전파 단위(Frame Drain, Immediately Flush, 노드의 StateUpdate)를 Wave로 감싸고,
+/// 가장 바깥 Wave가 끝날 때 대기중인 노드를 1회씩 호출한다.
+/// </summary>
+public static class StateUpdateBatcher
+{
+    #region Privates
+    private static readonly Queue<INodeLifecycleCallable> _queue = new();
+    private static int _waveDepth = 0;
+    private static bool _flushing = false;
+
+    private static void Flush()
+    {
+        if (_flushing)
+        {
+            return;
+        }
+
+        _flushing = true;
+        try
+        {
+            // 호출 중 다시 등록된 노드도 같은 Flush에서 처리
+            while (_queue.Count > 0)
+            {
+                INodeLifecycleCallable node = _queue.Dequeue();
+
+                _waveDepth++;
+                try
+                {
+                    node.CallBatchStateUpdate();
+                }
+                catch (Exception e)
+                {
+                    Debug.LogException(e);
+                }
+                finally
+                {
+                    _waveDepth--;
+                }
+            }
+        }
+        finally
+        {
+            _flushing = false;
+        }
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 대기중인 노드 개수
+    /// </summary>
+    public static int PendingCount => _queue.Count;
+
+    public static void BeginWave()
+    {
+        _waveDepth++;
+    }
+
+    public static void EndWave()
+    {
+        if (--_waveDepth > 0)
+        {
+            return;
+        }
+
+        _waveDepth = 0;
+        if (_queue.Count > 0)
+        {
+            Flush();
+        }
+    }
+
+    /// <summary>
+    /// 노드 호출 예약. Wave 밖이면 즉시 호출
+    /// </summary>
+    public static void Enqueue(INodeLifecycleCallable node)
+    {
+        _queue.Enqueue(node);
+
+        if (_waveDepth <= 0)
+        {
+            Flush();
+        }
+    }
+    #endregion
+}
@@ -46,7 +46,6 @@ public class ClassedPalette : NodePalette
             "Signal", new Dictionary<Type, string>
             {
                 { typeof(IsNull), "IsNull" },
-                { typeof(Splitter), "Split" },
                 { typeof(Merger), "Merger" },
                 { typeof(Switch), "Switch" },
                 { typeof(OneHot), "One Hot" },
@@ -30,7 +30,6 @@ public class CodexPalette : BaseCodexPalette
         {
             "Signal", new Dictionary<Type, string>
             {
-                { typeof(Splitter), "Split" },
                 { typeof(Switch), "Switch" },
                 { typeof(EdgeDetector), "Edge Detector" },
                 { typeof(TypeConverter), "Type Converter"},
@@ -0,0 +1,662 @@
+using System;
+using System.Collections.Generic;
+
+/// <summary>
+/// SerializeNodeInfo 변경분(Delta) 기반 Undo/Redo
+/// 마지막 기록 상태(State) 하나와, 기록마다 바뀐 노드 정보만 저장한다
+/// 용량은 기록 개수가 아닌 추정 메모리(byte)로 제한 (초과 시 오래된 기록부터 제거)
+/// </summary>
+public class NodeInfoHistory
+{
+    #region Privates
+    private enum OpKind
+    {
+        Insert,
+        Remove,
+        Replace,
+        ReplaceAll,
+    }
+
+    private class Op
+    {
+        public OpKind Kind;
+        public int Index;
+        public SerializeNodeInfo Before;
+        public SerializeNodeInfo After;
+        public List<SerializeNodeInfo> BeforeAll;
+        public List<SerializeNodeInfo> AfterAll;
+
+        /// <summary>
+        /// Remove: 제거된 노드를 참조하던 노드의 원래 정보 (제거 후 Index 기준)
+        /// </summary>
+        public List<(int index, SerializeNodeInfo info)> Patched;
+    }
+
+    private class Record
+    {
+        public readonly List<Op> Ops = new();
+        public long Size;
+    }
+
+    private const long INFO_BASE_SIZE = 128;
+    private const long CONNECTION_SIZE = 48;
+    private const long VERTEX_SIZE = 8;
+    private const long TP_SIZE = 24;
+    private const long ARGS_SIZE = 64;
+    private const int MAX_NESTED_DEPTH = 32;
+
+    private readonly long _memoryBudget;
+    private readonly List<Record> _records = new();
+    private List<SerializeNodeInfo> _state;
+    private Record _recording;
+    private int _current;
+    private long _memoryUsage;
+
+    private void AddOp(Op op)
+    {
+        _recording.Ops.Add(op);
+        _recording.Size += EstimateSize(op);
+    }
+
+    private void Apply(Op op, IListener listener)
+    {
+        switch (op.Kind)
+        {
+            case OpKind.Insert:
+                ApplyInsert(op.Index, default);
+                listener?.OnInserted(op.Index);
+                break;
+
+            case OpKind.Remove:
+                List<(int index, SerializeNodeInfo info)> patched = ApplyRemove(op.Index);
+                listener?.OnRemoved(op.Index);
+                NotifyPatched(patched, listener);
+                break;
+
+            case OpKind.Replace:
+                _state[op.Index] = op.After;
+                listener?.OnChanged(op.Index);
+                break;
+
+            case OpKind.ReplaceAll:
+                _state = new List<SerializeNodeInfo>(op.AfterAll);
+                listener?.OnReset();
+                break;
+        }
+    }
+
+    private void Revert(Op op, IListener listener)
+    {
+        switch (op.Kind)
+        {
+            case OpKind.Insert:
+                List<(int index, SerializeNodeInfo info)> patched = ApplyRemove(op.Index);
+                listener?.OnRemoved(op.Index);
+                NotifyPatched(patched, listener);
+                break;
+
+            case OpKind.Remove:
+                ApplyInsert(op.Index, op.Before);
+                listener?.OnInserted(op.Index);
+                if (op.Patched != null)
+                {
+                    foreach ((int index, SerializeNodeInfo info) in op.Patched)
+                    {
+                        int insertedIndex = index >= op.Index ? index + 1 : index;
+                        _state[insertedIndex] = info;
+                        listener?.OnChanged(insertedIndex);
+                    }
+                }
+                break;
+
+            case OpKind.Replace:
+                _state[op.Index] = op.Before;
+                listener?.OnChanged(op.Index);
+                break;
+
+            case OpKind.ReplaceAll:
+                _state = new List<SerializeNodeInfo>(op.BeforeAll);
+                listener?.OnReset();
+                break;
+        }
+    }
+
+    private static void NotifyPatched(List<(int index, SerializeNodeInfo info)> patched, IListener listener)
+    {
+        if (patched == null || listener == null)
+        {
+            return;
+        }
+
+        foreach ((int index, SerializeNodeInfo _) in patched)
+        {
+            listener.OnChanged(index);
+        }
+    }
+
+    /// <summary>
+    /// index에 노드 정보 삽입. 다른 노드의 index 이상 참조는 +1
+    /// </summary>
+    private void ApplyInsert(int index, SerializeNodeInfo info)
+    {
+        _state.Insert(index, info);
+
+        for (int i = 0; i < _state.Count; i++)
+        {
+            if (i != index && NeedsRemap(_state[i], index, out _))
+            {
+                _state[i] = Remap(_state[i], index, 1);
+            }
+        }
+    }
+
+    /// <summary>
+    /// index의 노드 정보 제거. 제거된 노드 참조는 끊고(null), 그 뒤 참조는 -1
+    /// </summary>
+    /// <returns>제거된 노드를 참조하던 노드의 원래 정보</returns>
+    private List<(int index, SerializeNodeInfo info)> ApplyRemove(int index)
+    {
+        _state.RemoveAt(index);
+
+        List<(int index, SerializeNodeInfo info)> patched = null;
+        for (int i = 0; i < _state.Count; i++)
+        {
+            SerializeNodeInfo info = _state[i];
+            if (!NeedsRemap(info, index, out bool referencesIndex))
+            {
+                continue;
+            }
+
+            if (referencesIndex)
+            {
+                patched ??= new List<(int index, SerializeNodeInfo info)>();
+                patched.Add((i, info));
+            }
+
+            _state[i] = Remap(info, index, -1);
+        }
+
+        return patched;
+    }
+
+    private static bool NeedsRemap(SerializeNodeInfo info, int pivot, out bool referencesPivot)
+    {
+        referencesPivot = false;
+        bool inNeeds = NeedsRemap(info.InConnectionTargets, pivot, ref referencesPivot);
+        bool outNeeds = NeedsRemap(info.OutConnectionTargets, pivot, ref referencesPivot);
+        return inNeeds || outNeeds;
+    }
+
+    private static bool NeedsRemap(TPConnectionIndexInfo[] targets, int pivot, ref bool referencesPivot)
+    {
+        if (targets == null)
+        {
+            return false;
+        }
+
+        bool needs = false;
+        foreach (TPConnectionIndexInfo target in targets)
+        {
+            if (target == null || target.NodeIndex < pivot)
+            {
+                continue;
+            }
+
+            needs = true;
+            referencesPivot |= target.NodeIndex == pivot;
+        }
+
+        return needs;
+    }
+
+    /// <summary>
+    /// pivot 이상 참조를 delta만큼 이동한 복사본. delta가 음수면 pivot 참조는 null
+    /// 기록에 공유된 TPConnectionIndexInfo는 수정하지 않는다
+    /// </summary>
+    private static SerializeNodeInfo Remap(SerializeNodeInfo info, int pivot, int delta)
+    {
+        info.InConnectionTargets = RemapTargets(info.InConnectionTargets, pivot, delta);
+        info.OutConnectionTargets = RemapTargets(info.OutConnectionTargets, pivot, delta);
+        return info;
+    }
+
+    private static TPConnectionIndexInfo[] RemapTargets(TPConnectionIndexInfo[] targets, int pivot, int delta)
+    {
+        if (targets == null)
+        {
+            return null;
+        }
+
+        TPConnectionIndexInfo[] result = new TPConnectionIndexInfo[targets.Length];
+        for (int i = 0; i < targets.Length; i++)
+        {
+            TPConnectionIndexInfo target = targets[i];
+            if (target == null || target.NodeIndex < pivot)
+            {
+                result[i] = target;
+                continue;
+            }
+
+            if (delta < 0 && target.NodeIndex == pivot)
+            {
+                result[i] = null;
+                continue;
+            }
+
+            result[i] = new TPConnectionIndexInfo
+            {
+                NodeIndex = target.NodeIndex + delta,
+                TpIndex = target.TpIndex,
+                Vertices = target.Vertices,
+            };
+        }
+
+        return result;
+    }
+
+    /// <summary>
+    /// TP 상태(State, StatePending)는 비교하지 않음. 실행 중 계속 바뀌는 값이므로 편집 기록 대상이 아님
+    /// </summary>
+    private static bool InfoEquals(SerializeNodeInfo a, SerializeNodeInfo b)
+    {
+        return a.NodeType == b.NodeType &&
+               a.NodePosition == b.NodePosition &&
+               ArrayEquals(a.InTpType, b.InTpType) &&
+               ArrayEquals(a.OutTpType, b.OutTpType) &&
+               ArgsEquals(a.NodeAdditionalArgs, b.NodeAdditionalArgs) &&
+               TargetsEquals(a.InConnectionTargets, b.InConnectionTargets) &&
+               TargetsEquals(a.OutConnectionTargets, b.OutConnectionTargets);
+    }
+
+    /// <summary>
+    /// NodeAdditionalArgs 값 비교. getter가 매번 새 값을 만드므로 참조가 아닌 값으로 (ClassedNode, ScriptingNode는 IEquatable)
+    /// </summary>
+    private static bool ArgsEquals(object a, object b)
+    {
+        return ReferenceEquals(a, b) || (a != null && a.Equals(b));
+    }
+
+    private static bool ArrayEquals<T>(T[] a, T[] b)
+    {
+        if (ReferenceEquals(a, b))
+        {
+            return true;
+        }
+
+        if (a == null || b == null || a.Length != b.Length)
+        {
+            return false;
+        }
+
+        EqualityComparer<T> comparer = EqualityComparer<T>.Default;
+        for (int i = 0; i < a.Length; i++)
+        {
+            if (!comparer.Equals(a[i], b[i]))
+            {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+    private static bool TargetsEquals(TPConnectionIndexInfo[] a, TPConnectionIndexInfo[] b)
+    {
+        if (ReferenceEquals(a, b))
+        {
+            return true;
+        }
+
+        if (a == null || b == null || a.Length != b.Length)
+        {
+            return false;
+        }
+
+        for (int i = 0; i < a.Length; i++)
+        {
+            TPConnectionIndexInfo x = a[i];
+            TPConnectionIndexInfo y = b[i];
+
+            if (ReferenceEquals(x, y))
+            {
+                continue;
+            }
+
+            if (x == null || y == null || x.NodeIndex != y.NodeIndex || x.TpIndex != y.TpIndex)
+            {
+                return false;
+            }
+
+            if (ReferenceEquals(x.Vertices, y.Vertices))
+            {
+                continue;
+            }
+
+            if (x.Vertices == null || y.Vertices == null || x.Vertices.Count != y.Vertices.Count)
+            {
+                return false;
+            }
+
+            for (int j = 0; j < x.Vertices.Count; j++)
+            {
+                if (x.Vertices[j] != y.Vertices[j])
+                {
+                    return false;
+                }
+            }
+        }
+
+        return true;
+    }
+
+    private static long EstimateSize(Op op)
+    {
+        long size = INFO_BASE_SIZE;
+
+        switch (op.Kind)
+        {
+            case OpKind.Remove:
+                size += EstimateSize(op.Before);
+                if (op.Patched != null)
+                {
+                    foreach ((int _, SerializeNodeInfo info) in op.Patched)
+                    {
+                        size += EstimateSize(info);
+                    }
+                }
+                break;
+
+            case OpKind.Replace:
+                size += EstimateSize(op.Before) + EstimateSize(op.After);
+                break;
+
+            case OpKind.ReplaceAll:
+                foreach (SerializeNodeInfo info in op.BeforeAll)
+                {
+                    size += EstimateSize(info);
+                }
+
+                foreach (SerializeNodeInfo info in op.AfterAll)
+                {
+                    size += EstimateSize(info);
+                }
+                break;
+        }
+
+        return size;
+    }
+
+    private static long EstimateSize(SerializeNodeInfo info, int depth = 0)
+    {
+        if (info.NodeType == null)
+        {
+            return 0;
+        }
+
+        long size = INFO_BASE_SIZE;
+        size += ((info.InTpType?.Length ?? 0) + (info.OutTpType?.Length ?? 0)) * TP_SIZE;
+        size += EstimateSize(info.InConnectionTargets) + EstimateSize(info.OutConnectionTargets);
+        size += EstimateArgsSize(info.NodeAdditionalArgs, depth);
+        return size;
+    }
+
+    /// <summary>
+    /// ClassedNode는 내부 모듈 구조를 재귀로, ScriptingNode는 스크립트 길이만큼
+    /// </summary>
+    private static long EstimateArgsSize(object args, int depth)
+    {
+        switch (args)
+        {
+            case null:
+                return 0;
+
+            case ClassedNodeSerializeInfo classed:
+            {
+                long size = ARGS_SIZE;
+                List<SerializeNodeInfo> nodeInfos = classed._structure?.NodeInfos;
+                if (nodeInfos == null || depth >= MAX_NESTED_DEPTH)
+                {
+                    return size;
+                }
+
+                foreach (SerializeNodeInfo nodeInfo in nodeInfos)
+                {
+                    size += EstimateSize(nodeInfo, depth + 1);
+                }
+
+                return size;
+            }
+
+            case ScriptingNode.ScriptingNodeSerializeInfo scripting:
+                return ARGS_SIZE + ((scripting._script?.Length ?? 0) + (scripting._fileName?.Length ?? 0)) * sizeof(char);
+
+            default:
+                return ARGS_SIZE;
+        }
+    }
+
+    private static long EstimateSize(TPConnectionIndexInfo[] targets)
+    {
+        if (targets == null)
+        {
+            return 0;
+        }
+
+        long size = 0;
+        foreach (TPConnectionIndexInfo target in targets)
+        {
+            if (target != null)
+            {
+                size += CONNECTION_SIZE + (target.Vertices?.Count ?? 0) * VERTEX_SIZE;
+            }
+        }
+
+        return size;
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// Undo()/Redo() 중 상태 변경 통지. 노드 추가/제거는 적용 순서대로 (이후 Index는 그 시점 기준)
+    /// </summary>
+    public interface IListener
+    {
+        void OnInserted(int index);
+        void OnRemoved(int index);
+
+        /// <summary>
+        /// index번째 노드 정보 변경 (위치, 연결, 인자 등)
+        /// </summary>
+        void OnChanged(int index);
+
+        /// <summary>
+        /// 상태 전체 교체
+        /// </summary>
+        void OnReset();
+    }
+
+    /// <param name="memoryBudget">기록 전체의 추정 메모리 한도 (byte). 최근 기록 하나는 한도를 넘어도 유지</param>
+    public NodeInfoHistory(long memoryBudget)
+    {
+        _memoryBudget = memoryBudget;
+    }
+
+    /// <summary>
+    /// Reset() 이후 true
+    /// </summary>
+    public bool HasState => _state != null;
+
+    /// <summary>
+    /// 현재 상태의 노드 수
+    /// </summary>
+    public int Count => _state?.Count ?? 0;
+
+    /// <summary>
+    /// 현재 상태의 index번째 노드 정보
+    /// </summary>
+    public SerializeNodeInfo this[int index] => _state[index];
+
+    /// <summary>
+    /// 기록 전체의 추정 메모리 (byte)
+    /// </summary>
+    public long MemoryUsage => _memoryUsage;
+
+    public bool CanUndo => _state != null && _current > 0;
+
+    public bool CanRedo => _state != null && _current < _records.Count;
+
+    /// <summary>
+    /// 현재 상태 복사본
+    /// </summary>
+    public List<SerializeNodeInfo> GetState()
+    {
+        return _state == null ? null : new List<SerializeNodeInfo>(_state);
+    }
+
+    /// <summary>
+    /// 기록을 모두 지우고 기준 상태 설정
+    /// </summary>
+    public void Reset(List<SerializeNodeInfo> state)
+    {
+        Clear();
+        _state = new List<SerializeNodeInfo>(state ?? new List<SerializeNodeInfo>());
+    }
+
+    public void Clear()
+    {
+        _records.Clear();
+        _state = null;
+        _recording = null;
+        _current = 0;
+        _memoryUsage = 0;
+    }
+
+    /// <summary>
+    /// 기록 시작. EndRecord()까지의 Insert/Remove/Replace/ReplaceAll이 하나의 기록
+    /// 순서: Remove(큰 index부터) => Insert(작은 index부터) => Replace
+    /// </summary>
+    public void BeginRecord()
+    {
+        if (_state == null)
+        {
+            throw new InvalidOperationException($"{nameof(NodeInfoHistory)}: Required call Reset()");
+        }
+
+        _recording = new Record();
+    }
+
+    /// <summary>
+    /// index에 빈 노드 정보 삽입. 내용은 이후 Replace()로 채운다
+    /// </summary>
+    public void Insert(int index)
+    {
+        ApplyInsert(index, default);
+        AddOp(new Op { Kind = OpKind.Insert, Index = index });
+    }
+
+    public void Remove(int index)
+    {
+        SerializeNodeInfo before = _state[index];
+        List<(int index, SerializeNodeInfo info)> patched = ApplyRemove(index);
+        AddOp(new Op { Kind = OpKind.Remove, Index = index, Before = before, Patched = patched });
+    }
+
+    /// <summary>
+    /// index의 노드 정보 교체. 내용이 같으면 기록하지 않음
+    /// </summary>
+    public void Replace(int index, SerializeNodeInfo info)
+    {
+        SerializeNodeInfo before = _state[index];
+        if (InfoEquals(before, info))
+        {
+            return;
+        }
+
+        _state[index] = info;
+        AddOp(new Op { Kind = OpKind.Replace, Index = index, Before = before, After = info });
+    }
+
+    /// <summary>
+    /// 상태 전체 교체 (대부분의 노드가 바뀐 경우)
+    /// </summary>
+    public void ReplaceAll(List<SerializeNodeInfo> state)
+    {
+        List<SerializeNodeInfo> before = _state;
+        _state = new List<SerializeNodeInfo>(state);
+        AddOp(new Op { Kind = OpKind.ReplaceAll, BeforeAll = before, AfterAll = new List<SerializeNodeInfo>(state) });
+    }
+
+    /// <returns>기록할 변경이 있었으면 true</returns>
+    public bool EndRecord()
+    {
+        Record record = _recording;
+        _recording = null;
+
+        if (record == null || record.Ops.Count == 0)
+        {
+            return false;
+        }
+
+        // Redo 기록 제거 ---------
+        for (int i = _current; i < _records.Count; i++)
+        {
+            _memoryUsage -= _records[i].Size;
+        }
+        _records.RemoveRange(_current, _records.Count - _current);
+
+        _records.Add(record);
+        _memoryUsage += record.Size;
+        _current = _records.Count;
+
+        // 메모리 한도 초과 시 오래된 기록부터 제거 ---------
+        while (_memoryUsage > _memoryBudget && _records.Count > 1)
+        {
+            _memoryUsage -= _records[0].Size;
+            _records.RemoveAt(0);
+            _current--;
+        }
+
+        return true;
+    }
+
+    /// <summary>
+    /// 상태를 이전 기록으로 되돌림. 결과는 GetState()
+    /// </summary>
+    /// <param name="listener">바뀐 노드 통지 (보드에 변경분만 적용할 때 사용)</param>
+    public bool Undo(IListener listener = null)
+    {
+        if (!CanUndo)
+        {
+            return false;
+        }
+
+        Record record = _records[--_current];
+        for (int i = record.Ops.Count - 1; i >= 0; i--)
+        {
+            Revert(record.Ops[i], listener);
+        }
+
+        return true;
+    }
+
+    /// <summary>
+    /// 상태를 다음 기록으로 되돌림. 결과는 GetState()
+    /// </summary>
+    /// <param name="listener">바뀐 노드 통지 (보드에 변경분만 적용할 때 사용)</param>
+    public bool Redo(IListener listener = null)
+    {
+        if (!CanRedo)
+        {
+            return false;
+        }
+
+        Record record = _records[_current++];
+        foreach (Op op in record.Ops)
+        {
+            Apply(op, listener);
+        }
+
+        return true;
+    }
+    #endregion
+}
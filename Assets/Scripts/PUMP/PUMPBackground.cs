@@ -35,6 +35,15 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
     [SerializeField] private int m_DefaultExternalInputCount = 2;
     [SerializeField] private int m_DefaultExternalOutputCount = 2;
 
+    [Space(10)]
+
+    [Header("<Simulation>"), Space(5)]
+    [SerializeField] private bool m_UseHeadlessKernel = false;
+    [SerializeField] private int m_KernelMaxTicksPerFrame = 256;
+
+    [SerializeField] private float m_SetInfosFrameBudget = 8f; // SetInfosAsync() 프레임당 작업 시간 (ms)
+    [SerializeField] private int m_UndoMemoryBudgetKB = 8192; // Undo 히스토리 메모리 한도 (KB)
+
     [field: Space(10)]
 
     [field: SerializeField] public bool RecordOnInitialize { get; set; } = true;
@@ -62,6 +71,10 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
     private readonly TaskCompletionSource<bool> _creationAwaitTcs = new();
     private Type[] _copyIgnoreType;
     private UniTask _changeInvokeTask = UniTask.CompletedTask;
+    private SimulationKernel _kernel;
+    private SafetyCancellationTokenSource _kernelLoopCts = new(false);
+    private SafetyCancellationTokenSource _setInfosCts = new(false);
+    private object _streamingLoad;
 
     /// <summary>
     /// All Nodes
@@ -98,6 +111,13 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
 
         OnChanged -= RecordHistory;
         OnChanged += RecordHistory;
+        OnChanged -= RebuildKernel;
+        OnChanged += RebuildKernel;
+        m_UseHeadlessKernel = Setting.IsHeadlessKernel;
+        Setting.OnSettingUpdated -= OnSettingUpdatedHandler;
+        Setting.OnSettingUpdated += OnSettingUpdatedHandler;
+        ModuleInliner.OnModuleChanged -= OnModuleChangedHandler;
+        ModuleInliner.OnModuleChanged += OnModuleChangedHandler;
 
         SetGateway();
         SetSelectionAreaController();
@@ -127,6 +147,7 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         node.OnRemove += n =>
         {
             Nodes.Remove(n);
+            _historyNodesChanged = true;
         };
     }
 
@@ -141,8 +162,18 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         JoinDraggable(draggable);
     }
     
-    private (int nodeIndex, int tpIndex) GetNodeAndTpIndex(ITransitionPoint findTp, List<Node> nodeDb)
+    private (int nodeIndex, int tpIndex) GetNodeAndTpIndex(ITransitionPoint findTp, List<Node> nodeDb, IReadOnlyDictionary<Node, int> nodeIndexes = null)
     {
+        if (nodeIndexes != null)
+        {
+            if (findTp.Node != null && nodeIndexes.TryGetValue(findTp.Node, out int nodeIndex))
+            {
+                return (nodeIndex, findTp.Node.GetTPIndex(findTp));
+            }
+
+            return (-1, -1);
+        }
+
         for (int i = 0; i < nodeDb.Count; i++)
         {
             int tpIndex = nodeDb[i].GetTPIndex(findTp);
@@ -155,7 +186,9 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         return (-1, -1);
     }
 
-    private void MapTransitionPointsToIndexInfo(TPConnectionIndexInfo[] saveTarget, ITransitionPoint[] source, List<Vector2>[] vertices, List<Node> nodeDb = null)
+    /// <param name="nodeIndexes">노드 => Index. 있으면 nodeDb 순회 대신 사용</param>
+    private void MapTransitionPointsToIndexInfo(TPConnectionIndexInfo[] saveTarget, ITransitionPoint[] source, List<Vector2>[] vertices, List<Node> nodeDb = null,
+        IReadOnlyDictionary<Node, int> nodeIndexes = null)
     {
         nodeDb ??= Nodes;
 
@@ -167,7 +200,7 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
                 continue;
             }
 
-            var nodeTpIndex = GetNodeAndTpIndex(source[i], nodeDb);
+            var nodeTpIndex = GetNodeAndTpIndex(source[i], nodeDb, nodeIndexes);
             if (nodeTpIndex.nodeIndex != -1 && nodeTpIndex.tpIndex != -1)
             {
                 Vector2 rectSize = Rect.rect.size;
@@ -182,6 +215,40 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         }
     }
 
+    /// <summary>
+    /// 노드 하나의 직렬화 정보
+    /// </summary>
+    /// <param name="nodeIndexes">노드 => Index. null이면 Nodes에서 검색</param>
+    private SerializeNodeInfo GetNodeInfo(Node node, IReadOnlyDictionary<Node, int> nodeIndexes = null)
+    {
+        Vector2 nodeLocalPosition = ConvertWorldToLocalPosition(node.Support.WorldPosition, Rect);
+        var typeTuple = node.GetTPElements(tp => tp.Type);
+        var statesTuple = node.GetTPElements(tp => tp.State);
+
+        SerializeNodeInfo nodeInfo = new()
+        {
+            NodeType = node.GetType(), // 노드 타입
+            NodePosition = GetNormalizeFromLocalPosition(Rect.rect.size, nodeLocalPosition), // 위치
+            InTpState = statesTuple.inputElems, // TP 상태정보
+            OutTpState = statesTuple.outputElems,
+            InTpType = typeTuple.inputElems,
+            OutTpType = typeTuple.outputElems,
+            StatePending = node.GetStatePending(),
+            NodeAdditionalArgs = node is INodeAdditionalArgs args ? args.AdditionalArgs : null // 직렬화 추가정보
+        };
+
+        // 연결정보
+        TPConnectionInfo connectionInfo = node.GetTPConnectionInfo();
+
+        nodeInfo.InConnectionTargets = new TPConnectionIndexInfo[connectionInfo.InConnectionTargets.Length];
+        MapTransitionPointsToIndexInfo(nodeInfo.InConnectionTargets, connectionInfo.InConnectionTargets, connectionInfo.InVertices, nodeIndexes: nodeIndexes);
+
+        nodeInfo.OutConnectionTargets = new TPConnectionIndexInfo[connectionInfo.OutConnectionTargets.Length];
+        MapTransitionPointsToIndexInfo(nodeInfo.OutConnectionTargets, connectionInfo.OutConnectionTargets, connectionInfo.OutVertices, nodeIndexes: nodeIndexes);
+
+        return nodeInfo;
+    }
+
     /// <summary>
     /// Gateway 무결성 보장 및 할당
     /// </summary>
@@ -234,6 +301,7 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
                 if (currentInput is Node node)
                 {
                     Nodes.Remove(node);
+                    _historyNodesChanged = true;
                 }
 
                 Node newNode = AddNewNode(typeof(ExternalInput));
@@ -266,6 +334,7 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
                 if (currentOutput is Node node)
                 {
                     Nodes.Remove(node);
+                    _historyNodesChanged = true;
                 }
 
                 Node newNode = AddNewNode(typeof(ExternalOutput));
@@ -304,6 +373,181 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         }
     }
 
+    /// <summary>
+    /// SetInfos(): 노드 하나 생성 (연결 정보 제외)
+    /// </summary>
+    private Node InstantiateNodeFromInfo(SerializeNodeInfo info, DeserializationCompleteReceiver completeReceiver)
+    {
+        // Instantiate new node and apply arg ---------
+        Node newNode = GetNewNodeWithArgs(info.NodeType, info.NodeAdditionalArgs);
+
+        // Notify the node of the deserialization ---------
+        if (newNode is IDeserializingListenable listenable) // 역직렬화 시작을 알림
+        {
+            listenable.OnDeserializing = true;
+            completeReceiver.Subscribe(() => listenable.OnDeserializing = false);
+        }
+
+        // Join Node and Invoke Initialize()
+        newNode = JoinNode(newNode);  // Initialize(), Nodes.Add() 한 상태
+        
+        if (newNode is null)
+        {
+            Debug.LogError($"{name}: AddNewNodeWithArgs() => GetNode() Null 반환");
+            return null;
+        }
+
+        // Set node position ---------
+        Vector2 normalizeValue = info.NodePosition;
+        Vector2 localPosition = GetLocalPositionFromNormalizeValue(Rect.rect.size, normalizeValue);
+        newNode.Support.SetPosition(ConvertLocalToWorldPosition(localPosition, Rect));
+
+        // Set Transition Point types --------
+        newNode.SetTPElements(info.InTpType, info.OutTpType, (tp, type) => tp.SetType(type));
+
+        // Set Transition Point states ---------
+        newNode.SetTPElements(info.InTpState, info.OutTpState, (tp, state) => tp.State = state);
+
+        return newNode;
+    }
+
+    /// <summary>
+    /// SetInfos(): index번째 노드 연결 복원
+    /// </summary>
+    /// <param name="inLocalVertices">미리 계산한 선분 로컬 좌표 (SetInfosPlan). null이면 여기서 계산</param>
+    private void LinkConnectionsFromInfo(int i, List<SerializeNodeInfo> infos, Vector2 rectSize, DeserializationCompleteReceiver completeReceiver,
+        List<Vector2>[] inLocalVertices = null, List<Vector2>[] outLocalVertices = null)
+    {
+        if (Nodes[i] == null)
+        {
+            return;
+        }
+
+        TPConnectionIndexInfo[] inConnectionTargetInfos = infos[i].InConnectionTargets;  // i번째 노드 커넥션 index 정보들
+        TPConnectionIndexInfo[] outConnectionTargetInfos = infos[i].OutConnectionTargets;
+
+        int inCount = inConnectionTargetInfos.Length;
+        int outCount = outConnectionTargetInfos.Length;
+
+        ITransitionPoint[] inConnectionTargets = new ITransitionPoint[inCount];
+        List<Vector2>[] inVertices = new List<Vector2>[inCount];
+        ITransitionPoint[] outConnectionTargets = new ITransitionPoint[outCount];
+        List<Vector2>[] outVertices = new List<Vector2>[outCount];
+
+        // In connection's target (target is TPOut) ---------
+        for (int j = 0; j < inCount; j++)
+        {
+            if (inConnectionTargetInfos[j] == null || Nodes.Count <= inConnectionTargetInfos[j].NodeIndex ||
+                inConnectionTargetInfos[j].NodeIndex <= -1) // 연결정보 없거나 잘못되었으면 연결 안함
+            {
+                continue;
+            }
+
+            // Find target node ---------
+            Node targetNode = Nodes[inConnectionTargetInfos[j].NodeIndex];
+
+            // Target's TP (out) ---------
+            ITransitionPoint[] targetOutTps = targetNode.GetTPs().outTps;
+
+            // Index info ---------
+            int targetTpIndex = inConnectionTargetInfos[j].TpIndex;
+
+            if (targetTpIndex <= -1 || targetOutTps.Length <= targetTpIndex)
+            {
+                continue;
+            }
+
+            // Match index to TP ---------
+            ITransitionPoint targetInTp = targetOutTps[targetTpIndex];
+            if (targetInTp == null)
+            {
+                continue;
+            }
+
+            // Apply to array ---------
+            inConnectionTargets[j] = targetInTp;
+
+            List<Vector2> verticesLocalPosition = inLocalVertices?[j] ?? inConnectionTargetInfos[j].Vertices
+                .Select(normalized => GetLocalPositionFromNormalizeValue(rectSize, normalized)).ToList();
+            inVertices[j] = ConvertLocalToWorldPositions(verticesLocalPosition, Rect);
+        }
+
+        // Out connection's target (target is TPIn)
+        for (int j = 0; j < outCount; j++)
+        {
+            if (outConnectionTargetInfos[j] == null || Nodes.Count <= outConnectionTargetInfos[j].NodeIndex ||
+                outConnectionTargetInfos[j].NodeIndex <= -1)
+            {
+                continue;
+            }
+
+            // Find target node ---------
+            Node targetNode = Nodes[outConnectionTargetInfos[j].NodeIndex];
+
+            // Target's TP (in) ---------
+            ITransitionPoint[] targetInTps = targetNode.GetTPs().inTps;
+
+            // Index info ---------
+            int targetTpIndex = outConnectionTargetInfos[j].TpIndex;
+
+            if (targetTpIndex <= -1 || targetInTps.Length <= targetTpIndex)
+            {
+                continue;
+            }
+
+            // Match index to TP ---------
+            ITransitionPoint targetOutTp = targetInTps[targetTpIndex];
+            if (targetOutTp == null)
+            {
+                continue;
+            }
+
+            // Apply to array ---------
+            outConnectionTargets[j] = targetOutTp;
+
+            List<Vector2> verticesLocalPosition = outLocalVertices?[j] ?? outConnectionTargetInfos[j].Vertices
+                .Select(normalized => GetLocalPositionFromNormalizeValue(rectSize, normalized)).ToList();
+            outVertices[j] = ConvertLocalToWorldPositions(verticesLocalPosition, Rect);
+        }
+
+        TPConnectionInfo connectionInfo = new(inConnectionTargets, outConnectionTargets, inVertices, outVertices);
+        Nodes[i].SetTPConnectionInfo(connectionInfo, completeReceiver);
+    }
+
+    /// <summary>
+    /// SetInfos(): 모든 노드 생성, 연결 이후 Pending 재생과 완료 처리
+    /// </summary>
+    private void CompleteSetInfos(List<SerializeNodeInfo> infos, List<INodeLifecycleCallable> callables, DeserializationCompleteReceiver completeReceiver, bool invokeOnChange)
+    {
+        // Lifecycle call 2: OnBeforeReplayPending ---------
+        for (int i = 0; i < callables.Count; i++)
+        {
+            INodeLifecycleCallable callable = callables[i];
+            callable.CallOnBeforeReplayPending(infos[i].StatePending.ToArray());
+        }
+
+        // Replay Pending ---------
+        for (int i = 0; i < Nodes.Count; i++)
+        {
+            Nodes[i].ReplayStatePending(infos[i].StatePending);
+        }
+
+        // Ensures the integrity of the gateway ---------
+        SetGateway();
+
+        // Invoke DeserializationCompleteReceiver ---------
+        completeReceiver.Invoke();
+
+        if (invokeOnChange)
+        {
+            OnChanged?.Invoke();
+        }
+        else
+        {
+            RebuildKernel();
+        }
+    }
+
     private void ClearNodes()
     {
         ClearSelected();
@@ -314,11 +558,13 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         }
         
         Nodes.Clear();
+        _historyNodesChanged = true;
     }
 
     /// <summary>
     /// 지속적으로 호출하더라도 이벤트 호출 프레임당 1회로 제한
     /// SetInfos() 메서드의 트랜지션에 영향받는 위치에서 호출하지 말 것.
+    /// 바뀐 노드를 모르므로 히스토리 기록 시 모든 노드를 다시 읽는다. 알 수 있으면 ReportChanges(Node) 사용
     /// </summary>
     void IChangeObserver.ReportChanges()
     {
@@ -327,6 +573,47 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
             return;
         }
 
+        _historyFullScan = true;
+        InvokeOnChangedEndFrame();
+    }
+
+    /// <summary>
+    /// changed 노드의 변경 (위치, 연결, 인자 등). 히스토리는 이 노드와 연결된 노드만 다시 읽는다
+    /// </summary>
+    void IChangeObserver.ReportChanges(Node changed)
+    {
+        if (IsOnChangeBlocked)
+        {
+            return;
+        }
+
+        if (changed != null)
+        {
+            _historyDirtyNodes.Add(changed);
+        }
+        else
+        {
+            _historyFullScan = true;
+        }
+
+        InvokeOnChangedEndFrame();
+    }
+
+    /// <summary>
+    /// 노드 추가/제거만 있는 변경. 추가/제거된 노드는 히스토리가 Nodes 변경으로 직접 추적
+    /// </summary>
+    private void ReportNodeListChanges()
+    {
+        if (IsOnChangeBlocked)
+        {
+            return;
+        }
+
+        InvokeOnChangedEndFrame();
+    }
+
+    private void InvokeOnChangedEndFrame()
+    {
         if (_changeInvokeTask.Status == UniTaskStatus.Succeeded)
         {
             _changeInvokeTask = ReportChangesEndFrameAsync();
@@ -339,6 +626,113 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         OnChanged?.Invoke();
     }
 
+    /// <summary>
+    /// 노드 구성 변경 시 커널 재컴파일
+    /// </summary>
+    private void RebuildKernel()
+    {
+        ReleaseKernel();
+
+        // SetInfosAsync() 진행 중에는 완료 시 한 번만 컴파일
+        if (_destroyed || _streamingLoad != null)
+        {
+            return;
+        }
+
+        // ClassedNode 모듈 내부: 부모 커널에 펼쳐서 평가
+        if (ModuleInliner.TryGetOwner(this, out Node owner))
+        {
+            PUMPBackground parent = owner.Background;
+            if (parent != null && parent != this)
+            {
+                parent.RebuildKernel();
+            }
+            return;
+        }
+
+        if (!m_UseHeadlessKernel)
+        {
+            return;
+        }
+
+        SimulationKernel kernel = SimulationKernel.Compile(Nodes);
+        if (kernel.NodeCount <= 0)
+        {
+            kernel.Dispose();
+            return;
+        }
+
+        _kernel = kernel;
+        KernelLoopAsync(kernel, _kernelLoopCts.CancelAndDisposeAndGetNewToken(out _kernelLoopCts)).Forget();
+    }
+
+    private void OnSettingUpdatedHandler()
+    {
+        UseHeadlessKernel = Setting.IsHeadlessKernel;
+    }
+
+    private void OnModuleChangedHandler(PUMPBackground parent)
+    {
+        if (parent == this)
+        {
+            RebuildKernel();
+        }
+    }
+
+    private void ReleaseKernel()
+    {
+        _kernelLoopCts.Cancel();
+
+        if (_kernel != null)
+        {
+            _kernel.Dispose();
+            _kernel = null;
+        }
+    }
+
+    private async UniTaskVoid KernelLoopAsync(SimulationKernel kernel, CancellationToken token)
+    {
+        System.Diagnostics.Stopwatch stopwatch = new();
+        try
+        {
+            while (!token.IsCancellationRequested)
+            {
+                if (Setting.IsTurbo)
+                {
+                    // Turbo: Tick 상한 또는 시간 예산까지 실행
+                    int maxTicks = Setting.TurboTicksPerFrame;
+                    double budget = Setting.TurboTimeBudget;
+                    stopwatch.Restart();
+                    for (int i = 0; i < maxTicks && !kernel.IsIdle; i++)
+                    {
+                        kernel.Tick();
+
+                        if (stopwatch.Elapsed.TotalMilliseconds >= budget)
+                        {
+                            break;
+                        }
+                    }
+
+                    stopwatch.Stop();
+                }
+                else
+                {
+                    // 대기중인 입력이 없어질 때까지 (진동 회로 대비 상한)
+                    for (int i = 0; i < m_KernelMaxTicksPerFrame && !kernel.IsIdle; i++)
+                    {
+                        kernel.Tick();
+                    }
+                }
+
+                // 변경된 포트만 프레임당 1회 UI 반영
+                kernel.Mirror();
+
+                await UniTask.Yield(token, cancelImmediately: true);
+            }
+        }
+        catch (OperationCanceledException) { }
+    }
+
     private void Start()
     {
         _creationAwaitTcs.SetResult(true);
@@ -352,6 +746,11 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         }
 
         ClearSelected();
+        _kernelLoopCts.CancelAndDispose();
+        _setInfosCts.CancelAndDispose();
+        _kernel = null;
+        ModuleInliner.OnModuleChanged -= OnModuleChangedHandler;
+        Setting.OnSettingUpdated -= OnSettingUpdatedHandler;
         _externalInputAdapter.Dispose();
         _externalOutputAdapter.Dispose();
         OnDestroyed?.Invoke();
@@ -396,6 +795,63 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
 
     public LineConnectManager LineConnectManager => m_LineConnectManager;
 
+    /// <summary>
+    /// IHeadlessEvaluable 노드를 SimulationKernel로 평가할지 여부. 설정 적용 시 Setting.IsHeadlessKernel로 갱신
+    /// </summary>
+    public bool UseHeadlessKernel
+    {
+        get => m_UseHeadlessKernel;
+        set
+        {
+            if (m_UseHeadlessKernel == value)
+            {
+                return;
+            }
+
+            m_UseHeadlessKernel = value;
+            RebuildKernel();
+        }
+    }
+
+    /// <summary>
+    /// 현재 동작중인 커널 (없으면 null)
+    /// </summary>
+    public SimulationKernel Kernel => _kernel;
+
+    /// <summary>
+    /// 현재 노드 중 Bool 게이트 영역을 비트 병렬 엔진으로 컴파일 (64 입력 벡터 동시 평가, 전수 검사용)
+    /// 콘솔 /truthtable에서 사용. 커널 루프(SimulationKernel)는 사용하지 않음
+    /// </summary>
+    public BitParallelNetwork CompileBitParallelNetwork()
+    {
+        return BitParallelNetwork.Compile(Nodes);
+    }
+
+    /// <summary>
+    /// 외부 출력 노드에 연결된 출력 TP (외부 출력 순서, 미연결은 제외)
+    /// </summary>
+    public List<ITransitionPoint> GetExternalOutputSources()
+    {
+        List<ITransitionPoint> sources = new();
+        foreach (Node node in Nodes)
+        {
+            if (node is not IExternalOutput)
+            {
+                continue;
+            }
+
+            foreach (ITransitionPoint inTp in node.GetTPs().inTps)
+            {
+                if (inTp?.Connection?.SourcePoint is { } source)
+                {
+                    sources.Add(source);
+                }
+            }
+        }
+
+        return sources;
+    }
+
     public LineEdgeSortingManager LineEdgeSortingManager => m_LineEdgeSortingManager;
 
     public PUMPComponentGetter ComponentGetter
@@ -665,6 +1121,7 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
 
         AddNodeToDraggable(node);
         Nodes.Add(node);
+        _historyNodesChanged = true;
         return node;
     }
 
@@ -687,32 +1144,7 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
 
             foreach (Node node in Nodes)
             {
-                Vector2 nodeLocalPosition = ConvertWorldToLocalPosition(node.Support.WorldPosition, Rect);
-                var typeTuple = node.GetTPElements(tp => tp.Type);
-                var statesTuple = node.GetTPElements(tp => tp.State);
-
-                SerializeNodeInfo nodeInfo = new()
-                {
-                    NodeType = node.GetType(), // 노드 타입
-                    NodePosition = GetNormalizeFromLocalPosition(Rect.rect.size, nodeLocalPosition), // 위치
-                    InTpState = statesTuple.inputElems, // TP 상태정보
-                    OutTpState = statesTuple.outputElems,
-                    InTpType = typeTuple.inputElems,
-                    OutTpType = typeTuple.outputElems,
-                    StatePending = node.GetStatePending(),
-                    NodeAdditionalArgs = node is INodeAdditionalArgs args ? args.AdditionalArgs : null // 직렬화 추가정보
-                };
-
-                // 연결정보
-                TPConnectionInfo connectionInfo = node.GetTPConnectionInfo();
-
-                nodeInfo.InConnectionTargets = new TPConnectionIndexInfo[connectionInfo.InConnectionTargets.Length];
-                MapTransitionPointsToIndexInfo(nodeInfo.InConnectionTargets, connectionInfo.InConnectionTargets, connectionInfo.InVertices);
-
-                nodeInfo.OutConnectionTargets = new TPConnectionIndexInfo[connectionInfo.OutConnectionTargets.Length];
-                MapTransitionPointsToIndexInfo(nodeInfo.OutConnectionTargets, connectionInfo.OutConnectionTargets, connectionInfo.OutVertices);
-
-                result.Add(nodeInfo);
+                result.Add(GetNodeInfo(node));
             }
 
             return result;
@@ -730,6 +1162,9 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
 
     public void SetInfos(List<SerializeNodeInfo> infos, bool invokeOnChange = true)
     {
+        // 진행중인 SetInfosAsync() 취소 ---------
+        _setInfosCts.Cancel();
+
         // Add change blocker ---------
         object blocker = new();
         _isOnChangeBlocker.Add(blocker);
@@ -739,39 +1174,23 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
 
         try
         {
+            ReleaseKernel();
             ClearNodes();
-            // Load without connection info ==>
-            foreach (SerializeNodeInfo info in infos)
-            {
-                // Instantiate new node and apply arg ---------
-                Node newNode = GetNewNodeWithArgs(info.NodeType, info.NodeAdditionalArgs);
 
-                // Notify the node of the deserialization ---------
-                if (newNode is IDeserializingListenable listenable) // 역직렬화 시작을 알림
-                {
-                    listenable.OnDeserializing = true;
-                    completeReceiver.Subscribe(() => listenable.OnDeserializing = false);
-                }
+            // Splitter => TPOut Fan-out (이전 저장 데이터)
+            infos = SplitterMigration.FoldSplitters(infos);
 
-                // Join Node and Invoke Initialize()
-                newNode = JoinNode(newNode);  // Initialize(), Nodes.Add() 한 상태
-                
-                if (newNode is null)
+            // 스크립트 컴파일, 실행 (워커 스레드에서 동시에). 노드 초기화 때는 바인딩만 ---------
+            ScriptLoadBatch.EnsureBridge(infos);
+            using ScriptLoadBatch scriptBatch = ScriptLoadBatch.Prepare(infos).Begin();
+
+            // Load without connection info ==>
+            foreach (SerializeNodeInfo info in infos)
+            {
+                if (InstantiateNodeFromInfo(info, completeReceiver) is null)
                 {
-                    Debug.LogError($"{name}: AddNewNodeWithArgs() => GetNode() Null 반환");
                     return;
                 }
-
-                // Set node position ---------
-                Vector2 normalizeValue = info.NodePosition;
-                Vector2 localPosition = GetLocalPositionFromNormalizeValue(Rect.rect.size, normalizeValue);
-                newNode.Support.SetPosition(ConvertLocalToWorldPosition(localPosition, Rect));
-
-                // Set Transition Point types --------
-                newNode.SetTPElements(info.InTpType, info.OutTpType, (tp, type) => tp.SetType(type));
-
-                // Set Transition Point states ---------
-                newNode.SetTPElements(info.InTpState, info.OutTpState, (tp, state) => tp.State = state);
             }
 
             if (Nodes.Count != infos.Count)
@@ -794,124 +1213,128 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
 
             for (int i = 0; i < Nodes.Count; i++)
             {
-                if (Nodes[i] == null)
-                {
-                    continue;
-                }
-
-                TPConnectionIndexInfo[] inConnectionTargetInfos = infos[i].InConnectionTargets;  // i번째 노드 커넥션 index 정보들
-                TPConnectionIndexInfo[] outConnectionTargetInfos = infos[i].OutConnectionTargets;
-
-                int inCount = inConnectionTargetInfos.Length;
-                int outCount = outConnectionTargetInfos.Length;
+                LinkConnectionsFromInfo(i, infos, rectSize, completeReceiver);
+            }
 
-                ITransitionPoint[] inConnectionTargets = new ITransitionPoint[inCount];
-                List<Vector2>[] inVertices = new List<Vector2>[inCount];
-                ITransitionPoint[] outConnectionTargets = new ITransitionPoint[outCount];
-                List<Vector2>[] outVertices = new List<Vector2>[outCount];
+            CompleteSetInfos(infos, callables, completeReceiver, invokeOnChange);
+        }
+        catch (Exception e)
+        {
+            Debug.LogException(e);
+        }
+        finally
+        {
+            // Remove change blocker ---------
+            _isOnChangeBlocker.Remove(blocker);
+        }
+    }
 
-                // In connection's target (target is TPOut) ---------
-                for (int j = 0; j < inCount; j++)
-                {
-                    if (inConnectionTargetInfos[j] == null || Nodes.Count <= inConnectionTargetInfos[j].NodeIndex ||
-                        inConnectionTargetInfos[j].NodeIndex <= -1) // 연결정보 없거나 잘못되었으면 연결 안함
-                    {
-                        continue;
-                    }
+    /// <summary>
+    /// SetInfos()를 여러 프레임에 나눠 실행. 프레임당 m_SetInfosFrameBudget(ms) 동안 노드 생성, 연결
+    /// 진행도는 Loading.Progress로 보고, 커널(시뮬레이션)은 모두 불러온 뒤에 만든다
+    /// Unity 객체가 필요 없는 준비(SetInfosPlan)는 워커 스레드에서 먼저 실행
+    /// </summary>
+    public async UniTask SetInfosAsync(List<SerializeNodeInfo> infos, bool invokeOnChange = true, CancellationToken token = default)
+    {
+        CancellationToken loadToken = _setInfosCts.CancelAndDisposeAndGetNewToken(out _setInfosCts);
+        using CancellationTokenSource linkedCts = CancellationTokenSource.CreateLinkedTokenSource(loadToken, token);
+        CancellationToken linkedToken = linkedCts.Token;
 
-                    // Find target node ---------
-                    Node targetNode = Nodes[inConnectionTargetInfos[j].NodeIndex];
+        // Add change blocker ---------
+        object blocker = new();
+        _isOnChangeBlocker.Add(blocker);
+        _streamingLoad = blocker;
 
-                    // Target's TP (out) ---------
-                    ITransitionPoint[] targetOutTps = targetNode.GetTPs().outTps;
+        // Can receive complete SetInfos() for this object ---------
+        using DeserializationCompleteReceiver completeReceiver = new();
 
-                    // Index info ---------
-                    int targetTpIndex = inConnectionTargetInfos[j].TpIndex;
+        Loading.Progress progress = Loading.GetProgress();
+        System.Diagnostics.Stopwatch stopwatch = System.Diagnostics.Stopwatch.StartNew();
 
-                    if (targetTpIndex <= -1 || targetOutTps.Length <= targetTpIndex)
-                    {
-                        continue;
-                    }
+        try
+        {
+            // Splitter 변환, 타입 검증, 선분 좌표, 스크립트 컴파일 (워커 스레드) ---------
+            Vector2 rectSize = Rect.rect.size;
+            ScriptLoadBatch.EnsureBridge(infos);
+
+            // 준비가 끝난 뒤 취소되어도 plan을 받아서 스크립트를 정리 (RunOnThreadPool에 토큰을 넘기면 결과가 버려짐)
+            SetInfosPlan plan = await UniTask.RunOnThreadPool(() => SetInfosPlan.Prepare(infos, rectSize, linkedToken));
+            using ScriptLoadBatch scriptBatch = plan.Scripts;
+            linkedToken.ThrowIfCancellationRequested();
+            scriptBatch.Begin();
+            if (!plan.IsValid)
+            {
+                Debug.LogError($"SetInfosAsync: invalid node type at index {string.Join(", ", plan.InvalidNodes)}");
+                return;
+            }
 
-                    // Match index to TP ---------
-                    ITransitionPoint targetInTp = targetOutTps[targetTpIndex];
-                    if (targetInTp == null)
-                    {
-                        continue;
-                    }
+            infos = plan.Infos;
+            stopwatch.Restart();
 
-                    // Apply to array ---------
-                    inConnectionTargets[j] = targetInTp;
+            ReleaseKernel();
+            ClearNodes();
 
-                    List<Vector2> verticesLocalPosition = inConnectionTargetInfos[j].Vertices
-                        .Select(normalized => GetLocalPositionFromNormalizeValue(rectSize, normalized)).ToList();
-                    inVertices[j] = ConvertLocalToWorldPositions(verticesLocalPosition, Rect);
-                }
+            // 생성 + 연결, 진행도 0 ~ 99 (100은 완료 시)
+            int totalSteps = Math.Max(infos.Count * 2, 1);
+            int doneSteps = 0;
 
-                // Out connection's target (target is TPIn)
-                for (int j = 0; j < outCount; j++)
+            async UniTask YieldIfOverBudget()
+            {
+                if (stopwatch.Elapsed.TotalMilliseconds < m_SetInfosFrameBudget)
                 {
-                    if (outConnectionTargetInfos[j] == null || Nodes.Count <= outConnectionTargetInfos[j].NodeIndex ||
-                        outConnectionTargetInfos[j].NodeIndex <= -1)
-                    {
-                        continue;
-                    }
-
-                    // Find target node ---------
-                    Node targetNode = Nodes[outConnectionTargetInfos[j].NodeIndex];
-
-                    // Target's TP (in) ---------
-                    ITransitionPoint[] targetInTps = targetNode.GetTPs().inTps;
-
-                    // Index info ---------
-                    int targetTpIndex = outConnectionTargetInfos[j].TpIndex;
-
-                    if (targetTpIndex <= -1 || targetInTps.Length <= targetTpIndex)
-                    {
-                        continue;
-                    }
-
-                    // Match index to TP ---------
-                    ITransitionPoint targetOutTp = targetInTps[targetTpIndex];
-                    if (targetOutTp == null)
-                    {
-                        continue;
-                    }
+                    return;
+                }
 
-                    // Apply to array ---------
-                    outConnectionTargets[j] = targetOutTp;
+                progress.SetProgress(doneSteps * 99 / totalSteps);
+                await UniTask.Yield(PlayerLoopTiming.Update, linkedToken);
+                stopwatch.Restart();
+            }
 
-                    List<Vector2> verticesLocalPosition = outConnectionTargetInfos[j].Vertices
-                        .Select(normalized => GetLocalPositionFromNormalizeValue(rectSize, normalized)).ToList();
-                    outVertices[j] = ConvertLocalToWorldPositions(verticesLocalPosition, Rect);
+            // Load without connection info ==>
+            foreach (SerializeNodeInfo info in infos)
+            {
+                if (InstantiateNodeFromInfo(info, completeReceiver) is null)
+                {
+                    return;
                 }
 
-                TPConnectionInfo connectionInfo = new(inConnectionTargets, outConnectionTargets, inVertices, outVertices);
-                Nodes[i].SetTPConnectionInfo(connectionInfo, completeReceiver);
+                doneSteps++;
+                await YieldIfOverBudget();
             }
 
-            // Lifecycle call 2: OnBeforeReplayPending ---------
-            for (int i = 0; i < callables.Count; i++)
+            if (Nodes.Count != infos.Count)
             {
-                INodeLifecycleCallable callable = callables[i];
-                callable.CallOnBeforeReplayPending(infos[i].StatePending.ToArray());
+                Debug.LogError("Nodes <-> infos count mismatch");
+                return;
             }
 
-            // Replay Pending ---------
-            for (int i = 0; i < Nodes.Count; i++)
+            // For call Node's lifecycle method ---------
+            List<INodeLifecycleCallable> callables = Nodes.Select(node => (INodeLifecycleCallable)node).ToList();
+
+            // Lifecycle call 1: OnBeforeAutoConnect ---------
+            foreach (INodeLifecycleCallable callable in callables) // 생명주기: 자동 커넥션 이전
             {
-                Nodes[i].ReplayStatePending(infos[i].StatePending);
+                callable.CallOnBeforeAutoConnect();
             }
 
-            // Ensures the integrity of the gateway ---------
-            SetGateway();
+            // Load connection info ==>
+            for (int i = 0; i < Nodes.Count; i++)
+            {
+                LinkConnectionsFromInfo(i, infos, rectSize, completeReceiver, plan.InLocalVertices[i], plan.OutLocalVertices[i]);
 
-            // Invoke DeserializationCompleteReceiver ---------
-            completeReceiver.Invoke();
+                doneSteps++;
+                await YieldIfOverBudget();
+            }
 
-            if (invokeOnChange)
+            _streamingLoad = null;
+            CompleteSetInfos(infos, callables, completeReceiver, invokeOnChange);
+        }
+        catch (OperationCanceledException)
+        {
+            // 일부만 불러온 상태로 남기지 않음 (다른 SetInfos로 대체된 경우는 제외)
+            if (!_destroyed && !loadToken.IsCancellationRequested)
             {
-                OnChanged?.Invoke();
+                ClearNodes();
             }
         }
         catch (Exception e)
@@ -920,6 +1343,13 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         }
         finally
         {
+            if (_streamingLoad == blocker)
+            {
+                _streamingLoad = null;
+            }
+
+            progress.SetComplete();
+
             // Remove change blocker ---------
             _isOnChangeBlocker.Remove(blocker);
         }
@@ -1113,6 +1543,8 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
                 }
             }
 
+            ScriptLoadBatch.EnsureBridge(infos);
+            using ScriptLoadBatch scriptBatch = ScriptLoadBatch.Prepare(infos).Begin();
             int nodeDbCount = Nodes.Count;
 
             foreach (SerializeNodeInfo info in infos)
@@ -1308,53 +1740,621 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
     #endregion
 
     #region Undo/Redo
-    private UndoDelegate<List<SerializeNodeInfo>> _undoDelegate;
+    /// <summary>
+    /// Undo()/Redo() 중 바뀐 노드 수집. Slots는 복원 후 상태 순서의 노드 (null = 새로 만들 노드)
+    /// </summary>
+    private class HistoryRestorePlan : NodeInfoHistory.IListener
+    {
+        public HistoryRestorePlan(List<Node> nodes)
+        {
+            Slots = new List<Node>(nodes);
+        }
+
+        public List<Node> Slots { get; }
+        public List<Node> Removed { get; } = new();
+        public HashSet<Node> Changed { get; } = new();
+        public bool IsReset { get; private set; }
 
-    private UndoDelegate<List<SerializeNodeInfo>> UndoDelegate
+        void NodeInfoHistory.IListener.OnInserted(int index)
+        {
+            Slots.Insert(index, null);
+        }
+
+        void NodeInfoHistory.IListener.OnRemoved(int index)
+        {
+            if (Slots[index] != null)
+            {
+                Removed.Add(Slots[index]);
+            }
+
+            Slots.RemoveAt(index);
+        }
+
+        void NodeInfoHistory.IListener.OnChanged(int index)
+        {
+            if (Slots[index] != null)
+            {
+                Changed.Add(Slots[index]);
+            }
+        }
+
+        void NodeInfoHistory.IListener.OnReset()
+        {
+            IsReset = true;
+        }
+    }
+
+    private NodeInfoHistory _history;
+    private readonly List<Node> _historyNodes = new();  // History 상태의 Index 순서와 같은 노드
+    private readonly Dictionary<Node, int> _historyNodeIndexes = new();
+    private readonly HashSet<Node> _historyDirtyNodes = new();
+    private bool _historyNodesChanged;
+    private bool _historyFullScan;
+
+    private NodeInfoHistory History => _history ??= new NodeInfoHistory(m_UndoMemoryBudgetKB * 1024L);
+
+    /// <summary>
+    /// 현재 보드 전체를 히스토리 기준 상태로 (기록 초기화)
+    /// </summary>
+    private void ResetHistory()
     {
-        get
+        List<SerializeNodeInfo> infos = GetInfos();
+        if (infos == null)
+        {
+            History.Clear();
+            return;
+        }
+
+        History.Reset(infos);
+        SetHistoryNodes();
+    }
+
+    private void SetHistoryNodes()
+    {
+        _historyNodes.Clear();
+        _historyNodes.AddRange(Nodes);
+        RebuildHistoryNodeIndexes();
+
+        _historyDirtyNodes.Clear();
+        _historyNodesChanged = false;
+        _historyFullScan = false;
+    }
+
+    private void RebuildHistoryNodeIndexes()
+    {
+        _historyNodeIndexes.Clear();
+        for (int i = 0; i < _historyNodes.Count; i++)
+        {
+            _historyNodeIndexes[_historyNodes[i]] = i;
+        }
+    }
+
+    /// <summary>
+    /// 기록된 index번째 노드와 연결되어 있던 노드를 변경 대상에 추가
+    /// Out 기록은 Fan-out의 첫 분기뿐이므로, 이 노드를 가리키는 In 기록으로 나머지 분기를 찾음
+    /// </summary>
+    /// <param name="recordedInRefs">BuildRecordedInRefs() 결과. null이면 기록 전체를 검색</param>
+    private void MarkRecordedNeighbors(int index, List<int>[] recordedInRefs = null)
+    {
+        SerializeNodeInfo info = History[index];
+        MarkRecordedNeighbors(info.InConnectionTargets);
+        MarkRecordedNeighbors(info.OutConnectionTargets);
+
+        if (recordedInRefs != null)
         {
-            if (_undoDelegate == null)
+            if (index < recordedInRefs.Length && recordedInRefs[index] != null)
             {
-                _undoDelegate = new
-                (
-                    recordGetter: GetInfos,
-                    onUndo: result =>
-                    {
-                        ClearSelected();
-                        SetInfos(result, false);
-                    },
-                    maxCapacity: 20
-                );
-                _undoDelegate.RecordAfterClear = true;
+                foreach (int targetIndex in recordedInRefs[index])
+                {
+                    _historyDirtyNodes.Add(_historyNodes[targetIndex]);
+                }
             }
 
-            return _undoDelegate;
+            return;
+        }
+
+        for (int i = 0; i < History.Count && i < _historyNodes.Count; i++)
+        {
+            if (RefersTo(History[i].InConnectionTargets, index))
+            {
+                _historyDirtyNodes.Add(_historyNodes[i]);
+            }
         }
     }
 
+    private static bool RefersTo(TPConnectionIndexInfo[] targets, int index)
+    {
+        if (targets == null)
+        {
+            return false;
+        }
+
+        foreach (TPConnectionIndexInfo target in targets)
+        {
+            if (target != null && target.NodeIndex == index)
+            {
+                return true;
+            }
+        }
+
+        return false;
+    }
+
     /// <summary>
-    /// 히스토리 저장.
+    /// [공급 노드 index] => 기록상 그 노드의 Out을 In으로 받는 노드 index 목록
+    /// </summary>
+    private List<int>[] BuildRecordedInRefs()
+    {
+        int count = Math.Min(History.Count, _historyNodes.Count);
+        List<int>[] refs = new List<int>[count];
+        for (int i = 0; i < count; i++)
+        {
+            TPConnectionIndexInfo[] targets = History[i].InConnectionTargets;
+            if (targets == null)
+            {
+                continue;
+            }
+
+            foreach (TPConnectionIndexInfo target in targets)
+            {
+                if (target == null || target.NodeIndex < 0 || target.NodeIndex >= count)
+                {
+                    continue;
+                }
+
+                List<int> list = refs[target.NodeIndex] ??= new List<int>();
+                if (!list.Contains(i))
+                {
+                    list.Add(i);
+                }
+            }
+        }
+
+        return refs;
+    }
+
+    private void MarkRecordedNeighbors(TPConnectionIndexInfo[] targets)
+    {
+        if (targets == null)
+        {
+            return;
+        }
+
+        foreach (TPConnectionIndexInfo target in targets)
+        {
+            if (target != null && target.NodeIndex >= 0 && target.NodeIndex < _historyNodes.Count)
+            {
+                _historyDirtyNodes.Add(_historyNodes[target.NodeIndex]);
+            }
+        }
+    }
+
+    /// <summary>
+    /// 노드 추가/제거를 히스토리 상태에 반영 (Nodes와 _historyNodes 순서 일치)
+    /// </summary>
+    /// <returns>대부분의 노드가 바뀌어 상태 전체를 교체했으면 true</returns>
+    private bool RecordHistoryNodeList()
+    {
+        if (!_historyNodesChanged)
+        {
+            return false;
+        }
+
+        HashSet<Node> current = new(Nodes);
+        int survivors = _historyNodes.Count(current.Contains);
+        int changes = _historyNodes.Count - survivors + (Nodes.Count - survivors);
+
+        // 보드 전체가 바뀐 경우 (SetInfos 등) ---------
+        if (survivors == 0 || changes > Nodes.Count)
+        {
+            _historyNodes.Clear();
+            _historyNodes.AddRange(Nodes);
+            RebuildHistoryNodeIndexes();
+            History.ReplaceAll(Nodes.Select(node => GetNodeInfo(node, _historyNodeIndexes)).ToList());
+            return true;
+        }
+
+        HashSet<Node> recorded = new(_historyNodes);
+
+        // 제거 (뒤에서부터) ---------
+        for (int i = _historyNodes.Count - 1; i >= 0; i--)
+        {
+            if (current.Contains(_historyNodes[i]))
+            {
+                continue;
+            }
+
+            MarkRecordedNeighbors(i);
+            History.Remove(i);
+            _historyNodes.RemoveAt(i);
+        }
+
+        // 추가, 순서가 바뀐 노드는 제거 후 다시 추가 ---------
+        for (int i = 0; i < Nodes.Count; i++)
+        {
+            Node node = Nodes[i];
+            if (i < _historyNodes.Count && _historyNodes[i] == node)
+            {
+                continue;
+            }
+
+            if (recorded.Contains(node))
+            {
+                int oldIndex = _historyNodes.IndexOf(node, i);
+                MarkRecordedNeighbors(oldIndex);
+                History.Remove(oldIndex);
+                _historyNodes.RemoveAt(oldIndex);
+            }
+
+            History.Insert(i);
+            _historyNodes.Insert(i, node);
+            _historyDirtyNodes.Add(node);
+        }
+
+        RebuildHistoryNodeIndexes();
+        return false;
+    }
+
+    /// <summary>
+    /// 히스토리 저장. 마지막 기록 이후 바뀐 노드(와 그 연결 노드)만 읽어 변경분을 기록
     /// SetInfos의 트레이스의 영향을 받는 위치에서 호출하지 말 것.
     /// </summary>
     private void RecordHistory()
     {
-        UndoDelegate.Record();
+        if (!History.HasState)
+        {
+            ResetHistory();
+            return;
+        }
+
+        try
+        {
+            SetGateway();  // ExternalGateway가 없는 예외사항을 대비 명시적 존재보장
+            History.BeginRecord();
+
+            if (!RecordHistoryNodeList())
+            {
+                if (_historyFullScan)
+                {
+                    _historyDirtyNodes.UnionWith(Nodes);
+                }
+
+                // 연결 변경은 상대 노드 정보도 바꾸므로, 이전/현재 연결 노드도 다시 읽음 ---------
+                List<int>[] recordedInRefs = _historyDirtyNodes.Count > 0 ? BuildRecordedInRefs() : null;
+                foreach (Node node in _historyDirtyNodes.ToList())
+                {
+                    if (!_historyNodeIndexes.TryGetValue(node, out int index))
+                    {
+                        continue;
+                    }
+
+                    MarkRecordedNeighbors(index, recordedInRefs);
+
+                    (ITransitionPoint[] inTps, ITransitionPoint[] outTps) = node.GetTPs();
+                    foreach (ITransitionPoint inTp in inTps)
+                    {
+                        Node source = inTp?.Connection?.SourcePoint?.Node;
+                        if (source != null)
+                        {
+                            _historyDirtyNodes.Add(source);
+                        }
+                    }
+
+                    // Fan-out: 모든 분기의 대상 노드
+                    foreach (ITransitionPoint outTp in outTps)
+                    {
+                        if (outTp is not ITPOut tpOut)
+                        {
+                            continue;
+                        }
+
+                        foreach (TPConnection connection in tpOut.Connections)
+                        {
+                            Node target = connection?.TargetPoint?.Node;
+                            if (target != null)
+                            {
+                                _historyDirtyNodes.Add(target);
+                            }
+                        }
+                    }
+                }
+
+                foreach (Node node in _historyDirtyNodes)
+                {
+                    if (_historyNodeIndexes.TryGetValue(node, out int index))
+                    {
+                        History.Replace(index, GetNodeInfo(node, _historyNodeIndexes));
+                    }
+                }
+            }
+
+            History.EndRecord();
+        }
+        catch (Exception e)
+        {
+            Debug.LogException(e);
+            ResetHistory();
+        }
+        finally
+        {
+            _historyDirtyNodes.Clear();
+            _historyFullScan = false;
+        }
+    }
+
+    /// <summary>
+    /// 종류, 인자, TP 개수가 같으면 노드를 유지한 채 위치/연결만 갱신
+    /// </summary>
+    private static bool CanRestoreInPlace(Node node, SerializeNodeInfo info)
+    {
+        if (node.GetType() != info.NodeType)
+        {
+            return false;
+        }
+
+        // SerializeInfo 형식은 IEquatable 값 비교 (getter가 매번 새 값을 만들므로 참조 비교 불가)
+        object args = node is INodeAdditionalArgs additionalArgs ? additionalArgs.AdditionalArgs : null;
+        if (!Equals(args, info.NodeAdditionalArgs))
+        {
+            return false;
+        }
+
+        var types = node.GetTPElements(tp => tp.Type);
+        return types.inputElems.Length == (info.InTpType?.Length ?? 0) && types.outputElems.Length == (info.OutTpType?.Length ?? 0);
+    }
+
+    /// <summary>
+    /// 유지한 노드를 info에 맞춤. 위치, TP 타입, 바뀐 In 연결만 다시 연결 (상태는 유지)
+    /// Out 연결은 상대 노드의 In 연결 정보로 복원됨 (연결이 바뀌면 양쪽 노드 정보가 모두 바뀜)
+    /// </summary>
+    private void RestoreNodeInPlace(Node node, SerializeNodeInfo info, IReadOnlyDictionary<Node, int> nodeIndexes, DeserializationCompleteReceiver completeReceiver)
+    {
+        SerializeNodeInfo current = GetNodeInfo(node, nodeIndexes);
+
+        if (current.NodePosition != info.NodePosition)
+        {
+            Vector2 localPosition = GetLocalPositionFromNormalizeValue(Rect.rect.size, info.NodePosition);
+            node.Support.SetPosition(ConvertLocalToWorldPosition(localPosition, Rect));
+        }
+
+        if (!current.InTpType.SequenceEqual(info.InTpType) || !current.OutTpType.SequenceEqual(info.OutTpType))
+        {
+            node.SetTPElements(info.InTpType, info.OutTpType, (tp, type) => tp.SetType(type));
+        }
+
+        ITransitionPoint[] inTps = node.GetTPs().inTps;
+        if (info.InConnectionTargets == null || info.InConnectionTargets.Length != inTps.Length)
+        {
+            throw new InvalidOperationException($"{node.GetType().Name}: In connection count mismatch");
+        }
+
+        ITransitionPoint[] inTargets = new ITransitionPoint[inTps.Length];
+        List<Vector2>[] inVertices = new List<Vector2>[inTps.Length];
+        bool relink = false;
+
+        for (int i = 0; i < inTps.Length; i++)
+        {
+            TPConnectionIndexInfo target = info.InConnectionTargets[i];
+            if (ConnectionEquals(current.InConnectionTargets[i], target))
+            {
+                continue;
+            }
+
+            inTps[i].DisconnectAll();
+            relink = true;
+
+            if (target == null || target.NodeIndex < 0 || target.NodeIndex >= Nodes.Count)
+            {
+                continue;
+            }
+
+            ITransitionPoint[] targetOutTps = Nodes[target.NodeIndex].GetTPs().outTps;
+            if (target.TpIndex < 0 || target.TpIndex >= targetOutTps.Length)
+            {
+                continue;
+            }
+
+            inTargets[i] = targetOutTps[target.TpIndex];
+            List<Vector2> verticesLocalPosition = target.Vertices
+                .Select(normalized => GetLocalPositionFromNormalizeValue(Rect.rect.size, normalized)).ToList();
+            inVertices[i] = ConvertLocalToWorldPositions(verticesLocalPosition, Rect);
+        }
+
+        if (relink)
+        {
+            int outCount = node.GetTPs().outTps.Length;
+            node.SetTPConnectionInfo(new TPConnectionInfo(inTargets, new ITransitionPoint[outCount], inVertices, new List<Vector2>[outCount]), completeReceiver);
+        }
+    }
+
+    private static bool ConnectionEquals(TPConnectionIndexInfo a, TPConnectionIndexInfo b)
+    {
+        if (a == null || b == null)
+        {
+            return a == b;
+        }
+
+        return a.NodeIndex == b.NodeIndex && a.TpIndex == b.TpIndex &&
+               (a.Vertices ?? new List<Vector2>()).SequenceEqual(b.Vertices ?? new List<Vector2>());
+    }
+
+    /// <summary>
+    /// 바뀐 노드만 보드에 적용. 바뀌지 않은 노드와 그 실행 상태는 유지
+    /// </summary>
+    /// <returns>실패 시 false (보드 일부만 바뀌었을 수 있음)</returns>
+    private bool TryRestoreHistoryDiff(HistoryRestorePlan plan)
+    {
+        object blocker = new();
+        _isOnChangeBlocker.Add(blocker);
+
+        // Can receive complete restore for this object ---------
+        using DeserializationCompleteReceiver completeReceiver = new();
+
+        try
+        {
+            List<SerializeNodeInfo> infos = History.GetState();
+            List<Node> slots = plan.Slots;
+            if (slots.Count != infos.Count)
+            {
+                return false;
+            }
+
+            // 종류나 인자가 바뀐 노드는 다시 생성 ---------
+            for (int i = 0; i < slots.Count; i++)
+            {
+                if (slots[i] != null && plan.Changed.Contains(slots[i]) && !CanRestoreInPlace(slots[i], infos[i]))
+                {
+                    plan.Removed.Add(slots[i]);
+                    slots[i] = null;
+                }
+            }
+
+            foreach (Node node in plan.Removed)
+            {
+                node.Remove();
+            }
+
+            // 생성 ---------
+            List<SerializeNodeInfo> createInfos = Enumerable.Range(0, slots.Count).Where(i => slots[i] == null).Select(i => infos[i]).ToList();
+            ScriptLoadBatch.EnsureBridge(createInfos);
+            using ScriptLoadBatch scriptBatch = ScriptLoadBatch.Prepare(createInfos).Begin();
+            List<int> created = new();
+            for (int i = 0; i < slots.Count; i++)
+            {
+                if (slots[i] != null)
+                {
+                    continue;
+                }
+
+                slots[i] = InstantiateNodeFromInfo(infos[i], completeReceiver);
+                if (slots[i] is null)
+                {
+                    return false;
+                }
+
+                created.Add(i);
+            }
+
+            // Nodes 순서를 상태와 일치 ---------
+            Nodes.Clear();
+            Nodes.AddRange(slots);
+
+            Dictionary<Node, int> nodeIndexes = new();
+            for (int i = 0; i < Nodes.Count; i++)
+            {
+                nodeIndexes[Nodes[i]] = i;
+            }
+
+            // 새 노드에 In 연결이 있는 기존 노드도 다시 연결 ---------
+            HashSet<int> createdSet = new(created);
+            HashSet<Node> changed = new(plan.Changed.Where(nodeIndexes.ContainsKey));
+            if (createdSet.Count > 0)
+            {
+                for (int i = 0; i < infos.Count; i++)
+                {
+                    if (!createdSet.Contains(i) && infos[i].InConnectionTargets.Any(target => target != null && createdSet.Contains(target.NodeIndex)))
+                    {
+                        changed.Add(Nodes[i]);
+                    }
+                }
+            }
+
+            // Lifecycle call 1: OnBeforeAutoConnect ---------
+            foreach (int i in created)
+            {
+                ((INodeLifecycleCallable)Nodes[i]).CallOnBeforeAutoConnect();
+            }
+
+            Vector2 rectSize = Rect.rect.size;
+            foreach (int i in created)
+            {
+                LinkConnectionsFromInfo(i, infos, rectSize, completeReceiver);
+            }
+
+            foreach (Node node in changed)
+            {
+                RestoreNodeInPlace(node, infos[nodeIndexes[node]], nodeIndexes, completeReceiver);
+            }
+
+            // Lifecycle call 2: OnBeforeReplayPending, Replay Pending ---------
+            foreach (int i in created)
+            {
+                ((INodeLifecycleCallable)Nodes[i]).CallOnBeforeReplayPending(infos[i].StatePending.ToArray());
+                Nodes[i].ReplayStatePending(infos[i].StatePending);
+            }
+
+            SetGateway();
+            completeReceiver.Invoke();
+            RebuildKernel();
+            return true;
+        }
+        catch (Exception e)
+        {
+            Debug.LogException(e);
+            return false;
+        }
+        finally
+        {
+            _isOnChangeBlocker.Remove(blocker);
+        }
+    }
+
+    /// <summary>
+    /// History 상태를 보드에 적용. 변경분만 적용하고, 불가능하면 전체 다시 불러오기
+    /// </summary>
+    private void ApplyHistoryState(HistoryRestorePlan plan)
+    {
+        ClearSelected();
+
+        if (plan.IsReset || !TryRestoreHistoryDiff(plan))
+        {
+            SetInfos(History.GetState(), false);
+        }
+
+        if (Nodes.Count != History.Count)
+        {
+            Debug.LogWarning($"{GetType().Name}: History state mismatch. Reset history");
+            ResetHistory();
+            return;
+        }
+
+        SetHistoryNodes();
     }
 
     public void ClearHistory()
     {
-        UndoDelegate.Clear();
+        ResetHistory();
+    }
+
+    /// <summary>
+    /// 아직 기록되지 않은 변경 (이번 프레임) 먼저 기록. Undo/Redo는 _historyNodes가 보드와 같아야 함
+    /// </summary>
+    private void FlushHistory()
+    {
+        if (_historyNodesChanged || _historyFullScan || _historyDirtyNodes.Count > 0)
+        {
+            RecordHistory();
+        }
     }
 
     public void Undo()
     {
-        UndoDelegate.Undo();
+        FlushHistory();
+        HistoryRestorePlan plan = new(_historyNodes);
+        if (History.Undo(plan))
+        {
+            ApplyHistoryState(plan);
+        }
     }
 
     public void Redo()
     {
-        UndoDelegate.Redo();
+        FlushHistory();
+        HistoryRestorePlan plan = new(_historyNodes);
+        if (History.Redo(plan))
+        {
+            ApplyHistoryState(plan);
+        }
     }
     #endregion
 
@@ -1425,7 +2425,7 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         }
 
         ClearSelected();
-        ((IChangeObserver)this).ReportChanges();
+        ReportNodeListChanges();
     }
 
     public void DisconnectSelected()
@@ -1435,9 +2435,9 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
             if (draggable.CanDisconnect)
             {
                 draggable.ObjectDisconnect();
+                ((IChangeObserver)this).ReportChanges(draggable.GetSelfIfNode());
             }
         }
-        ((IChangeObserver)this).ReportChanges();
     }
 
     public void Paste()
@@ -1492,7 +2492,7 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         }
 
         AddSelected(paste.Select(node => node.Support.NodeSelectingHandler).Concat(edgeSelectables));
-        ((IChangeObserver)this).ReportChanges();
+        ReportNodeListChanges();
     }
 
     public void CopySelected()
@@ -1528,7 +2528,7 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
         {
             node.Remove();
         }
-        ((IChangeObserver)this).ReportChanges();
+        ReportNodeListChanges();
     }
 
     private void SetSelectionAreaController()
@@ -1620,6 +2620,12 @@ public class PUMPBackground : MonoBehaviour, IChangeObserver, ISeparatorSectorab
             {
                 if (draggable != invokerToExclude)
                     draggable.MoveSelected(delta);
+
+                // 같이 움직인 노드는 스스로 ReportChanges()하지 않음 ---------
+                if (draggable.GetSelfIfNode() is { } node)
+                    _historyDirtyNodes.Add(node);
+                else
+                    _historyFullScan = true;
             }
         }
         catch (MissingReferenceException)
@@ -2226,6 +3232,7 @@ public interface IHighlightable
 public interface IChangeObserver
 {
     void ReportChanges();
+    void ReportChanges(Node changed);
 }
 
 public interface ISetVisibleTarget
@@ -0,0 +1,618 @@
+using System;
+using System.Collections.Generic;
+using System.Text;
+using Object = UnityEngine.Object;
+
+/// <summary>
+/// Bool 게이트(IBitParallelEvaluable)만으로 이루어진 영역을 ulong 비트셋으로 평가하는 엔진.
+/// - 레인(lane): 비트 하나 = 독립된 입력 벡터 하나, 워드당 64 벡터를 동시에 평가
+/// - Net: 게이트 출력 포트 또는 외부 입력. 값 비트셋 + Null 비트셋 (Null 레인의 값 비트는 항상 0)
+/// - Transition 의미 유지: 입력이 모두 Null이면 Null, 아니면 Null을 false로 취급
+/// - 게이트는 레벨(위상 정렬) 순서로 평가, 피드백(래치 등)은 안정될 때까지 반복
+/// - TFlipFlop은 상태 소자: q는 Toggle/ResetFlipFlop으로만 바뀌고 평가 중에는 입력 Net으로 취급
+/// </summary>
+public class BitParallelNetwork
+{
+    #region Privates
+    private const int MAX_SETTLE_PASSES = 64;
+    private const int MAX_EXHAUSTIVE_INPUTS = 30;
+
+    // 레인 번호의 i번째 비트 패턴 (조합 번호의 하위 6비트)
+    private static readonly ulong[] LANE_PATTERNS =
+    {
+        0xAAAAAAAAAAAAAAAAUL,
+        0xCCCCCCCCCCCCCCCCUL,
+        0xF0F0F0F0F0F0F0F0UL,
+        0xFF00FF00FF00FF00UL,
+        0xFFFF0000FFFF0000UL,
+        0xFFFFFFFF00000000UL,
+    };
+
+    // Net ----------
+    private ulong[] _values;
+    private ulong[] _nulls;
+
+    // Instruction (평가 순서) ----------
+    private BitGateType[] _ops;
+    private int[] _operandOffsets;  // 길이 instruction + 1
+    private int[] _operands;        // net index
+    private int[] _targets;         // net index
+    private int _acyclicCount;      // [0, _acyclicCount): 비순환, 나머지: 피드백 영역
+
+    // Mapping ----------
+    private ITransitionPoint[] _inputPoints;                 // 외부 입력 net의 원천 (외부 출력 TP 또는 미연결 입력 TP)
+    private int[] _inputNets;
+    private readonly Dictionary<ITransitionPoint, int> _outputNets = new();
+    private readonly Dictionary<Node, int> _stateNets = new();
+    private readonly List<(ITransitionPoint tp, Node node, int net)> _mirrorTargets = new();
+
+    private BitParallelNetwork() { }
+
+    private static ulong Broadcast(bool value) => value ? ulong.MaxValue : 0UL;
+
+    /// <summary>
+    /// 게이트 1개 평가
+    /// </summary>
+    /// <returns>출력이 바뀌었는지</returns>
+    private bool Execute(int instruction)
+    {
+        int offset = _operandOffsets[instruction];
+        int target = _targets[instruction];
+        ulong value;
+        ulong nulls;
+
+        switch (_ops[instruction])
+        {
+            case BitGateType.Not:
+                nulls = _nulls[_operands[offset]];
+                value = ~_values[_operands[offset]];
+                break;
+
+            case BitGateType.Multiplexer:
+            {
+                ulong a = _values[_operands[offset]];
+                ulong b = _values[_operands[offset + 1]];
+                ulong c = _values[_operands[offset + 2]];
+                ulong d = _values[_operands[offset + 3]];
+                ulong s1 = _values[_operands[offset + 4]];
+                ulong s0 = _values[_operands[offset + 5]];
+
+                // Null 선택선은 false (Null 레인의 값 비트는 0). 선택된 입력이 Null이면 출력도 Null
+                // 입력이 모두 Null인 레인은 s = 0 으로 A를 선택하므로 역시 Null
+                ulong selectA = ~s1 & ~s0;
+                ulong selectB = ~s1 & s0;
+                ulong selectC = s1 & ~s0;
+                ulong selectD = s1 & s0;
+
+                nulls = (selectA & _nulls[_operands[offset]]) | (selectB & _nulls[_operands[offset + 1]]) |
+                        (selectC & _nulls[_operands[offset + 2]]) | (selectD & _nulls[_operands[offset + 3]]);
+                value = (selectA & a) | (selectB & b) | (selectC & c) | (selectD & d);
+                break;
+            }
+
+            default:
+            {
+                int a = _operands[offset];
+                int b = _operands[offset + 1];
+                nulls = _nulls[a] & _nulls[b];
+                value = _ops[instruction] switch
+                {
+                    BitGateType.And => _values[a] & _values[b],
+                    BitGateType.Or => _values[a] | _values[b],
+                    BitGateType.Xor => _values[a] ^ _values[b],
+                    BitGateType.Nand => ~(_values[a] & _values[b]),
+                    BitGateType.Nor => ~(_values[a] | _values[b]),
+                    BitGateType.Xnor => ~(_values[a] ^ _values[b]),
+                    _ => throw new ArgumentOutOfRangeException()
+                };
+                break;
+            }
+        }
+
+        value &= ~nulls;
+        if (_values[target] == value && _nulls[target] == nulls)
+        {
+            return false;
+        }
+
+        _values[target] = value;
+        _nulls[target] = nulls;
+        return true;
+    }
+
+    private static int GetOperandCount(BitGateType type) => type switch
+    {
+        BitGateType.Not => 1,
+        BitGateType.Multiplexer => 6,
+        BitGateType.TFlipFlop => 0,
+        _ => 2
+    };
+
+    private static bool IsBoolOnly(ITransitionPoint[] inTps, ITransitionPoint[] outTps, BitGateType type)
+    {
+        // TFlipFlop의 입력(t, rst)은 Pulse. 출력만 확인
+        if (type != BitGateType.TFlipFlop)
+        {
+            if (inTps.Length != GetOperandCount(type))
+            {
+                return false;
+            }
+
+            foreach (ITransitionPoint tp in inTps)
+            {
+                if (tp.Type != TransitionType.Bool)
+                {
+                    return false;
+                }
+            }
+        }
+
+        return outTps.Length == 1 && outTps[0].Type == TransitionType.Bool;
+    }
+
+    private static bool IsMirrorable(ITransitionPoint tp, Node node, out IStateMirrorable mirrorable)
+    {
+        mirrorable = tp as IStateMirrorable;
+
+        if (mirrorable == null || node.IsDestroyed)
+        {
+            return false;
+        }
+
+        return tp is not Object unityObject || unityObject != null;
+    }
+
+    private void ThrowIfLaneOutOfRange(int lane)
+    {
+        if (lane < 0 || lane >= LaneCount)
+        {
+            throw new ArgumentOutOfRangeException(nameof(lane), $"Lane must be between 0 and {LaneCount - 1} / current: {lane}");
+        }
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 워드당 입력 벡터 수
+    /// </summary>
+    public const int LaneCount = 64;
+
+    /// <summary>
+    /// 평가 대상 게이트 수 (TFlipFlop 제외)
+    /// </summary>
+    public int GateCount => _ops.Length;
+
+    public int NetCount => _values.Length;
+
+    /// <summary>
+    /// 외부 입력 Net 개수
+    /// </summary>
+    public int InputCount => _inputNets.Length;
+
+    /// <summary>
+    /// 피드백(래치 등)이 있는지
+    /// </summary>
+    public bool HasFeedback => _acyclicCount < _ops.Length;
+
+    /// <summary>
+    /// IBitParallelEvaluable이면서 입출력이 모두 Bool인 노드를 컴파일
+    /// </summary>
+    public static BitParallelNetwork Compile(IEnumerable<Node> nodes)
+    {
+        if (nodes == null)
+        {
+            throw new ArgumentNullException(nameof(nodes));
+        }
+
+        BitParallelNetwork network = new();
+        HashSet<Node> visited = new();
+        List<Node> gates = new();
+        List<(ITransitionPoint[] inTps, ITransitionPoint[] outTps)> tpsPerGate = new();
+        List<ITransitionPoint> inputPoints = new();
+        Dictionary<ITransitionPoint, int> inputNetLookup = new();
+        int netCount = 0;
+
+        // Output net ----------
+        foreach (Node node in nodes)
+        {
+            if (node is not IBitParallelEvaluable evaluable || node.IsDestroyed || !visited.Add(node))
+            {
+                continue;
+            }
+
+            (ITransitionPoint[] inTps, ITransitionPoint[] outTps) = node.GetTPs();
+            if (!IsBoolOnly(inTps, outTps, evaluable.BitGateType))
+            {
+                continue;
+            }
+
+            network._outputNets.Add(outTps[0], netCount);
+            network._mirrorTargets.Add((outTps[0], node, netCount));
+
+            if (evaluable.BitGateType == BitGateType.TFlipFlop)
+            {
+                network._stateNets.Add(node, netCount);
+            }
+            else
+            {
+                gates.Add(node);
+                tpsPerGate.Add((inTps, outTps));
+            }
+
+            netCount++;
+        }
+
+        // Operand ----------
+        int gateCount = gates.Count;
+        BitGateType[] ops = new BitGateType[gateCount];
+        int[] operandOffsets = new int[gateCount + 1];
+        List<int> operands = new();
+        int[] targets = new int[gateCount];
+
+        for (int i = 0; i < gateCount; i++)
+        {
+            (ITransitionPoint[] inTps, ITransitionPoint[] outTps) = tpsPerGate[i];
+            ops[i] = ((IBitParallelEvaluable)gates[i]).BitGateType;
+            targets[i] = network._outputNets[outTps[0]];
+
+            foreach (ITransitionPoint inTp in inTps)
+            {
+                ITransitionPoint source = inTp.Connection?.SourcePoint;
+                if (source != null && network._outputNets.TryGetValue(source, out int sourceNet))
+                {
+                    operands.Add(sourceNet);
+                    network._mirrorTargets.Add((inTp, gates[i], sourceNet));
+                    continue;
+                }
+
+                // 외부 입력: 외부 출력 TP 단위로 공유, 미연결 입력은 각자 하나
+                ITransitionPoint inputPoint = source ?? inTp;
+                if (!inputNetLookup.TryGetValue(inputPoint, out int inputNet))
+                {
+                    inputNet = netCount++;
+                    inputNetLookup.Add(inputPoint, inputNet);
+                    inputPoints.Add(inputPoint);
+                }
+
+                operands.Add(inputNet);
+                network._mirrorTargets.Add((inTp, gates[i], inputNet));
+            }
+
+            operandOffsets[i + 1] = operands.Count;
+        }
+
+        // Level (Kahn) ----------
+        Dictionary<int, int> producers = new();
+        for (int i = 0; i < gateCount; i++)
+        {
+            producers.Add(targets[i], i);
+        }
+
+        int[] inDegrees = new int[gateCount];
+        List<int>[] consumers = new List<int>[gateCount];
+        for (int i = 0; i < gateCount; i++)
+        {
+            for (int j = operandOffsets[i]; j < operandOffsets[i + 1]; j++)
+            {
+                if (producers.TryGetValue(operands[j], out int producer))
+                {
+                    inDegrees[i]++;
+                    (consumers[producer] ??= new List<int>()).Add(i);
+                }
+            }
+        }
+
+        List<int> order = new(gateCount);
+        Queue<int> ready = new();
+        for (int i = 0; i < gateCount; i++)
+        {
+            if (inDegrees[i] == 0)
+            {
+                ready.Enqueue(i);
+            }
+        }
+
+        while (ready.Count > 0)
+        {
+            int gate = ready.Dequeue();
+            order.Add(gate);
+
+            if (consumers[gate] == null)
+            {
+                continue;
+            }
+
+            foreach (int consumer in consumers[gate])
+            {
+                if (--inDegrees[consumer] == 0)
+                {
+                    ready.Enqueue(consumer);
+                }
+            }
+        }
+
+        network._acyclicCount = order.Count;
+        for (int i = 0; i < gateCount; i++)
+        {
+            if (inDegrees[i] > 0)
+            {
+                order.Add(i);
+            }
+        }
+
+        // Flatten ----------
+        network._ops = new BitGateType[gateCount];
+        network._targets = new int[gateCount];
+        network._operandOffsets = new int[gateCount + 1];
+        List<int> orderedOperands = new(operands.Count);
+
+        for (int i = 0; i < gateCount; i++)
+        {
+            int gate = order[i];
+            network._ops[i] = ops[gate];
+            network._targets[i] = targets[gate];
+            for (int j = operandOffsets[gate]; j < operandOffsets[gate + 1]; j++)
+            {
+                orderedOperands.Add(operands[j]);
+            }
+
+            network._operandOffsets[i + 1] = orderedOperands.Count;
+        }
+
+        network._operands = orderedOperands.ToArray();
+        network._inputPoints = inputPoints.ToArray();
+        network._inputNets = new int[inputPoints.Count];
+        for (int i = 0; i < inputPoints.Count; i++)
+        {
+            network._inputNets[i] = inputNetLookup[inputPoints[i]];
+        }
+
+        network._values = new ulong[netCount];
+        network._nulls = new ulong[netCount];
+        network.LoadStates();
+        return network;
+    }
+
+    /// <summary>
+    /// 외부 입력의 원천 TP (외부 노드의 출력 TP, 또는 미연결 게이트 입력 TP)
+    /// </summary>
+    public ITransitionPoint GetInputPoint(int input) => _inputPoints[input];
+
+    /// <summary>
+    /// 현재 TP 상태를 모든 레인에 복사 (외부 입력, TFlipFlop 상태, 게이트 출력)
+    /// </summary>
+    public void LoadStates()
+    {
+        for (int i = 0; i < _inputNets.Length; i++)
+        {
+            Transition state = _inputPoints[i].State;
+            SetInput(i, Broadcast(!state.IsNull && state), Broadcast(state.IsNull));
+        }
+
+        foreach (KeyValuePair<ITransitionPoint, int> pair in _outputNets)
+        {
+            Transition state = pair.Key.State;
+            _nulls[pair.Value] = Broadcast(state.IsNull);
+            _values[pair.Value] = Broadcast(!state.IsNull && state);
+        }
+    }
+
+    /// <summary>
+    /// 외부 입력의 레인별 값 설정
+    /// </summary>
+    /// <param name="values">레인별 값 (1 = true)</param>
+    /// <param name="nulls">레인별 Null 여부 (1 = Null)</param>
+    public void SetInput(int input, ulong values, ulong nulls = 0UL)
+    {
+        int net = _inputNets[input];
+        _values[net] = values & ~nulls;
+        _nulls[net] = nulls;
+    }
+
+    /// <summary>
+    /// 출력 TP에 해당하는 Net (게이트, TFlipFlop 출력만)
+    /// </summary>
+    public bool TryGetNet(ITransitionPoint outputTp, out int net)
+    {
+        return _outputNets.TryGetValue(outputTp, out net);
+    }
+
+    public ulong GetValues(int net) => _values[net];
+
+    public ulong GetNulls(int net) => _nulls[net];
+
+    /// <summary>
+    /// Net의 특정 레인 값을 Transition으로
+    /// </summary>
+    public Transition GetState(int net, int lane)
+    {
+        ThrowIfLaneOutOfRange(lane);
+
+        ulong mask = 1UL << lane;
+        if ((_nulls[net] & mask) != 0)
+        {
+            return TransitionType.Bool.Null();
+        }
+
+        return (_values[net] & mask) != 0;
+    }
+
+    /// <summary>
+    /// 모든 게이트를 레벨 순서로 1회 평가, 피드백 영역은 안정될 때까지 반복
+    /// </summary>
+    /// <returns>피드백 영역이 상한 내에 안정되었는지 (진동 시 false)</returns>
+    public bool Evaluate()
+    {
+        for (int i = 0; i < _acyclicCount; i++)
+        {
+            Execute(i);
+        }
+
+        if (!HasFeedback)
+        {
+            return true;
+        }
+
+        for (int pass = 0; pass < MAX_SETTLE_PASSES; pass++)
+        {
+            bool changed = false;
+            for (int i = _acyclicCount; i < _ops.Length; i++)
+            {
+                changed |= Execute(i);
+            }
+
+            if (!changed)
+            {
+                // 피드백 결과를 소비하는 비순환 게이트 갱신
+                for (int i = 0; i < _acyclicCount; i++)
+                {
+                    Execute(i);
+                }
+
+                return true;
+            }
+
+            for (int i = 0; i < _acyclicCount; i++)
+            {
+                Execute(i);
+            }
+        }
+
+        return false;
+    }
+
+    /// <summary>
+    /// TFlipFlop t 펄스 (lanes에 해당하는 레인만 반전, Null은 true가 됨)
+    /// </summary>
+    public void Toggle(Node flipFlop, ulong lanes = ulong.MaxValue)
+    {
+        if (!_stateNets.TryGetValue(flipFlop, out int net))
+        {
+            throw new ArgumentException($"{flipFlop?.GetType().Name} is not a compiled TFlipFlop", nameof(flipFlop));
+        }
+
+        // Null 레인의 값 비트는 0이므로 반전하면 true
+        _values[net] ^= lanes;
+        _nulls[net] &= ~lanes;
+    }
+
+    /// <summary>
+    /// TFlipFlop rst 펄스 (lanes에 해당하는 레인을 false로)
+    /// </summary>
+    public void ResetFlipFlop(Node flipFlop, ulong lanes = ulong.MaxValue)
+    {
+        if (!_stateNets.TryGetValue(flipFlop, out int net))
+        {
+            throw new ArgumentException($"{flipFlop?.GetType().Name} is not a compiled TFlipFlop", nameof(flipFlop));
+        }
+
+        _values[net] &= ~lanes;
+        _nulls[net] &= ~lanes;
+    }
+
+    /// <summary>
+    /// 외부 입력의 모든 조합(2^InputCount)을 64개씩 평가.
+    /// onBatch(첫 조합 번호, 유효 레인 마스크): 레인 k는 조합 (첫 조합 번호 + k), 입력 i는 조합 번호의 i번째 비트
+    /// </summary>
+    public void EvaluateExhaustive(Action<long, ulong> onBatch)
+    {
+        if (onBatch == null)
+        {
+            throw new ArgumentNullException(nameof(onBatch));
+        }
+
+        int inputCount = InputCount;
+        if (inputCount > MAX_EXHAUSTIVE_INPUTS)
+        {
+            throw new InvalidOperationException($"Too many inputs for exhaustive evaluation: {inputCount} (max {MAX_EXHAUSTIVE_INPUTS})");
+        }
+
+        long combinationCount = 1L << inputCount;
+        for (long first = 0; first < combinationCount; first += LaneCount)
+        {
+            for (int i = 0; i < inputCount; i++)
+            {
+                ulong values = i < LANE_PATTERNS.Length ? LANE_PATTERNS[i] : Broadcast(((first >> i) & 1L) != 0);
+                SetInput(i, values);
+            }
+
+            long remaining = combinationCount - first;
+            ulong validLanes = remaining >= LaneCount ? ulong.MaxValue : (1UL << (int)remaining) - 1UL;
+
+            Evaluate();
+            onBatch(first, validLanes);
+        }
+    }
+
+    /// <summary>
+    /// EvaluateExhaustive()로 진리표 문자열 생성. 열: 외부 입력, outputs 순서. 값: 1, 0, Null은 -
+    /// </summary>
+    /// <param name="outputs">표에 넣을 출력 TP (게이트, TFlipFlop 출력)</param>
+    public string FormatTruthTable(IReadOnlyList<ITransitionPoint> outputs)
+    {
+        if (outputs == null)
+        {
+            throw new ArgumentNullException(nameof(outputs));
+        }
+
+        int[] outputNets = new int[outputs.Count];
+        for (int i = 0; i < outputs.Count; i++)
+        {
+            if (!TryGetNet(outputs[i], out outputNets[i]))
+            {
+                throw new ArgumentException($"{outputs[i]?.Name} is not a compiled output", nameof(outputs));
+            }
+        }
+
+        StringBuilder sb = new();
+        for (int i = 0; i < InputCount; i++)
+        {
+            sb.Append(_inputPoints[i].Name).Append(' ');
+        }
+
+        sb.Append('|');
+        foreach (ITransitionPoint output in outputs)
+        {
+            sb.Append(' ').Append(output.Name);
+        }
+
+        EvaluateExhaustive((first, validLanes) =>
+        {
+            for (int lane = 0; lane < LaneCount && (validLanes >> lane & 1UL) != 0; lane++)
+            {
+                long combination = first + lane;
+                sb.AppendLine();
+                for (int i = 0; i < InputCount; i++)
+                {
+                    sb.Append((combination >> i & 1L) != 0 ? '1' : '0').Append(' ');
+                }
+
+                sb.Append('|');
+                foreach (int net in outputNets)
+                {
+                    Transition state = GetState(net, lane);
+                    sb.Append(' ').Append(state.IsNull ? '-' : state ? '1' : '0');
+                }
+            }
+        });
+
+        return sb.ToString();
+    }
+
+    /// <summary>
+    /// 지정한 레인의 상태를 게이트 TP에 반영 (UI 표시용)
+    /// </summary>
+    public void MirrorLane(int lane)
+    {
+        ThrowIfLaneOutOfRange(lane);
+
+        foreach ((ITransitionPoint tp, Node node, int net) in _mirrorTargets)
+        {
+            if (IsMirrorable(tp, node, out IStateMirrorable mirrorable))
+            {
+                mirrorable.MirrorState(GetState(net, lane));
+            }
+        }
+    }
+    #endregion
+}
@@ -0,0 +1,172 @@
+using System;
+
+/// <summary>
+/// HeadlessContext의 출력 기록 대상 (SimulationKernel, ModuleInstance)
+/// </summary>
+internal interface IHeadlessOutputWriter
+{
+    void WriteOutput(int port, Transition state);
+}
+
+/// <summary>
+/// IHeadlessEvaluable.Evaluate()에 전달되는 평가 정보.
+/// TransitionEventArgs + InputToken/OutputToken 역할을 커널의 배열 위에서 수행한다.
+/// 커널이 재사용하므로 Evaluate() 밖으로 참조를 넘기지 말 것.
+/// </summary>
+public class HeadlessContext
+{
+    #region Privates
+    private IHeadlessOutputWriter _writer;
+    private Transition[] _inputs;
+    private Transition[] _outputs;
+    private TransitionType[] _inputTypes;
+    private TransitionType[] _outputTypes;
+    private int _inputOffset;
+    private int _outputOffset;
+
+    internal void Set(IHeadlessOutputWriter writer, Transition[] inputs, Transition[] outputs, TransitionType[] inputTypes, TransitionType[] outputTypes,
+        int inputOffset, int inputCount, int outputOffset, int outputCount, int index, Transition state, Transition beforeState, bool isStateChange)
+    {
+        _writer = writer;
+        _inputs = inputs;
+        _outputs = outputs;
+        _inputTypes = inputTypes;
+        _outputTypes = outputTypes;
+        _inputOffset = inputOffset;
+        _outputOffset = outputOffset;
+        InputCount = inputCount;
+        OutputCount = outputCount;
+        Index = index;
+        State = state;
+        BeforeState = beforeState;
+        IsStateChange = isStateChange;
+    }
+
+    private void ThrowIfOutOfRange(int index, int count)
+    {
+        if (index < 0 || index >= count)
+        {
+            throw new IndexOutOfRangeException($"Index must be between 0 and {count - 1} / current: {index}");
+        }
+    }
+    #endregion
+
+    #region Event Args
+    /// <summary>
+    /// 변경된 입력의 Index
+    /// </summary>
+    public int Index { get; private set; }
+
+    /// <summary>
+    /// 현재 입력의 State
+    /// </summary>
+    public Transition State { get; private set; }
+
+    /// <summary>
+    /// 변경 이전 입력의 State
+    /// </summary>
+    public Transition BeforeState { get; private set; }
+
+    /// <summary>
+    /// 이전 값과 비교해서 변경되었는지
+    /// </summary>
+    public bool IsStateChange { get; private set; }
+
+    public TransitionType Type => State.Type;
+
+    public bool IsNull => State.IsNull;
+    #endregion
+
+    #region Input
+    public int InputCount { get; private set; }
+
+    public Transition GetInput(int index)
+    {
+        ThrowIfOutOfRange(index, InputCount);
+        return _inputs[_inputOffset + index];
+    }
+
+    public TransitionType GetInputType(int index)
+    {
+        ThrowIfOutOfRange(index, InputCount);
+        return _inputTypes[_inputOffset + index];
+    }
+
+    public bool HasOnlyNull
+    {
+        get
+        {
+            for (int i = 0; i < InputCount; i++)
+            {
+                if (!_inputs[_inputOffset + i].IsNull)
+                {
+                    return false;
+                }
+            }
+
+            return true;
+        }
+    }
+
+    public bool AllSameType
+    {
+        get
+        {
+            for (int i = 1; i < InputCount; i++)
+            {
+                if (_inputTypes[_inputOffset + i] != _inputTypes[_inputOffset])
+                {
+                    return false;
+                }
+            }
+
+            return true;
+        }
+    }
+    #endregion
+
+    #region Output
+    public int OutputCount { get; private set; }
+
+    public Transition FirstState => GetOutput(0);
+
+    public TransitionType FirstType => GetOutputType(0);
+
+    public Transition GetOutput(int index)
+    {
+        ThrowIfOutOfRange(index, OutputCount);
+        return _outputs[_outputOffset + index];
+    }
+
+    public TransitionType GetOutputType(int index)
+    {
+        ThrowIfOutOfRange(index, OutputCount);
+        return _outputTypes[_outputOffset + index];
+    }
+
+    public void PushFirst(Transition state) => PushAt(0, state);
+
+    public void PushAt(int index, Transition state)
+    {
+        ThrowIfOutOfRange(index, OutputCount);
+        state.ThrowIfTypeMismatch(_outputTypes[_outputOffset + index]);
+        _writer.WriteOutput(_outputOffset + index, state);
+    }
+
+    public void PushAll(Transition state)
+    {
+        for (int i = 0; i < OutputCount; i++)
+        {
+            PushAt(i, state);
+        }
+    }
+
+    public void PushAllAsNull()
+    {
+        for (int i = 0; i < OutputCount; i++)
+        {
+            PushAt(i, _outputTypes[_outputOffset + i].Null());
+        }
+    }
+    #endregion
+}
@@ -0,0 +1,50 @@
+/// <summary>
+/// SimulationKernel에서 GameObject(TP, Connection) 없이 평가 가능한 노드.
+/// Evaluate()는 해당 노드의 StateUpdate()와 동일한 의미로 구현할 것.
+/// </summary>
+public interface IHeadlessEvaluable
+{
+    /// <summary>
+    /// 입력 하나가 갱신될 때마다 호출 (StateUpdate와 동일한 호출 단위, ICombinationalEvaluable 제외)
+    /// 출력은 context.PushAt() 등으로만 설정할 것. OutputToken을 직접 건드리지 말 것.
+    /// </summary>
+    void Evaluate(HeadlessContext context);
+}
+
+/// <summary>
+/// 출력이 현재 입력에만 의존하는 노드 (내부 상태, 이벤트 순서 무관)
+/// 커널은 Tick 당 1회, 모든 입력 변경이 반영된 후 평가한다.
+/// context.Index/State/BeforeState는 변경된 첫 입력 기준, IsStateChange는 입력 중 하나라도 바뀌었는지.
+/// </summary>
+public interface ICombinationalEvaluable : IHeadlessEvaluable { }
+
+/// <summary>
+/// SimulationKernel이 노드를 점유할 때 사용
+/// 바인딩 된 노드의 TP 입력은 StateUpdate 대신 커널로 전달된다
+/// </summary>
+public interface IKernelBindable
+{
+    void BindKernel(SimulationKernel kernel, int kernelIndex);
+    void UnbindKernel(SimulationKernel kernel);
+}
+
+/// <summary>
+/// BitParallelNetwork에서 ulong 단위(64 입력 벡터)로 평가 가능한 Bool 게이트
+/// </summary>
+public interface IBitParallelEvaluable
+{
+    BitGateType BitGateType { get; }
+}
+
+public enum BitGateType
+{
+    And,
+    Or,
+    Xor,
+    Nand,
+    Nor,
+    Xnor,
+    Not,
+    Multiplexer,    // 입력: A, B, C, D, S1, S0
+    TFlipFlop,      // 상태 소자: q는 Toggle/Reset으로만 변경
+}
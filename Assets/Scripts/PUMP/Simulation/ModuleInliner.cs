@@ -0,0 +1,191 @@
+using System;
+using System.Collections.Generic;
+
+/// <summary>
+/// ClassedNode 모듈의 내부 그래프를 부모 SimulationKernel에 펼쳐 넣기 위한 등록부 및 경계 해석.
+/// - ClassedNode 입력 i  = 내부 ExternalInput 출력 i  (하나의 선으로 취급)
+/// - 내부 ExternalOutput 입력 j = ClassedNode 출력 j
+/// 경계(Gateway) TP는 평가 경로에서 빠지고 Mirror 대상으로만 남아, ExternalInputStatesAdapter / OutputApply를 거치지 않는다.
+/// </summary>
+public static class ModuleInliner
+{
+    #region Privates
+    private static readonly Dictionary<Node, PUMPBackground> _modules = new();     // ClassedNode → 내부 Background
+    private static readonly Dictionary<PUMPBackground, Node> _owners = new();      // 내부 Background → ClassedNode
+
+    private static T FindNode<T>(PUMPBackground background) where T : Node
+    {
+        foreach (Node node in background.AllNodes)
+        {
+            if (node is T target && !node.IsDestroyed)
+            {
+                return target;
+            }
+        }
+
+        return null;
+    }
+
+    private static void Flatten(IEnumerable<Node> nodes, List<Node> result, HashSet<PUMPBackground> visited)
+    {
+        foreach (Node node in nodes)
+        {
+            if (node == null || node.IsDestroyed)
+            {
+                continue;
+            }
+
+            if (_modules.TryGetValue(node, out PUMPBackground background))
+            {
+                if (background != null && visited.Add(background))
+                {
+                    Flatten(background.AllNodes, result, visited);
+                }
+                continue;
+            }
+
+            result.Add(node);
+        }
+    }
+
+    /// <summary>
+    /// 경계 TP를 건너편 TP로 치환 (경계가 아니면 null)
+    /// </summary>
+    private static ITransitionPoint GetOppositePoint(ITransitionPoint target)
+    {
+        Node node = target.Node;
+        if (node == null || node.IsDestroyed)
+        {
+            return null;
+        }
+
+        // ClassedNode 입력 → 내부 ExternalInput 출력
+        if (node is IClassedNode && _modules.TryGetValue(node, out PUMPBackground module) && module != null)
+        {
+            ExternalInput gateway = FindNode<ExternalInput>(module);
+            if (gateway == null)
+            {
+                return null;
+            }
+
+            int index = Array.IndexOf(node.GetTPs().inTps, target);
+            ITransitionPoint[] gatewayTps = gateway.GetTPs().outTps;
+            return index >= 0 && index < gatewayTps.Length ? gatewayTps[index] : null;
+        }
+
+        // 내부 ExternalOutput 입력 → ClassedNode 출력
+        if (node is ExternalOutput && node.Background != null && _owners.TryGetValue(node.Background, out Node owner) && !owner.IsDestroyed)
+        {
+            int index = Array.IndexOf(node.GetTPs().inTps, target);
+            ITransitionPoint[] ownerTps = owner.GetTPs().outTps;
+            return index >= 0 && index < ownerTps.Length ? ownerTps[index] : null;
+        }
+
+        return null;
+    }
+
+    private static void ResolveTargets(ITransitionPoint target, List<ITransitionPoint> results, List<ITransitionPoint> aliases, HashSet<ITransitionPoint> visited)
+    {
+        // 모듈 출력이 자기 입력으로 되돌아오는 경우 등
+        if (target == null || !visited.Add(target))
+        {
+            return;
+        }
+
+        ITransitionPoint opposite = GetOppositePoint(target);
+        if (opposite == null)
+        {
+            results.Add(target);
+            return;
+        }
+
+        aliases.Add(target);
+        aliases.Add(opposite);
+
+        if (opposite is not ITPOut tpOut)
+        {
+            return;
+        }
+
+        foreach (TPConnection connection in tpOut.Connections)
+        {
+            ResolveTargets(connection.TargetPoint, results, aliases, visited);
+        }
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 등록된 모듈 구성이 바뀌었을 때. 인자는 ClassedNode가 놓인 부모 Background
+    /// </summary>
+    public static event Action<PUMPBackground> OnModuleChanged;
+
+    public static int ModuleCount => _modules.Count;
+
+    public static void Register(IClassedNode classedNode, PUMPBackground background)
+    {
+        Node node = classedNode?.GetNode();
+        if (node == null || background == null)
+        {
+            return;
+        }
+
+        _modules[node] = background;
+        _owners[background] = node;
+        OnModuleChanged?.Invoke(node.Background);
+    }
+
+    public static void Unregister(IClassedNode classedNode)
+    {
+        Node node = classedNode?.GetNode();
+        if (node == null || !_modules.Remove(node, out PUMPBackground background))
+        {
+            return;
+        }
+
+        if (background != null)
+        {
+            _owners.Remove(background);
+        }
+
+        OnModuleChanged?.Invoke(node.Background);
+    }
+
+    /// <summary>
+    /// ClassedNode의 내부 Background
+    /// </summary>
+    public static bool TryGetModule(Node classedNode, out PUMPBackground background)
+    {
+        return _modules.TryGetValue(classedNode, out background) && background != null;
+    }
+
+    /// <summary>
+    /// 모듈 내부 Background를 소유한 ClassedNode
+    /// </summary>
+    public static bool TryGetOwner(PUMPBackground background, out Node classedNode)
+    {
+        return _owners.TryGetValue(background, out classedNode) && classedNode is { IsDestroyed: false };
+    }
+
+    /// <summary>
+    /// 등록된 ClassedNode를 내부 노드로 치환 (중첩 모듈 포함)
+    /// </summary>
+    public static List<Node> Flatten(IEnumerable<Node> nodes)
+    {
+        List<Node> result = new();
+        Flatten(nodes, result, new HashSet<PUMPBackground>());
+        return result;
+    }
+
+    /// <summary>
+    /// 연결 대상 TP가 모듈 경계라면 경계를 통과해 실제로 값을 받는 입력 TP까지 따라간다.
+    /// </summary>
+    /// <param name="target">연결의 TargetPoint</param>
+    /// <param name="results">실제 대상 TP</param>
+    /// <param name="aliases">지나친 경계 TP (같은 값을 표시만 함)</param>
+    public static void ResolveTargets(ITransitionPoint target, List<ITransitionPoint> results, List<ITransitionPoint> aliases)
+    {
+        ResolveTargets(target, results, aliases, new HashSet<ITransitionPoint>());
+    }
+    #endregion
+}
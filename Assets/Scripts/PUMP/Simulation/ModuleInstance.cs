@@ -0,0 +1,326 @@
+using System;
+using System.Collections.Generic;
+using UnityEngine;
+
+/// <summary>
+/// ModuleTemplate의 인스턴스 하나. 위상과 평가기는 템플릿과 공유하고 포트 상태 배열만 가진다.
+/// 평가 의미는 SimulationKernel과 동일 (레벨 순서, 조합 노드 Tick 당 1회, 사이클 노드 입력은 다음 Tick)
+/// </summary>
+public class ModuleInstance : IHeadlessOutputWriter
+{
+    #region Privates
+    private readonly struct InputEvent
+    {
+        public InputEvent(int port, Transition state, Transition beforeState)
+        {
+            Port = port;
+            State = state;
+            BeforeState = beforeState;
+        }
+
+        public int Port { get; }
+        public Transition State { get; }
+        public Transition BeforeState { get; }
+    }
+
+    // 인스턴스끼리 동시에 평가되지 않으므로 공유
+    private static readonly HeadlessContext _context = new();
+
+    private readonly ModuleTemplate _template;
+
+    // State ----------
+    private readonly Transition[] _inputs;
+    private readonly Transition[] _outputs;
+    private readonly Transition[] _inputSnapshots;
+    private readonly bool[] _inputWritten;
+    private readonly bool[] _nodeDirty;
+    private readonly Transition[] _moduleOutputs;
+    private List<InputEvent>[] _nodeEvents;
+    private List<int>[] _levelBuckets;
+
+    // Queue ----------
+    private Queue<InputEvent> _pending = new();
+    private Queue<InputEvent> _processing = new();
+
+    private void SetContext(int nodeIndex, int index, Transition state, Transition beforeState, bool isStateChange)
+    {
+        int inputOffset = _template.InputOffsets[nodeIndex];
+        int outputOffset = _template.OutputOffsets[nodeIndex];
+
+        _context.Set
+        (
+            writer: this,
+            inputs: _inputs,
+            outputs: _outputs,
+            inputTypes: _template.InputTypes,
+            outputTypes: _template.OutputTypes,
+            inputOffset: inputOffset,
+            inputCount: _template.InputOffsets[nodeIndex + 1] - inputOffset,
+            outputOffset: outputOffset,
+            outputCount: _template.OutputOffsets[nodeIndex + 1] - outputOffset,
+            index: index,
+            state: state,
+            beforeState: beforeState,
+            isStateChange: isStateChange
+        );
+    }
+
+    private void CallEvaluate(int nodeIndex)
+    {
+        try
+        {
+            _template.Evaluators[nodeIndex].Evaluate(_context);
+        }
+        catch (Exception e)
+        {
+            Debug.LogError("<color=red><b>[LIFE CYCLE: Evaluate]</b></color>");
+            Debug.LogException(e);
+        }
+    }
+
+    private void Accept(InputEvent inputEvent)
+    {
+        int nodeIndex = _template.InputOwners[inputEvent.Port];
+
+        if (_template.Combinational[nodeIndex])
+        {
+            _inputWritten[inputEvent.Port] = true;
+        }
+        else
+        {
+            _nodeEvents[nodeIndex] ??= new List<InputEvent>();
+            _nodeEvents[nodeIndex].Add(inputEvent);
+        }
+
+        if (!_nodeDirty[nodeIndex])
+        {
+            _nodeDirty[nodeIndex] = true;
+            _levelBuckets ??= CreateLevelBuckets();
+            _levelBuckets[_template.Levels[nodeIndex]].Add(nodeIndex);
+        }
+    }
+
+    private List<int>[] CreateLevelBuckets()
+    {
+        List<int>[] buckets = new List<int>[_template.LevelCount];
+        for (int i = 0; i < buckets.Length; i++)
+        {
+            buckets[i] = new List<int>();
+        }
+
+        return buckets;
+    }
+
+    private void EvaluateNode(int nodeIndex)
+    {
+        _nodeDirty[nodeIndex] = false;
+
+        if (!_template.Combinational[nodeIndex])
+        {
+            List<InputEvent> events = _nodeEvents[nodeIndex];
+            if (events == null)
+            {
+                return;
+            }
+
+            int inputOffset = _template.InputOffsets[nodeIndex];
+            for (int i = 0; i < events.Count; i++)
+            {
+                InputEvent inputEvent = events[i];
+                SetContext(nodeIndex, inputEvent.Port - inputOffset, inputEvent.State, inputEvent.BeforeState,
+                    !inputEvent.BeforeState.Equals(inputEvent.State));
+                CallEvaluate(nodeIndex);
+            }
+
+            events.Clear();
+            return;
+        }
+
+        // 조합 노드: 이번 Tick의 모든 입력 변경을 반영해 1회 평가
+        int start = _template.InputOffsets[nodeIndex];
+        int end = _template.InputOffsets[nodeIndex + 1];
+        int changedPort = -1;
+        int writtenPort = -1;
+        Transition changedBefore = default;
+
+        for (int port = start; port < end; port++)
+        {
+            if (!_inputWritten[port])
+            {
+                continue;
+            }
+
+            _inputWritten[port] = false;
+            if (writtenPort < 0)
+            {
+                writtenPort = port;
+            }
+
+            if (changedPort < 0 && !_inputSnapshots[port].Equals(_inputs[port]))
+            {
+                changedPort = port;
+                changedBefore = _inputSnapshots[port];
+            }
+
+            _inputSnapshots[port] = _inputs[port];
+        }
+
+        if (writtenPort < 0)
+        {
+            return;
+        }
+
+        int reportPort = changedPort >= 0 ? changedPort : writtenPort;
+        Transition beforeState = changedPort >= 0 ? changedBefore : _inputs[reportPort];
+        SetContext(nodeIndex, reportPort - start, _inputs[reportPort], beforeState, changedPort >= 0);
+        CallEvaluate(nodeIndex);
+    }
+
+    /// <summary>
+    /// 내부 입력 포트 기록 또는 모듈 출력 갱신
+    /// </summary>
+    private void Deliver(int target, Transition state, bool isImmediate)
+    {
+        if (target < 0)
+        {
+            SetModuleOutput(~target, state);
+            return;
+        }
+
+        Transition beforeState = _inputs[target];
+        _inputs[target] = state;
+
+        InputEvent inputEvent = new(target, state, beforeState);
+        if (isImmediate && !_template.IsCyclic[_template.InputOwners[target]])
+        {
+            Accept(inputEvent);
+        }
+        else
+        {
+            _pending.Enqueue(inputEvent);
+        }
+    }
+
+    private void SetModuleOutput(int index, Transition state)
+    {
+        _moduleOutputs[index] = state;
+
+        try
+        {
+            OnOutput?.Invoke(index, state);
+        }
+        catch (Exception e)
+        {
+            Debug.LogException(e);
+        }
+    }
+
+    void IHeadlessOutputWriter.WriteOutput(int port, Transition state)
+    {
+        _outputs[port] = state;
+
+        for (int i = _template.FanoutOffsets[port]; i < _template.FanoutOffsets[port + 1]; i++)
+        {
+            Deliver(_template.FanoutTargets[i], state, true);
+        }
+    }
+    #endregion
+
+    #region Interface
+    internal ModuleInstance(ModuleTemplate template)
+    {
+        _template = template ?? throw new ArgumentNullException(nameof(template));
+
+        _inputs = (Transition[])template.InitialInputs.Clone();
+        _inputSnapshots = (Transition[])template.InitialInputs.Clone();
+        _outputs = (Transition[])template.InitialOutputs.Clone();
+        _moduleOutputs = (Transition[])template.InitialModuleOutputs.Clone();
+        _inputWritten = new bool[_inputs.Length];
+        _nodeDirty = new bool[template.NodeCount];
+        _nodeEvents = new List<InputEvent>[template.NodeCount];
+    }
+
+    public ModuleTemplate Template => _template;
+
+    /// <summary>
+    /// 평가 대기중인 입력이 없는지
+    /// </summary>
+    public bool IsIdle => _pending.Count <= 0;
+
+    public int InputCount => _template.InputCount;
+
+    public int OutputCount => _template.OutputCount;
+
+    /// <summary>
+    /// 모듈 출력이 갱신될 때 (출력 Index, State). 평가 도중 호출된다.
+    /// </summary>
+    public event Action<int, Transition> OnOutput;
+
+    public Transition GetOutput(int index) => _moduleOutputs[index];
+
+    /// <summary>
+    /// 모든 모듈 출력의 현재 State
+    /// </summary>
+    public Transition[] GetOutputs() => (Transition[])_moduleOutputs.Clone();
+
+    /// <summary>
+    /// 모듈 입력 갱신. 다음 Tick()에 평가 (통과 연결된 출력은 즉시 갱신)
+    /// </summary>
+    public void WriteInput(int index, Transition state)
+    {
+        if (index < 0 || index >= _template.InputCount)
+        {
+            throw new IndexOutOfRangeException($"{nameof(ModuleInstance)}: Input index {index} is out of range");
+        }
+
+        for (int i = _template.ModuleInputOffsets[index]; i < _template.ModuleInputOffsets[index + 1]; i++)
+        {
+            Deliver(_template.ModuleInputTargets[i], state, false);
+        }
+    }
+
+    /// <summary>
+    /// 대기중인 입력을 레벨 순서로 평가
+    /// </summary>
+    /// <returns>다음 Tick에 평가할 입력이 남아있는지</returns>
+    public bool Tick()
+    {
+        (_pending, _processing) = (_processing, _pending);
+
+        while (_processing.Count > 0)
+        {
+            Accept(_processing.Dequeue());
+        }
+
+        if (_levelBuckets != null)
+        {
+            // 평가 중 추가되는 노드는 항상 더 높은 레벨
+            foreach (List<int> bucket in _levelBuckets)
+            {
+                for (int i = 0; i < bucket.Count; i++)
+                {
+                    EvaluateNode(bucket[i]);
+                }
+
+                bucket.Clear();
+            }
+        }
+
+        return _pending.Count > 0;
+    }
+
+    /// <summary>
+    /// 대기중인 입력이 없어질 때까지 평가 (진동 회로 대비 상한)
+    /// </summary>
+    /// <returns>상한에 걸려 입력이 남아있는지</returns>
+    public bool Run(int maxTicks)
+    {
+        for (int i = 0; i < maxTicks && !IsIdle; i++)
+        {
+            Tick();
+        }
+
+        return !IsIdle;
+    }
+    #endregion
+}
@@ -0,0 +1,464 @@
+using System;
+using System.Collections.Generic;
+
+/// <summary>
+/// ClassedNode 모듈 정의(NodeInfos)를 한 번 컴파일한 불변 템플릿. 같은 정의의 인스턴스가 모두 공유한다.
+/// - 공유: 노드 종류, 평가기(IHeadlessEvaluable), 포트 오프셋/타입, fan-out(CSR), 레벨
+/// - 인스턴스: ModuleInstance가 가진 포트 상태 배열뿐
+/// - 중첩 ClassedNode는 내부 구조를 펼쳐 넣고, ExternalInput/ExternalOutput은 선으로 치환
+/// 평가기는 상태를 포트 배열(HeadlessContext)에만 두므로 노드 종류당 하나의 인스턴스를 공유한다.
+/// Gateway, ClassedNode 외에 IHeadlessEvaluable이 아닌 노드가 있으면 컴파일하지 않는다.
+/// </summary>
+public class ModuleTemplate
+{
+    #region Privates
+    private const int NO_SOURCE = int.MinValue;
+    private const int MAX_NESTED_DEPTH = 32;
+    private const int MAX_RESOLVE_DEPTH = 256;
+
+    private static readonly Dictionary<Type, IHeadlessEvaluable> _evaluatorCache = new();
+
+    /// <summary>
+    /// 컴파일 중인 구조 하나 (최상위 또는 중첩 ClassedNode 내부)
+    /// </summary>
+    private class Scope
+    {
+        public List<SerializeNodeInfo> Infos;
+        public Scope Parent;
+        public int OwnerIndex = -1;                     // Parent에서 이 구조를 가진 ClassedNode의 index
+        public int[] CellIndices;                       // info index → cell index (평가 노드가 아니면 -1)
+        public readonly Dictionary<int, Scope> Children = new();
+        public int InputGatewayIndex = -1;
+        public int OutputGatewayIndex = -1;
+    }
+
+    private ModuleTemplate() { }
+
+    private static IHeadlessEvaluable GetEvaluator(Type nodeType)
+    {
+        if (!_evaluatorCache.TryGetValue(nodeType, out IHeadlessEvaluable evaluator))
+        {
+            evaluator = (IHeadlessEvaluable)Activator.CreateInstance(nodeType);
+            _evaluatorCache.Add(nodeType, evaluator);
+        }
+
+        return evaluator;
+    }
+
+    private static List<SerializeNodeInfo> GetModuleInfos(SerializeNodeInfo info)
+    {
+        return info.NodeAdditionalArgs is ClassedNodeSerializeInfo args ? args._structure?.NodeInfos : null;
+    }
+
+    /// <summary>
+    /// 평가 노드(cell) 수집. 지원하지 않는 노드가 있으면 false
+    /// </summary>
+    private static bool Collect(Scope scope, List<(Scope scope, int infoIndex)> cells, int depth)
+    {
+        if (depth > MAX_NESTED_DEPTH)
+        {
+            return false;
+        }
+
+        int count = scope.Infos.Count;
+        scope.CellIndices = new int[count];
+
+        for (int i = 0; i < count; i++)
+        {
+            scope.CellIndices[i] = -1;
+            Type nodeType = scope.Infos[i].NodeType;
+
+            if (nodeType == null)
+            {
+                return false;
+            }
+
+            if (nodeType == typeof(ExternalInput))
+            {
+                if (scope.InputGatewayIndex < 0)
+                {
+                    scope.InputGatewayIndex = i;
+                }
+                continue;
+            }
+
+            if (nodeType == typeof(ExternalOutput))
+            {
+                if (scope.OutputGatewayIndex < 0)
+                {
+                    scope.OutputGatewayIndex = i;
+                }
+                continue;
+            }
+
+            if (typeof(IClassedNode).IsAssignableFrom(nodeType))
+            {
+                Scope child = new()
+                {
+                    Infos = GetModuleInfos(scope.Infos[i]) ?? new List<SerializeNodeInfo>(),
+                    Parent = scope,
+                    OwnerIndex = i,
+                };
+                scope.Children.Add(i, child);
+
+                if (!Collect(child, cells, depth + 1))
+                {
+                    return false;
+                }
+                continue;
+            }
+
+            if (!typeof(IHeadlessEvaluable).IsAssignableFrom(nodeType) || nodeType.IsAbstract)
+            {
+                return false;
+            }
+
+            SerializeNodeInfo info = scope.Infos[i];
+            if (info.InTpType == null || info.OutTpType == null)
+            {
+                return false;
+            }
+
+            scope.CellIndices[i] = cells.Count;
+            cells.Add((scope, i));
+        }
+
+        return true;
+    }
+
+    /// <summary>
+    /// 입력 TP의 연결 소스 (TPIn이 자기 소스 TPOut을 기록)
+    /// </summary>
+    private static TPConnectionIndexInfo GetInSource(Scope scope, int nodeIndex, int tpIndex)
+    {
+        if (nodeIndex < 0 || nodeIndex >= scope.Infos.Count)
+        {
+            return null;
+        }
+
+        TPConnectionIndexInfo[] targets = scope.Infos[nodeIndex].InConnectionTargets;
+        if (targets == null || tpIndex < 0 || tpIndex >= targets.Length)
+        {
+            return null;
+        }
+
+        TPConnectionIndexInfo source = targets[tpIndex];
+        return source != null && source.NodeIndex >= 0 && source.NodeIndex < scope.Infos.Count && source.TpIndex >= 0 ? source : null;
+    }
+
+    /// <summary>
+    /// 출력 TP를 Gateway/ClassedNode 경계 너머의 실제 출처로 해석
+    /// </summary>
+    /// <returns>>= 0: 출력 포트, &lt; 0: ~모듈 입력, NO_SOURCE: 연결 없음</returns>
+    private int ResolveSource(Scope scope, int nodeIndex, int tpIndex, int depth)
+    {
+        if (depth > MAX_RESOLVE_DEPTH || nodeIndex < 0 || nodeIndex >= scope.Infos.Count)
+        {
+            return NO_SOURCE;
+        }
+
+        int cell = scope.CellIndices[nodeIndex];
+        if (cell >= 0)
+        {
+            return tpIndex < OutputOffsets[cell + 1] - OutputOffsets[cell] ? OutputOffsets[cell] + tpIndex : NO_SOURCE;
+        }
+
+        // 구조의 ExternalInput: 최상위면 모듈 입력, 중첩이면 부모의 ClassedNode 입력 소스
+        if (nodeIndex == scope.InputGatewayIndex)
+        {
+            if (scope.Parent == null)
+            {
+                return tpIndex < ModuleInputTypes.Length ? ~tpIndex : NO_SOURCE;
+            }
+
+            TPConnectionIndexInfo outerSource = GetInSource(scope.Parent, scope.OwnerIndex, tpIndex);
+            return outerSource == null ? NO_SOURCE : ResolveSource(scope.Parent, outerSource.NodeIndex, outerSource.TpIndex, depth + 1);
+        }
+
+        // 중첩 ClassedNode 출력: 내부 ExternalOutput 입력의 소스
+        if (scope.Children.TryGetValue(nodeIndex, out Scope child) && child.OutputGatewayIndex >= 0)
+        {
+            TPConnectionIndexInfo innerSource = GetInSource(child, child.OutputGatewayIndex, tpIndex);
+            return innerSource == null ? NO_SOURCE : ResolveSource(child, innerSource.NodeIndex, innerSource.TpIndex, depth + 1);
+        }
+
+        return NO_SOURCE;
+    }
+
+    private static Transition GetState(Transition[] states, TransitionType[] types, int index)
+    {
+        return states != null && index < states.Length && states[index].Type == types[index] ? states[index] : types[index].Null();
+    }
+
+    private static void ToCsr(List<int>[] lists, out int[] offsets, out int[] targets)
+    {
+        offsets = new int[lists.Length + 1];
+        List<int> flat = new();
+
+        for (int i = 0; i < lists.Length; i++)
+        {
+            if (lists[i] != null)
+            {
+                flat.AddRange(lists[i]);
+            }
+
+            offsets[i + 1] = flat.Count;
+        }
+
+        targets = flat.ToArray();
+    }
+
+    /// <summary>
+    /// 레벨 계산 (Kahn). 위상 정렬에서 남은 노드(사이클 및 그 하류)는 사이클로 취급
+    /// </summary>
+    private void Levelize()
+    {
+        int nodeCount = Evaluators.Length;
+        Levels = new int[nodeCount];
+        IsCyclic = new bool[nodeCount];
+
+        int[] inDegrees = new int[nodeCount];
+        foreach (int target in FanoutTargets)
+        {
+            if (target >= 0)
+            {
+                inDegrees[InputOwners[target]]++;
+            }
+        }
+
+        Queue<int> ready = new();
+        for (int i = 0; i < nodeCount; i++)
+        {
+            if (inDegrees[i] == 0)
+            {
+                ready.Enqueue(i);
+            }
+        }
+
+        int maxLevel = 0;
+        while (ready.Count > 0)
+        {
+            int nodeIndex = ready.Dequeue();
+
+            for (int port = OutputOffsets[nodeIndex]; port < OutputOffsets[nodeIndex + 1]; port++)
+            {
+                for (int i = FanoutOffsets[port]; i < FanoutOffsets[port + 1]; i++)
+                {
+                    int target = FanoutTargets[i];
+                    if (target < 0)
+                    {
+                        continue;
+                    }
+
+                    int next = InputOwners[target];
+                    Levels[next] = Math.Max(Levels[next], Levels[nodeIndex] + 1);
+                    maxLevel = Math.Max(maxLevel, Levels[next]);
+
+                    if (--inDegrees[next] == 0)
+                    {
+                        ready.Enqueue(next);
+                    }
+                }
+            }
+        }
+
+        for (int i = 0; i < nodeCount; i++)
+        {
+            if (inDegrees[i] > 0)
+            {
+                IsCyclic[i] = true;
+                Levels[i] = 0;
+            }
+        }
+
+        LevelCount = maxLevel + 1;
+    }
+    #endregion
+
+    #region Shared Layout
+    // ModuleInstance 전용. 컴파일 이후 변경하지 않음
+    internal Type[] NodeTypes { get; private set; }
+    internal IHeadlessEvaluable[] Evaluators { get; private set; }
+    internal bool[] Combinational { get; private set; }
+    internal int[] InputOffsets { get; private set; }      // node → 입력 포트 시작 (길이 node + 1)
+    internal int[] OutputOffsets { get; private set; }     // node → 출력 포트 시작 (길이 node + 1)
+    internal int[] InputOwners { get; private set; }
+    internal TransitionType[] InputTypes { get; private set; }
+    internal TransitionType[] OutputTypes { get; private set; }
+    internal Transition[] InitialInputs { get; private set; }
+    internal Transition[] InitialOutputs { get; private set; }
+    internal int[] FanoutOffsets { get; private set; }     // output port → FanoutTargets 시작
+    internal int[] FanoutTargets { get; private set; }     // >= 0: 입력 포트, < 0: ~모듈 출력
+    internal int[] ModuleInputOffsets { get; private set; }
+    internal int[] ModuleInputTargets { get; private set; } // >= 0: 입력 포트, < 0: ~모듈 출력 (통과 연결)
+    internal TransitionType[] ModuleInputTypes { get; private set; }
+    internal TransitionType[] ModuleOutputTypes { get; private set; }
+    internal Transition[] InitialModuleOutputs { get; private set; }
+    internal int[] Levels { get; private set; }
+    internal bool[] IsCyclic { get; private set; }
+    internal int LevelCount { get; private set; }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 펼쳐진 평가 노드 수 (중첩 모듈 포함)
+    /// </summary>
+    public int NodeCount => Evaluators.Length;
+
+    /// <summary>
+    /// 인스턴스 하나가 가지는 포트 상태 수
+    /// </summary>
+    public int PortCount => InputTypes.Length + OutputTypes.Length;
+
+    /// <summary>
+    /// 모듈 입력(ExternalInput) 개수
+    /// </summary>
+    public int InputCount => ModuleInputTypes.Length;
+
+    /// <summary>
+    /// 모듈 출력(ExternalOutput) 개수
+    /// </summary>
+    public int OutputCount => ModuleOutputTypes.Length;
+
+    public TransitionType GetInputType(int index) => ModuleInputTypes[index];
+
+    public TransitionType GetOutputType(int index) => ModuleOutputTypes[index];
+
+    /// <summary>
+    /// 모듈 구조를 템플릿으로 컴파일. 헤드리스로 평가할 수 없는 구조면 null
+    /// </summary>
+    public static ModuleTemplate Compile(List<SerializeNodeInfo> infos)
+    {
+        if (infos == null)
+        {
+            return null;
+        }
+
+        Scope root = new() { Infos = infos };
+        List<(Scope scope, int infoIndex)> cells = new();
+        if (!Collect(root, cells, 0))
+        {
+            return null;
+        }
+
+        int nodeCount = cells.Count;
+        ModuleTemplate template = new()
+        {
+            NodeTypes = new Type[nodeCount],
+            Evaluators = new IHeadlessEvaluable[nodeCount],
+            Combinational = new bool[nodeCount],
+            InputOffsets = new int[nodeCount + 1],
+            OutputOffsets = new int[nodeCount + 1],
+        };
+
+        // Gateway (원본 infos와 배열을 공유하지 않음) ----------
+        template.ModuleInputTypes = root.InputGatewayIndex >= 0 && infos[root.InputGatewayIndex].OutTpType != null
+            ? (TransitionType[])infos[root.InputGatewayIndex].OutTpType.Clone()
+            : Array.Empty<TransitionType>();
+        template.ModuleOutputTypes = root.OutputGatewayIndex >= 0 && infos[root.OutputGatewayIndex].InTpType != null
+            ? (TransitionType[])infos[root.OutputGatewayIndex].InTpType.Clone()
+            : Array.Empty<TransitionType>();
+
+        // Port offset ----------
+        for (int i = 0; i < nodeCount; i++)
+        {
+            SerializeNodeInfo info = cells[i].scope.Infos[cells[i].infoIndex];
+            template.NodeTypes[i] = info.NodeType;
+            template.Evaluators[i] = GetEvaluator(info.NodeType);
+            template.Combinational[i] = template.Evaluators[i] is ICombinationalEvaluable;
+            template.InputOffsets[i + 1] = template.InputOffsets[i] + info.InTpType.Length;
+            template.OutputOffsets[i + 1] = template.OutputOffsets[i] + info.OutTpType.Length;
+        }
+
+        int inputCount = template.InputOffsets[nodeCount];
+        int outputCount = template.OutputOffsets[nodeCount];
+
+        template.InputOwners = new int[inputCount];
+        template.InputTypes = new TransitionType[inputCount];
+        template.InitialInputs = new Transition[inputCount];
+        template.OutputTypes = new TransitionType[outputCount];
+        template.InitialOutputs = new Transition[outputCount];
+
+        List<int>[] fanouts = new List<int>[outputCount];
+        List<int>[] moduleInputFanouts = new List<int>[template.ModuleInputTypes.Length];
+
+        void Link(int source, int target)
+        {
+            if (source == NO_SOURCE)
+            {
+                return;
+            }
+
+            if (source >= 0)
+            {
+                (fanouts[source] ??= new List<int>()).Add(target);
+            }
+            else
+            {
+                (moduleInputFanouts[~source] ??= new List<int>()).Add(target);
+            }
+        }
+
+        for (int i = 0; i < nodeCount; i++)
+        {
+            SerializeNodeInfo info = cells[i].scope.Infos[cells[i].infoIndex];
+
+            for (int j = 0; j < info.OutTpType.Length; j++)
+            {
+                int port = template.OutputOffsets[i] + j;
+                template.OutputTypes[port] = info.OutTpType[j];
+                template.InitialOutputs[port] = GetState(info.OutTpState, info.OutTpType, j);
+            }
+
+            for (int j = 0; j < info.InTpType.Length; j++)
+            {
+                int port = template.InputOffsets[i] + j;
+                template.InputOwners[port] = i;
+                template.InputTypes[port] = info.InTpType[j];
+                template.InitialInputs[port] = GetState(info.InTpState, info.InTpType, j);
+            }
+        }
+
+        // Wire (모든 출력 포트 오프셋이 정해진 뒤 해석) ----------
+        for (int i = 0; i < nodeCount; i++)
+        {
+            (Scope scope, int infoIndex) = cells[i];
+            for (int j = 0; j < template.InputOffsets[i + 1] - template.InputOffsets[i]; j++)
+            {
+                TPConnectionIndexInfo source = GetInSource(scope, infoIndex, j);
+                if (source != null)
+                {
+                    Link(template.ResolveSource(scope, source.NodeIndex, source.TpIndex, 0), template.InputOffsets[i] + j);
+                }
+            }
+        }
+
+        template.InitialModuleOutputs = new Transition[template.ModuleOutputTypes.Length];
+        for (int j = 0; j < template.ModuleOutputTypes.Length; j++)
+        {
+            TPConnectionIndexInfo source = root.OutputGatewayIndex >= 0 ? GetInSource(root, root.OutputGatewayIndex, j) : null;
+            int resolved = source == null ? NO_SOURCE : template.ResolveSource(root, source.NodeIndex, source.TpIndex, 0);
+
+            Link(resolved, ~j);
+            template.InitialModuleOutputs[j] = resolved >= 0 && template.OutputTypes[resolved] == template.ModuleOutputTypes[j]
+                ? template.InitialOutputs[resolved]
+                : template.ModuleOutputTypes[j].Null();
+        }
+
+        ToCsr(fanouts, out int[] fanoutOffsets, out int[] fanoutTargets);
+        ToCsr(moduleInputFanouts, out int[] moduleInputOffsets, out int[] moduleInputTargets);
+        template.FanoutOffsets = fanoutOffsets;
+        template.FanoutTargets = fanoutTargets;
+        template.ModuleInputOffsets = moduleInputOffsets;
+        template.ModuleInputTargets = moduleInputTargets;
+
+        template.Levelize();
+        return template;
+    }
+
+    /// <summary>
+    /// 템플릿 초기 상태로 인스턴스 생성 (상태 배열만 할당)
+    /// </summary>
+    public ModuleInstance CreateInstance() => new(this);
+    #endregion
+}
@@ -0,0 +1,255 @@
+using System;
+using System.Collections.Generic;
+using UnityEngine;
+
+/// <summary>
+/// 모듈 구조 (해시 + 정규형) → ModuleTemplate 캐시.
+/// 같은 정의의 ClassedNode는 템플릿을 한 번만 컴파일하고, 이후 인스턴스는 상태 배열만 할당한다.
+/// 해시는 노드 종류, 포트 타입/상태, 연결 (중첩 모듈 포함) 기준
+/// </summary>
+public static class ModuleTemplateRegistry
+{
+    #region Privates
+    private const ulong FNV_OFFSET = 14695981039346656037UL;
+    private const ulong FNV_PRIME = 1099511628211UL;
+    private const int MAX_NESTED_DEPTH = 32;
+
+    private static readonly Dictionary<StructureKey, ModuleTemplate> _templates = new();
+    private static readonly HashSet<StructureKey> _unsupported = new();
+
+    /// <summary>
+    /// 구조의 정규형 (노드 종류 이름, 정수 토큰, 포트 상태를 순서대로 나열) + FNV 해시.
+    /// 해시가 같아도 정규형이 다르면 다른 키 (해시 충돌 시 다른 구조의 템플릿을 쓰지 않도록)
+    /// </summary>
+    private sealed class StructureKey : IEquatable<StructureKey>
+    {
+        private readonly List<int> _tokens = new();
+        private readonly List<string> _typeNames = new();
+        private readonly List<Transition> _states = new();
+
+        public ulong Hash { get; private set; } = FNV_OFFSET;
+
+        public void Add(int value)
+        {
+            _tokens.Add(value);
+            Hash = Mix(Hash, value);
+        }
+
+        public void Add(string typeName)
+        {
+            _typeNames.Add(typeName);
+            Hash = Mix(Hash, typeName?.GetHashCode() ?? 0);
+        }
+
+        public void Add(Transition state)
+        {
+            _states.Add(state);
+            Hash = Mix(Hash, state.GetHashCode());
+        }
+
+        public bool Equals(StructureKey other)
+        {
+            if (other == null)
+            {
+                return false;
+            }
+
+            if (ReferenceEquals(this, other))
+            {
+                return true;
+            }
+
+            if (Hash != other.Hash || _tokens.Count != other._tokens.Count || _typeNames.Count != other._typeNames.Count || _states.Count != other._states.Count)
+            {
+                return false;
+            }
+
+            for (int i = 0; i < _tokens.Count; i++)
+            {
+                if (_tokens[i] != other._tokens[i])
+                {
+                    return false;
+                }
+            }
+
+            for (int i = 0; i < _typeNames.Count; i++)
+            {
+                if (!string.Equals(_typeNames[i], other._typeNames[i], StringComparison.Ordinal))
+                {
+                    return false;
+                }
+            }
+
+            for (int i = 0; i < _states.Count; i++)
+            {
+                if (!_states[i].Equals(other._states[i]))
+                {
+                    return false;
+                }
+            }
+
+            return true;
+        }
+
+        public override bool Equals(object obj) => obj is StructureKey other && Equals(other);
+
+        public override int GetHashCode() => Hash.GetHashCode();
+    }
+
+    private static ulong Mix(ulong hash, int value)
+    {
+        return (hash ^ (uint)value) * FNV_PRIME;
+    }
+
+    private static void AddStates(StructureKey key, Transition[] states)
+    {
+        if (states == null)
+        {
+            key.Add(-1);
+            return;
+        }
+
+        key.Add(states.Length);
+        foreach (Transition state in states)
+        {
+            key.Add(state);
+        }
+    }
+
+    private static void AddTypes(StructureKey key, TransitionType[] types)
+    {
+        if (types == null)
+        {
+            key.Add(-1);
+            return;
+        }
+
+        key.Add(types.Length);
+        foreach (TransitionType type in types)
+        {
+            key.Add((int)type);
+        }
+    }
+
+    private static void AddTargets(StructureKey key, TPConnectionIndexInfo[] targets)
+    {
+        if (targets == null)
+        {
+            key.Add(-1);
+            return;
+        }
+
+        key.Add(targets.Length);
+        foreach (TPConnectionIndexInfo target in targets)
+        {
+            key.Add(target?.NodeIndex ?? -1);
+            key.Add(target?.TpIndex ?? -1);
+        }
+    }
+
+    private static void AddStructure(StructureKey key, List<SerializeNodeInfo> infos, int depth)
+    {
+        if (infos == null || depth > MAX_NESTED_DEPTH)
+        {
+            key.Add(-1);
+            return;
+        }
+
+        key.Add(infos.Count);
+        foreach (SerializeNodeInfo info in infos)
+        {
+            key.Add(info.NodeType?.FullName);
+            AddTypes(key, info.InTpType);
+            AddTypes(key, info.OutTpType);
+            AddStates(key, info.InTpState);
+            AddStates(key, info.OutTpState);
+            AddTargets(key, info.InConnectionTargets);
+
+            if (info.NodeAdditionalArgs is ClassedNodeSerializeInfo args)
+            {
+                AddStructure(key, args._structure?.NodeInfos, depth + 1);
+            }
+            else
+            {
+                key.Add(-2);
+            }
+        }
+    }
+
+    private static StructureKey CreateKey(List<SerializeNodeInfo> infos)
+    {
+        StructureKey key = new();
+        AddStructure(key, infos, 0);
+        return key;
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 캐시된 템플릿 수
+    /// </summary>
+    public static int Count => _templates.Count;
+
+    public static ulong ComputeHash(List<SerializeNodeInfo> infos)
+    {
+        return CreateKey(infos).Hash;
+    }
+
+    /// <summary>
+    /// 구조에 맞는 템플릿 (없으면 컴파일 후 캐시). 헤드리스로 평가할 수 없는 구조면 false
+    /// </summary>
+    public static bool TryGet(List<SerializeNodeInfo> infos, out ModuleTemplate template)
+    {
+        template = null;
+        if (infos == null)
+        {
+            return false;
+        }
+
+        // 해시 + 정규형 비교 (해시 충돌 시 캐시 미스)
+        StructureKey key = CreateKey(infos);
+        if (_templates.TryGetValue(key, out template))
+        {
+            return true;
+        }
+
+        if (_unsupported.Contains(key))
+        {
+            return false;
+        }
+
+        try
+        {
+            template = ModuleTemplate.Compile(infos);
+        }
+        catch (Exception e)
+        {
+            Debug.LogException(e);
+            template = null;
+        }
+
+        if (template == null)
+        {
+            _unsupported.Add(key);
+            return false;
+        }
+
+        _templates.Add(key, template);
+        return true;
+    }
+
+    /// <summary>
+    /// 구조에 맞는 템플릿으로 인스턴스 생성. 헤드리스로 평가할 수 없는 구조면 null
+    /// </summary>
+    public static ModuleInstance CreateInstance(List<SerializeNodeInfo> infos)
+    {
+        return TryGet(infos, out ModuleTemplate template) ? template.CreateInstance() : null;
+    }
+
+    public static void Clear()
+    {
+        _templates.Clear();
+        _unsupported.Clear();
+    }
+    #endregion
+}
@@ -0,0 +1,136 @@
+using System;
+using Cysharp.Threading.Tasks;
+using UnityEngine;
+
+/// <summary>
+/// 시간 기반 노드(Timer, Delay, Blink, ClockGate, Debouncer, FrequencyMeter, KeyInput)가 공유하는 시뮬레이션 시계.
+/// 노드마다 UniTask 루프를 돌리지 않고 만료 시각을 TimingWheel에 등록하며, 하나의 Update 루프가 만료된 이벤트만 실행한다.
+/// - 시간: 1 Tick = 1ms, 프레임 deltaTime을 누적해 정수 Tick 단위로 진행 (프레임률과 무관한 순서/간격)
+/// - 프레임: 시계 Update 1회 = 1 Frame
+/// </summary>
+public static class SimulationClock
+{
+    #region Privates
+    private const double MAX_ADVANCE_MS_PER_FRAME = 250.0; // 프레임 드랍 시 한 번에 진행할 시간 상한
+
+    private static readonly TimingWheel _timeWheel = new();
+    private static readonly TimingWheel _frameWheel = new();
+    private static double _accumulatedMs = 0.0;
+    private static Action _onFrame;
+
+    private static UniTask _loopTask = UniTask.CompletedTask;
+
+    private static bool HasWork => _timeWheel.Count > 0 || _frameWheel.Count > 0 || _onFrame != null;
+
+    private static void LoopCheck()
+    {
+        if (_loopTask.Status != UniTaskStatus.Pending)
+        {
+            _loopTask = ClockLoopAsync();
+        }
+    }
+
+    private static async UniTask ClockLoopAsync()
+    {
+        _accumulatedMs = 0.0;
+
+        while (HasWork)
+        {
+            await UniTask.Yield(PlayerLoopTiming.Update);
+            Advance(Time.deltaTime);
+        }
+    }
+
+    private static void Advance(float deltaTime)
+    {
+        // 같은 프레임에 만료된 이벤트의 입력 변경은 IBatchStateUpdate 노드에 한 번에 전달
+        StateUpdateBatcher.BeginWave();
+        try
+        {
+            _frameWheel.Advance(_frameWheel.Now + 1);
+
+            _accumulatedMs = Math.Min(_accumulatedMs + deltaTime * 1000.0, MAX_ADVANCE_MS_PER_FRAME);
+            long ticks = (long)_accumulatedMs;
+            _accumulatedMs -= ticks;
+            _timeWheel.Advance(_timeWheel.Now + ticks);
+
+            try
+            {
+                _onFrame?.Invoke();
+            }
+            catch (Exception e)
+            {
+                Debug.LogException(e);
+            }
+        }
+        finally
+        {
+            StateUpdateBatcher.EndWave();
+        }
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 시뮬레이션 시각 (ms)
+    /// </summary>
+    public static long Now => _timeWheel.Now;
+
+    /// <summary>
+    /// 시뮬레이션 시각 (초)
+    /// </summary>
+    public static float Seconds => _timeWheel.Now * 0.001f;
+
+    /// <summary>
+    /// 시계가 진행한 프레임 수
+    /// </summary>
+    public static long Frame => _frameWheel.Now;
+
+    /// <summary>
+    /// 대기중인 만료 예약 수
+    /// </summary>
+    public static int PendingCount => _timeWheel.Count + _frameWheel.Count;
+
+    /// <summary>
+    /// 시뮬레이션 시각 dueMilliseconds(ms)에 실행
+    /// </summary>
+    public static ClockTimer ScheduleAt(long dueMilliseconds, Action callback)
+    {
+        ClockTimer timer = _timeWheel.Schedule(dueMilliseconds, callback);
+        LoopCheck();
+        return timer;
+    }
+
+    /// <summary>
+    /// seconds초 뒤에 실행 (1ms 단위로 올림)
+    /// </summary>
+    public static ClockTimer ScheduleAfter(float seconds, Action callback)
+    {
+        long delay = (long)Math.Ceiling(Math.Max(0.0, seconds) * 1000.0);
+        return ScheduleAt(_timeWheel.Now + delay, callback);
+    }
+
+    /// <summary>
+    /// frames 프레임 뒤에 실행 (0 이하면 다음 프레임)
+    /// </summary>
+    public static ClockTimer ScheduleFrames(int frames, Action callback)
+    {
+        ClockTimer timer = _frameWheel.Schedule(_frameWheel.Now + Math.Max(0, frames), callback);
+        LoopCheck();
+        return timer;
+    }
+
+    /// <summary>
+    /// 만료 이벤트 처리 후 매 프레임 호출. 폴링이 꼭 필요한 경우(키 입력, 진행도 표시)에만 구독할 것
+    /// </summary>
+    public static event Action OnFrame
+    {
+        add
+        {
+            _onFrame += value;
+            LoopCheck();
+        }
+        remove => _onFrame -= value;
+    }
+    #endregion
+}
@@ -0,0 +1,686 @@
+using System;
+using System.Collections.Generic;
+using UnityEngine;
+using Object = UnityEngine.Object;
+
+/// <summary>
+/// PUMPBackground의 노드 목록을 평면 배열로 컴파일하여 GameObject 없이 평가하는 커널.
+/// - 상태: 입력 포트 배열, 출력 포트(Net) 배열 (Transition)
+/// - 연결: 출력 포트 기준 CSR 인접 배열 (fan-out)
+/// - 평가: IHeadlessEvaluable 노드만 커널이 점유, 나머지 노드는 기존 경로(TP, Connection) 유지
+/// - 순서: 사이클 밖 노드는 레벨(위상 정렬) 순서로 Tick 당 1회 평가, 사이클 노드로 들어가는 입력은 다음 Tick
+/// - 모듈: 등록된 ClassedNode는 내부 노드로 펼쳐 함께 평가 (ModuleInliner), 경계 TP는 Mirror만
+/// UI는 Mirror() 호출 시 변경된 포트만 반영한다.
+/// </summary>
+public class SimulationKernel : IDisposable, IHeadlessOutputWriter
+{
+    #region Privates
+    private readonly struct InputEvent
+    {
+        public InputEvent(int port, Transition state, Transition beforeState)
+        {
+            Port = port;
+            State = state;
+            BeforeState = beforeState;
+        }
+
+        public int Port { get; }
+        public Transition State { get; }
+        public Transition BeforeState { get; }
+    }
+
+    // Node ----------
+    private Node[] _nodes;
+    private IHeadlessEvaluable[] _evaluators;
+    private int[] _inputOffsets;    // node -> 입력 포트 시작 (길이 node + 1)
+    private int[] _outputOffsets;   // node -> 출력 포트 시작 (길이 node + 1)
+
+    // Level ----------
+    private int[] _levels;          // 사이클 노드는 0
+    private bool[] _isCyclic;
+    private bool[] _combinational;
+    private bool[] _nodeDirty;
+    private List<int>[] _levelBuckets;
+    private List<InputEvent>[] _nodeEvents;     // 조합 노드가 아닌 경우 입력 이벤트 단위 평가
+
+    // Input port ----------
+    private int[] _inputOwners;
+    private Transition[] _inputs;
+    private TransitionType[] _inputTypes;
+    private ITransitionPoint[] _inputTps;
+    private bool[] _inputWritten;               // 이번 Tick에 기록된 입력 (조합 노드)
+    private Transition[] _inputSnapshots;       // 조합 노드의 마지막 평가 시점 입력
+
+    // Output port (Net) ----------
+    private int[] _outputOwners;
+    private Transition[] _outputs;
+    private TransitionType[] _outputTypes;
+    private ITransitionPoint[] _outputTps;
+
+    // Fan-out (CSR) ----------
+    private int[] _fanoutOffsets;   // output port -> _fanoutTargets 시작 (길이 output + 1)
+    private int[] _fanoutTargets;   // >= 0: 커널 입력 포트, < 0: ~(외부 TP index)
+    private ITransitionPoint[] _externalTargets;
+
+    // Module boundary alias (CSR) ----------
+    private int[] _aliasOffsets;    // output port -> _aliasTps 시작 (길이 output + 1)
+    private ITransitionPoint[] _aliasTps;
+
+    // Queue ----------
+    private Queue<InputEvent> _pending = new();
+    private Queue<InputEvent> _processing = new();
+
+    // Mirror ----------
+    private bool[] _inputMirrorFlags;
+    private bool[] _outputMirrorFlags;
+    private readonly List<int> _inputMirrorList = new();
+    private readonly List<int> _outputMirrorList = new();
+
+    private readonly HeadlessContext _context = new();
+    private bool _disposed = false;
+
+    private SimulationKernel() { }
+
+    private void MarkInput(int port)
+    {
+        if (_inputMirrorFlags[port])
+        {
+            return;
+        }
+
+        _inputMirrorFlags[port] = true;
+        _inputMirrorList.Add(port);
+    }
+
+    private void MarkOutput(int port)
+    {
+        if (_outputMirrorFlags[port])
+        {
+            return;
+        }
+
+        _outputMirrorFlags[port] = true;
+        _outputMirrorList.Add(port);
+    }
+
+    private void SetContext(int nodeIndex, int index, Transition state, Transition beforeState, bool isStateChange)
+    {
+        int inputOffset = _inputOffsets[nodeIndex];
+        int outputOffset = _outputOffsets[nodeIndex];
+
+        _context.Set
+        (
+            writer: this,
+            inputs: _inputs,
+            outputs: _outputs,
+            inputTypes: _inputTypes,
+            outputTypes: _outputTypes,
+            inputOffset: inputOffset,
+            inputCount: _inputOffsets[nodeIndex + 1] - inputOffset,
+            outputOffset: outputOffset,
+            outputCount: _outputOffsets[nodeIndex + 1] - outputOffset,
+            index: index,
+            state: state,
+            beforeState: beforeState,
+            isStateChange: isStateChange
+        );
+    }
+
+    private void CallEvaluate(int nodeIndex)
+    {
+        try
+        {
+            _evaluators[nodeIndex].Evaluate(_context);
+        }
+        catch (Exception e)
+        {
+            Debug.LogError("<color=red><b>[LIFE CYCLE: Evaluate]</b></color>");
+            Debug.LogException(e);
+        }
+    }
+
+    /// <summary>
+    /// 입력 이벤트를 노드의 레벨 버킷에 등록
+    /// </summary>
+    private void Accept(InputEvent inputEvent)
+    {
+        int nodeIndex = _inputOwners[inputEvent.Port];
+
+        if (_combinational[nodeIndex])
+        {
+            _inputWritten[inputEvent.Port] = true;
+        }
+        else
+        {
+            _nodeEvents[nodeIndex] ??= new List<InputEvent>();
+            _nodeEvents[nodeIndex].Add(inputEvent);
+        }
+
+        if (!_nodeDirty[nodeIndex])
+        {
+            _nodeDirty[nodeIndex] = true;
+            _levelBuckets[_levels[nodeIndex]].Add(nodeIndex);
+        }
+    }
+
+    private void EvaluateNode(int nodeIndex)
+    {
+        _nodeDirty[nodeIndex] = false;
+
+        if (_nodes[nodeIndex].IsDestroyed)
+        {
+            _nodeEvents[nodeIndex]?.Clear();
+            return;
+        }
+
+        if (!_combinational[nodeIndex])
+        {
+            List<InputEvent> events = _nodeEvents[nodeIndex];
+            if (events == null)
+            {
+                return;
+            }
+
+            int inputOffset = _inputOffsets[nodeIndex];
+            for (int i = 0; i < events.Count; i++)
+            {
+                InputEvent inputEvent = events[i];
+                SetContext(nodeIndex, inputEvent.Port - inputOffset, inputEvent.State, inputEvent.BeforeState,
+                    !inputEvent.BeforeState.Equals(inputEvent.State));
+                CallEvaluate(nodeIndex);
+            }
+
+            events.Clear();
+            return;
+        }
+
+        // 조합 노드: 이번 Tick의 모든 입력 변경을 반영해 1회 평가
+        int start = _inputOffsets[nodeIndex];
+        int end = _inputOffsets[nodeIndex + 1];
+        int changedPort = -1;
+        int writtenPort = -1;
+        Transition changedBefore = default;
+
+        for (int port = start; port < end; port++)
+        {
+            if (!_inputWritten[port])
+            {
+                continue;
+            }
+
+            _inputWritten[port] = false;
+            if (writtenPort < 0)
+            {
+                writtenPort = port;
+            }
+
+            if (changedPort < 0 && !_inputSnapshots[port].Equals(_inputs[port]))
+            {
+                changedPort = port;
+                changedBefore = _inputSnapshots[port];
+            }
+
+            _inputSnapshots[port] = _inputs[port];
+        }
+
+        if (writtenPort < 0)
+        {
+            return;
+        }
+
+        int reportPort = changedPort >= 0 ? changedPort : writtenPort;
+        Transition beforeState = changedPort >= 0 ? changedBefore : _inputs[reportPort];
+        SetContext(nodeIndex, reportPort - start, _inputs[reportPort], beforeState, changedPort >= 0);
+        CallEvaluate(nodeIndex);
+    }
+
+    /// <summary>
+    /// 사이클 밖 노드의 레벨 계산 (Kahn). 사이클 노드로 들어가는 간선은 제외
+    /// </summary>
+    private void Levelize(IReadOnlyList<Node> targets)
+    {
+        int nodeCount = targets.Count;
+        _levels = new int[nodeCount];
+        _isCyclic = new bool[nodeCount];
+        _combinational = new bool[nodeCount];
+        _nodeDirty = new bool[nodeCount];
+        _nodeEvents = new List<InputEvent>[nodeCount];
+
+        for (int i = 0; i < nodeCount; i++)
+        {
+            _isCyclic[i] = ConnectionGraph.IsCyclic(targets[i]);
+            _combinational[i] = targets[i] is ICombinationalEvaluable;
+        }
+
+        int[] inDegrees = new int[nodeCount];
+        foreach (int target in _fanoutTargets)
+        {
+            if (target >= 0 && !_isCyclic[_inputOwners[target]])
+            {
+                inDegrees[_inputOwners[target]]++;
+            }
+        }
+
+        Queue<int> ready = new();
+        for (int i = 0; i < nodeCount; i++)
+        {
+            if (inDegrees[i] == 0)
+            {
+                ready.Enqueue(i);
+            }
+        }
+
+        int maxLevel = 0;
+        int visitCount = 0;
+        while (ready.Count > 0)
+        {
+            int nodeIndex = ready.Dequeue();
+            visitCount++;
+
+            for (int port = _outputOffsets[nodeIndex]; port < _outputOffsets[nodeIndex + 1]; port++)
+            {
+                for (int i = _fanoutOffsets[port]; i < _fanoutOffsets[port + 1]; i++)
+                {
+                    int target = _fanoutTargets[i];
+                    if (target < 0)
+                    {
+                        continue;
+                    }
+
+                    int next = _inputOwners[target];
+                    if (_isCyclic[next])
+                    {
+                        continue;
+                    }
+
+                    _levels[next] = Math.Max(_levels[next], _levels[nodeIndex] + 1);
+                    maxLevel = Math.Max(maxLevel, _levels[next]);
+
+                    if (--inDegrees[next] == 0)
+                    {
+                        ready.Enqueue(next);
+                    }
+                }
+            }
+        }
+
+        // ConnectionGraph와 불일치 (정상적이라면 발생하지 않음): 남은 노드는 사이클로 취급
+        if (visitCount < nodeCount)
+        {
+            for (int i = 0; i < nodeCount; i++)
+            {
+                if (inDegrees[i] > 0)
+                {
+                    _isCyclic[i] = true;
+                    _levels[i] = 0;
+                }
+            }
+        }
+
+        _levelBuckets = new List<int>[maxLevel + 1];
+        for (int i = 0; i <= maxLevel; i++)
+        {
+            _levelBuckets[i] = new List<int>();
+        }
+    }
+
+    private static bool IsMirrorable(ITransitionPoint tp, out IStateMirrorable mirrorable)
+    {
+        mirrorable = tp as IStateMirrorable;
+
+        if (mirrorable == null)
+        {
+            return false;
+        }
+
+        // 씬 종료 등으로 TP가 먼저 파괴된 경우
+        return tp is not Object unityObject || unityObject != null;
+    }
+
+    private void ThrowIfDisposed()
+    {
+        if (_disposed)
+        {
+            throw new ObjectDisposedException(nameof(SimulationKernel));
+        }
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 커널이 점유한 노드 개수
+    /// </summary>
+    public int NodeCount => _nodes.Length;
+
+    /// <summary>
+    /// 출력 포트(Net) 개수
+    /// </summary>
+    public int NetCount => _outputs.Length;
+
+    /// <summary>
+    /// 지금까지 수행한 Tick 수
+    /// </summary>
+    public long TickCount { get; private set; }
+
+    /// <summary>
+    /// 평가 대기중인 입력이 없는지
+    /// </summary>
+    public bool IsIdle => _pending.Count <= 0;
+
+    /// <summary>
+    /// 노드 목록 중 IHeadlessEvaluable 노드를 컴파일하고 커널에 바인딩
+    /// </summary>
+    public static SimulationKernel Compile(IEnumerable<Node> nodes)
+    {
+        if (nodes == null)
+        {
+            throw new ArgumentNullException(nameof(nodes));
+        }
+
+        List<Node> targets = new();
+        Dictionary<Node, int> nodeIndices = new();
+
+        foreach (Node node in ModuleInliner.Flatten(nodes))
+        {
+            if (node is IHeadlessEvaluable && node is IKernelBindable && !node.IsDestroyed && !nodeIndices.ContainsKey(node))
+            {
+                nodeIndices.Add(node, targets.Count);
+                targets.Add(node);
+            }
+        }
+
+        int nodeCount = targets.Count;
+        ITransitionPoint[][] inTpsPerNode = new ITransitionPoint[nodeCount][];
+        ITransitionPoint[][] outTpsPerNode = new ITransitionPoint[nodeCount][];
+
+        SimulationKernel kernel = new()
+        {
+            _nodes = targets.ToArray(),
+            _evaluators = new IHeadlessEvaluable[nodeCount],
+            _inputOffsets = new int[nodeCount + 1],
+            _outputOffsets = new int[nodeCount + 1],
+        };
+
+        // Port offset ----------
+        for (int i = 0; i < nodeCount; i++)
+        {
+            (ITransitionPoint[] inTps, ITransitionPoint[] outTps) = targets[i].GetTPs();
+            inTpsPerNode[i] = inTps;
+            outTpsPerNode[i] = outTps;
+            kernel._evaluators[i] = (IHeadlessEvaluable)targets[i];
+            kernel._inputOffsets[i + 1] = kernel._inputOffsets[i] + inTps.Length;
+            kernel._outputOffsets[i + 1] = kernel._outputOffsets[i] + outTps.Length;
+        }
+
+        int inputCount = kernel._inputOffsets[nodeCount];
+        int outputCount = kernel._outputOffsets[nodeCount];
+
+        kernel._inputOwners = new int[inputCount];
+        kernel._inputs = new Transition[inputCount];
+        kernel._inputTypes = new TransitionType[inputCount];
+        kernel._inputTps = new ITransitionPoint[inputCount];
+        kernel._inputWritten = new bool[inputCount];
+        kernel._inputSnapshots = new Transition[inputCount];
+        kernel._inputMirrorFlags = new bool[inputCount];
+
+        kernel._outputOwners = new int[outputCount];
+        kernel._outputs = new Transition[outputCount];
+        kernel._outputTypes = new TransitionType[outputCount];
+        kernel._outputTps = new ITransitionPoint[outputCount];
+        kernel._outputMirrorFlags = new bool[outputCount];
+        kernel._fanoutOffsets = new int[outputCount + 1];
+        kernel._aliasOffsets = new int[outputCount + 1];
+
+        List<int> fanoutTargets = new();
+        List<ITransitionPoint> externalTargets = new();
+        List<ITransitionPoint> aliasTps = new();
+        List<ITransitionPoint> resolvedTargets = new();
+
+        for (int i = 0; i < nodeCount; i++)
+        {
+            // Input ----------
+            ITransitionPoint[] inTps = inTpsPerNode[i];
+            for (int j = 0; j < inTps.Length; j++)
+            {
+                int port = kernel._inputOffsets[i] + j;
+                kernel._inputOwners[port] = i;
+                kernel._inputs[port] = inTps[j].State;
+                kernel._inputSnapshots[port] = inTps[j].State;
+                kernel._inputTypes[port] = inTps[j].Type;
+                kernel._inputTps[port] = inTps[j];
+            }
+
+            // Output, Fan-out ----------
+            ITransitionPoint[] outTps = outTpsPerNode[i];
+            for (int j = 0; j < outTps.Length; j++)
+            {
+                int port = kernel._outputOffsets[i] + j;
+                kernel._outputOwners[port] = i;
+                kernel._outputs[port] = outTps[j].State;
+                kernel._outputTypes[port] = outTps[j].Type;
+                kernel._outputTps[port] = outTps[j];
+
+                // 모듈 경계는 건너편 연결로 치환
+                resolvedTargets.Clear();
+                IReadOnlyList<TPConnection> connections = outTps[j] is ITPOut tpOut ? tpOut.Connections : Array.Empty<TPConnection>();
+                foreach (TPConnection connection in connections)
+                {
+                    ModuleInliner.ResolveTargets(connection.TargetPoint, resolvedTargets, aliasTps);
+                }
+
+                foreach (ITransitionPoint targetTp in resolvedTargets)
+                {
+                    int targetTpIndex = -1;
+                    if (targetTp.Node != null && nodeIndices.TryGetValue(targetTp.Node, out int targetNodeIndex))
+                    {
+                        targetTpIndex = Array.IndexOf(inTpsPerNode[targetNodeIndex], targetTp);
+                        if (targetTpIndex >= 0)
+                        {
+                            fanoutTargets.Add(kernel._inputOffsets[targetNodeIndex] + targetTpIndex);
+                        }
+                    }
+
+                    if (targetTpIndex < 0)
+                    {
+                        fanoutTargets.Add(~externalTargets.Count);
+                        externalTargets.Add(targetTp);
+                    }
+                }
+
+                kernel._fanoutOffsets[port + 1] = fanoutTargets.Count;
+                kernel._aliasOffsets[port + 1] = aliasTps.Count;
+            }
+        }
+
+        kernel._fanoutTargets = fanoutTargets.ToArray();
+        kernel._externalTargets = externalTargets.ToArray();
+        kernel._aliasTps = aliasTps.ToArray();
+        kernel.Levelize(targets);
+
+        for (int i = 0; i < nodeCount; i++)
+        {
+            ((IKernelBindable)targets[i]).BindKernel(kernel, i);
+        }
+
+        return kernel;
+    }
+
+    /// <summary>
+    /// 커널 외부(TP)에서 바인딩 된 노드의 입력이 갱신되었을 때
+    /// </summary>
+    public void WriteInput(int kernelIndex, int index, Transition state)
+    {
+        ThrowIfDisposed();
+
+        int port = _inputOffsets[kernelIndex] + index;
+        if (port >= _inputOffsets[kernelIndex + 1])
+        {
+            throw new IndexOutOfRangeException($"{_nodes[kernelIndex].GetType().Name}: Input index {index} is out of range");
+        }
+
+        Transition beforeState = _inputs[port];
+        _inputs[port] = state;
+        _pending.Enqueue(new InputEvent(port, state, beforeState));
+    }
+
+    /// <summary>
+    /// 출력 포트(Net) 갱신 후 fan-out 전파
+    /// 커널 내부 입력은 같은 Tick의 상위 레벨에서 평가 (사이클 노드는 다음 Tick), 외부 TP는 즉시 반영
+    /// </summary>
+    internal void WriteOutput(int port, Transition state)
+    {
+        _outputs[port] = state;
+        MarkOutput(port);
+
+        for (int i = _fanoutOffsets[port]; i < _fanoutOffsets[port + 1]; i++)
+        {
+            int target = _fanoutTargets[i];
+
+            if (target >= 0)
+            {
+                Transition beforeState = _inputs[target];
+                _inputs[target] = state;
+                MarkInput(target);
+
+                InputEvent inputEvent = new(target, state, beforeState);
+                if (_isCyclic[_inputOwners[target]])
+                {
+                    _pending.Enqueue(inputEvent);
+                }
+                else
+                {
+                    Accept(inputEvent);
+                }
+                continue;
+            }
+
+            ITransitionPoint externalTarget = _externalTargets[~target];
+            if (externalTarget.Node is not { IsDestroyed: false })
+            {
+                continue;
+            }
+
+            // 연결을 거쳐 전달해야 대기중인 값, ChangeOnly 비교 기준이 어긋나지 않음
+            TPConnection connection = externalTarget.Connection;
+            if (connection != null && connection.TargetPoint == externalTarget)
+            {
+                connection.Deliver(state);
+            }
+            else
+            {
+                externalTarget.State = state;
+            }
+        }
+    }
+
+    void IHeadlessOutputWriter.WriteOutput(int port, Transition state) => WriteOutput(port, state);
+
+    /// <summary>
+    /// 대기중인 입력을 레벨 순서로 평가. 사이클 밖 노드는 Tick 당 최대 1회 평가된다.
+    /// </summary>
+    /// <returns>다음 Tick에 평가할 입력이 남아있는지</returns>
+    public bool Tick()
+    {
+        ThrowIfDisposed();
+
+        (_pending, _processing) = (_processing, _pending);
+
+        while (_processing.Count > 0)
+        {
+            Accept(_processing.Dequeue());
+        }
+
+        // 평가 중 추가되는 노드는 항상 더 높은 레벨
+        foreach (List<int> bucket in _levelBuckets)
+        {
+            for (int i = 0; i < bucket.Count; i++)
+            {
+                EvaluateNode(bucket[i]);
+            }
+
+            bucket.Clear();
+        }
+
+        TickCount++;
+        return _pending.Count > 0;
+    }
+
+    /// <summary>
+    /// 마지막 Mirror() 이후 변경된 포트만 TP에 반영 (프레임당 1회)
+    /// </summary>
+    public void Mirror()
+    {
+        if (_disposed)
+        {
+            return;
+        }
+
+        foreach (int port in _outputMirrorList)
+        {
+            _outputMirrorFlags[port] = false;
+            if (!_nodes[_outputOwners[port]].IsDestroyed && IsMirrorable(_outputTps[port], out IStateMirrorable mirrorable))
+            {
+                mirrorable.MirrorState(_outputs[port]);
+            }
+
+            for (int i = _aliasOffsets[port]; i < _aliasOffsets[port + 1]; i++)
+            {
+                ITransitionPoint aliasTp = _aliasTps[i];
+                if (aliasTp.Node is { IsDestroyed: false } && aliasTp.Type == _outputTypes[port] && IsMirrorable(aliasTp, out IStateMirrorable aliasMirrorable))
+                {
+                    aliasMirrorable.MirrorState(_outputs[port]);
+                }
+            }
+        }
+
+        foreach (int port in _inputMirrorList)
+        {
+            _inputMirrorFlags[port] = false;
+            if (!_nodes[_inputOwners[port]].IsDestroyed && IsMirrorable(_inputTps[port], out IStateMirrorable mirrorable))
+            {
+                mirrorable.MirrorState(_inputs[port]);
+            }
+        }
+
+        _outputMirrorList.Clear();
+        _inputMirrorList.Clear();
+    }
+
+    /// <summary>
+    /// UI에 반영 후 노드 바인딩 해제.
+    /// 평가되지 않은 입력은 노드의 StateUpdate()로 넘긴다.
+    /// </summary>
+    public void Dispose()
+    {
+        if (_disposed)
+        {
+            return;
+        }
+
+        Mirror();
+        _disposed = true;
+
+        foreach (Node node in _nodes)
+        {
+            ((IKernelBindable)node).UnbindKernel(this);
+        }
+
+        while (_pending.Count > 0)
+        {
+            InputEvent inputEvent = _pending.Dequeue();
+            int nodeIndex = _inputOwners[inputEvent.Port];
+            Node node = _nodes[nodeIndex];
+
+            if (node.IsDestroyed)
+            {
+                continue;
+            }
+
+            TransitionEventArgs args = TransitionEventArgs.Get(inputEvent.Port - _inputOffsets[nodeIndex], inputEvent.State,
+                inputEvent.BeforeState, !inputEvent.BeforeState.Equals(inputEvent.State));
+            ((INodeLifecycleCallable)node).CallStateUpdate(args);
+            TransitionEventArgs.Release(args);
+        }
+    }
+    #endregion
+}
@@ -0,0 +1,280 @@
+using System;
+using System.Collections.Generic;
+using UnityEngine;
+
+/// <summary>
+/// 계층형 타이밍 휠. 정수 Tick 단위로 만료를 관리한다.
+/// - 64 슬롯 x 5 레벨 (최대 2^30 Tick 앞까지, 초과분은 상한으로 고정)
+/// - 등록/취소 O(1), Advance 비용은 (진행한 Tick 수 + 만료된 타이머 수)
+/// - 같은 Tick에 만료된 타이머는 등록 순서대로 실행 (재현 가능한 순서)
+/// </summary>
+public sealed class TimingWheel
+{
+    #region Privates
+    private const int SLOT_BITS = 6;
+    private const int SLOT_COUNT = 1 << SLOT_BITS;
+    private const int SLOT_MASK = SLOT_COUNT - 1;
+    private const int LEVELS = 5;
+    private const long MAX_DELTA = (1L << (SLOT_BITS * LEVELS)) - 1;
+
+    internal const int READY_SLOT = -1;
+    internal const int FIRING_SLOT = -2;
+
+    private readonly ClockTimer[] _heads = new ClockTimer[LEVELS * SLOT_COUNT];
+    private ClockTimer _ready;  // Due <= Now, 다음 Step에서 실행
+    private readonly List<ClockTimer> _firing = new();
+    private long _sequence = 0;
+
+    private static readonly Comparison<ClockTimer> _sequenceComparison = (a, b) => a.Sequence.CompareTo(b.Sequence);
+
+    private void Link(ClockTimer timer)
+    {
+        long due = timer.Due;
+        if (due <= Now)
+        {
+            timer.Slot = READY_SLOT;
+            timer.Prev = null;
+            timer.Next = _ready;
+            if (_ready != null)
+            {
+                _ready.Prev = timer;
+            }
+
+            _ready = timer;
+            return;
+        }
+
+        // 상위 비트가 현재 시각과 같아지는 가장 낮은 레벨에 배치
+        int level = 0;
+        while (level < LEVELS - 1 && (due >> (SLOT_BITS * (level + 1))) != (Now >> (SLOT_BITS * (level + 1))))
+        {
+            level++;
+        }
+
+        int slot = level * SLOT_COUNT + (int)((due >> (SLOT_BITS * level)) & SLOT_MASK);
+        timer.Slot = slot;
+        timer.Prev = null;
+        timer.Next = _heads[slot];
+        if (_heads[slot] != null)
+        {
+            _heads[slot].Prev = timer;
+        }
+
+        _heads[slot] = timer;
+    }
+
+    private void Unlink(ClockTimer timer)
+    {
+        if (timer.Prev != null)
+        {
+            timer.Prev.Next = timer.Next;
+        }
+        else if (timer.Slot == READY_SLOT)
+        {
+            _ready = timer.Next;
+        }
+        else if (timer.Slot >= 0)
+        {
+            _heads[timer.Slot] = timer.Next;
+        }
+
+        if (timer.Next != null)
+        {
+            timer.Next.Prev = timer.Prev;
+        }
+
+        timer.Prev = null;
+        timer.Next = null;
+    }
+
+    /// <summary>
+    /// 상위 레벨 슬롯에 진입했을 때 하위 레벨로 재배치
+    /// </summary>
+    private void Cascade(int slot)
+    {
+        ClockTimer timer = _heads[slot];
+        _heads[slot] = null;
+
+        while (timer != null)
+        {
+            ClockTimer next = timer.Next;
+            timer.Prev = null;
+            timer.Next = null;
+            Link(timer);
+            timer = next;
+        }
+    }
+
+    private void Collect(ClockTimer head)
+    {
+        while (head != null)
+        {
+            ClockTimer next = head.Next;
+            head.Prev = null;
+            head.Next = null;
+            head.Slot = FIRING_SLOT;
+            _firing.Add(head);
+            head = next;
+        }
+    }
+
+    private void Step()
+    {
+        Now++;
+
+        for (int level = LEVELS - 1; level >= 1; level--)
+        {
+            if ((Now & ((1L << (SLOT_BITS * level)) - 1)) != 0)
+            {
+                continue;
+            }
+
+            Cascade(level * SLOT_COUNT + (int)((Now >> (SLOT_BITS * level)) & SLOT_MASK));
+        }
+
+        // 재배치 중 Due == Now가 된 타이머는 Ready로 들어감
+        ClockTimer ready = _ready;
+        _ready = null;
+
+        int current = (int)(Now & SLOT_MASK);
+        ClockTimer due = _heads[current];
+        _heads[current] = null;
+
+        Collect(ready);
+        Collect(due);
+
+        if (_firing.Count == 0)
+        {
+            return;
+        }
+
+        if (_firing.Count > 1)
+        {
+            _firing.Sort(_sequenceComparison);
+        }
+
+        try
+        {
+            foreach (ClockTimer timer in _firing)
+            {
+                // 같은 배치의 앞선 콜백에서 취소되었을 수 있음
+                if (!timer.IsPending)
+                {
+                    continue;
+                }
+
+                timer.IsPending = false;
+                timer.Slot = READY_SLOT;
+                Count--;
+
+                try
+                {
+                    timer.Callback?.Invoke();
+                }
+                catch (Exception e)
+                {
+                    Debug.LogException(e);
+                }
+            }
+        }
+        finally
+        {
+            _firing.Clear();
+        }
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 현재 Tick
+    /// </summary>
+    public long Now { get; private set; }
+
+    /// <summary>
+    /// 대기중인 타이머 수
+    /// </summary>
+    public int Count { get; private set; }
+
+    /// <summary>
+    /// dueTick에 callback 실행 예약. 이미 지난 Tick이면 다음 Step에서 실행
+    /// </summary>
+    public ClockTimer Schedule(long dueTick, Action callback)
+    {
+        ClockTimer timer = new ClockTimer(this, Math.Min(dueTick, Now + MAX_DELTA), _sequence++, callback);
+        Link(timer);
+        Count++;
+        return timer;
+    }
+
+    /// <summary>
+    /// 대기중인 타이머 취소
+    /// </summary>
+    public void Cancel(ClockTimer timer)
+    {
+        if (timer == null || timer.Wheel != this || !timer.IsPending)
+        {
+            return;
+        }
+
+        if (timer.Slot != FIRING_SLOT)
+        {
+            Unlink(timer);
+        }
+
+        timer.IsPending = false;
+        Count--;
+    }
+
+    /// <summary>
+    /// targetTick까지 진행하며 만료된 타이머 실행
+    /// </summary>
+    public void Advance(long targetTick)
+    {
+        while (Now < targetTick)
+        {
+            // 대기 타이머가 없으면 빈 슬롯을 순회할 필요 없음
+            if (Count == 0)
+            {
+                Now = targetTick;
+                return;
+            }
+
+            Step();
+        }
+    }
+    #endregion
+}
+
+/// <summary>
+/// TimingWheel에 등록된 만료 예약 1건
+/// </summary>
+public sealed class ClockTimer
+{
+    internal ClockTimer(TimingWheel wheel, long due, long sequence, Action callback)
+    {
+        Wheel = wheel;
+        Due = due;
+        Sequence = sequence;
+        Callback = callback;
+        IsPending = true;
+    }
+
+    internal readonly TimingWheel Wheel;
+    internal readonly long Sequence;
+    internal readonly Action Callback;
+    internal ClockTimer Prev;
+    internal ClockTimer Next;
+    internal int Slot;
+
+    /// <summary>
+    /// 만료 Tick
+    /// </summary>
+    public long Due { get; }
+
+    /// <summary>
+    /// 아직 실행/취소되지 않았는지
+    /// </summary>
+    public bool IsPending { get; internal set; }
+
+    public void Cancel() => Wheel.Cancel(this);
+}
@@ -327,7 +327,7 @@ public class ExternalTPEnum : MonoBehaviour, ITPEnumerator, IHighlightable
             
             foreach (ITransitionPoint tp in tps)
             {
-                tp.Connection?.Disconnect();
+                tp.DisconnectAll();
                 tp.BlockConnect = true;
             }
 
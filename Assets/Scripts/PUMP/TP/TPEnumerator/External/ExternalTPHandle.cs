@@ -55,7 +55,7 @@ public class ExternalTPHandle : MonoBehaviour, IDragHandler, IPointerEnterHandle
     {
         if (TP != null)
         {
-            TP.Connection?.Disconnect();
+            TP.DisconnectAll();
             if (TP is IGameObject gameObject)
             {
                 Destroy(gameObject.GameObject);
@@ -53,7 +53,7 @@ public class TPEnumerator : MonoBehaviour, ITPEnumerator
 
             foreach (ITransitionPoint tp in TPs)
             {
-                tp.Connection?.Disconnect();
+                tp.DisconnectAll();
                 tp.BlockConnect = true;
             }
 
@@ -229,7 +229,7 @@ public class TPEnumerator : MonoBehaviour, ITPEnumerator
     {
         foreach (ITransitionPoint tp in TPs)
         {
-            tp.Connection?.Disconnect();
+            tp.DisconnectAll();
             if (tp is IGameObject gameObject)
             {
                 Destroy(gameObject.GameObject);
@@ -0,0 +1,369 @@
+using System;
+using System.Collections.Generic;
+
+/// <summary>
+/// 연결된 모든 TPConnection의 노드 단위 그래프 인덱스.
+/// TPConnection 연결/해제 시 갱신되며, 순환(SCC)과 피드백 간선을 관리한다.
+/// - 간선 추가: 사이클이 생기지 않으면(도달성 검사) 그대로 유지, 생기면 Dirty
+/// - 조회 시 Dirty면 반복형 Tarjan으로 SCC와 피드백 간선(DFS back-edge) 재계산
+/// Immediately 모드에서 피드백 간선만 루프 카운트 대상이 된다.
+/// </summary>
+public static class ConnectionGraph
+{
+    #region Privates
+    private const int REACHABILITY_LIMIT = 4096;
+
+    // Edge (connection id) ----------
+    private static Node[] _edgeSources = new Node[256];
+    private static Node[] _edgeTargets = new Node[256];
+    private static bool[] _edgeAlive = new bool[256];
+    private static bool[] _feedbackEdges = new bool[256];
+    private static int _edgeCapacityUsed = 0;
+    private static readonly Stack<int> _freeIds = new();
+
+    // Vertex (node) ----------
+    private static readonly Dictionary<Node, List<int>> _outEdges = new();
+    private static readonly Dictionary<Node, int> _sccIds = new();
+    private static readonly HashSet<Node> _cyclicNodes = new();
+
+    private static bool _dirty = false;
+
+    // Reachability cache ----------
+    private static readonly HashSet<Node> _visited = new();
+    private static readonly Queue<Node> _searchQueue = new();
+
+    private static void EnsureCapacity(int id)
+    {
+        if (id < _edgeSources.Length)
+        {
+            return;
+        }
+
+        int newSize = Math.Max(_edgeSources.Length * 2, id + 1);
+        Array.Resize(ref _edgeSources, newSize);
+        Array.Resize(ref _edgeTargets, newSize);
+        Array.Resize(ref _edgeAlive, newSize);
+        Array.Resize(ref _feedbackEdges, newSize);
+    }
+
+    private static int AllocateId()
+    {
+        if (_freeIds.Count > 0)
+        {
+            return _freeIds.Pop();
+        }
+
+        int id = _edgeCapacityUsed++;
+        EnsureCapacity(id);
+        return id;
+    }
+
+    private static List<int> GetOutEdges(Node node)
+    {
+        if (!_outEdges.TryGetValue(node, out List<int> edges))
+        {
+            edges = new List<int>();
+            _outEdges.Add(node, edges);
+        }
+
+        return edges;
+    }
+
+    /// <summary>
+    /// from에서 to로 도달 가능한지 (탐색 상한 초과 시 true로 간주)
+    /// </summary>
+    private static bool IsReachable(Node from, Node to)
+    {
+        if (from == to)
+        {
+            return true;
+        }
+
+        _visited.Clear();
+        _searchQueue.Clear();
+        _visited.Add(from);
+        _searchQueue.Enqueue(from);
+
+        try
+        {
+            while (_searchQueue.Count > 0)
+            {
+                Node current = _searchQueue.Dequeue();
+                if (!_outEdges.TryGetValue(current, out List<int> edges))
+                {
+                    continue;
+                }
+
+                foreach (int edge in edges)
+                {
+                    Node next = _edgeTargets[edge];
+                    if (next == to)
+                    {
+                        return true;
+                    }
+
+                    if (_visited.Add(next))
+                    {
+                        if (_visited.Count > REACHABILITY_LIMIT)
+                        {
+                            return true;
+                        }
+
+                        _searchQueue.Enqueue(next);
+                    }
+                }
+            }
+
+            return false;
+        }
+        finally
+        {
+            _visited.Clear();
+            _searchQueue.Clear();
+        }
+    }
+
+    /// <summary>
+    /// 반복형 Tarjan. SCC 번호와 DFS back-edge(피드백 간선)를 함께 계산
+    /// </summary>
+    private static void Recompute()
+    {
+        _dirty = false;
+        _sccIds.Clear();
+        _cyclicNodes.Clear();
+        Array.Clear(_feedbackEdges, 0, _feedbackEdges.Length);
+
+        Dictionary<Node, int> indices = new();
+        Dictionary<Node, int> lowLinks = new();
+        HashSet<Node> onStack = new();
+        HashSet<Node> onPath = new();
+        Stack<Node> sccStack = new();
+        Stack<(Node node, int cursor)> callStack = new();
+        List<Node> component = new();
+        int index = 0;
+        int sccId = 0;
+
+        foreach (Node root in _outEdges.Keys)
+        {
+            if (indices.ContainsKey(root))
+            {
+                continue;
+            }
+
+            indices[root] = lowLinks[root] = index++;
+            sccStack.Push(root);
+            onStack.Add(root);
+            onPath.Add(root);
+            callStack.Push((root, 0));
+
+            while (callStack.Count > 0)
+            {
+                (Node node, int cursor) = callStack.Pop();
+                List<int> edges = _outEdges.TryGetValue(node, out List<int> found) ? found : null;
+
+                if (edges != null && cursor < edges.Count)
+                {
+                    callStack.Push((node, cursor + 1));
+
+                    int edge = edges[cursor];
+                    Node next = _edgeTargets[edge];
+
+                    if (!indices.ContainsKey(next))
+                    {
+                        indices[next] = lowLinks[next] = index++;
+                        sccStack.Push(next);
+                        onStack.Add(next);
+                        onPath.Add(next);
+                        callStack.Push((next, 0));
+                        continue;
+                    }
+
+                    if (onPath.Contains(next))
+                    {
+                        _feedbackEdges[edge] = true;
+                    }
+
+                    if (onStack.Contains(next))
+                    {
+                        lowLinks[node] = Math.Min(lowLinks[node], indices[next]);
+                    }
+
+                    continue;
+                }
+
+                // node 완료 ----------
+                onPath.Remove(node);
+
+                if (lowLinks[node] == indices[node])
+                {
+                    component.Clear();
+                    Node member;
+                    do
+                    {
+                        member = sccStack.Pop();
+                        onStack.Remove(member);
+                        _sccIds[member] = sccId;
+                        component.Add(member);
+                    } while (member != node);
+
+                    if (component.Count > 1 || HasSelfLoop(node))
+                    {
+                        _cyclicNodes.UnionWith(component);
+                    }
+
+                    sccId++;
+                }
+
+                if (callStack.Count > 0)
+                {
+                    Node parent = callStack.Peek().node;
+                    lowLinks[parent] = Math.Min(lowLinks[parent], lowLinks[node]);
+                }
+            }
+        }
+    }
+
+    private static bool HasSelfLoop(Node node)
+    {
+        if (!_outEdges.TryGetValue(node, out List<int> edges))
+        {
+            return false;
+        }
+
+        foreach (int edge in edges)
+        {
+            if (_edgeTargets[edge] == node)
+            {
+                return true;
+            }
+        }
+
+        return false;
+    }
+
+    private static void EnsureComputed()
+    {
+        if (_dirty)
+        {
+            Recompute();
+        }
+    }
+    #endregion
+
+    #region Interface
+    /// <summary>
+    /// 간선 추가/제거 시마다 증가
+    /// </summary>
+    public static int Version { get; private set; }
+
+    /// <summary>
+    /// 발급된 connection id의 상한 (id < IdCapacity)
+    /// </summary>
+    public static int IdCapacity => _edgeSources.Length;
+
+    /// <summary>
+    /// 연결 완료된 Connection 등록
+    /// </summary>
+    /// <returns>connection id</returns>
+    public static int Add(TPConnection connection)
+    {
+        Node source = connection.SourcePoint?.Node;
+        Node target = connection.TargetPoint?.Node;
+
+        if (source == null || target == null)
+        {
+            return -1;
+        }
+
+        int id = AllocateId();
+        _edgeSources[id] = source;
+        _edgeTargets[id] = target;
+        _edgeAlive[id] = true;
+        _feedbackEdges[id] = false;
+
+        // 기존 인덱스가 유효하고 사이클이 생기지 않으면 재계산 불필요
+        if (!_dirty && IsReachable(target, source))
+        {
+            _dirty = true;
+        }
+
+        GetOutEdges(source).Add(id);
+        GetOutEdges(target);
+        Version++;
+        return id;
+    }
+
+    /// <summary>
+    /// Connection 해제 시 id 반납
+    /// </summary>
+    public static void Remove(int id)
+    {
+        if (id < 0 || id >= _edgeAlive.Length || !_edgeAlive[id])
+        {
+            return;
+        }
+
+        Node source = _edgeSources[id];
+        Node target = _edgeTargets[id];
+
+        if (_outEdges.TryGetValue(source, out List<int> edges))
+        {
+            edges.Remove(id);
+            if (edges.Count == 0)
+            {
+                _outEdges.Remove(source);
+            }
+        }
+
+        if (_outEdges.TryGetValue(target, out List<int> targetEdges) && targetEdges.Count == 0)
+        {
+            _outEdges.Remove(target);
+        }
+
+        // 간선 제거는 사이클을 만들지 않음. 피드백 간선이었거나 사이클 내부였다면 정밀도를 위해 재계산
+        if (_feedbackEdges[id] || _cyclicNodes.Contains(source))
+        {
+            _dirty = true;
+        }
+
+        _edgeSources[id] = null;
+        _edgeTargets[id] = null;
+        _edgeAlive[id] = false;
+        _feedbackEdges[id] = false;
+        _freeIds.Push(id);
+        Version++;
+    }
+
+    /// <summary>
+    /// 해당 Connection이 사이클을 끊는 피드백 간선인지
+    /// </summary>
+    public static bool IsFeedbackEdge(int id)
+    {
+        if (id < 0 || id >= _edgeAlive.Length || !_edgeAlive[id])
+        {
+            return false;
+        }
+
+        EnsureComputed();
+        return _feedbackEdges[id];
+    }
+
+    /// <summary>
+    /// 노드가 사이클(SCC 크기 2 이상 또는 자기 루프)에 속하는지
+    /// </summary>
+    public static bool IsCyclic(Node node)
+    {
+        EnsureComputed();
+        return node != null && _cyclicNodes.Contains(node);
+    }
+
+    /// <summary>
+    /// 노드의 SCC 번호 (그래프에 없으면 -1)
+    /// </summary>
+    public static int GetSccId(Node node)
+    {
+        EnsureComputed();
+        return node != null && _sccIds.TryGetValue(node, out int id) ? id : -1;
+    }
+    #endregion
+}
@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using Cysharp.Threading.Tasks;
 using UnityEngine;
 
@@ -43,6 +44,15 @@ public interface IStateful
     Transition State { get; set; }
 }
 
+/// <summary>
+/// 전파(Connection, 이벤트) 없이 State와 시각 요소만 갱신
+/// SimulationKernel의 UI 반영용
+/// </summary>
+public interface IStateMirrorable
+{
+    void MirrorState(Transition state);
+}
+
 public interface ITypeListenStateful : IStateful
 {
     event Action<TransitionType> OnBeforeTypeChange;
@@ -58,9 +68,10 @@ public interface IPolymorphicStateful : IStateful
 /// <summary>
 /// 노드의 연결 포인트
 /// Connection.Disconnect()는 양쪽 모두의 커넥션을 해제를 의미
-/// ITransitionPoint.Disconnect()는 Connection객체의 참조를 지우도록 설계
-/// Connection.Disconnect()에서 양쪽의 ITransitionPoint.Disconnect()를 호출하도록
+/// ITransitionPoint.ClearConnection()는 Connection객체의 참조를 지우도록 설계
+/// Connection.Disconnect()에서 양쪽의 ITransitionPoint.ClearConnection()를 호출하도록
 /// LinkTo() 메서드로 상대 TP와 연결
+/// TPOut은 여러 Connection을 가질 수 있음 (Fan-out). 이 경우 Connection은 첫 번째 Connection
 /// </summary>
 public interface ITransitionPoint : IPolymorphicStateful, ITypeListenStateful, INameable, ILocatable
 {
@@ -70,7 +81,12 @@ public interface ITransitionPoint : IPolymorphicStateful, ITypeListenStateful, I
     bool BlockConnect { get; set; }
     void LinkTo(ITransitionPoint targetTp, TPConnection connection = null);
     void AcceptLink(TPConnection connection);
-    void ClearConnection();
+    void ClearConnection(TPConnection connection);
+
+    /// <summary>
+    /// 이 TP의 모든 Connection 해제
+    /// </summary>
+    void DisconnectAll();
 }
 
 public interface ITPIn : ITransitionPoint
@@ -83,6 +99,10 @@ public interface ITPIn : ITransitionPoint
 
 public interface ITPOut : ITransitionPoint
 {
+    /// <summary>
+    /// 연결된 모든 Connection (State 변경 시 모두에게 전달)
+    /// </summary>
+    IReadOnlyList<TPConnection> Connections { get; }
     bool IsStatePending { get; }
     void PushToConnection(UniTask delayTask);
 }
\ No newline at end of file
@@ -1,11 +1,10 @@
 using System;
 using System.Collections.Generic;
-using System.Threading;
 using Cysharp.Threading.Tasks;
 using UnityEngine;
 using Utils;
 
-public class TPConnection : IStateful, IDisposable
+public class TPConnection : IStateful, IDisposable, IScheduledFlushable
 {
     #region Privates
     private Transition _state;
@@ -16,10 +15,12 @@ public class TPConnection : IStateful, IDisposable
     private LineConnector _lineConnector = null;
     private bool _initialized = false;
     private List<Vector2> _lineEdges;
-    private readonly SafetyCancellationTokenSource _pendingCts = new(false);
     private bool _typeSet = false;
     private bool _disposed = false;
     private bool _disconnected = false;
+    private int _graphId = -1;
+    private bool _isDelivered = false;      // 한 번이라도 TargetPoint에 전달했는지 (이전 값 비교 기준이 유효한지)
+    private bool _alwaysPropagate = false;  // 대상 노드가 같은 값의 반복 전달을 필요로 함
     
     private void InitializeCheck()
     {
@@ -27,6 +28,8 @@ public class TPConnection : IStateful, IDisposable
         {
             if (SourcePoint != null && TargetPoint != null)
             {
+                _alwaysPropagate = TargetPoint.Node is IRepeatedStateListenable;
+                _graphId = ConnectionGraph.Add(this);
                 State = SourcePoint.State;
 
                 DrawLine();
@@ -61,10 +64,21 @@ public class TPConnection : IStateful, IDisposable
                 return;
             }
 
+            // ChangeOnly: 대기중인 값(없으면 대상 TP의 현재 값)과 같으면 전파 중단
+            // 커널이 TP를 직접 갱신(Mirror)할 수 있으므로 _state가 아닌 TargetPoint.State와 비교
+            if (ConnectionScheduler.IsChangeOnly && _isDelivered && !_alwaysPropagate && TargetPoint is not null &&
+                value.Type != TransitionType.Pulse && value.Equals(IsFlushing ? _stateCache : TargetPoint.State))
+            {
+                SuppressedWriteCount++;
+                ConnectionScheduler.SuppressedWriteCount++;
+                return;
+            }
+
             _stateCache = value;
-            if (TargetPoint is not null && !IsFlushing)
+            if (TargetPoint is not null && !IsFlushing && !_disposed)
             {
-                TargetStateUpdateAsync().Forget();
+                IsFlushing = true;
+                ConnectionScheduler.Schedule(this);
             }
         }
     }
@@ -88,6 +102,16 @@ public class TPConnection : IStateful, IDisposable
 
     public bool IsFlushing { get; private set; }
 
+    /// <summary>
+    /// ChangeOnly 모드에서 같은 값이라 전파하지 않은 쓰기 횟수
+    /// </summary>
+    public long SuppressedWriteCount { get; private set; }
+
+    /// <summary>
+    /// ConnectionGraph의 connection id (연결 전, 해제 후 -1)
+    /// </summary>
+    public int GraphId => _graphId;
+
     public ITransitionPoint SourcePoint
     {
         get => _sourcePoint;
@@ -159,12 +183,42 @@ public class TPConnection : IStateful, IDisposable
     // LineConnector에서 ContextMenu를 통해 Disconnect 되었을 때
     public event Action OnSelfDisconnect;
 
+    /// <summary>
+    /// 대기 없이 TargetPoint에 바로 전달 (SimulationKernel 출력)
+    /// 대기중인 값은 이 값으로 대체하고, ChangeOnly 비교 기준도 갱신
+    /// </summary>
+    public void Deliver(Transition value)
+    {
+        value.ThrowIfTypeMismatch(Type);
+
+        if (_disposed || TargetPoint is null)
+        {
+            return;
+        }
+
+        IsFlushing = false;
+        _stateCache = value;
+        _state = value;
+
+        if (ConnectionScheduler.IsChangeOnly && _isDelivered && !_alwaysPropagate &&
+            value.Type != TransitionType.Pulse && value.Equals(TargetPoint.State))
+        {
+            SuppressedWriteCount++;
+            ConnectionScheduler.SuppressedWriteCount++;
+            return;
+        }
+
+        _isDelivered = true;
+        TargetPoint.State = value;
+    }
+
     public void Disconnect()
     {
         if (_disconnected)
             return;
 
         _disconnected = true;
+        ReleaseGraphId();
 
         if (SourcePoint == null || TargetPoint == null)
         {
@@ -172,8 +226,8 @@ public class TPConnection : IStateful, IDisposable
             return;
         }
 
-        SourcePoint.ClearConnection();
-        TargetPoint.ClearConnection();
+        SourcePoint.ClearConnection(this);
+        TargetPoint.ClearConnection(this);
 
         TargetPoint.State = Type.Null();
 
@@ -187,7 +241,8 @@ public class TPConnection : IStateful, IDisposable
         if (_disposed)
             return;
         
-        _pendingCts.CancelAndDispose();
+        IsFlushing = false;
+        ReleaseGraphId();
         OnSelfDisconnect = null;
         _sourcePoint = null;
         _targetPoint = null;
@@ -208,39 +263,40 @@ public class TPConnection : IStateful, IDisposable
         LineConnector.ContextElements = ContextElements;
     }
 
-    private async UniTaskVoid TargetStateUpdateAsync()
+    /// <summary>
+    /// ConnectionScheduler에서 대기 종료 시 호출
+    /// </summary>
+    void IScheduledFlushable.Flush()
     {
-        IsFlushing = true;
-
-        try
+        if (!IsFlushing)
         {
-            ConnectionAwaiter awaiter = ConnectionAwaitManager.GetAwaiter(this, _pendingCts.Token);
-            await awaiter.Task;
-
-            if (TargetPoint is not null && !_pendingCts.Token.IsCancellationRequested)
-            {
-                _state = _stateCache;
-                IsFlushing = false;
-                TargetPoint.State = _stateCache;
-            }
-        }
-        catch (OperationCanceledException)
-        {
-            IsFlushing = false;
+            return;
         }
-        catch
+
+        IsFlushing = false;
+
+        if (_disposed || TargetPoint is null)
         {
-            IsFlushing = false;
-            throw;
+            return;
         }
+
+        _state = _stateCache;
+        _isDelivered = true;
+        TargetPoint.State = _stateCache;
+    }
+
+    private void ReleaseGraphId()
+    {
+        ConnectionGraph.Remove(_graphId);
+        _graphId = -1;
     }
 
     private void ThrowIfMismatch(TransitionType checkType)
     {
         if (checkType != Type)
         {
-            SourcePoint.ClearConnection();
-            TargetPoint.ClearConnection();
+            SourcePoint.ClearConnection(this);
+            TargetPoint.ClearConnection(this);
 
             TargetPoint.State = Type.Null();
 
@@ -256,34 +312,82 @@ public class TPConnection : IStateful, IDisposable
     #endregion
 }
 
-public static class ConnectionAwaitManager
+public interface IScheduledFlushable
+{
+    void Flush();
+}
+
+/// <summary>
+/// 모든 Connection의 대기(Frame, FixedTime)를 하나의 루프에서 처리.
+/// Connection마다 UniTask를 만들지 않고 큐에 넣어 Update 타이밍에 일괄 Flush 한다.
+/// Immediately 모드는 루프 감지 전까지 동기 Flush.
+/// Turbo 모드는 한 프레임에 Frame 큐를 여러 번(Tick) 비운다. 화면에는 프레임 마지막 상태만 렌더링된다.
+/// </summary>
+public static class ConnectionScheduler
 {
     #region Privates
     private const float MAX_WAIT_TIME = 10f;
     private const int MAX_LOOP_THRESHOLD = 20;
+    private const int MAX_TURBO_TICKS = 100000;
+    private const float MAX_TURBO_TIME_BUDGET = 33f;
+
+    private readonly struct TimedEntry
+    {
+        public TimedEntry(float dueTime, long sequence, IScheduledFlushable target)
+        {
+            DueTime = dueTime;
+            Sequence = sequence;
+            Target = target;
+        }
+
+        public float DueTime { get; }
+        public long Sequence { get; }   // 같은 시간이면 등록 순서 유지
+        public IScheduledFlushable Target { get; }
+
+        public bool IsBefore(TimedEntry other)
+        {
+            return DueTime < other.DueTime || (DueTime == other.DueTime && Sequence < other.Sequence);
+        }
+    }
 
     private static float _waitTime = 0.5f;
     private static int _loopThreshold = 2;
+    private static int _turboTicksPerFrame = 1000;
+    private static float _turboTimeBudget = 8f;
+    private static readonly System.Diagnostics.Stopwatch _turboStopwatch = new();
+    private const int MAX_IMMEDIATE_DEPTH = 2048;
+
     private static bool _hasGetSetting = false;
-    private static bool _clearRequested = false;
 
-    private static readonly Dictionary<TPConnection, int> _propagateCountDict = new();
+    // Frame: 다음 Update에 Flush (더블 버퍼)
+    private static Queue<IScheduledFlushable> _frameQueue = new();
+    private static Queue<IScheduledFlushable> _drainingQueue = new();
 
-    private static async UniTaskVoid DelayClearDictionary()
-    {
-        if (_clearRequested)
-            return;
+    // FixedTime: DueTime 최소 힙
+    private static TimedEntry[] _timedHeap = new TimedEntry[64];
+    private static int _timedCount = 0;
+    private static long _sequence = 0;
 
-        _clearRequested = true;
+    private static UniTask _loopTask = UniTask.CompletedTask;
 
-        await UniTask.NextFrame(PlayerLoopTiming.EarlyUpdate);
-        _propagateCountDict.Clear();
-
-        _clearRequested = false;
-    }
+    // Immediately: 피드백 간선 hop 카운트 (connection id 인덱스, 프레임마다 touched만 초기화)
+    private static int[] _hopCounts = new int[256];
+    private static readonly List<int> _touchedIds = new();
+    private static int _hopFrame = -1;
+    private static int _immediateDepth = 0;
 
     private static void SetConnectionAwait()
     {
+        IsChangeOnly = Setting.IsChangeOnly;
+
+        if (Setting.IsTurbo)
+        {
+            AwaitType = ConnectionAwait.Turbo;
+            TurboTicksPerFrame = Setting.TurboTicksPerFrame;
+            TurboTimeBudget = Setting.TurboTimeBudget;
+            return;
+        }
+
         if (Setting.IsImmediately)
         {
             AwaitType = ConnectionAwait.Immediately;
@@ -303,28 +407,224 @@ public static class ConnectionAwaitManager
         WaitTime = simulationSpeed;
     }
 
-    private static ConnectionAwaiter GetImmediatelyAwaiter(TPConnection caller, CancellationToken token)
+    private static bool IsImmediatelyLooped(TPConnection caller)
     {
-        if (!_propagateCountDict.TryAdd(caller, 1))
+        // 비순환 경로는 카운트하지 않음
+        int id = caller.GraphId;
+        if (!ConnectionGraph.IsFeedbackEdge(id))
+        {
+            return false;
+        }
+
+        if (_hopFrame != Time.frameCount)
+        {
+            foreach (int touchedId in _touchedIds)
+            {
+                _hopCounts[touchedId] = 0;
+            }
+
+            _touchedIds.Clear();
+            _hopFrame = Time.frameCount;
+        }
+
+        if (id >= _hopCounts.Length)
         {
-            _propagateCountDict[caller]++;
+            Array.Resize(ref _hopCounts, ConnectionGraph.IdCapacity);
         }
 
-        DelayClearDictionary().Forget();
+        if (_hopCounts[id]++ == 0)
+        {
+            _touchedIds.Add(id);
+        }
 
-        if (_propagateCountDict[caller] >= LoopThreshold)
+        if (_hopCounts[id] >= LoopThreshold)
         {
-            _propagateCountDict.Remove(caller);
+            _hopCounts[id] = 0;
             OnImmediatelyLoopDetected?.Invoke(caller);
-            return new ConnectionAwaiter(UniTask.Yield(PlayerLoopTiming.Update, token), true);
+            return true;
+        }
+
+        return false;
+    }
+
+    private static void EnqueueFrame(IScheduledFlushable target)
+    {
+        _frameQueue.Enqueue(target);
+        LoopCheck();
+    }
+
+    private static void EnqueueTimed(IScheduledFlushable target)
+    {
+        if (_timedCount == _timedHeap.Length)
+        {
+            Array.Resize(ref _timedHeap, _timedHeap.Length * 2);
+        }
+
+        TimedEntry entry = new(Time.time + WaitTime, _sequence++, target);
+
+        // Sift up
+        int index = _timedCount++;
+        while (index > 0)
+        {
+            int parent = (index - 1) >> 1;
+            if (!entry.IsBefore(_timedHeap[parent]))
+            {
+                break;
+            }
+
+            _timedHeap[index] = _timedHeap[parent];
+            index = parent;
+        }
+
+        _timedHeap[index] = entry;
+        LoopCheck();
+    }
+
+    private static IScheduledFlushable PopTimed()
+    {
+        IScheduledFlushable result = _timedHeap[0].Target;
+        TimedEntry last = _timedHeap[--_timedCount];
+        _timedHeap[_timedCount] = default;
+
+        if (_timedCount <= 0)
+        {
+            return result;
+        }
+
+        // Sift down
+        int index = 0;
+        while (true)
+        {
+            int child = (index << 1) + 1;
+            if (child >= _timedCount)
+            {
+                break;
+            }
+
+            if (child + 1 < _timedCount && _timedHeap[child + 1].IsBefore(_timedHeap[child]))
+            {
+                child++;
+            }
+
+            if (!_timedHeap[child].IsBefore(last))
+            {
+                break;
+            }
+
+            _timedHeap[index] = _timedHeap[child];
+            index = child;
+        }
+
+        _timedHeap[index] = last;
+        return result;
+    }
+
+    private static void Flush(IScheduledFlushable target)
+    {
+        try
+        {
+            target.Flush();
+        }
+        catch (Exception e)
+        {
+            Debug.LogException(e);
+        }
+    }
+
+    private static void LoopCheck()
+    {
+        if (_loopTask.Status != UniTaskStatus.Pending)
+        {
+            _loopTask = FlushLoopAsync();
+        }
+    }
+
+    /// <summary>
+    /// Frame 큐 1회(1 Tick) 처리. Drain 중 등록된 대기는 다음 Tick으로
+    /// </summary>
+    private static void DrainFrameQueue()
+    {
+        (_frameQueue, _drainingQueue) = (_drainingQueue, _frameQueue);
+
+        // Tick 단위로 IBatchStateUpdate 노드 호출
+        StateUpdateBatcher.BeginWave();
+        try
+        {
+            while (_drainingQueue.Count > 0)
+            {
+                Flush(_drainingQueue.Dequeue());
+            }
+        }
+        finally
+        {
+            StateUpdateBatcher.EndWave();
+        }
+    }
+
+    private static void DrainTimed(float now)
+    {
+        StateUpdateBatcher.BeginWave();
+        try
+        {
+            while (_timedCount > 0 && _timedHeap[0].DueTime <= now)
+            {
+                Flush(PopTimed());
+            }
+        }
+        finally
+        {
+            StateUpdateBatcher.EndWave();
         }
+    }
 
-        return new ConnectionAwaiter(UniTask.CompletedTask, false);
+    private static async UniTask FlushLoopAsync()
+    {
+        while (_frameQueue.Count > 0 || _timedCount > 0)
+        {
+            await UniTask.Yield(PlayerLoopTiming.Update);
+
+            // Turbo: 시간 예산 안에서 추가 Tick. TP 색상, Radial은 프레임 끝에 최종 State로 1회만 갱신
+            if (AwaitType == ConnectionAwait.Turbo)
+            {
+                TransitionPoint.DeferStateVisuals = true;
+                try
+                {
+                    DrainFrameQueue();
+
+                    _turboStopwatch.Restart();
+                    for (int tick = 1; tick < TurboTicksPerFrame && _frameQueue.Count > 0; tick++)
+                    {
+                        if (_turboStopwatch.Elapsed.TotalMilliseconds >= TurboTimeBudget)
+                        {
+                            break;
+                        }
+
+                        DrainFrameQueue();
+                    }
+
+                    _turboStopwatch.Stop();
+                    DrainTimed(Time.time);
+                }
+                finally
+                {
+                    TransitionPoint.DeferStateVisuals = false;
+                    TransitionPoint.FlushStateVisuals();
+                }
+            }
+            else
+            {
+                DrainFrameQueue();
+                DrainTimed(Time.time);
+            }
+        }
     }
     #endregion
 
     #region Interfaces
-    public static ConnectionAwaiter GetAwaiter(TPConnection caller, CancellationToken token)
+    /// <summary>
+    /// Connection의 Flush 예약. 현재 AwaitType에 따라 즉시 또는 큐에서 Flush 된다.
+    /// </summary>
+    public static void Schedule(TPConnection caller)
     {
         if (!_hasGetSetting)
         {
@@ -333,23 +633,61 @@ public static class ConnectionAwaitManager
             _hasGetSetting = true;
         }
 
-        return AwaitType switch
+        switch (AwaitType)
         {
-            ConnectionAwait.Frame => new ConnectionAwaiter(UniTask.Yield(PlayerLoopTiming.Update, token), false),
-            ConnectionAwait.FixedTime => new ConnectionAwaiter(UniTask.WaitForSeconds
-            (
-                duration: WaitTime,
-                ignoreTimeScale: false,
-                delayTiming: PlayerLoopTiming.Update,
-                cancellationToken: token
-            ), false),
-            ConnectionAwait.Immediately => GetImmediatelyAwaiter(caller, token),
-            _ => new ConnectionAwaiter(UniTask.Yield(PlayerLoopTiming.Update, token), false),
-        };
+            case ConnectionAwait.FixedTime:
+                EnqueueTimed(caller);
+                break;
+
+            case ConnectionAwait.Immediately:
+                // 피드백 간선 루프 또는 호출 깊이 초과(안전장치) 시 다음 프레임으로
+                if (IsImmediatelyLooped(caller) || _immediateDepth >= MAX_IMMEDIATE_DEPTH)
+                {
+                    EnqueueFrame(caller);
+                    break;
+                }
+
+                _immediateDepth++;
+                StateUpdateBatcher.BeginWave();
+                try
+                {
+                    Flush(caller);
+                }
+                finally
+                {
+                    StateUpdateBatcher.EndWave();
+                    _immediateDepth--;
+                }
+                break;
+
+            default:
+                EnqueueFrame(caller);
+                break;
+        }
     }
 
+    /// <summary>
+    /// 대기중인 Flush 개수
+    /// </summary>
+    public static int PendingCount => _frameQueue.Count + _drainingQueue.Count + _timedCount;
+
     public static event Action<TPConnection> OnImmediatelyLoopDetected;
 
+    /// <summary>
+    /// 이전과 같은 값(Pulse 제외)의 전파를 Connection에서 중단할지
+    /// </summary>
+    public static bool IsChangeOnly { get; set; }
+
+    /// <summary>
+    /// ChangeOnly 모드에서 전파하지 않은 쓰기 횟수 (전체 Connection 합계)
+    /// </summary>
+    public static long SuppressedWriteCount { get; internal set; }
+
+    public static void ResetSuppressedWriteCount()
+    {
+        SuppressedWriteCount = 0;
+    }
+
     public static float WaitTime
     {
         get => _waitTime;
@@ -362,25 +700,32 @@ public static class ConnectionAwaitManager
         set => _loopThreshold = value.Clamp(2, MAX_LOOP_THRESHOLD);
     }
 
-    public static ConnectionAwait AwaitType { get; set; } = ConnectionAwait.Frame;
-    #endregion
-}
+    /// <summary>
+    /// Turbo 모드에서 프레임당 최대 Tick 수
+    /// </summary>
+    public static int TurboTicksPerFrame
+    {
+        get => _turboTicksPerFrame;
+        set => _turboTicksPerFrame = value.Clamp(1, MAX_TURBO_TICKS);
+    }
 
-public struct ConnectionAwaiter
-{
-    public ConnectionAwaiter(UniTask task, bool isLooped)
+    /// <summary>
+    /// Turbo 모드에서 프레임당 시뮬레이션에 쓸 시간 (ms)
+    /// </summary>
+    public static float TurboTimeBudget
     {
-        Task = task;
-        IsLooped = isLooped;
+        get => _turboTimeBudget;
+        set => _turboTimeBudget = Mathf.Clamp(value, 1f, MAX_TURBO_TIME_BUDGET);
     }
 
-    public UniTask Task;
-    public bool IsLooped;
+    public static ConnectionAwait AwaitType { get; set; } = ConnectionAwait.Frame;
+    #endregion
 }
 
 public enum ConnectionAwait
 {
     Frame,
     FixedTime,
-    Immediately
+    Immediately,
+    Turbo
 }
\ No newline at end of file
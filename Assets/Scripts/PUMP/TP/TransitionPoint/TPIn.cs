@@ -5,7 +5,7 @@ using UnityEngine.UI;
 using Utils;
 
 [RequireComponent(typeof(Image))]
-public class TPIn : TransitionPoint, ITPIn, ISoundable, IDraggable, ITPHideable
+public class TPIn : TransitionPoint, ITPIn, ISoundable, IDraggable, ITPHideable, IStateMirrorable
 {
     #region Privates
     private Transition _state;
@@ -19,7 +19,7 @@ public class TPIn : TransitionPoint, ITPIn, ISoundable, IDraggable, ITPHideable
 
     private TPConnection SetTPConnectionLineConnector(TPConnection tpConnection)
     {
-        LineConnector lineConnector = Node.Background.LineConnectManager.AddLineConnector();
+        LineConnector lineConnector = Node.Background.LineConnectManager.AddLineConnector(tpConnection);
 
         OnMove = _ => OnNodeMove(lineConnector);   // 커넥션 제거 시 구독 해제를 위해 Action에 할당
         Node.Support.OnPositionUpdate += OnMove;
@@ -70,8 +70,7 @@ public class TPIn : TransitionPoint, ITPIn, ISoundable, IDraggable, ITPHideable
             bool isStateChange = !beforeState.Equals(value);
             _state = value;
 
-            SetImageColor(_state.IsNull ? m_DefaultColor: m_StateActiveColor);
-            ShowRadial(_state);
+            UpdateStateVisual();
 
             if (!OnDeserializing)
             {
@@ -152,8 +151,11 @@ public class TPIn : TransitionPoint, ITPIn, ISoundable, IDraggable, ITPHideable
         targetTp.AcceptLink(connection);
     }
 
-    public override void ClearConnection()
+    public override void ClearConnection(TPConnection connection)
     {
+        if (Connection != connection)
+            return;
+
         Connection = null;
         Node.Support.OnPositionUpdate -= OnMove;
         OnMove = null;
@@ -164,6 +166,14 @@ public class TPIn : TransitionPoint, ITPIn, ISoundable, IDraggable, ITPHideable
         }
     }
 
+    public void MirrorState(Transition state)
+    {
+        state.ThrowIfTypeMismatch(Type);
+
+        _state = state;
+        UpdateStateVisual();
+    }
+
     public void AddHider(object hider)
     {
         if (_hiders.Add(hider))
@@ -5,7 +5,7 @@ using UnityEngine;
 using UnityEngine.EventSystems;
 using Utils;
 
-public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideable
+public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideable, IStateMirrorable
 {
     #region Privates
     private Transition _state;
@@ -15,17 +15,64 @@ public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideabl
     private HashSet<object> _hiders = new();
     private readonly object _hider = new();
 
+    // Fan-out: 연결/해제 시 배열을 새로 만들고(Copy-on-write), State 전달은 배열 스냅샷을 순회
+    private TPConnection[] _connections = Array.Empty<TPConnection>();
+
     private bool OnDeserializing => Node?.OnDeserializing ?? false;
 
     private TPConnection SetTPConnectionLineConnector(TPConnection tpConnection)
     {
-        LineConnector lineConnector = Node.Background.LineConnectManager.AddLineConnector();
+        tpConnection.LineConnector = Node.Background.LineConnectManager.AddLineConnector(tpConnection);
+        return tpConnection;
+    }
 
-        OnMove = _ => OnNodeMove(lineConnector);
-        Node.Support.OnPositionUpdate += OnMove;
+    private void AddConnection(TPConnection connection)
+    {
+        if (Array.IndexOf(_connections, connection) >= 0)
+            return;
 
-        tpConnection.LineConnector = lineConnector;
-        return tpConnection;
+        TPConnection[] connections = new TPConnection[_connections.Length + 1];
+        Array.Copy(_connections, connections, _connections.Length);
+        connections[^1] = connection;
+        _connections = connections;
+        Connection = _connections[0];
+
+        // 노드 이동 시 모든 Connection의 시작점 갱신 (구독은 1회)
+        if (OnMove == null)
+        {
+            OnMove = _ => OnNodeMove();
+            Node.Support.OnPositionUpdate += OnMove;
+        }
+    }
+
+    private bool RemoveConnection(TPConnection connection)
+    {
+        int index = Array.IndexOf(_connections, connection);
+        if (index < 0)
+            return false;
+
+        TPConnection[] connections = new TPConnection[_connections.Length - 1];
+        Array.Copy(_connections, 0, connections, 0, index);
+        Array.Copy(_connections, index + 1, connections, index, connections.Length - index);
+        _connections = connections;
+        Connection = _connections.Length > 0 ? _connections[0] : null;
+
+        if (_connections.Length == 0)
+        {
+            Node.Support.OnPositionUpdate -= OnMove;
+            OnMove = null;
+        }
+
+        return true;
+    }
+
+    private void PushToConnections()
+    {
+        TPConnection[] connections = _connections;
+        for (int i = 0; i < connections.Length; i++)
+        {
+            connections[i].State = _state;
+        }
     }
 
     private async UniTaskVoid PushToConnectionAsync(UniTask task)
@@ -33,36 +80,40 @@ public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideabl
         try
         {
             await task;
-
-            if (Connection != null)
-            {
-                Connection.State = State;
-            }
+            PushToConnections();
         }
         catch (OperationCanceledException) { }
     }
 
-    private void OnNodeMove(LineConnector lineConnector)
+    private void OnNodeMove()
     {
-        lineConnector.StartSidePoint = WorldPosition;
+        Vector2 worldPosition = WorldPosition;
+        foreach (TPConnection connection in _connections)
+        {
+            if (connection.LineConnector != null)
+            {
+                connection.LineConnector.StartSidePoint = worldPosition;
+            }
+        }
     }
 
     private void SetHide(bool isHide)
     {
-        if (Connection is null)
-            return;
-        if (Connection.LineConnector is null)
-            return;
-
-        if (isHide)
-        {
-            Connection.LineConnector.SetAlpha(0.5f);
-            Connection.LineConnector.FreezeLinesAttributes = true;
-        }
-        else
+        foreach (TPConnection connection in _connections)
         {
-            Connection.LineConnector.FreezeLinesAttributes = false;
-            Connection.LineConnector.SetAlpha(1f);
+            if (connection.LineConnector is null)
+                continue;
+
+            if (isHide)
+            {
+                connection.LineConnector.SetAlpha(0.5f);
+                connection.LineConnector.FreezeLinesAttributes = true;
+            }
+            else
+            {
+                connection.LineConnector.FreezeLinesAttributes = false;
+                connection.LineConnector.SetAlpha(1f);
+            }
         }
     }
 
@@ -83,10 +134,9 @@ public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideabl
             value.ThrowIfTypeMismatch(Type);
 
             _state = value;
-            PushToConnection(UniTask.CompletedTask);
+            PushToConnections();
 
-            SetImageColor(_state.IsNull ? m_DefaultColor : m_StateActiveColor);
-            ShowRadial(_state);
+            UpdateStateVisual();
         }
     }
 
@@ -95,7 +145,7 @@ public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideabl
         get => _type;
         protected set
         {
-            Connection?.Disconnect();
+            DisconnectAll();
 
             _type = value;
             _state = _type.Null();
@@ -108,33 +158,46 @@ public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideabl
         }
     }
 
-    public bool IsStatePending => Connection?.IsFlushing ?? false;
+    public IReadOnlyList<TPConnection> Connections => _connections;
+
+    public bool IsStatePending
+    {
+        get
+        {
+            foreach (TPConnection connection in _connections)
+            {
+                if (connection.IsFlushing)
+                    return true;
+            }
+
+            return false;
+        }
+    }
 
     public void PushToConnection(UniTask delayTask)
     {
         PushToConnectionAsync(delayTask).Forget();
     }
 
+    /// <summary>
+    /// 기존 Connection은 유지하고 targetTp로의 Connection 추가 (Fan-out)
+    /// </summary>
     public override void LinkTo(ITransitionPoint targetTp, TPConnection connection = null)
     {
         if (targetTp.Type != Type)
             return;
 
-        Connection?.Disconnect();
-
         connection ??= new();
 
         connection = SetTPConnectionLineConnector(connection);
         connection.SourcePoint = this;
-        Connection = connection;
+        AddConnection(connection);
 
         targetTp.AcceptLink(connection);
     }
 
     public override void AcceptLink(TPConnection connection)
     {
-        Connection?.Disconnect();
-
         try
         {
             connection.SourcePoint = this;
@@ -151,11 +214,8 @@ public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideabl
             return;
         }
 
-        Connection = connection;
-
-        OnMove = _ => OnNodeMove(Connection.LineConnector);
-        Connection.OnSelfDisconnect += Node.ReportChanges;
-        Node.Support.OnPositionUpdate += OnMove;
+        AddConnection(connection);
+        connection.OnSelfDisconnect += Node.ReportChanges;
 
         if (!OnDeserializing)
         {
@@ -163,11 +223,10 @@ public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideabl
         }
     }
 
-    public override void ClearConnection()
+    public override void ClearConnection(TPConnection connection)
     {
-        Connection = null;
-        Node.Support.OnPositionUpdate -= OnMove;
-        OnMove = null;
+        if (!RemoveConnection(connection))
+            return;
 
         if (!OnDeserializing)
         {
@@ -175,6 +234,30 @@ public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideabl
         }
     }
 
+    public override void DisconnectAll()
+    {
+        foreach (TPConnection connection in _connections)
+        {
+            connection.Disconnect();
+        }
+    }
+
+    protected override void DisposeConnections()
+    {
+        foreach (TPConnection connection in _connections)
+        {
+            connection.Dispose();
+        }
+    }
+
+    public void MirrorState(Transition state)
+    {
+        state.ThrowIfTypeMismatch(Type);
+
+        _state = state;
+        UpdateStateVisual();
+    }
+
     public void AddHider(object hider)
     {
         if (_hiders.Add(hider))
@@ -274,10 +357,10 @@ public class TPOut : TransitionPoint, ITPOut, ISoundable, IDraggable, ITPHideabl
         }
         else
         {
-            if (Connection is not null)
+            if (_connections.Length > 0)
                 Node.ReportChanges();
             
-            Connection?.Disconnect();
+            DisconnectAll();
         }
     }
     #endregion
@@ -45,7 +45,7 @@ public abstract class TransitionPoint : MonoBehaviour, ITransitionPoint, IPointe
     private void OnDestroy()
     {
         OnGettableRemove?.Invoke();
-        Connection?.Dispose();
+        DisposeConnections();
         _radialCts.CancelAndDispose();
         _stateDisplayCts.CancelAndDispose();
     }
@@ -128,7 +128,12 @@ public abstract class TransitionPoint : MonoBehaviour, ITransitionPoint, IPointe
 
     public abstract void LinkTo(ITransitionPoint targetTp, TPConnection connection = null);
     public abstract void AcceptLink(TPConnection connection);
-    public abstract void ClearConnection();
+    public abstract void ClearConnection(TPConnection connection);
+
+    public virtual void DisconnectAll()
+    {
+        Connection?.Disconnect();
+    }
     #endregion
 
     #region Use in child
@@ -140,11 +145,16 @@ public abstract class TransitionPoint : MonoBehaviour, ITransitionPoint, IPointe
 
     public Action<PositionInfo> OnMove { get; set; }
 
+    protected virtual void DisposeConnections()
+    {
+        Connection?.Dispose();
+    }
+
     protected virtual List<ContextElement> ContextElements
     {
         get
         {
-            List<ContextElement> context = new() { new ContextElement(clickAction: () => Connection?.Disconnect(), text: "Disconnect") };
+            List<ContextElement> context = new() { new ContextElement(clickAction: DisconnectAll, text: "Disconnect") };
 
             if (m_MultiType)
             {
@@ -295,6 +305,61 @@ public abstract class TransitionPoint : MonoBehaviour, ITransitionPoint, IPointe
     }
     #endregion
 
+    #region StateVisual
+    private static readonly List<TransitionPoint> _deferredVisuals = new();
+    private bool _isVisualDeferred = false;
+
+    private void ApplyStateVisual()
+    {
+        Transition state = State;
+        SetImageColor(state.IsNull ? m_DefaultColor : m_StateActiveColor);
+        ShowRadial(state);
+    }
+
+    /// <summary>
+    /// State 변경 시 색상, Radial 갱신. DeferStateVisuals 동안에는 FlushStateVisuals()까지 미룸
+    /// </summary>
+    protected void UpdateStateVisual()
+    {
+        if (!DeferStateVisuals)
+        {
+            ApplyStateVisual();
+            return;
+        }
+
+        if (!_isVisualDeferred)
+        {
+            _isVisualDeferred = true;
+            _deferredVisuals.Add(this);
+        }
+    }
+
+    /// <summary>
+    /// true인 동안 State 시각 갱신을 모아 둠 (Turbo: 한 프레임의 여러 Tick)
+    /// </summary>
+    public static bool DeferStateVisuals { get; set; }
+
+    /// <summary>
+    /// 미뤄 둔 시각 갱신을 TP마다 최종 State로 1회 적용
+    /// </summary>
+    public static void FlushStateVisuals()
+    {
+        for (int i = 0; i < _deferredVisuals.Count; i++)
+        {
+            TransitionPoint tp = _deferredVisuals[i];
+            if (tp == null)
+            {
+                continue;
+            }
+
+            tp._isVisualDeferred = false;
+            tp.ApplyStateVisual();
+        }
+
+        _deferredVisuals.Clear();
+    }
+    #endregion
+
     #region StateDisplay
     private SafetyCancellationTokenSource _stateDisplayCts = new(false);
     private readonly float _mouseMoveThreshold = 0.5f;
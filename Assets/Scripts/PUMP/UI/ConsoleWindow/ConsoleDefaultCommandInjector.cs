@@ -1,5 +1,6 @@
 using System.Collections.Generic;
 using System.Linq;
+using System.Text;
 using NCalc;
 #if !UNITY_EDITOR
 using UnityEngine;
@@ -9,6 +10,8 @@ public class ConsoleDefaultCommandInjector
 {
     private static bool _isInjected = false;
     private const string BAR_STRING = "========================";
+    private const int MAX_TRUTH_TABLE_INPUTS = 10;
+    private const int MAX_SUPPRESSED_CONNECTIONS = 5;
     private static List<ConsoleCommand> _deafultCommands = new List<ConsoleCommand>()
     {
         new ConsoleCommand
@@ -151,6 +154,106 @@ ifs(cond1, val1, cond2, val2, ..., default): Evaluates multiple conditions",
                 }
             }
         ),
+        new ConsoleCommand
+        (
+            command: "/truthtable",
+            doc: "Print the truth table of the open board's Bool gates for every input combination. Outputs are the gates wired to the external output.",
+            isSystem: true,
+            queryProcess: async _ =>
+            {
+                PUMPBackground background = PUMPBackground.Current;
+                if (background == null)
+                {
+                    return "No open board";
+                }
+
+                BitParallelNetwork network = background.CompileBitParallelNetwork();
+                if (network.InputCount > MAX_TRUTH_TABLE_INPUTS)
+                {
+                    return $"Too many inputs: {network.InputCount} (max {MAX_TRUTH_TABLE_INPUTS})";
+                }
+
+                List<ITransitionPoint> outputs = background.GetExternalOutputSources()
+                    .Where(output => network.TryGetNet(output, out _))
+                    .ToList();
+                if (outputs.Count == 0)
+                {
+                    return "No Bool gate is wired to the external output";
+                }
+
+                return $"{BAR_STRING}\n{network.FormatTruthTable(outputs)}\n{BAR_STRING}";
+            }
+        ),
+        new ConsoleCommand
+        (
+            command: "/suppressed",
+            doc: "Print how many writes Change Only stopped since the last call, then reset the count. Also lists the open board's connections with the most suppressed writes since they were connected.",
+            isSystem: true,
+            queryProcess: async _ =>
+            {
+                StringBuilder sb = new();
+                sb.Append($"Suppressed writes: {ConnectionScheduler.SuppressedWriteCount}");
+                ConnectionScheduler.ResetSuppressedWriteCount();
+
+                if (PUMPBackground.Current != null)
+                {
+                    IEnumerable<TPConnection> top = PUMPBackground.Current.AllNodes
+                        .SelectMany(node => node.GetTPs().outTps ?? Enumerable.Empty<ITransitionPoint>())
+                        .OfType<ITPOut>()
+                        .SelectMany(outTp => outTp.Connections)
+                        .Where(connection => connection.SuppressedWriteCount > 0)
+                        .OrderByDescending(connection => connection.SuppressedWriteCount)
+                        .Take(MAX_SUPPRESSED_CONNECTIONS);
+
+                    foreach (TPConnection connection in top)
+                    {
+                        sb.Append($"\n{connection.SourcePoint?.Node?.GetType().Name}.{connection.SourcePoint?.Name} -> {connection.TargetPoint?.Node?.GetType().Name}.{connection.TargetPoint?.Name}: {connection.SuppressedWriteCount}");
+                    }
+                }
+
+                if (!ConnectionScheduler.IsChangeOnly)
+                {
+                    sb.Append("\nChange Only is off");
+                }
+
+                return sb.ToString();
+            }
+        ),
+        new ConsoleCommand
+        (
+            command: "/savesize",
+            doc: "Compare save body sizes in the Odin format and the v2 binary format. (file: e.g. node_data.bin)",
+            isSystem: true,
+            args: new []{ "file" },
+            queryProcess: async context =>
+            {
+                List<PUMPSaveDataStructure> datas = await SerializeManagerCatalog.GetDatas<PUMPSaveDataStructure>(DataDirectory.PumpAppData, context.GetArg("file"));
+                if (datas == null || datas.Count == 0)
+                {
+                    return "No saves";
+                }
+
+                StringBuilder sb = new();
+                long odinTotal = 0;
+                long binaryTotal = 0;
+                foreach (PUMPSaveDataStructure data in datas)
+                {
+                    PUMPSaveDataStructure body = await data.LoadAsync();
+                    if (body == null)
+                    {
+                        continue;
+                    }
+
+                    (int odinSize, int binarySize) = NodeInfoBinaryFormat.MeasureSize(body);
+                    odinTotal += odinSize;
+                    binaryTotal += binarySize;
+                    sb.AppendLine($"{data.Name} ({body.NodeCount} nodes): Odin {odinSize} B / v2 {binarySize} B (x{(float)odinSize / binarySize:0.00})");
+                }
+
+                sb.Append($"{BAR_STRING}\nTotal: Odin {odinTotal} B / v2 {binaryTotal} B (x{(binaryTotal > 0 ? (float)odinTotal / binaryTotal : 0f):0.00})");
+                return sb.ToString();
+            }
+        ),
     };
 
     public static void Inject()
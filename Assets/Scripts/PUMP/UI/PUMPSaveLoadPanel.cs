@@ -147,6 +147,22 @@ public class PUMPSaveLoadPanel : MonoBehaviour, IRecyclableScrollRectDataSource,
         }
     }
 
+    /// <summary>
+    /// 목록 항목은 본문이 없을 수 있으므로 열 때 읽음
+    /// </summary>
+    private async UniTaskVoid OpenData(PUMPSaveDataStructure data)
+    {
+        PUMPSaveDataStructure structure = await data.LoadAsync();
+        if (structure == null)
+        {
+            Debug.LogError($"{GetType().Name}: Can't load save '{data.Name}'");
+            return;
+        }
+
+        extractor.ApplyData(structure);
+        UiController.SetActive(false);
+    }
+
     private async UniTaskVoid DeleteData(PUMPSaveDataStructure data)
     {
         data.Delete();
@@ -173,11 +189,7 @@ public class PUMPSaveLoadPanel : MonoBehaviour, IRecyclableScrollRectDataSource,
 
         PUMPSaveDataStructure currentData = _saveDatas[_saveDatas.Count - 1 - index];
         elem.Initialize(currentData);
-        elem.OnDoubleClick += data =>
-        {
-            extractor.ApplyData(data);
-            UiController.SetActive(false);
-        };
+        elem.OnDoubleClick += data => OpenData(data).Forget();
         elem.OnRightClick += (data, eventData) =>
         {
             ContextElement[] contextElements = 
@@ -1,6 +1,5 @@
 using System;
 using System.Collections.Generic;
-using System.Linq;
 using TMPro;
 using UnityEngine;
 using UnityEngine.EventSystems;
@@ -27,7 +26,6 @@ public class SaveScrollElem : MonoBehaviour, ISaveScrollElem, IPointerClickHandl
     private bool _classedDataTarget_IsPointerEnter;
     private float _lastClickTime;
     private Vector2 _lastClickPos;
-    private List<Type> _displayExclusionType = new() { typeof(ExternalInput), typeof(ExternalOutput) };
     private const float DOUBLE_CLICK_TIME = 0.5f;
     private const float DOUBLE_CLICK_MAX_DISTANCE = 10f; // 픽셀 단위
     
@@ -41,11 +39,6 @@ public class SaveScrollElem : MonoBehaviour, ISaveScrollElem, IPointerClickHandl
         _onDoubleClick?.Invoke(Data);
     }
 
-    private bool IsExclusionType(Type nodeType)
-    {
-        return _displayExclusionType.Contains(nodeType);
-    }
-
     private void SetDisplay(List<Vector2> normalizedPosition)
     {
         if (normalizedPosition == null)
@@ -116,10 +109,7 @@ public class SaveScrollElem : MonoBehaviour, ISaveScrollElem, IPointerClickHandl
         nameText.text = Data.Name;
         DateTime date = Data.LastUpdate;
         dateText.text = $"<b>{date.Month:D2}</b> / <b>{date.Day:D2}</b> / <b>{date.Year}</b>\n<b>{date.Hour:D2}</b>:<b>{date.Minute:D2}</b>";
-        SetDisplay(Data.NodeInfos
-            .Where(info => !IsExclusionType(info.NodeType))
-            .Select(info => info.NodePosition)
-            .ToList());
+        SetDisplay(Data.PreviewPositions);
     }
 
     public void Initialize(PUMPSaveDataStructure data)
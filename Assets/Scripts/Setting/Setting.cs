@@ -17,6 +17,11 @@ public static class Setting
     public static float DefaultSimulationSpeed = 0.0f; // Default simulation speed
     public static int DefaultLoopThreshold = 5; //min 2 max 20
     public static bool DefaultIsImmediately = true;
+    public static bool DefaultIsTurbo = false;
+    public static int DefaultTurboTicksPerFrame = 1000; //min 1 max 100000
+    public static float DefaultTurboTimeBudget = 8.0f; // ms, min 1 max 33
+    public static bool DefaultIsChangeOnly = false;
+    public static bool DefaultIsHeadlessKernel = false;
     // Default key map settings
     public static List<BackgroundActionKeyMap> DefaultKeyMap => new List<BackgroundActionKeyMap>
     {
@@ -122,6 +127,11 @@ public static class Setting
     private static float _tempSimulationSpeed = DefaultSimulationSpeed;
     private static bool _tempIsImmediately = DefaultIsImmediately;
     private static int _tempLoopThreshold = DefaultLoopThreshold;
+    private static bool _tempIsTurbo = DefaultIsTurbo;
+    private static int _tempTurboTicksPerFrame = DefaultTurboTicksPerFrame;
+    private static float _tempTurboTimeBudget = DefaultTurboTimeBudget;
+    private static bool _tempIsChangeOnly = DefaultIsChangeOnly;
+    private static bool _tempIsHeadlessKernel = DefaultIsHeadlessKernel;
     private static List<BackgroundActionKeyMap> _tempKeyMap = new List<BackgroundActionKeyMap>(DefaultKeyMap);
 
     // 실제 적용된 설정값
@@ -138,12 +148,25 @@ public static class Setting
     public static bool IsImmediately => _currentSettings.isImmediately;
     public static int LoopThreshold => _currentSettings.loopThreshold;
 
+    // Turbo: 프레임당 여러 Tick 실행, 화면에는 프레임의 최종 상태만 반영
+    public static bool IsTurbo => _currentSettings.isTurbo;
+    public static int TurboTicksPerFrame => _currentSettings.turboTicksPerFrame;
+    public static float TurboTimeBudget => _currentSettings.turboTimeBudget;
+
+    // ChangeOnly: 이전과 같은 값(Pulse 제외)은 Connection에서 전파 중단
+    public static bool IsChangeOnly => _currentSettings.isChangeOnly;
+
+    // HeadlessKernel: 지원 노드를 SimulationKernel로 평가, UI에는 프레임당 1회 반영
+    public static bool IsHeadlessKernel => _currentSettings.isHeadlessKernel;
+
     // ConnectionAwait 상태를 반환하는 프로퍼티
     public static ConnectionAwait CurrentConnectionAwait
     {
         get
         {
-            if (_currentSettings.isImmediately)
+            if (_currentSettings.isTurbo)
+                return ConnectionAwait.Turbo;
+            else if (_currentSettings.isImmediately)
                 return ConnectionAwait.Immediately;
             else if (_currentSettings.simulationSpeed < 0.001f)
                 return ConnectionAwait.Frame;
@@ -220,6 +243,26 @@ public static class Setting
     {
         _tempLoopThreshold = Mathf.Clamp(loopThreshold, 2, 20); // 최소값 1로 제한..
     }
+    public static void SetTempIsTurbo(bool isTurbo)
+    {
+        _tempIsTurbo = isTurbo;
+    }
+    public static void SetTempTurboTicksPerFrame(int ticksPerFrame)
+    {
+        _tempTurboTicksPerFrame = Mathf.Clamp(ticksPerFrame, 1, 100000);
+    }
+    public static void SetTempTurboTimeBudget(float milliseconds)
+    {
+        _tempTurboTimeBudget = Mathf.Clamp(milliseconds, 1f, 33f);
+    }
+    public static void SetTempIsChangeOnly(bool isChangeOnly)
+    {
+        _tempIsChangeOnly = isChangeOnly;
+    }
+    public static void SetTempIsHeadlessKernel(bool isHeadlessKernel)
+    {
+        _tempIsHeadlessKernel = isHeadlessKernel;
+    }
     #endregion
     public static void ResetTempToDefault()
     {
@@ -228,6 +271,11 @@ public static class Setting
         _tempKeyMap = new List<BackgroundActionKeyMap>(DefaultKeyMap);
         _tempLoopThreshold = DefaultLoopThreshold;
         _tempIsImmediately = DefaultIsImmediately;
+        _tempIsTurbo = DefaultIsTurbo;
+        _tempTurboTicksPerFrame = DefaultTurboTicksPerFrame;
+        _tempTurboTimeBudget = DefaultTurboTimeBudget;
+        _tempIsChangeOnly = DefaultIsChangeOnly;
+        _tempIsHeadlessKernel = DefaultIsHeadlessKernel;
     }
     public static void OnClickApplyButton()
     {
@@ -236,6 +284,11 @@ public static class Setting
         _currentSettings.simulationSpeed = _tempSimulationSpeed;
         _currentSettings.isImmediately = _tempIsImmediately;
         _currentSettings.loopThreshold = _tempLoopThreshold;
+        _currentSettings.isTurbo = _tempIsTurbo;
+        _currentSettings.turboTicksPerFrame = _tempTurboTicksPerFrame;
+        _currentSettings.turboTimeBudget = _tempTurboTimeBudget;
+        _currentSettings.isChangeOnly = _tempIsChangeOnly;
+        _currentSettings.isHeadlessKernel = _tempIsHeadlessKernel;
         _currentSettings.keyMapList = new List<BackgroundActionKeyMap>(_tempKeyMap);
 
         // 설정 저장
@@ -253,6 +306,11 @@ public static class Setting
         [OdinSerialize] public List<BackgroundActionKeyMap> keyMapList;
         [OdinSerialize] public bool isImmediately;
         [OdinSerialize] public int loopThreshold;
+        [OdinSerialize] public bool isTurbo;
+        [OdinSerialize] public int turboTicksPerFrame;
+        [OdinSerialize] public float turboTimeBudget;
+        [OdinSerialize] public bool isChangeOnly;
+        [OdinSerialize] public bool isHeadlessKernel;
 
         public SettingData()
         {
@@ -260,6 +318,11 @@ public static class Setting
             simulationSpeed = DefaultSimulationSpeed;
             isImmediately = DefaultIsImmediately;
             loopThreshold = DefaultLoopThreshold;
+            isTurbo = DefaultIsTurbo;
+            turboTicksPerFrame = DefaultTurboTicksPerFrame;
+            turboTimeBudget = DefaultTurboTimeBudget;
+            isChangeOnly = DefaultIsChangeOnly;
+            isHeadlessKernel = DefaultIsHeadlessKernel;
             keyMapList = new List<BackgroundActionKeyMap>(DefaultKeyMap);
         }
 
@@ -269,6 +332,11 @@ public static class Setting
             simulationSpeed = speed;
             isImmediately = immediately;
             loopThreshold = threshold;
+            isTurbo = DefaultIsTurbo;
+            turboTicksPerFrame = DefaultTurboTicksPerFrame;
+            turboTimeBudget = DefaultTurboTimeBudget;
+            isChangeOnly = DefaultIsChangeOnly;
+            isHeadlessKernel = DefaultIsHeadlessKernel;
             keyMapList = new List<BackgroundActionKeyMap>(keyMap);
         }
     }
@@ -295,11 +363,22 @@ public static class Setting
             {
                 _currentSettings = loadedData;
 
+                // Turbo 항목이 없던 이전 저장 파일 보정
+                if (_currentSettings.turboTicksPerFrame <= 0)
+                    _currentSettings.turboTicksPerFrame = DefaultTurboTicksPerFrame;
+                if (_currentSettings.turboTimeBudget <= 0f)
+                    _currentSettings.turboTimeBudget = DefaultTurboTimeBudget;
+
                 // 로드된 값으로 임시 설정값도 초기화
                 _tempVfxVolume = _currentSettings.vfxVolume;
                 _tempSimulationSpeed = _currentSettings.simulationSpeed;
                 _tempIsImmediately = _currentSettings.isImmediately;
                 _tempLoopThreshold = _currentSettings.loopThreshold;
+                _tempIsTurbo = _currentSettings.isTurbo;
+                _tempTurboTicksPerFrame = _currentSettings.turboTicksPerFrame;
+                _tempTurboTimeBudget = _currentSettings.turboTimeBudget;
+                _tempIsChangeOnly = _currentSettings.isChangeOnly;
+                _tempIsHeadlessKernel = _currentSettings.isHeadlessKernel;
                 _tempKeyMap = new List<BackgroundActionKeyMap>(_currentSettings.keyMapList);
             }
             else
@@ -326,6 +405,30 @@ public static class Setting
         return (_tempVfxVolume, _tempSimulationSpeed, _tempIsImmediately, _tempLoopThreshold, new List<BackgroundActionKeyMap>(_tempKeyMap));
     }
 
+    // Turbo 임시 설정값 가져오기 (UI 표시용)
+    public static (bool turbo, int ticksPerFrame, float timeBudget) GetTempTurboSettings()
+    {
+        return (_tempIsTurbo, _tempTurboTicksPerFrame, _tempTurboTimeBudget);
+    }
+
+    // Turbo 현재 설정값 가져오기
+    public static (bool turbo, int ticksPerFrame, float timeBudget) GetCurrentTurboSettings()
+    {
+        return (_currentSettings.isTurbo, _currentSettings.turboTicksPerFrame, _currentSettings.turboTimeBudget);
+    }
+
+    // ChangeOnly 임시 설정값 가져오기 (UI 표시용)
+    public static bool GetTempIsChangeOnly()
+    {
+        return _tempIsChangeOnly;
+    }
+
+    // HeadlessKernel 임시 설정값 가져오기 (UI 표시용)
+    public static bool GetTempIsHeadlessKernel()
+    {
+        return _tempIsHeadlessKernel;
+    }
+
     // 현재 설정값 가져오기 (시스템 적용용)
     public static (float vfx, float speed, bool immediately, int loopThreshold, List<BackgroundActionKeyMap> keyMap) GetCurrentSettings()
     {
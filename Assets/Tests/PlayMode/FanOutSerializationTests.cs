@@ -0,0 +1,112 @@
+#if UNITY_INCLUDE_TESTS
+using System.Collections;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+using UnityEngine;
+using UnityEngine.TestTools;
+using Utils;
+
+/// <summary>
+/// TPOut 하나가 여러 TPIn으로 Fan-out될 때, 분기마다 자신의 선분 정보가 GetInfos() / SetInfos()를 거쳐 유지되는지
+/// </summary>
+public class FanOutSerializationTests
+{
+    private const string BACKGROUND_PREFAB_PATH = "PUMP/Prefab/PUMP_Background";
+    private const float TOLERANCE = 1e-3f;
+
+    private GameObject _canvasObject;
+    private PUMPBackground _background;
+
+    private static SerializeNodeInfo CreateNotInfo(Vector2 position, TPConnectionIndexInfo inTarget, TPConnectionIndexInfo outTarget)
+    {
+        return new SerializeNodeInfo
+        {
+            NodeType = typeof(NOT),
+            NodePosition = position,
+            InTpType = new[] { TransitionType.Bool },
+            OutTpType = new[] { TransitionType.Bool },
+            InTpState = new[] { TransitionType.Bool.Null() },
+            OutTpState = new[] { TransitionType.Bool.Null() },
+            StatePending = new[] { false },
+            InConnectionTargets = new[] { inTarget },
+            OutConnectionTargets = new[] { outTarget },
+        };
+    }
+
+    // 양 끝점은 TP 위치로 다시 계산되므로 중간 꺾임점만 비교
+    private static void AssertInnerVertices(List<Vector2> expected, List<Vector2> actual)
+    {
+        Assert.IsNotNull(actual);
+        Assert.AreEqual(expected.Count, actual.Count);
+
+        for (int i = 1; i < expected.Count - 1; i++)
+        {
+            Assert.AreEqual(expected[i].x, actual[i].x, TOLERANCE, $"vertex {i}.x");
+            Assert.AreEqual(expected[i].y, actual[i].y, TOLERANCE, $"vertex {i}.y");
+        }
+    }
+
+    [UnitySetUp]
+    public IEnumerator SetUp()
+    {
+        _canvasObject = new GameObject("TestCanvas", typeof(Canvas));
+        _canvasObject.GetComponent<Canvas>().renderMode = RenderMode.ScreenSpaceOverlay;
+
+        GameObject backgroundObject = Object.Instantiate(Resources.Load<GameObject>(BACKGROUND_PREFAB_PATH), _canvasObject.transform);
+        _background = backgroundObject.GetComponent<PUMPBackground>();
+        _background.RecordOnInitialize = false;
+        _background.Rect.SetRectFull();
+        yield return null;
+    }
+
+    [UnityTearDown]
+    public IEnumerator TearDown()
+    {
+        Object.Destroy(_canvasObject);
+        yield return null;
+    }
+
+    [UnityTest]
+    public IEnumerator FanOutBranchesRoundTripTheirOwnVertices()
+    {
+        List<Vector2> branchA = new() { new(0.2f, 0.5f), new(0.3f, 0.5f), new(0.3f, 0.3f), new(0.5f, 0.3f) };
+        List<Vector2> branchB = new() { new(0.2f, 0.5f), new(0.35f, 0.5f), new(0.35f, 0.7f), new(0.5f, 0.7f) };
+
+        // 0: 공급원, 1, 2: 같은 Out을 받는 노드 (분기마다 다른 경로)
+        List<SerializeNodeInfo> infos = new()
+        {
+            CreateNotInfo(new Vector2(0.15f, 0.5f), null, new TPConnectionIndexInfo { NodeIndex = 1, TpIndex = 0, Vertices = branchA }),
+            CreateNotInfo(new Vector2(0.55f, 0.3f), new TPConnectionIndexInfo { NodeIndex = 0, TpIndex = 0, Vertices = branchA }, null),
+            CreateNotInfo(new Vector2(0.55f, 0.7f), new TPConnectionIndexInfo { NodeIndex = 0, TpIndex = 0, Vertices = branchB }, null),
+        };
+
+        _background.SetInfos(infos, false);
+        yield return null;
+
+        Node source = _background.AllNodes.First(node => node is NOT);
+        Assert.AreEqual(2, ((ITPOut)source.GetTPs().outTps[0]).Connections.Count);
+
+        List<SerializeNodeInfo> saved = _background.GetInfos();
+        List<SerializeNodeInfo> targets = saved.Where(info => info.NodeType == typeof(NOT) && info.InConnectionTargets[0] != null).ToList();
+        Assert.AreEqual(2, targets.Count);
+
+        SerializeNodeInfo upper = targets.OrderBy(info => info.NodePosition.y).First();
+        SerializeNodeInfo lower = targets.OrderBy(info => info.NodePosition.y).Last();
+        AssertInnerVertices(branchA, upper.InConnectionTargets[0].Vertices);
+        AssertInnerVertices(branchB, lower.InConnectionTargets[0].Vertices);
+
+        // 저장한 정보로 다시 불러와도 분기별 경로 유지
+        _background.SetInfos(saved, false);
+        yield return null;
+
+        List<SerializeNodeInfo> reloaded = _background.GetInfos()
+            .Where(info => info.NodeType == typeof(NOT) && info.InConnectionTargets[0] != null)
+            .OrderBy(info => info.NodePosition.y)
+            .ToList();
+        Assert.AreEqual(2, reloaded.Count);
+        AssertInnerVertices(branchA, reloaded[0].InConnectionTargets[0].Vertices);
+        AssertInnerVertices(branchB, reloaded[1].InConnectionTargets[0].Vertices);
+    }
+}
+#endif